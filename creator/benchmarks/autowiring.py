@@ -0,0 +1,36 @@
+"""Wiring time of long chains of data flow nodes.
+
+Wiring visits every node and edge a bounded number of times, so the time
+per node should stay roughly constant as the chains grow.
+Run with `python -m benchmarks.autowiring`.
+"""
+
+import time
+
+from elasticai.creator.vhdl.auto_wire_protocols.autowiring import (
+    AutoWirer,
+    DataFlowNode,
+)
+
+
+def _chain(length: int) -> list[DataFlowNode]:
+    return [
+        DataFlowNode.buffered(f"n_{i}")
+        if i % 2 == 0
+        else DataFlowNode.unbuffered(f"n_{i}")
+        for i in range(length)
+    ]
+
+
+def main() -> None:
+    print(f"{'nodes':>8} {'total [s]':>10} {'per node [us]':>14}")
+    for length in [10, 100, 1_000, 10_000]:
+        nodes = _chain(length)
+        start = time.perf_counter()
+        AutoWirer().wire(DataFlowNode.top("top"), nodes)
+        seconds = time.perf_counter() - start
+        print(f"{length:>8} {seconds:>10.4f} {seconds / length * 1e6:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Export time of large fixed point layers.
+
+Compares the former per scalar conversion (nested `tolist()`, recursive
+`as_integer`, per value binary strings) against the vectorized export of
+`create_design` and `save_to`.
+Run with `python -m benchmarks.design_export`.
+"""
+
+import time
+from itertools import chain
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+from elasticai.creator.nn.fixed_point import Linear
+from elasticai.creator.vhdl.code_generation.code_abstractions import (
+    to_vhdl_binary_string,
+)
+
+
+def _export_per_scalar(linear: Linear) -> str:
+    config = linear._config
+
+    def float_to_signed_int(value: float | list) -> int | list:
+        if isinstance(value, list):
+            return list(map(float_to_signed_int, value))
+        return config.as_integer(value)
+
+    weights = float_to_signed_int(linear.weight.tolist())
+    flat = list(chain(*weights))
+    return ",".join(to_vhdl_binary_string(x, config.total_bits) for x in flat)
+
+
+def _export_vectorized(linear: Linear) -> None:
+    linear.create_design("linear").save_to(InMemoryPath("build", parent=None))
+
+
+def _seconds(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'parameters':>12} {'per scalar [s]':>15} {'vectorized [s]':>15}")
+    for in_features, out_features in [(100, 100), (1000, 100), (1000, 1000)]:
+        linear = Linear(in_features, out_features, total_bits=16, frac_bits=8)
+        per_scalar = _seconds(lambda: _export_per_scalar(linear))
+        vectorized = _seconds(lambda: _export_vectorized(linear))
+        print(
+            f"{in_features * out_features:>12} {per_scalar:>15.3f} {vectorized:>15.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
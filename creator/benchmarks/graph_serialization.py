@@ -0,0 +1,46 @@
+"""Saving and loading `ir.Graph`s of layers with large weights.
+
+Loading maps the weights instead of reading them, so its time should only
+depend on the number of nodes, not on the size of the weights.
+Run with `python -m benchmarks.graph_serialization`.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from elasticai.creator import ir
+
+
+def _graph(layers: int, features: int) -> ir.Graph[ir.Node, ir.Edge]:
+    rng = np.random.default_rng(0)
+    graph: ir.Graph[ir.Node, ir.Edge] = ir.Graph()
+    for i in range(layers):
+        weight = rng.integers(-128, 128, (features, features), dtype=np.int8)
+        graph.add_node(ir.node(f"fc_{i}", "linear", dict(weight=weight)))
+        if i > 0:
+            graph.add_edge(ir.edge(f"fc_{i - 1}", f"fc_{i}"))
+    return graph
+
+
+def main() -> None:
+    print(f"{'layers':>8} {'size [MB]':>10} {'save [s]':>10} {'load [ms]':>10}")
+    with tempfile.TemporaryDirectory() as directory:
+        file = Path(directory) / "graph.bin"
+        for layers, features in ((10, 1024), (100, 1024), (1000, 256)):
+            graph = _graph(layers, features)
+            start = time.perf_counter()
+            ir.save_graph(graph, file)
+            saved = time.perf_counter()
+            ir.load_graph(file)
+            loaded = time.perf_counter()
+            print(
+                f"{layers:>8} {file.stat().st_size / 1e6:>10.1f}"
+                f" {saved - start:>10.3f} {(loaded - saved) * 1e3:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
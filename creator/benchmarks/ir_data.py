@@ -0,0 +1,56 @@
+"""Memory per node and attribute access time of `ir.Node`s.
+
+Passes over large graphs read the name, type and attributes of every node,
+so both should stay small and fast for 10^5 nodes and more.
+Run with `python -m benchmarks.ir_data`.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from elasticai.creator import ir
+
+
+def _nodes(count: int) -> list[ir.Node]:
+    return [
+        ir.node(name=f"n_{i}", type=f"layer_{i % 4}", attributes=dict(width=8, depth=i))
+        for i in range(count)
+    ]
+
+
+def _bytes_per_node(count: int) -> float:
+    tracemalloc.start()
+    nodes = _nodes(count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del nodes
+    return size / count
+
+
+def _access_time(nodes: list[ir.Node], access: Callable[[ir.Node], object]) -> float:
+    start = time.perf_counter()
+    for n in nodes:
+        access(n)
+    return (time.perf_counter() - start) / len(nodes)
+
+
+def main() -> None:
+    count = 100_000
+    nodes = _nodes(count)
+    accesses: dict[str, Callable[[ir.Node], object]] = {
+        "name": lambda n: n.name,
+        "type": lambda n: n.type,
+        "data[...]": lambda n: n.data["width"],
+        "attributes[...]": lambda n: n.attributes["width"],
+        "len(attributes)": lambda n: len(n.attributes),
+    }
+    print(f"{count} nodes, {_bytes_per_node(count):.0f} bytes per node")
+    print(f"{'access':>16} {'per node [ns]':>14}")
+    for label, access in accesses.items():
+        seconds = min(_access_time(nodes, access) for _ in range(5))
+        print(f"{label:>16} {seconds * 1e9:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
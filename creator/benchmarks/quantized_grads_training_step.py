@@ -0,0 +1,93 @@
+"""Training step time of `quantized_grads` layers with stochastic rounding.
+
+Compares the previous unfused rounding (fresh noise, clamped, scaled and
+rounded copies per call) against the fused `StochasticRounding`.
+Run with `python -m benchmarks.quantized_grads_training_step`.
+"""
+
+import time
+from collections.abc import Callable
+from typing import cast
+
+import torch
+
+from elasticai.creator.nn.quantized_grads._math_operations import MathOperations
+from elasticai.creator.nn.quantized_grads.base_modules import Conv2d, Linear
+from elasticai.creator.nn.quantized_grads.fixed_point import (
+    FixedPointConfigV2,
+    MathOperationsForwBackwStoch,
+    StochasticRounding,
+)
+from elasticai.creator.nn.quantized_grads.fixed_point._round_to_fixed_point_autograd import (
+    _make_autograd_function_forwbackw,
+)
+
+_FORWARD = FixedPointConfigV2(total_bits=8, frac_bits=4)
+_BACKWARD = FixedPointConfigV2(total_bits=16, frac_bits=10)
+
+
+def _unfused_stochastic(
+    number: torch.Tensor, fxp_conf: FixedPointConfigV2
+) -> torch.Tensor:
+    noise = (torch.rand_like(number) - 0.5) / (2**fxp_conf.frac_bits)
+    clamped = torch.clamp(
+        number,
+        fxp_conf.minimum_as_rational_tensor,
+        fxp_conf.maximum_as_rational_tensor,
+    )
+    return torch.round((clamped + noise) * 2**fxp_conf.frac_bits) / (
+        2**fxp_conf.frac_bits
+    )
+
+
+class _UnfusedOperations(MathOperations):
+    _quantize = _make_autograd_function_forwbackw(_unfused_stochastic)
+
+    def quantize(self, a: torch.Tensor) -> torch.Tensor:
+        return cast(torch.Tensor, self._quantize.apply(a, _FORWARD, _BACKWARD))
+
+
+def _param_quantization(x: torch.Tensor) -> torch.Tensor:
+    return StochasticRounding(seed=0)(x, _FORWARD)
+
+
+def _step_time(model: torch.nn.Module, make_input: Callable[[], torch.Tensor]) -> float:
+    optimizer = torch.optim.SGD(model.parameters(), lr=0.01)
+    x = make_input()
+
+    def step() -> None:
+        optimizer.zero_grad()
+        model(x).sum().backward()
+        optimizer.step()
+
+    step()
+    repetitions = 20
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        step()
+    return (time.perf_counter() - start) / repetitions
+
+
+def main() -> None:
+    operations: dict[str, Callable[[], MathOperations]] = {
+        "unfused": _UnfusedOperations,
+        "fused": lambda: MathOperationsForwBackwStoch(_FORWARD, _BACKWARD, seed=0),
+    }
+    layers: dict[str, tuple[Callable, Callable[[], torch.Tensor]]] = {
+        "Linear 1024x1024, batch 256": (
+            lambda ops: Linear(1024, 1024, ops, _param_quantization, bias=True),
+            lambda: torch.rand(256, 1024),
+        ),
+        "Conv2d 32->64 3x3, batch 32x64x64": (
+            lambda ops: Conv2d(ops, _param_quantization, 32, 64, 3, padding=1),
+            lambda: torch.rand(32, 32, 64, 64),
+        ),
+    }
+    for layer_name, (make_layer, make_input) in layers.items():
+        for ops_name, make_ops in operations.items():
+            seconds = _step_time(make_layer(make_ops()), make_input)
+            print(f"{layer_name:<36} {ops_name:<8} {seconds * 1e3:8.2f} ms/step")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Step time and allocations of fixed point optimizers.
+
+Compares `QuantizedSGD`/`QuantizedAdam` against the float torch optimizers
+followed by manually requantizing every parameter.
+Run with `python -m benchmarks.quantized_optimizers`.
+"""
+
+import time
+from collections.abc import Callable
+
+import torch
+from torch.profiler import ProfilerActivity, profile
+
+from elasticai.creator.nn.quantized_grads.fixed_point import (
+    FixedPointConfigV2,
+    QuantizedAdam,
+    QuantizedSGD,
+    quantize_to_fxp_hte,
+)
+
+_PARAM_CONF = FixedPointConfigV2(total_bits=8, frac_bits=4)
+_STATE_CONF = FixedPointConfigV2(total_bits=16, frac_bits=12)
+
+
+def _make_params() -> list[torch.nn.Parameter]:
+    params = [torch.nn.Parameter(torch.rand(1024, 1024)) for _ in range(8)]
+    for p in params:
+        p.grad = torch.rand_like(p) * 0.1
+    return params
+
+
+def _float_with_requantization(
+    optimizer_type: type[torch.optim.Optimizer], **kwargs
+) -> Callable[[list[torch.nn.Parameter]], Callable[[], None]]:
+    def make_step(params: list[torch.nn.Parameter]) -> Callable[[], None]:
+        optimizer = optimizer_type(params, **kwargs)
+
+        def step() -> None:
+            optimizer.step()
+            for p in params:
+                p.data = quantize_to_fxp_hte(p.data, _PARAM_CONF)
+
+        return step
+
+    return make_step
+
+
+def _quantized(
+    optimizer_type: type[torch.optim.Optimizer], **kwargs
+) -> Callable[[list[torch.nn.Parameter]], Callable[[], None]]:
+    def make_step(params: list[torch.nn.Parameter]) -> Callable[[], None]:
+        return optimizer_type(
+            params, param_config=_PARAM_CONF, state_config=_STATE_CONF, **kwargs
+        ).step
+
+    return make_step
+
+
+def _measure(step: Callable[[], None]) -> tuple[float, int]:
+    step()
+    repetitions = 10
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        step()
+    seconds = (time.perf_counter() - start) / repetitions
+    with profile(activities=[ProfilerActivity.CPU], profile_memory=True) as prof:
+        step()
+    allocated = sum(
+        max(event.self_cpu_memory_usage, 0) for event in prof.key_averages()
+    )
+    return seconds, allocated
+
+
+def main() -> None:
+    candidates = {
+        "SGD float + requantization": _float_with_requantization(
+            torch.optim.SGD, lr=0.01
+        ),
+        "QuantizedSGD": _quantized(QuantizedSGD, lr=0.01),
+        "SGD momentum float + requantization": _float_with_requantization(
+            torch.optim.SGD, lr=0.01, momentum=0.9
+        ),
+        "QuantizedSGD momentum": _quantized(QuantizedSGD, lr=0.01, momentum=0.9),
+        "Adam float + requantization": _float_with_requantization(
+            torch.optim.Adam, lr=0.01, foreach=False
+        ),
+        "QuantizedAdam": _quantized(QuantizedAdam, lr=0.01),
+    }
+    print(f"{'optimizer':<38} {'step [ms]':>10} {'allocated [MiB]':>16}")
+    for name, make_step in candidates.items():
+        seconds, allocated = _measure(make_step(_make_params()))
+        print(f"{name:<38} {seconds * 1e3:>10.2f} {allocated / 2**20:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
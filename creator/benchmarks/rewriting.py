@@ -0,0 +1,43 @@
+"""Rewriting a few matches in growing graphs.
+
+Matching starts from the type index of the graph, so the time to find and
+replace a fixed number of matches should not grow with the graph.
+Run with `python -m benchmarks.rewriting`.
+"""
+
+import time
+
+from elasticai.creator import ir
+
+
+def _graph(nodes: int, matches: int) -> ir.Graph[ir.Node, ir.Edge]:
+    graph: ir.Graph[ir.Node, ir.Edge] = ir.Graph()
+    for i in range(nodes):
+        graph.add_node(ir.node(f"n_{i}", "relu" if i % 2 else "linear"))
+        if i > 0:
+            graph.add_edge(ir.edge(f"n_{i - 1}", f"n_{i}"))
+    for i in range(matches):
+        graph.add_node(ir.node(f"m_{i}", "batch_norm"))
+        graph.add_edge(ir.edge(f"n_{2 * i}", f"m_{i}"))
+    return graph
+
+
+def _fold(match: ir.rewriting.Match) -> ir.Replacement:
+    return ir.Replacement(
+        nodes=(match["fc"],), rewire={match["bn"].name: match["fc"].name}
+    )
+
+
+def main() -> None:
+    rule = ir.Rule(ir.Pattern.chain(fc="linear", bn="batch_norm"), _fold)
+    matches = 10
+    print(f"{'nodes':>8} {'rewrite [ms]':>13}")
+    for nodes in (10**3, 10**4, 10**5):
+        graph = _graph(nodes, matches)
+        start = time.perf_counter()
+        assert matches == ir.rewrite(graph, [rule])
+        print(f"{nodes:>8} {(time.perf_counter() - start) * 1e3:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
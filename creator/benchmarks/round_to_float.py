@@ -0,0 +1,58 @@
+"""Throughput of `nn.float` rounding, table lookup vs. per element arithmetic.
+
+Run with `python -m benchmarks.round_to_float`.
+"""
+
+import time
+from collections.abc import Callable
+
+import torch
+
+from elasticai.creator.nn.float._round_to_float import RoundToFloat
+
+
+def _round_arithmetically(
+    x: torch.Tensor, mantissa_bits: int, exponent_bits: int
+) -> torch.Tensor:
+    exponent_bias = 2 ** (exponent_bits - 1)
+    smallest_value = 2 ** (1 - exponent_bias - mantissa_bits)
+    x = x.clone()
+    x[(x > -smallest_value) & (x < smallest_value)] = smallest_value
+    scale = 2 ** (x.abs().log2().floor() - mantissa_bits)
+    return scale * torch.round(x / scale)
+
+
+def _throughput(fn: Callable[[], torch.Tensor], num_elements: int) -> float:
+    fn()
+    repetitions = 20
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        fn()
+    return repetitions * num_elements / (time.perf_counter() - start)
+
+
+def main() -> None:
+    num_elements = 1 << 20
+    print(f"{'config':>10} {'arithmetic [M/s]':>18} {'table [M/s]':>12}")
+    for mantissa_bits, exponent_bits in [(2, 3), (3, 4), (6, 3), (7, 5), (10, 5)]:
+        exponent_bias = 2 ** (exponent_bits - 1)
+        largest = (2 - 1 / 2**mantissa_bits) * 2 ** (
+            2**exponent_bits - exponent_bias - 1
+        )
+        x = (torch.rand(num_elements) * 2 - 1) * largest
+        arithmetic = _throughput(
+            lambda: _round_arithmetically(x, mantissa_bits, exponent_bits),
+            num_elements,
+        )
+        table = _throughput(
+            lambda: RoundToFloat.apply(x, mantissa_bits, exponent_bits),
+            num_elements,
+        )
+        print(
+            f"{f'm{mantissa_bits}e{exponent_bits}':>10}"
+            f" {arithmetic / 1e6:>18.1f} {table / 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
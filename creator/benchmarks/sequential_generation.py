@@ -0,0 +1,44 @@
+"""Generation time of Sequential designs with many sub designs.
+
+Builds the port, the connections, the signal definitions and the instances
+of a network alternating between buffered and unbuffered sub designs. The
+time per sub design should stay roughly constant as the network grows.
+Run with `python -m benchmarks.sequential_generation`.
+"""
+
+import time
+
+from elasticai.creator.nn.fixed_point.relu.design import ReLU
+from elasticai.creator.nn.identity.design import BufferedIdentity
+from elasticai.creator.nn.sequential.design import Sequential
+from elasticai.creator.vhdl.design.design import Design
+
+
+def _sub_designs(number: int) -> list[Design]:
+    return [
+        BufferedIdentity(f"identity_{i}", num_input_features=4, num_input_bits=8)
+        if i % 2 == 0
+        else ReLU(f"relu_{i}", total_bits=8, use_clock=False)
+        for i in range(number)
+    ]
+
+
+def _generate(sub_designs: list[Design]) -> None:
+    network = Sequential(sub_designs, name="network")
+    network._generate_signal_definitions()
+    network._generate_instantiations()
+    network._generate_connections_code()
+
+
+def main() -> None:
+    print(f"{'sub designs':>12} {'total [s]':>10} {'per design [us]':>16}")
+    for number in [10, 100, 1_000, 10_000]:
+        sub_designs = _sub_designs(number)
+        start = time.perf_counter()
+        _generate(sub_designs)
+        seconds = time.perf_counter() - start
+        print(f"{number:>12} {seconds:>10.4f} {seconds / number * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Run time of the linear, conv1d and LSTM testbenches on every simulator
+backend installed, `ghdl` and `nvc`.
+
+Backends that are not on the PATH are skipped. Times include analysis,
+elaboration and simulation, as every `SimulatedLayer` call does them.
+Run with `python -m benchmarks.simulators`.
+"""
+
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+
+import torch
+
+from elasticai.creator.file_generation.on_disk_path import OnDiskPath
+from elasticai.creator.nn.fixed_point import Linear
+from elasticai.creator.nn.fixed_point.conv1d.layer import Conv1d
+from elasticai.creator.nn.fixed_point.lstm.layer import (
+    FixedPointLSTMWithHardActivations,
+    LSTMNetwork,
+)
+from elasticai.creator.vhdl.simulated_layer import SIMULATORS, SimulatedLayer
+
+
+def _linear(build: str, simulator: str) -> None:
+    layer = Linear(in_features=32, out_features=16, total_bits=8, frac_bits=4)
+    _simulate_layer(layer, torch.rand(8, 1, 32), build, simulator)
+
+
+def _conv1d(build: str, simulator: str) -> None:
+    layer = Conv1d(
+        total_bits=8,
+        frac_bits=4,
+        in_channels=4,
+        out_channels=4,
+        signal_length=32,
+        kernel_size=3,
+    )
+    _simulate_layer(layer, torch.rand(8, 4, 32), build, simulator)
+
+
+def _simulate_layer(layer, inputs: torch.Tensor, build: str, simulator: str) -> None:
+    design = layer.create_design("uut")
+    testbench = layer.create_testbench("testbench", design)
+    destination = OnDiskPath(build, parent="")
+    design.save_to(destination.create_subpath("srcs"))
+    testbench.save_to(destination.create_subpath("testbenches"))
+    SimulatedLayer(testbench, simulator, working_dir=build)(inputs)
+
+
+def _lstm(build: str, simulator: str) -> None:
+    model = LSTMNetwork(
+        [
+            FixedPointLSTMWithHardActivations(
+                total_bits=8, frac_bits=4, input_size=1, hidden_size=20, bias=True
+            ),
+            Linear(total_bits=8, frac_bits=4, in_features=20, out_features=1),
+        ]
+    )
+    design = model.create_design("lstm_network")
+    testbench = model.create_testbench("lstm_network_tb", design)
+    destination = OnDiskPath(build, parent="")
+    design.save_to(destination.create_subpath("lstm_network"))
+    testbench.save_to(destination)
+    runner = SIMULATORS[simulator](workdir=build, top_design_name=testbench.name)
+    runner.initialize()
+    runner.run()
+
+
+TESTBENCHES: dict[str, Callable[[str, str], None]] = dict(
+    linear=_linear, conv1d=_conv1d, lstm=_lstm
+)
+
+
+def main() -> None:
+    print(f"{'testbench':>10} {'simulator':>10} {'time [s]':>10}")
+    for name, simulate in TESTBENCHES.items():
+        for simulator in SIMULATORS:
+            if shutil.which(simulator) is None:
+                print(f"{name:>10} {simulator:>10} {'not found':>10}")
+                continue
+            with tempfile.TemporaryDirectory() as build:
+                start = time.perf_counter()
+                simulate(build, simulator)
+                seconds = time.perf_counter() - start
+            print(f"{name:>10} {simulator:>10} {seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import hashlib
+from typing import Optional
+
+from .savable import File, Path
+from .template import Template, TemplateExpander
+
+
+class DeduplicatingFile(File):
+    def __init__(self, path: "DeduplicatingPath", suffix: str) -> None:
+        self._path = path
+        self._suffix = suffix
+
+    def write(self, template: Template) -> None:
+        content = "\n".join(TemplateExpander(template).lines())
+        digest = hashlib.sha256(f"{self._suffix}\n{content}".encode()).hexdigest()
+        if digest in self._path.written:
+            return
+        self._path.written.add(digest)
+        self._path.resolve().as_file(self._suffix).write(template)
+
+
+class DeduplicatingPath(Path):
+    """Writes files with identical suffix and content only once.
+
+    Shared designs, like the MAC unit of every serial conv1d layer or the RAM
+    of every lstm cell, are saved by each of their users. VHDL references
+    entities by name, so the first copy serves all of them. Subpaths are
+    created on the wrapped path only once a file is written to them, skipped
+    duplicates do not leave empty folders behind.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        parent: Optional["DeduplicatingPath"] = None,
+        name: str = "",
+    ) -> None:
+        self._path = path
+        self._parent = parent
+        self._name = name
+        self.written: set[str] = set() if parent is None else parent.written
+
+    def resolve(self) -> Path:
+        if self._path is None:
+            assert self._parent is not None
+            self._path = self._parent.resolve().create_subpath(self._name)
+        return self._path
+
+    def create_subpath(self, subpath_name: str) -> "DeduplicatingPath":
+        return DeduplicatingPath(parent=self, name=subpath_name)
+
+    def as_file(self, suffix: str) -> DeduplicatingFile:
+        return DeduplicatingFile(self, suffix)
+
+
+def deduplicated(path: Path) -> DeduplicatingPath:
+    """Wraps `path` unless it deduplicates already, so nested designs share
+    the registry of the outermost one."""
+    if isinstance(path, DeduplicatingPath):
+        return path
+    return DeduplicatingPath(path)
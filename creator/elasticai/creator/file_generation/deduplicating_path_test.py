@@ -0,0 +1,51 @@
+from dataclasses import dataclass, field
+
+from .deduplicating_path import DeduplicatingPath, deduplicated
+from .in_memory_path import InMemoryFile, InMemoryPath
+
+
+@dataclass
+class Template:
+    content: list[str]
+    parameters: dict[str, str | list[str]] = field(default_factory=dict)
+
+
+def test_identical_files_are_written_once() -> None:
+    root = InMemoryPath("build", parent=None)
+    destination = DeduplicatingPath(root)
+    destination.create_subpath("a").create_subpath("mac").as_file(".vhd").write(
+        Template(["entity mac"])
+    )
+    destination.create_subpath("b").create_subpath("mac").as_file(".vhd").write(
+        Template(["entity mac"])
+    )
+    assert list(root.children) == ["a"]
+
+
+def test_files_with_different_content_are_written() -> None:
+    root = InMemoryPath("build", parent=None)
+    destination = DeduplicatingPath(root)
+    destination.create_subpath("a").as_file(".vhd").write(Template(["entity a"]))
+    destination.create_subpath("b").as_file(".vhd").write(Template(["entity b"]))
+    assert list(root.children) == ["a", "b"]
+
+
+def test_content_is_compared_after_filling_the_template() -> None:
+    root = InMemoryPath("build", parent=None)
+    destination = DeduplicatingPath(root)
+    for name in ("a", "b"):
+        destination.create_subpath(name).as_file(".vhd").write(
+            Template(["entity $name"], dict(name=name))
+        )
+    file = root["b"]
+    assert isinstance(file, InMemoryFile)
+    assert file.text == ["entity b"]
+
+
+def test_nested_wrapping_shares_the_registry() -> None:
+    root = InMemoryPath("build", parent=None)
+    destination = deduplicated(root)
+    destination.create_subpath("a").as_file(".vhd").write(Template(["entity mac"]))
+    nested = deduplicated(destination.create_subpath("b"))
+    nested.create_subpath("mac").as_file(".vhd").write(Template(["entity mac"]))
+    assert list(root.children) == ["a"]
@@ -0,0 +1,62 @@
+from pathlib import Path as _PyPath
+
+from .savable import File, Path
+from .template import Template, TemplateExpander
+
+
+class IncrementalFile(File):
+    def __init__(self, path: "IncrementalPath", full_path: str) -> None:
+        self._path = path
+        self._full_path = full_path
+
+    def write(self, template: Template) -> None:
+        expander = TemplateExpander(template)
+        unfilled_variables = expander.unfilled_variables()
+        if len(unfilled_variables) > 0:
+            raise KeyError(
+                "Template is not filled completly. The following variables are"
+                f" unfilled: {', '.join(unfilled_variables)}."
+            )
+        content = "".join(f"{line}\n" for line in expander.lines())
+        full_path = _PyPath(self._full_path)
+        if full_path.is_file() and full_path.read_text() == content:
+            self._path.unchanged.append(self._full_path)
+            return
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text(content)
+        self._path.written.append(self._full_path)
+
+
+class IncrementalPath(Path):
+    """Writes files like `OnDiskPath`, but leaves files untouched that
+    already hold the same content.
+
+    Regenerating a design after changing one of its layers then only
+    rewrites the files of that layer and of the designs connecting it,
+    other files keep their modification time, so build tools can skip
+    them. The files of a generation run are recorded in `written` and
+    `unchanged`. Files of removed designs are not deleted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parent: str = ".",
+        *,
+        written: list[str] | None = None,
+        unchanged: list[str] | None = None,
+    ) -> None:
+        self._full_path = f"{parent}/{name}"
+        self.written: list[str] = [] if written is None else written
+        self.unchanged: list[str] = [] if unchanged is None else unchanged
+
+    def create_subpath(self, name: str) -> "IncrementalPath":
+        return IncrementalPath(
+            name,
+            parent=self._full_path,
+            written=self.written,
+            unchanged=self.unchanged,
+        )
+
+    def as_file(self, suffix: str) -> IncrementalFile:
+        return IncrementalFile(self, full_path=f"{self._full_path}{suffix}")
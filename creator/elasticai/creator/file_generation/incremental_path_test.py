@@ -0,0 +1,33 @@
+import os
+from dataclasses import dataclass, field
+
+from .incremental_path import IncrementalPath
+
+
+@dataclass
+class Template:
+    content: list[str]
+    parameters: dict[str, str | list[str]] = field(default_factory=dict)
+
+
+def _save(build: str, **entities: str) -> IncrementalPath:
+    destination = IncrementalPath("build", parent=build)
+    for name, content in entities.items():
+        destination.create_subpath(name).as_file(".vhd").write(Template([content]))
+    return destination
+
+
+def test_writes_new_files(tmp_path) -> None:
+    destination = _save(str(tmp_path), a="entity a")
+    assert [f"{tmp_path}/build/a.vhd"] == destination.written
+    assert "entity a\n" == (tmp_path / "build" / "a.vhd").read_text()
+
+
+def test_leaves_files_with_same_content_untouched(tmp_path) -> None:
+    _save(str(tmp_path), a="entity a", b="entity b")
+    file = tmp_path / "build" / "a.vhd"
+    os.utime(file, (0, 0))
+    destination = _save(str(tmp_path), a="entity a", b="entity b2")
+    assert [f"{tmp_path}/build/a.vhd"] == destination.unchanged
+    assert [f"{tmp_path}/build/b.vhd"] == destination.written
+    assert 0 == file.stat().st_mtime
@@ -10,10 +10,23 @@ __all__ = [
     "LoweringPass",
     "Lowerable",
     "Graph",
+    "load_graph",
+    "save_graph",
+    "Pattern",
+    "Replacement",
+    "Rule",
+    "find_matches",
+    "rewrite",
+    "GraphDiff",
+    "content_hash",
+    "diff",
 ]
 from .core import Edge, Node, edge, node
+from .diffing import GraphDiff, content_hash, diff
 from .graph import Graph
 from .ir_data import IrData
 from .ir_data_meta import IrDataMeta
 from .lowering import Lowerable, LoweringPass
 from .required_field import RequiredField, SimpleRequiredField
+from .rewriting import Pattern, Replacement, Rule, find_matches, rewrite
+from .serialization import load_graph, save_graph
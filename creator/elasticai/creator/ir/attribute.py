@@ -1,6 +1,14 @@
 from typing import TypeAlias
 
+import numpy as np
+import numpy.typing as npt
+
 SizeT: TypeAlias = tuple[int] | tuple[int, int] | tuple[int, int, int]
 Attribute: TypeAlias = (
-    int | float | str | tuple["Attribute", ...] | dict[str, "Attribute"]
+    int
+    | float
+    | str
+    | tuple["Attribute", ...]
+    | dict[str, "Attribute"]
+    | npt.NDArray[np.integer]
 )
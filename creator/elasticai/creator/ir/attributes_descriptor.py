@@ -22,7 +22,11 @@ class _ReadOnlyMappingWithHiddenFields(Mapping[str, Attribute]):
         return key in self._mapping and key not in self._hidden_fields
 
     def __len__(self) -> int:
-        return len(set(self._mapping.keys()).difference(self._hidden_fields))
+        length = len(self._mapping)
+        for key in self._hidden_fields:
+            if key in self._mapping:
+                length -= 1
+        return length
 
     def __iter__(self) -> Iterator[str]:
         for key in self._mapping:
@@ -1,10 +1,12 @@
+import sys
+
 from .attribute import Attribute
 from .ir_data import IrData
-from .required_field import ReadOnlyField
+from .required_field import ReadOnlyField, SimpleReadOnlyField
 
 
 def _read_only_str() -> ReadOnlyField[str, str]:
-    return ReadOnlyField(lambda x: x)
+    return SimpleReadOnlyField()
 
 
 class Node(IrData):
@@ -34,7 +36,9 @@ class Edge(IrData):
 def node(name: str, type: str, attributes: dict[str, Attribute] | None = None) -> Node:
     if attributes is None:
         attributes = dict()
-    return Node(dict(name=name, type=type, **attributes))
+    # graphs hold many nodes of few types, read e.g. from files, interning
+    # keeps a single copy of each type string
+    return Node(dict(name=name, type=sys.intern(type), **attributes))
 
 
 def edge(src: str, sink: str, attributes: dict[str, Attribute] | None = None) -> Edge:
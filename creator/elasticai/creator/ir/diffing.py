@@ -0,0 +1,123 @@
+"""Differences between two versions of an `ir.Graph`, e.g. before and after
+fine tuning a single layer.
+
+Nodes are compared by name and by a hash of their data, so weights do not
+need to be compared element by element with the old version in memory.
+Only the nodes in `GraphDiff.to_lower` need to be lowered and saved again,
+all others produce the same code as before.
+"""
+
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from hashlib import blake2b
+
+import numpy as np
+
+from .attribute import Attribute
+from .core import Node
+from .graph import Graph
+
+
+def content_hash(data: Attribute) -> bytes:
+    """Hash of `data`, equal for equal data regardless of the order of
+    dict keys. Arrays are hashed by dtype, shape and content."""
+    h = blake2b(digest_size=16)
+    for chunk in _chunks(data):
+        h.update(chunk)
+    return h.digest()
+
+
+def _chunks(value: Attribute) -> Iterator[bytes]:
+    if isinstance(value, np.ndarray):
+        yield f"a{value.dtype.str}{value.shape}".encode()
+        yield np.ascontiguousarray(value).tobytes()
+    elif isinstance(value, dict):
+        yield f"d{len(value)}".encode()
+        for key in sorted(value):
+            yield _sized(key.encode())
+            yield from _chunks(value[key])
+    elif isinstance(value, tuple):
+        yield f"t{len(value)}".encode()
+        for item in value:
+            yield from _chunks(item)
+    else:
+        yield _sized(f"{type(value).__name__}:{value!r}".encode())
+
+
+def _sized(b: bytes) -> bytes:
+    return struct.pack("<Q", len(b)) + b
+
+
+@dataclass(frozen=True)
+class GraphDiff:
+    """Names of nodes by the way they changed from the old to the new graph.
+
+    `changed` nodes differ in their data, `rewired` nodes only in their
+    predecessors, successors or the data of the edges connecting them.
+    """
+
+    added: frozenset[str]
+    removed: frozenset[str]
+    changed: frozenset[str]
+    rewired: frozenset[str]
+
+    @property
+    def to_lower(self) -> frozenset[str]:
+        """Nodes of the new graph whose code has to be generated again."""
+        return self.added | self.changed | self.rewired
+
+    @property
+    def topology_changed(self) -> bool:
+        """Whether code connecting the nodes, e.g. of the enclosing network,
+        has to be generated again."""
+        return bool(self.added or self.removed or self.rewired)
+
+    def nodes_to_lower(self, new: Graph) -> Iterator[Node]:
+        """The nodes of `to_lower` in the order of `new`, e.g. as input for
+        a `LoweringPass`."""
+        to_lower = self.to_lower
+        for name, node in new.nodes.items():
+            if name in to_lower:
+                yield node
+
+    def __bool__(self) -> bool:
+        return bool(self.removed or self.to_lower)
+
+
+def diff(old: Graph, new: Graph) -> GraphDiff:
+    """Compares nodes of the same name, which is how nodes are identified
+    between the versions, e.g. the names of `to_ir` stay the same as long as
+    the model keeps its structure."""
+    old_names = set(old.nodes)
+    new_names = set(new.nodes)
+    kept = old_names & new_names
+    changed = {
+        name
+        for name in kept
+        if content_hash(old.nodes[name].data) != content_hash(new.nodes[name].data)
+    }
+    rewired = {
+        name
+        for name in kept - changed
+        if _neighbourhood(old, name) != _neighbourhood(new, name)
+    }
+    return GraphDiff(
+        added=frozenset(new_names - old_names),
+        removed=frozenset(old_names - new_names),
+        changed=frozenset(changed),
+        rewired=frozenset(rewired),
+    )
+
+
+def _neighbourhood(graph: Graph, name: str) -> tuple[set, set]:
+    return (
+        {
+            (s, content_hash(graph.edges[(name, s)].data))
+            for s in graph.successors(name)
+        },
+        {
+            (p, content_hash(graph.edges[(p, name)].data))
+            for p in graph.predecessors(name)
+        },
+    )
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from .core import edge, node
+from .diffing import content_hash, diff
+from .graph import Graph
+
+
+def _graph(weight: list[int], act: str = "relu") -> Graph:
+    return Graph(
+        nodes=(
+            node("x", "input"),
+            node("fc", "linear", dict(weight=np.array(weight, dtype=np.int8))),
+            node("act", act),
+            node("y", "output"),
+        ),
+        edges=(edge("x", "fc"), edge("fc", "act"), edge("act", "y")),
+    )
+
+
+def test_hash_ignores_order_of_keys() -> None:
+    assert content_hash(dict(a=1, b=(2, "c"))) == content_hash(dict(b=(2, "c"), a=1))
+
+
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        (1, "1"),
+        (1, 1.0),
+        ((1, 2), (1, (2,))),
+        (np.array([1], dtype=np.int8), np.array([1], dtype=np.int16)),
+        (np.array([1, 2]), np.array([[1, 2]])),
+    ],
+)
+def test_hash_distinguishes_types_and_shapes(a, b) -> None:
+    assert content_hash(a) != content_hash(b)
+
+
+def test_equal_graphs_do_not_differ() -> None:
+    assert not diff(_graph([1, 2]), _graph([1, 2]))
+
+
+def test_changed_weights_only_lower_their_node() -> None:
+    d = diff(_graph([1, 2]), _graph([1, 3]))
+    assert {"fc"} == d.to_lower
+    assert not d.topology_changed
+
+
+def test_replaced_node_rewires_its_neighbours() -> None:
+    old = _graph([1, 2])
+    new = _graph([1, 2], act="hardtanh")
+    new.remove_node("act")
+    new.add_node(node("tanh", "hardtanh"))
+    new.add_edges((edge("fc", "tanh"), edge("tanh", "y")))
+    d = diff(old, new)
+    assert {"act"} == d.removed
+    assert {"tanh"} == d.added
+    assert {"fc", "y"} == d.rewired
+    assert ["fc", "y", "tanh"] == [n.name for n in d.nodes_to_lower(new)]
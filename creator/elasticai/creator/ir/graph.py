@@ -16,12 +16,41 @@ class Graph(Generic[N, E]):
         self._g: GraphDelegate[str] = GraphDelegate()
         self._edge_data: dict[tuple[str, str], E] = dict()
         self._node_data: dict[str, N] = dict()
+        self._names_by_type: dict[str, dict[str, None]] = dict()
+        self._indexed_type: dict[str, str] = dict()
         self.add_edges(edges)
         self.add_nodes(nodes)
 
     def add_node(self: Self, n: N) -> None:
+        """Adds `n` or replaces the node of the same name."""
+        if n.name in self._node_data:
+            self._unindex(n.name)
         self._g.add_node(n.name)
         self._node_data[n.name] = n
+        self._indexed_type[n.name] = n.type
+        self._names_by_type.setdefault(n.type, dict())[n.name] = None
+
+    def _unindex(self: Self, name: str) -> None:
+        """Uses the type the node was indexed with, its `data` may hold
+        another one by now."""
+        type = self._indexed_type.pop(name)
+        names = self._names_by_type[type]
+        del names[name]
+        if not names:
+            del self._names_by_type[type]
+
+    def remove_node(self: Self, node: str | N) -> None:
+        """Removes the node together with all its edges."""
+        if not isinstance(node, str):
+            node = node.name
+        for sink in self._g.successors[node]:
+            del self._edge_data[(node, sink)]
+        for src in self._g.predecessors[node]:
+            self._edge_data.pop((src, node), None)
+        self._g.remove_node(node)
+        if node in self._node_data:
+            del self._node_data[node]
+            self._unindex(node)
 
     def add_nodes(self: Self, ns: Iterable[N]) -> None:
         for n in ns:
@@ -35,6 +64,20 @@ class Graph(Generic[N, E]):
         self._g.add_edge(e.src, e.sink)
         self._edge_data[(e.src, e.sink)] = e
 
+    def remove_edge(self: Self, src: str, sink: str) -> None:
+        self._g.remove_edge(src, sink)
+        del self._edge_data[(src, sink)]
+
+    def nodes_of_type(self: Self, type: str) -> Mapping[str, N]:
+        """All nodes of `type` in the order they were added, without
+        visiting any other node.
+
+        The index is updated by adding and removing nodes. Nodes whose
+        `type` is changed in their `data` stay listed under their old type
+        until they are added again.
+        """
+        return _NodesOfType(self._names_by_type.get(type, dict()), self._node_data)
+
     def successors(self: Self, node: str | N) -> Mapping[str, N]:
         if not isinstance(node, str):
             node = node.name
@@ -82,3 +125,23 @@ class _ReadOnlyMappingInOrderAsIterable(Mapping[_K, _V]):
 
     def __getitem__(self, k: _K) -> _V:
         return self._d[k]
+
+
+class _NodesOfType(Mapping[str, _V]):
+    def __init__(self, names: dict[str, None], d: dict[str, _V]):
+        self._names = names
+        self._d = d
+
+    def __iter__(self) -> Iterator[str]:
+        yield from tuple(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, k: object) -> bool:
+        return k in self._names
+
+    def __getitem__(self, k: str) -> _V:
+        if k not in self._names:
+            raise KeyError(k)
+        return self._d[k]
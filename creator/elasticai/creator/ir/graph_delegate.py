@@ -45,6 +45,18 @@ class GraphDelegate(Generic[_T]):
             self.successors[node] = set()
         return self
 
+    def remove_edge(self, _from: _T, _to: _T):
+        self.successors[_from].discard(_to)
+        self.predecessors[_to].discard(_from)
+        return self
+
+    def remove_node(self, node: _T):
+        for _to in self.successors.pop(node):
+            self.predecessors[_to].discard(node)
+        for _from in self.predecessors.pop(node):
+            self.successors[_from].discard(node)
+        return self
+
     def iter_nodes(self) -> Iterator[_T]:
         """Iterator over nodes in a fixed but unspecified order."""
         yield from self.predecessors.keys()
@@ -43,3 +43,28 @@ def test_predecessors_of_z_is_y(graph) -> None:
 def test_successor_of_x_is_y(graph) -> None:
     n = next(iter(graph.successors("x").values()))
     assert graph.nodes["y"] is n
+
+
+def test_nodes_of_type_follow_adding_and_removing(graph) -> None:
+    graph.add_node(node(name="w", type="u"))
+    graph.add_node(node(name="y", type="u"))
+    graph.remove_node("x")
+    assert ["z"] == list(graph.nodes_of_type("t"))
+    assert ["w", "y"] == list(graph.nodes_of_type("u"))
+
+
+def test_removing_a_node_removes_its_edges(graph) -> None:
+    graph.remove_node("y")
+    assert [] == list(graph.edges)
+    assert [] == list(graph.successors("x"))
+
+
+def test_node_with_changed_type_is_reindexed_when_added_again(graph) -> None:
+    n = graph.nodes["y"]
+    n.data["type"] = "u"
+    assert ["x", "y", "z"] == list(graph.nodes_of_type("t"))
+    graph.add_node(n)
+    assert ["x", "z"] == list(graph.nodes_of_type("t"))
+    assert ["y"] == list(graph.nodes_of_type("u"))
+    graph.remove_node(n)
+    assert [] == list(graph.nodes_of_type("u"))
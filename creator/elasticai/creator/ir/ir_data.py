@@ -1,6 +1,8 @@
 from collections.abc import Callable
 from typing import TypeVar
 
+import numpy as np
+
 from .attribute import Attribute
 from .attributes_descriptor import AttributesDescriptor
 from .ir_data_meta import IrDataMeta
@@ -30,9 +32,21 @@ class IrData(metaclass=IrDataMeta, create_init=False):
         if self is o:
             return True
         if isinstance(o, self.__class__):
-            return o.data == self.data
+            return _equal_attributes(o.data, self.data)
         return False
 
 
+def _equal_attributes(a: Attribute, b: Attribute) -> bool:
+    """Equality of attributes that may contain arrays, e.g. weights, which
+    do not compare to a single bool."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal_attributes(a[k], b[k]) for k in a)
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(map(_equal_attributes, a, b))
+    return a == b
+
+
 def ir_data_class(cls) -> Callable[[dict[str, Attribute]], IrData]:
     return type(cls.__name__, (cls, IrData), {})
@@ -59,7 +59,7 @@ class IrDataMeta(type):
         """
         create_init = kwds.get("create_init", True)
         namespace = super().__prepare__(name, bases, **kwds)
-        cls.__add_data_slot(namespace)
+        cls.__add_data_slot(namespace, bases)
         if create_init:
             cls.__add_init(namespace)
         namespace["_fields"] = {}
@@ -107,8 +107,14 @@ class IrDataMeta(type):
         return inherited_fields
 
     @staticmethod
-    def __add_data_slot(namespace: dict[str, Any]) -> None:
-        namespace["__slots__"] = ("data",) + namespace.get("__slots__", tuple())
+    def __add_data_slot(namespace: dict[str, Any], bases: tuple[type, ...]) -> None:
+        """Children inherit the slot, repeating it would add an unused
+        pointer to every instance."""
+        slots = namespace.get("__slots__", tuple())
+        if any(isinstance(b, IrDataMeta) for b in resolve_bases(bases)):
+            namespace["__slots__"] = slots
+        else:
+            namespace["__slots__"] = ("data",) + slots
 
     @staticmethod
     def __get_user_defined_fields_from_annotations(
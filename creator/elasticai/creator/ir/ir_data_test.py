@@ -1,6 +1,7 @@
 from .ir_data_meta import IrDataMeta
 from .required_field import RequiredField, ReadOnlyField
 from .ir_data import IrData
+import numpy as np
 import pytest
 
 
@@ -124,3 +125,40 @@ def test_read_only_field_is_detected() -> None:
         name: ReadOnlyField[str, str] = ReadOnlyField(lambda x: x)
 
     assert "name" in Node.required_fields
+
+
+def test_data_holding_arrays_compares_by_value() -> None:
+    class Node(IrData):
+        weight: tuple
+
+    assert Node(dict(weight=np.array([1, 2]), shape=(2,))) == Node(
+        dict(weight=np.array([1, 2]), shape=(2,))
+    )
+    assert Node(dict(weight=np.array([1, 2]))) != Node(dict(weight=np.array([1, 3])))
+
+
+def test_attributes_length_excludes_present_mandatory_fields() -> None:
+    class Node(IrData):
+        name: str
+        type: str
+
+    assert 2 == len(Node(dict(name="x", a=1, b=2)).attributes)
+
+
+def test_children_do_not_repeat_data_slot() -> None:
+    class Node(IrData):
+        name: str
+
+    class Sub(Node):
+        type: str
+
+    assert () == Node.__slots__ == Sub.__slots__
+
+
+def test_simple_required_field_writes_into_data() -> None:
+    class Node(IrData):
+        name: str
+
+    n = Node(dict(name="x"))
+    n.name = "y"
+    assert dict(name="y") == n.data
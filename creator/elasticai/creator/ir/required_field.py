@@ -64,15 +64,28 @@ class RequiredField(Generic[StoredT, VisibleT]):
         instance.data[self.name] = self.set_convert(value)
 
 
+def _identity(x):
+    return x
+
+
 class SimpleRequiredField(RequiredField[StoredT, StoredT]):
-    slots = ("get_convert", "set_convert", "name")
+    """Stores values as they are. Reads and writes skip the conversion, as
+    they happen for every field of every node in passes over large graphs."""
+
+    __slots__ = ()
 
     def __init__(self):
-        super().__init__(lambda x: x, lambda x: x)
+        super().__init__(_identity, _identity)
+
+    def __get__(self, instance: HasData, owner=None) -> StoredT:
+        return cast(StoredT, instance.data[self.name])
+
+    def __set__(self, instance: HasData, value: StoredT) -> None:
+        instance.data[self.name] = value
 
 
 class ReadOnlyField(Generic[StoredT, VisibleT]):
-    slots = ("get_convert",)
+    __slots__ = ("get_convert", "name")
 
     def __init__(self, get_convert: Callable[[StoredT], VisibleT]) -> None:
         self.get_convert = get_convert
@@ -86,5 +99,17 @@ class ReadOnlyField(Generic[StoredT, VisibleT]):
         return self.get_convert(cast(StoredT, instance.data[self.name]))
 
 
+class SimpleReadOnlyField(ReadOnlyField[StoredT, StoredT]):
+    """Read only counterpart of `SimpleRequiredField`."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(_identity)
+
+    def __get__(self, instance: HasData, owner: type[HasData] | None = None) -> StoredT:
+        return cast(StoredT, instance.data[self.name])
+
+
 def is_required_field(o: object) -> TypeIs[RequiredField | ReadOnlyField]:
     return isinstance(o, RequiredField) or isinstance(o, ReadOnlyField)
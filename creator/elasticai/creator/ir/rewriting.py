@@ -0,0 +1,187 @@
+"""Rewriting of small subgraphs of an `ir.Graph`, e.g. merging every
+`linear` node followed by a `relu` into a single node.
+
+A `Pattern` names its nodes and gives their types and the edges between
+them. Matching starts at the nodes of the least frequent type of the
+pattern, found through the type index of the graph, and only follows
+edges of the candidates from there. Rewriting therefore visits the
+matches and their neighbours, not the whole graph.
+"""
+
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TypeAlias
+
+from .core import Edge, Node, edge
+from .graph import Graph
+
+Match: TypeAlias = Mapping[str, Node]
+"""Pattern node names mapped to the graph nodes they matched."""
+
+
+@dataclass(frozen=True)
+class Pattern:
+    """A connected subgraph of typed nodes, e.g.
+
+    ```python
+    Pattern(nodes=dict(fc="linear", act="relu"), edges=(("fc", "act"),))
+    ```
+
+    `where` can restrict matches further, e.g. to nodes whose outputs are
+    not used outside of the match.
+    """
+
+    nodes: Mapping[str, str]
+    edges: tuple[tuple[str, str], ...] = ()
+    where: Callable[[Graph, Match], bool] = lambda graph, match: True
+
+    def __post_init__(self) -> None:
+        for src, sink in self.edges:
+            if src not in self.nodes or sink not in self.nodes:
+                raise ValueError(f"edge {src} -> {sink} of unknown pattern nodes.")
+        first = next(iter(self.nodes))
+        if len(self._search_order(first)) != len(self.nodes):
+            raise ValueError("pattern nodes need to be connected.")
+
+    @classmethod
+    def chain(cls, *types: str, **named_types: str) -> "Pattern":
+        """Nodes connected one after another, named by keyword or their
+        position, e.g. `Pattern.chain(fc="linear", act="relu")`."""
+        nodes = {str(i): t for i, t in enumerate(types)} | named_types
+        names = list(nodes)
+        return cls(nodes=nodes, edges=tuple(zip(names, names[1:])))
+
+    def _search_order(self, anchor: str) -> list[tuple[str, str, bool]]:
+        """Pattern nodes reachable from `anchor`, each with an already
+        visited neighbour and whether it is a successor of that neighbour."""
+        order = [(anchor, anchor, True)]
+        visited = {anchor}
+        for name, _, _ in order:
+            for src, sink in self.edges:
+                if src == name and sink not in visited:
+                    order.append((sink, name, True))
+                    visited.add(sink)
+                elif sink == name and src not in visited:
+                    order.append((src, name, False))
+                    visited.add(src)
+        return order
+
+
+def find_matches(graph: Graph, pattern: Pattern) -> Iterator[dict[str, Node]]:
+    """All matches of `pattern` in `graph`, possibly overlapping."""
+    anchor = min(
+        pattern.nodes, key=lambda n: len(graph.nodes_of_type(pattern.nodes[n]))
+    )
+    order = pattern._search_order(anchor)
+
+    def extend(match: dict[str, Node]) -> Iterator[dict[str, Node]]:
+        if len(match) == len(order):
+            if pattern.where(graph, match):
+                yield dict(match)
+            return
+        name, neighbour, is_successor = order[len(match)]
+        known = match[neighbour].name
+        candidates = (
+            graph.successors(known) if is_successor else graph.predecessors(known)
+        )
+        used = {n.name for n in match.values()}
+        for candidate in candidates:
+            node = graph.nodes.get(candidate)
+            if (
+                node is not None
+                and candidate not in used
+                and node.type == pattern.nodes[name]
+                and _has_pattern_edges(graph, pattern, match, name, candidate)
+            ):
+                match[name] = node
+                yield from extend(match)
+                del match[name]
+
+    for node in graph.nodes_of_type(pattern.nodes[anchor]).values():
+        if node.type == pattern.nodes[anchor]:
+            yield from extend({anchor: node})
+
+
+def _has_pattern_edges(
+    graph: Graph, pattern: Pattern, match: Match, name: str, candidate: str
+) -> bool:
+    for src, sink in pattern.edges:
+        if src == name and sink in match:
+            if (candidate, match[sink].name) not in graph.edges:
+                return False
+        elif sink == name and src in match:
+            if (match[src].name, candidate) not in graph.edges:
+                return False
+    return True
+
+
+@dataclass(frozen=True)
+class Replacement:
+    """Nodes and edges taking the place of a match.
+
+    Edges between the match and the rest of the graph are moved to the
+    replacement node of the same name, or to the node given by `rewire`
+    for the name of the replaced node. Edges of replaced nodes without
+    such a node are removed.
+    """
+
+    nodes: Sequence[Node]
+    edges: Sequence[Edge] = ()
+    rewire: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class Rule:
+    pattern: Pattern
+    replace: Callable[[Match], Replacement]
+
+
+def rewrite(graph: Graph, rules: Sequence[Rule]) -> int:
+    """Applies the rules one after another, each to all its matches in
+    `graph` at once, and returns the number of replaced matches.
+
+    Matches of one rule that share nodes with an earlier match of the same
+    rule are skipped.
+    """
+    replaced = 0
+    for rule in rules:
+        batch = []
+        used: set[str] = set()
+        for match in find_matches(graph, rule.pattern):
+            names = {n.name for n in match.values()}
+            if used.isdisjoint(names):
+                used |= names
+                batch.append(match)
+        for match in batch:
+            _replace(graph, match, rule.replace(match))
+        replaced += len(batch)
+    return replaced
+
+
+def _replace(graph: Graph, match: Match, replacement: Replacement) -> None:
+    replaced = {n.name for n in match.values()}
+    new = {n.name for n in replacement.nodes}
+    target = {name: name for name in replaced if name in new}
+    target.update(replacement.rewire)
+    outside = [
+        e
+        for name in replaced
+        for e in _edges_of(graph, name)
+        if e.src not in replaced or e.sink not in replaced
+    ]
+    for name in replaced:
+        graph.remove_node(name)
+    graph.add_nodes(replacement.nodes)
+    graph.add_edges(replacement.edges)
+    for e in outside:
+        src = target.get(e.src) if e.src in replaced else e.src
+        sink = target.get(e.sink) if e.sink in replaced else e.sink
+        if src is not None and sink is not None:
+            graph.add_edge(edge(src, sink, dict(e.attributes)))
+
+
+def _edges_of(graph: Graph, name: str) -> Iterator[Edge]:
+    for sink in graph.successors(name):
+        yield graph.edges[(name, sink)]
+    for src in graph.predecessors(name):
+        yield graph.edges[(src, name)]
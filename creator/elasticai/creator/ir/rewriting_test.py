@@ -0,0 +1,102 @@
+import pytest
+
+from .core import edge, node
+from .graph import Graph
+from .rewriting import Pattern, Replacement, Rule, find_matches, rewrite
+
+
+@pytest.fixture
+def graph() -> Graph:
+    return Graph(
+        nodes=(
+            node("x", "input"),
+            node("fc_0", "linear"),
+            node("act_0", "relu"),
+            node("fc_1", "linear"),
+            node("act_1", "relu"),
+            node("fc_2", "linear"),
+            node("y", "output"),
+        ),
+        edges=(
+            edge("x", "fc_0"),
+            edge("fc_0", "act_0"),
+            edge("act_0", "fc_1"),
+            edge("fc_1", "act_1"),
+            edge("act_1", "fc_2"),
+            edge("fc_2", "y", dict(width=8)),
+        ),
+    )
+
+
+def _fuse(match) -> Replacement:
+    fc, act = match["fc"], match["act"]
+    return Replacement(
+        nodes=(node(fc.name, "linear_relu"),), rewire={act.name: fc.name}
+    )
+
+
+def test_finds_linear_followed_by_relu(graph) -> None:
+    matches = find_matches(graph, Pattern.chain(fc="linear", act="relu"))
+    assert [("fc_0", "act_0"), ("fc_1", "act_1")] == [
+        (m["fc"].name, m["act"].name) for m in matches
+    ]
+
+
+def test_nodes_whose_type_changed_are_not_matched(graph) -> None:
+    graph.nodes["act_0"].data["type"] = "tanh"
+    matches = find_matches(graph, Pattern.chain(fc="linear", act="relu"))
+    assert ["fc_1"] == [m["fc"].name for m in matches]
+
+
+def test_where_restricts_matches(graph) -> None:
+    pattern = Pattern(
+        nodes=dict(fc="linear", act="relu"),
+        edges=(("fc", "act"),),
+        where=lambda g, m: m["fc"].name != "fc_0",
+    )
+    assert ["fc_1"] == [m["fc"].name for m in find_matches(graph, pattern)]
+
+
+def test_rewrite_replaces_all_matches_and_keeps_outer_edges(graph) -> None:
+    replaced = rewrite(graph, [Rule(Pattern.chain(fc="linear", act="relu"), _fuse)])
+    assert 2 == replaced
+    assert ["fc_0", "fc_1"] == list(graph.nodes_of_type("linear_relu"))
+    assert [] == list(graph.nodes_of_type("relu"))
+    assert {
+        ("x", "fc_0"),
+        ("fc_0", "fc_1"),
+        ("fc_1", "fc_2"),
+        ("fc_2", "y"),
+    } == set(graph.edges)
+
+
+def test_rewrite_keeps_edge_attributes(graph) -> None:
+    rule = Rule(
+        Pattern.chain(fc="linear", out="output"),
+        lambda m: Replacement(
+            nodes=(node("fused", "linear"), node("y", "output")),
+            edges=(edge("fused", "y"),),
+            rewire={"fc_2": "fused"},
+        ),
+    )
+    rewrite(graph, [rule])
+    assert dict() == graph.edges[("fused", "y")].attributes
+    assert ("act_1", "fused") in graph.edges
+
+
+def test_overlapping_matches_are_replaced_once() -> None:
+    g = Graph(
+        nodes=(node("a", "t"), node("b", "t"), node("c", "t")),
+        edges=(edge("a", "b"), edge("b", "c")),
+    )
+    rule = Rule(
+        Pattern.chain("t", "t"),
+        lambda m: Replacement(nodes=(node(m["0"].name, "u"),)),
+    )
+    assert 1 == rewrite(g, [rule])
+    assert ["a", "c"] == sorted(g.nodes)
+
+
+def test_disconnected_patterns_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        Pattern(nodes=dict(a="linear", b="relu"))
@@ -0,0 +1,147 @@
+"""Binary files holding an `ir.Graph`, e.g. between exporting a model and
+generating hardware for it.
+
+A file starts with a magic number and the length of a JSON header holding
+the data of all nodes and edges. Arrays, like the weights of a layer, are
+replaced by references into the binary section after the header, where
+each array starts at a multiple of `ALIGNMENT`. `load_graph` maps that
+section into memory instead of reading it, so only the pages of arrays
+that are actually accessed are loaded. Loading neither reads nor copies
+the weights and does not need torch.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, BinaryIO, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .attribute import Attribute
+from .core import Edge, Node
+from .graph import Graph
+
+MAGIC = b"EAIGRAPH"
+VERSION = 1
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct("<8sIQ")
+_ARRAY_KEY = "__array__"
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGNMENT
+
+
+class _Encoder:
+    def __init__(self) -> None:
+        self.arrays: list[npt.NDArray[Any]] = []
+        self.entries: list[dict[str, Any]] = []
+        self._size = 0
+
+    def encode(self, value: Attribute) -> Any:
+        if isinstance(value, np.ndarray):
+            return {_ARRAY_KEY: self._add_array(value)}
+        if isinstance(value, dict):
+            if _ARRAY_KEY in value:
+                raise ValueError(f"the key '{_ARRAY_KEY}' is reserved.")
+            return {k: self.encode(v) for k, v in value.items()}
+        if isinstance(value, tuple):
+            return [self.encode(v) for v in value]
+        if isinstance(value, (str, int, float)):
+            return value
+        raise TypeError(f"cannot serialize attribute of type {type(value)}.")
+
+    def _add_array(self, array: npt.NDArray[Any]) -> int:
+        if array.dtype.kind not in "biuf":
+            raise TypeError(f"cannot serialize array of dtype {array.dtype}.")
+        array = np.ascontiguousarray(array)
+        self._size += _padding(self._size)
+        self.entries.append(
+            dict(dtype=array.dtype.str, shape=array.shape, offset=self._size)
+        )
+        self.arrays.append(array)
+        self._size += array.nbytes
+        return len(self.arrays) - 1
+
+
+def save_graph(graph: Graph, file: str | os.PathLike) -> None:
+    """Writes nodes and edges of `graph` with all their data.
+
+    Attributes may be of any `Attribute` type, dicts must not use the key
+    `"__array__"`.
+    """
+    encoder = _Encoder()
+    header = dict(
+        nodes=[encoder.encode(n.data) for n in graph.nodes.values()],
+        edges=[encoder.encode(e.data) for e in graph.edges.values()],
+    )
+    header["arrays"] = encoder.entries
+    encoded = json.dumps(header, separators=(",", ":")).encode()
+    with open(file, "wb") as f:
+        _write(f, encoded, encoder)
+
+
+def _write(f: BinaryIO, header: bytes, encoder: _Encoder) -> None:
+    f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+    f.write(header)
+    position = _PREAMBLE.size + len(header)
+    start = position + _padding(position)
+    for entry, array in zip(encoder.entries, encoder.arrays):
+        f.write(bytes(start + entry["offset"] - position))
+        f.write(array.tobytes())
+        position = start + entry["offset"] + array.nbytes
+
+
+def load_graph(file: str | os.PathLike) -> Graph[Node, Edge]:
+    """Reads a graph written by `save_graph`.
+
+    Arrays are read only views of the memory mapped file, that are valid
+    as long as they are referenced, even after the file was removed.
+    """
+    with open(file, "rb") as f:
+        magic, version, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f"{file} does not hold a graph.")
+        if version != VERSION:
+            raise ValueError(f"unsupported graph file version {version}.")
+        header = json.loads(f.read(header_length))
+        position = _PREAMBLE.size + header_length
+        start = position + _padding(position)
+        arrays = _map_arrays(f, header["arrays"], start)
+    graph: Graph[Node, Edge] = Graph()
+    graph.add_nodes(Node(_decode(data, arrays)) for data in header["nodes"])
+    graph.add_edges(Edge(_decode(data, arrays)) for data in header["edges"])
+    return graph
+
+
+def _map_arrays(
+    f: BinaryIO, entries: list[dict[str, Any]], start: int
+) -> list[npt.NDArray[Any]]:
+    if not entries:
+        return []
+    buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    arrays = []
+    for entry in entries:
+        dtype = np.dtype(entry["dtype"])
+        shape = tuple(entry["shape"])
+        array = np.frombuffer(
+            buffer,
+            dtype=dtype,
+            count=int(np.prod(shape, dtype=np.int64)),
+            offset=start + entry["offset"],
+        )
+        arrays.append(array.reshape(shape))
+    return arrays
+
+
+def _decode(value: Any, arrays: list[npt.NDArray[Any]]) -> Any:
+    if isinstance(value, dict):
+        if _ARRAY_KEY in value:
+            return arrays[value[_ARRAY_KEY]]
+        return {k: _decode(v, arrays) for k, v in value.items()}
+    if isinstance(value, list):
+        return tuple(_decode(v, arrays) for v in value)
+    return cast(Attribute, value)
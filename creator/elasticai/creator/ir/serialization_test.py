@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from .core import edge, node
+from .graph import Graph
+from .serialization import ALIGNMENT, load_graph, save_graph
+
+
+@pytest.fixture
+def graph() -> Graph:
+    return Graph(
+        nodes=(
+            node("x", "input", dict(shape=(1, 3))),
+            node(
+                "fc",
+                "linear",
+                dict(
+                    weight=np.arange(6, dtype=np.int8).reshape(2, 3),
+                    bias=np.array([-300, 7], dtype=np.int16),
+                    format=dict(total_bits=8, frac_bits=2),
+                    scale=0.5,
+                ),
+            ),
+            node("y", "output"),
+        ),
+        edges=(edge("x", "fc"), edge("fc", "y", dict(width=8))),
+    )
+
+
+def test_loaded_graph_equals_saved_graph(graph, tmp_path) -> None:
+    save_graph(graph, tmp_path / "g.bin")
+    loaded = load_graph(tmp_path / "g.bin")
+    assert list(graph.nodes) == list(loaded.nodes)
+    assert dict(graph.nodes) == dict(loaded.nodes)
+    assert dict(graph.edges) == dict(loaded.edges)
+
+
+def test_arrays_keep_dtype_and_are_mapped_read_only(graph, tmp_path) -> None:
+    save_graph(graph, tmp_path / "g.bin")
+    bias = load_graph(tmp_path / "g.bin").nodes["fc"].data["bias"]
+    assert np.int16 == bias.dtype
+    assert not bias.flags.writeable
+    assert 0 == bias.__array_interface__["data"][0] % ALIGNMENT
+
+
+def test_graph_without_arrays_can_be_loaded(tmp_path) -> None:
+    save_graph(Graph(nodes=(node("x", "t"),)), tmp_path / "g.bin")
+    assert ["x"] == list(load_graph(tmp_path / "g.bin").nodes)
+
+
+def test_rejects_files_not_holding_a_graph(tmp_path) -> None:
+    (tmp_path / "g.bin").write_bytes(bytes(32))
+    with pytest.raises(ValueError):
+        load_graph(tmp_path / "g.bin")
+
+
+def test_loading_does_not_import_torch(graph, tmp_path) -> None:
+    save_graph(graph, tmp_path / "g.bin")
+    script = (
+        "import sys\n"
+        "from elasticai.creator.ir.serialization import load_graph\n"
+        f"load_graph({str(tmp_path / 'g.bin')!r})\n"
+        "assert 'torch' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,8 @@
+from .exploration import (
+    Evaluation,
+    Exploration,
+    SearchSpace,
+    classification_accuracy,
+    evaluate,
+    pareto_front,
+)
@@ -0,0 +1,205 @@
+import hashlib
+import itertools
+import json
+import pathlib
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import Any
+
+import torch
+
+from elasticai.creator.nn.design_creator_module import DesignCreatorModule
+from elasticai.creator.vhdl.design.resources import Device, Resources
+from elasticai.creator.vhdl.design.timing import Timing
+from elasticai.creator.vhdl.system_integrations.firmware_env5 import ENV5_FPGA
+
+Configuration = dict[str, Any]
+ModelFactory = Callable[[Configuration], DesignCreatorModule]
+Metric = Callable[[torch.Tensor, torch.Tensor], float]
+
+
+class SearchSpace:
+    """All combinations of the given choices, e.g.
+
+    ```python
+    SearchSpace(total_bits=[6, 8], frac_bits=[2, 4], parallelism=[1, 2, 4])
+    ```
+    """
+
+    def __init__(self, **choices: Sequence[Any]) -> None:
+        self._choices = choices
+
+    def __iter__(self) -> Iterator[Configuration]:
+        names = list(self._choices)
+        for values in itertools.product(*self._choices.values()):
+            yield dict(zip(names, values))
+
+    def __len__(self) -> int:
+        length = 1
+        for values in self._choices.values():
+            length *= len(values)
+        return length
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    configuration: Configuration
+    accuracy: float
+    timing: Timing
+    resources: Resources
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Evaluation":
+        return cls(
+            configuration=dict(data["configuration"]),
+            accuracy=data["accuracy"],
+            timing=Timing(**data["timing"]),
+            resources=Resources(**data["resources"]),
+        )
+
+
+def classification_accuracy(prediction: torch.Tensor, target: torch.Tensor) -> float:
+    return (prediction.argmax(dim=-1) == target).float().mean().item()
+
+
+def pareto_front(
+    evaluations: Iterable[Evaluation], device: Device = ENV5_FPGA
+) -> list[Evaluation]:
+    """Evaluations no other evaluation beats in accuracy, latency and area
+    at once. Area is the utilization of `device`."""
+
+    def objectives(e: Evaluation) -> tuple[float, int, float]:
+        return (
+            -e.accuracy,
+            e.timing.latency_in_cycles,
+            e.resources.utilization(device),
+        )
+
+    def dominates(a: tuple, b: tuple) -> bool:
+        return all(x <= y for x, y in zip(a, b)) and a != b
+
+    candidates = [(objectives(e), e) for e in evaluations]
+    return [
+        evaluation
+        for scores, evaluation in candidates
+        if not any(dominates(other, scores) for other, _ in candidates)
+    ]
+
+
+def evaluate(
+    model_factory: ModelFactory,
+    dataset: tuple[torch.Tensor, torch.Tensor],
+    metric: Metric,
+    configuration: Configuration,
+) -> Evaluation:
+    """Builds the model for `configuration`, measures `metric` on `dataset`
+    in software and queries the timing and resource models of its design."""
+    model = model_factory(configuration)
+    inputs, targets = dataset
+    model.eval()
+    with torch.no_grad():
+        accuracy = metric(model(inputs), targets)
+    design = model.create_design("network")
+    return Evaluation(
+        configuration=configuration,
+        accuracy=accuracy,
+        timing=design.timing,
+        resources=design.resources,
+    )
+
+
+def _qualified_name(function: Callable) -> str:
+    """Identifies `function` in the cache, so it has to be defined at module
+    level, lambdas and local functions of the same name would collide."""
+    name = getattr(function, "__qualname__", "<unnamed>")
+    if "<" in name:
+        raise ValueError(f"{function!r} has no unique name, define it at module level.")
+    return f"{function.__module__}.{name}"
+
+
+def _fingerprint(tensors: Iterable[torch.Tensor]) -> str:
+    h = hashlib.sha256()
+    for tensor in tensors:
+        h.update(f"{tensor.dtype}{tuple(tensor.shape)}".encode())
+        h.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    return h.hexdigest()
+
+
+class Exploration:
+    """Evaluates every configuration of a search space and keeps the results.
+
+    The `model_factory` builds, and if needed trains, a model for a
+    configuration. With `workers > 1` configurations are evaluated in
+    separate processes, so `model_factory` and `metric` have to be picklable,
+    i.e. defined at module level.
+    Evaluations are cached by a hash of the configuration, the qualified
+    names of the factory and the metric and a fingerprint of the dataset,
+    so both have to be defined at module level in any case. With a
+    `cache_file` the cache survives between runs, so an interrupted or
+    extended exploration only evaluates new configurations.
+    """
+
+    def __init__(
+        self,
+        model_factory: ModelFactory,
+        dataset: tuple[torch.Tensor, torch.Tensor],
+        *,
+        metric: Metric = classification_accuracy,
+        workers: int = 1,
+        cache_file: str | pathlib.Path | None = None,
+    ) -> None:
+        self._evaluate = partial(evaluate, model_factory, dataset, metric)
+        self._factory_name = _qualified_name(model_factory)
+        self._metric_name = _qualified_name(metric)
+        self._dataset_fingerprint = _fingerprint(dataset)
+        self._workers = workers
+        self._cache_file = None if cache_file is None else pathlib.Path(cache_file)
+        self._cache: dict[str, Evaluation] = self._load_cache()
+
+    def _key(self, configuration: Configuration) -> str:
+        serialized = json.dumps(
+            [
+                self._factory_name,
+                self._metric_name,
+                self._dataset_fingerprint,
+                configuration,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _load_cache(self) -> dict[str, Evaluation]:
+        if self._cache_file is None or not self._cache_file.exists():
+            return {}
+        with self._cache_file.open() as f:
+            return {k: Evaluation.from_dict(v) for k, v in json.load(f).items()}
+
+    def _store_cache(self) -> None:
+        if self._cache_file is None:
+            return
+        with self._cache_file.open("w") as f:
+            json.dump({k: v.as_dict() for k, v in self._cache.items()}, f, indent=2)
+
+    def run(self, search_space: Iterable[Configuration]) -> list[Evaluation]:
+        configurations = {self._key(c): c for c in search_space}
+        missing = {k: c for k, c in configurations.items() if k not in self._cache}
+        if self._workers > 1 and len(missing) > 1:
+            with ProcessPoolExecutor(max_workers=self._workers) as pool:
+                results = pool.map(self._evaluate, missing.values())
+                self._cache.update(zip(missing, results))
+        else:
+            self._cache.update((k, self._evaluate(c)) for k, c in missing.items())
+        if missing:
+            self._store_cache()
+        return [self._cache[k] for k in configurations]
+
+    def pareto_front(
+        self, search_space: Iterable[Configuration], device: Device = ENV5_FPGA
+    ) -> list[Evaluation]:
+        return pareto_front(self.run(search_space), device)
@@ -0,0 +1,118 @@
+import pytest
+import torch
+
+from elasticai.creator.nn.fixed_point import Linear
+from elasticai.creator.nn.sequential import Sequential
+from elasticai.creator.vhdl.design.resources import Device, Resources
+from elasticai.creator.vhdl.design.timing import Timing
+
+from .exploration import (
+    Configuration,
+    Evaluation,
+    Exploration,
+    SearchSpace,
+    pareto_front,
+)
+
+created_models: list[Configuration] = []
+
+
+def constant_metric(prediction: torch.Tensor, target: torch.Tensor) -> float:
+    return 0.0
+
+
+def create_model(configuration: Configuration) -> Sequential:
+    created_models.append(configuration)
+    torch.manual_seed(0)
+    return Sequential(
+        Linear(
+            in_features=4,
+            out_features=3,
+            total_bits=configuration["total_bits"],
+            frac_bits=configuration["total_bits"] // 2,
+            parallelism=configuration["parallelism"],
+        )
+    )
+
+
+@pytest.fixture
+def dataset() -> tuple[torch.Tensor, torch.Tensor]:
+    generator = torch.Generator().manual_seed(1)
+    inputs = torch.rand(16, 4, generator=generator)
+    return inputs, torch.randint(0, 3, (16,), generator=generator)
+
+
+@pytest.fixture
+def space() -> SearchSpace:
+    return SearchSpace(total_bits=[6, 8], parallelism=[1, 3])
+
+
+def test_search_space_contains_all_combinations(space: SearchSpace) -> None:
+    assert len(space) == 4
+    assert list(space)[1] == dict(total_bits=6, parallelism=3)
+
+
+def test_evaluates_every_configuration(dataset, space: SearchSpace) -> None:
+    evaluations = Exploration(create_model, dataset).run(space)
+    assert [e.configuration for e in evaluations] == list(space)
+    assert [e.resources.dsps for e in evaluations] == [1, 3, 1, 3]
+    assert (
+        evaluations[0].timing.latency_in_cycles
+        > evaluations[1].timing.latency_in_cycles
+    )
+
+
+def test_cached_configurations_are_not_evaluated_again(
+    dataset, space: SearchSpace, tmp_path
+) -> None:
+    cache_file = tmp_path / "cache.json"
+    first = Exploration(create_model, dataset, cache_file=cache_file).run(space)
+    created_models.clear()
+    second = Exploration(create_model, dataset, cache_file=cache_file).run(space)
+    assert created_models == [] and second == first
+
+
+def test_changed_dataset_or_metric_invalidates_cache(
+    dataset, space: SearchSpace, tmp_path
+) -> None:
+    cache_file = tmp_path / "cache.json"
+    Exploration(create_model, dataset, cache_file=cache_file).run(space)
+    inputs, targets = dataset
+    created_models.clear()
+    Exploration(create_model, (inputs, targets.flip(0)), cache_file=cache_file).run(
+        space
+    )
+    assert len(created_models) == len(space)
+    created_models.clear()
+    Exploration(
+        create_model, dataset, metric=constant_metric, cache_file=cache_file
+    ).run(space)
+    assert len(created_models) == len(space)
+
+
+def test_rejects_metrics_without_unique_name(dataset) -> None:
+    with pytest.raises(ValueError):
+        Exploration(create_model, dataset, metric=lambda y, t: 0.0)
+
+
+def test_workers_produce_same_evaluations(dataset, space: SearchSpace) -> None:
+    sequential = Exploration(create_model, dataset).run(space)
+    parallel = Exploration(create_model, dataset, workers=2).run(space)
+    assert parallel == sequential
+
+
+def test_pareto_front_drops_dominated_evaluations() -> None:
+    device = Device("device", Resources(luts=100))
+
+    def evaluation(accuracy: float, latency: int, luts: int) -> Evaluation:
+        return Evaluation({}, accuracy, Timing(latency, latency + 1), Resources(luts))
+
+    fast = evaluation(0.8, 10, 50)
+    accurate = evaluation(0.9, 20, 50)
+    small = evaluation(0.8, 20, 10)
+    dominated = evaluation(0.8, 20, 50)
+    assert pareto_front([fast, accurate, small, dominated], device) == [
+        fast,
+        accurate,
+        small,
+    ]
@@ -1,3 +1,4 @@
+from .batch_norm_folding import fold_batch_norms
 from .conv1d import BatchNormedConv1d, Conv1d
 from .hard_sigmoid import HardSigmoid
 from .hard_tanh import HardTanh
@@ -0,0 +1,24 @@
+from typing import cast
+
+import torch
+
+
+def folded_parameters(
+    weight: torch.Tensor,
+    bias: torch.Tensor | None,
+    batch_norm: torch.nn.BatchNorm1d,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Weight and bias of a layer computing `batch_norm(layer(x))` with the
+    running statistics of `batch_norm`. The first dimension of `weight`
+    indexes the output channels."""
+    mean = cast(torch.Tensor, batch_norm.running_mean)
+    variance = cast(torch.Tensor, batch_norm.running_var)
+    scale = torch.rsqrt(variance + batch_norm.eps)
+    shift = -mean * scale
+    if batch_norm.affine:
+        scale = batch_norm.weight * scale
+        shift = batch_norm.weight * shift + batch_norm.bias
+    if bias is None:
+        bias = torch.zeros_like(scale)
+    channel_shape = (-1,) + (1,) * (weight.dim() - 1)
+    return weight * scale.view(channel_shape), bias * scale + shift
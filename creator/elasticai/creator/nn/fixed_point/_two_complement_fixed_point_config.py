@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from typing import Protocol, TypeVar, Union, cast, overload, runtime_checkable
 
+import torch
+
 T = TypeVar("T", bound="ConvertableToFixedPointValues")
 
 
@@ -65,6 +67,15 @@ class FixedPointConfig:
             return self._convert_T_to_integer(cast(T, number))
         return self._convert_float_or_int_to_integer(number)
 
+    def as_rounded_integer(self, number: torch.Tensor) -> torch.Tensor:
+        """Integer tensor of the fixed point values of `number`, like
+        `as_integer` does for a single python number.
+
+        Rounds half to even instead of truncating, as used for exporting
+        parameters to designs.
+        """
+        return (number * (1 << self.frac_bits)).round().int()
+
     @overload
     def as_rational(self, number: float | int) -> float: ...
 
@@ -0,0 +1,185 @@
+"""Folding of batch norms into the linear or conv1d layer they follow.
+
+In inference a batch norm scales and shifts every output channel by
+constants, so it can be merged into the weights and bias of the layer
+before it. The merged parameters are quantized like any other, the error
+this introduces is reported by `fold_batch_norms`.
+"""
+
+import copy
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import cast
+
+import torch
+
+from ._folded_batch_norm import folded_parameters
+from ._math_operations import MathOperations
+from ._two_complement_fixed_point_config import FixedPointConfig
+from .conv1d.layer import Conv1d
+from .linear.layer import Linear
+
+
+@dataclass(frozen=True)
+class FoldedBatchNorm:
+    """Quantization error of the folded parameters of one layer, in units of
+    the represented values. `saturated` counts the parameters that left the
+    range of the fixed point format by folding and were clamped."""
+
+    layer: str
+    batch_norm: str
+    max_weight_error: float
+    max_bias_error: float
+    saturated: int
+
+
+@dataclass(frozen=True)
+class FoldingReport:
+    folds: tuple[FoldedBatchNorm, ...]
+    max_output_error: float | None = None
+
+    def __str__(self) -> str:
+        lines = [
+            f"{fold.batch_norm} into {fold.layer}: weights off by at most"
+            f" {fold.max_weight_error:g}, bias by {fold.max_bias_error:g},"
+            f" {fold.saturated} saturated"
+            for fold in self.folds
+        ]
+        if self.max_output_error is not None:
+            lines.append(f"outputs off by at most {self.max_output_error:g}")
+        return "\n".join(lines)
+
+
+def _quantization_error(
+    values: torch.Tensor, config: FixedPointConfig
+) -> tuple[float, int]:
+    quantized = MathOperations(config).quantize(values)
+    saturated = config.rational_out_of_bounds(values)
+    return float((quantized - values).abs().max()), int(saturated.sum())
+
+
+def _channels(layer: Linear | Conv1d) -> int:
+    if isinstance(layer, Linear):
+        return layer.out_features
+    return layer.out_channels
+
+
+def fold_batch_norm(
+    layer: Linear | Conv1d, batch_norm: torch.nn.BatchNorm1d
+) -> Linear | Conv1d:
+    """A new layer of the same type and fixed point format computing `layer`
+    followed by `batch_norm` in inference."""
+    if _channels(layer) != batch_norm.num_features:
+        raise ValueError(
+            f"cannot fold a batch norm over {batch_norm.num_features} features"
+            f" into a layer with {_channels(layer)} outputs."
+        )
+    config = layer._config
+    folded: Linear | Conv1d
+    if isinstance(layer, Linear):
+        folded = Linear(
+            in_features=layer.in_features,
+            out_features=layer.out_features,
+            total_bits=config.total_bits,
+            frac_bits=config.frac_bits,
+            bias=True,
+            parallelism=layer.parallelism,
+        )
+    else:
+        folded = Conv1d(
+            total_bits=config.total_bits,
+            frac_bits=config.frac_bits,
+            in_channels=layer.in_channels,
+            out_channels=layer.out_channels,
+            signal_length=layer._signal_length,
+            kernel_size=layer.kernel_size,
+            bias=True,
+            parallelism=layer.parallelism,
+        )
+    weight, bias = folded_parameters(layer.weight, layer.bias, batch_norm)
+    folded.to(layer.weight.device)
+    folded.train(layer.training)
+    with torch.no_grad():
+        folded.weight.copy_(weight)
+        cast(torch.Tensor, folded.bias).copy_(bias)
+    return folded
+
+
+def _foldable_pairs(
+    children: list[tuple[str, torch.nn.Module]],
+) -> Iterator[int]:
+    for position, ((_, layer), (_, batch_norm)) in enumerate(
+        zip(children, children[1:])
+    ):
+        if (
+            isinstance(layer, (Linear, Conv1d))
+            and isinstance(batch_norm, torch.nn.BatchNorm1d)
+            and batch_norm.track_running_stats
+            and _channels(layer) == batch_norm.num_features
+        ):
+            yield position
+
+
+def fold_batch_norms(
+    model: torch.nn.Sequential, inputs: torch.Tensor | None = None
+) -> tuple[torch.nn.Sequential, FoldingReport]:
+    """A copy of `model`, where every `BatchNorm1d` that directly follows a
+    fixed point `Linear` or `Conv1d` is folded into it, and the error this
+    introduces.
+
+    The copy keeps the type and settings of `model`, e.g. `pipelined` of a
+    `Sequential`. If `inputs` are given, the report also contains the largest
+    difference between the outputs of `model` and the folded copy in
+    inference.
+    """
+    result = copy.deepcopy(model)
+    children = list(result.named_children())
+    positions = set(_foldable_pairs(children))
+    modules: list[torch.nn.Module] = []
+    folds = []
+    for position, (name, module) in enumerate(children):
+        if position - 1 in positions:
+            continue
+        if position not in positions:
+            modules.append(module)
+            continue
+        layer = cast(Linear | Conv1d, module)
+        batch_norm_name, batch_norm = children[position + 1]
+        folded = fold_batch_norm(layer, cast(torch.nn.BatchNorm1d, batch_norm))
+        weight_error, weight_saturated = _quantization_error(
+            folded.weight.detach(), layer._config
+        )
+        bias_error, bias_saturated = _quantization_error(
+            cast(torch.Tensor, folded.bias).detach(), layer._config
+        )
+        folds.append(
+            FoldedBatchNorm(
+                layer=name,
+                batch_norm=batch_norm_name,
+                max_weight_error=weight_error,
+                max_bias_error=bias_error,
+                saturated=weight_saturated + bias_saturated,
+            )
+        )
+        modules.append(folded)
+
+    result._modules.clear()
+    for position, module in enumerate(modules):
+        result.add_module(str(position), module)
+    max_output_error = None
+    if inputs is not None:
+        max_output_error = _max_output_error(model, result, inputs)
+    return result, FoldingReport(folds=tuple(folds), max_output_error=max_output_error)
+
+
+def _max_output_error(
+    model: torch.nn.Module, folded: torch.nn.Module, inputs: torch.Tensor
+) -> float:
+    was_training = model.training
+    model.eval()
+    folded.eval()
+    with torch.no_grad():
+        error = (model(inputs) - folded(inputs)).abs().max()
+    model.train(was_training)
+    folded.train(was_training)
+    return float(error)
@@ -0,0 +1,100 @@
+import pytest
+import torch
+
+from elasticai.creator.nn.sequential import Sequential
+
+from ._folded_batch_norm import folded_parameters
+from .batch_norm_folding import fold_batch_norms
+from .conv1d import Conv1d
+from .linear import Linear
+from .relu import ReLU
+
+
+def trained_batch_norm(features: int, affine: bool = True) -> torch.nn.BatchNorm1d:
+    batch_norm = torch.nn.BatchNorm1d(features, affine=affine)
+    with torch.no_grad():
+        batch_norm.running_mean.copy_(torch.linspace(-1, 1, features))
+        batch_norm.running_var.copy_(torch.linspace(0.25, 4, features))
+        if affine:
+            batch_norm.weight.copy_(torch.linspace(0.5, 2, features))
+            batch_norm.bias.copy_(torch.linspace(1, -1, features))
+    return batch_norm.eval()
+
+
+def linear(bias: bool = True) -> Linear:
+    torch.manual_seed(0)
+    return Linear(in_features=3, out_features=4, total_bits=16, frac_bits=8, bias=bias)
+
+
+@pytest.mark.parametrize("affine", [True, False])
+@pytest.mark.parametrize("bias", [True, False])
+def test_folded_linear_parameters_compute_the_batch_norm(
+    affine: bool, bias: bool
+) -> None:
+    layer = torch.nn.Linear(3, 4, bias=bias)
+    batch_norm = trained_batch_norm(4, affine)
+    weight, folded_bias = folded_parameters(layer.weight, layer.bias, batch_norm)
+    x = torch.randn(5, 3)
+    with torch.no_grad():
+        assert torch.allclose(
+            x @ weight.t() + folded_bias, batch_norm(layer(x)), atol=1e-6
+        )
+
+
+def test_folded_conv1d_parameters_scale_output_channels() -> None:
+    layer = torch.nn.Conv1d(2, 3, kernel_size=2)
+    batch_norm = trained_batch_norm(3)
+    weight, bias = folded_parameters(layer.weight, layer.bias, batch_norm)
+    x = torch.randn(5, 2, 6)
+    with torch.no_grad():
+        folded = torch.nn.functional.conv1d(x, weight, bias)
+        assert torch.allclose(folded, batch_norm(layer(x)), atol=1e-6)
+
+
+def test_batch_norms_after_layers_are_removed() -> None:
+    model = Sequential(linear(), trained_batch_norm(4), ReLU(16), trained_batch_norm(4))
+    folded, report = fold_batch_norms(model)
+    assert [type(m) for m in folded] == [Linear, ReLU, torch.nn.BatchNorm1d]
+    assert [(f.layer, f.batch_norm) for f in report.folds] == [("0", "1")]
+
+
+def test_folded_model_keeps_its_settings_and_the_original_is_untouched() -> None:
+    model = Sequential(linear(bias=False), trained_batch_norm(4), pipelined=True)
+    folded, _ = fold_batch_norms(model)
+    assert isinstance(folded, Sequential) and folded.pipelined
+    assert len(model) == 2 and model[0].bias is None
+
+
+def test_conv1d_is_folded() -> None:
+    conv = Conv1d(
+        total_bits=16,
+        frac_bits=8,
+        in_channels=2,
+        out_channels=3,
+        signal_length=6,
+        kernel_size=2,
+    )
+    folded, report = fold_batch_norms(Sequential(conv, trained_batch_norm(3)))
+    assert isinstance(folded[0], Conv1d) and len(folded) == 1
+    assert folded.create_design("network") is not None
+
+
+def test_report_bounds_the_error_of_the_folded_model() -> None:
+    model = Sequential(linear(), trained_batch_norm(4))
+    x = torch.randn(8, 3)
+    _, report = fold_batch_norms(model, inputs=x)
+    (fold,) = report.folds
+    resolution = 2**-8
+    assert fold.max_weight_error < resolution
+    assert fold.max_bias_error < resolution
+    assert fold.saturated == 0
+    assert report.max_output_error is not None
+    assert report.max_output_error <= 4 * resolution
+
+
+def test_parameters_leaving_the_value_range_are_reported_as_saturated() -> None:
+    batch_norm = trained_batch_norm(4)
+    with torch.no_grad():
+        batch_norm.weight.fill_(1000.0)
+    _, report = fold_batch_norms(Sequential(linear(), batch_norm))
+    assert report.folds[0].saturated > 0
@@ -1,5 +1,6 @@
 library ieee;
 use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
 
 entity ${name} is
     port (
@@ -22,14 +23,17 @@ architecture rtl of ${name} is
     constant KERNEL_SIZE : natural := ${kernel_size};
     constant IN_CHANNELS : natural := ${in_channels};
     constant OUT_CHANNELS : natural := ${out_channels};
+    constant ACC_WIDTH : natural := ${acc_width};
     constant X_ADDRESS_WIDTH : natural := ${x_address_width};
     constant Y_ADDRESS_WIDTH : natural := ${y_address_width};
 
     signal reset : std_logic;
+    ${activation_declarations}
 
 begin
 
     reset <= not enable;
+    ${activation_output}
 
     ${name}_conv1d : entity work.conv1d_fxp_MAC_RoundToZero
         generic map(
@@ -39,6 +43,7 @@ begin
             KERNEL_SIZE => KERNEL_SIZE,
             IN_CHANNELS => IN_CHANNELS,
             OUT_CHANNELS => OUT_CHANNELS,
+            ACC_WIDTH => ACC_WIDTH,
             X_ADDRESS_WIDTH => X_ADDRESS_WIDTH,
             Y_ADDRESS_WIDTH => Y_ADDRESS_WIDTH
         )
@@ -48,7 +53,7 @@ begin
             reset => reset,
             x => x,
             x_address => x_address,
-            y => y,
+            y => ${core_y},
             y_address => y_address,
             done => done
         );
@@ -14,6 +14,7 @@ entity conv1d_fxp_MAC_RoundToZero is
         KERNEL_SIZE : natural;
         IN_CHANNELS : natural;
         OUT_CHANNELS : natural;
+        ACC_WIDTH : natural;
         X_ADDRESS_WIDTH : natural;
         Y_ADDRESS_WIDTH : natural
     );
@@ -69,7 +70,8 @@ begin
         generic map(
             VECTOR_WIDTH => KERNEL_SIZE*IN_CHANNELS+1, -- +1 need for Bias
             TOTAL_WIDTH => TOTAL_WIDTH,
-            FRAC_WIDTH => FRAC_WIDTH
+            FRAC_WIDTH => FRAC_WIDTH,
+            ACC_WIDTH => ACC_WIDTH
         )
         port map (
             reset => mac_reset,
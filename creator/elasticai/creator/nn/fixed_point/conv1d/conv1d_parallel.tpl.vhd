@@ -0,0 +1,189 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+entity ${name} is
+    generic (
+        TOTAL_WIDTH : integer := ${x_width};
+        FRAC_WIDTH : integer := ${frac_width};
+        VECTOR_WIDTH : integer := ${vector_width};
+        KERNEL_SIZE : integer := ${kernel_size};
+        IN_CHANNELS : integer := ${in_channels};
+        OUT_CHANNELS : integer := ${out_channels};
+        ACC_WIDTH : integer := ${acc_width}; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := ${w_addr_width};
+        B_ADDR_WIDTH : integer := ${b_addr_width};
+        PARALLELISM : integer := ${parallelism} -- number of MAC lanes, lane l computes output channels l, l+P, l+2P, ...
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x_address : out std_logic_vector(${x_address_width}-1 downto 0);
+        y_address : in std_logic_vector(${y_address_width}-1 downto 0);
+
+        x   : in std_logic_vector(${x_width}-1 downto 0);
+        y  : out std_logic_vector(${y_width}-1 downto 0);
+
+        done   : out std_logic
+    );
+end;
+
+architecture rtl of ${name} is
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0)) return signed is
+        variable result : signed(TOTAL_WIDTH-1 downto 0) := (others=>'0');
+        constant left_bit : natural := TOTAL_WIDTH-1+FRAC_WIDTH;
+        constant right_bit : natural := FRAC_WIDTH;
+        constant max : signed(left_bit downto 0) := ('0', others => '1');
+        constant min : signed(left_bit downto 0) := ('1', others => '0');
+        variable dropped_fractional_part : signed(FRAC_WIDTH-1 downto 0);
+    begin
+        -- get result-range of x and underflow part
+        result := x(left_bit downto right_bit);
+        dropped_fractional_part := x(right_bit-1 downto 0);
+
+        -- round negative towards zero
+        if FRAC_WIDTH > 0 and result < 0 and dropped_fractional_part /= 0 then
+            result := result + 1;
+        end if;
+
+        -- check if overflow occured
+        if x < 0 and result >= 0 then
+            result := min(left_bit downto right_bit);
+        elsif x >= 0 and result < 0 then
+            result := max(left_bit downto right_bit);
+        end if;
+        return result;
+    end function;
+    ${activation_function}
+
+    constant FXP_ONE : signed(TOTAL_WIDTH-1 downto 0) := to_signed(2**FRAC_WIDTH,TOTAL_WIDTH);
+    constant OUTPUT_LENGTH : integer := VECTOR_WIDTH-KERNEL_SIZE+1;
+    constant GROUP_NUM : integer := (OUT_CHANNELS + PARALLELISM - 1) / PARALLELISM;
+    constant GROUP_WEIGHT_NUM : integer := IN_CHANNELS*KERNEL_SIZE;
+
+    type t_state is (s_stop, s_forward, s_idle);
+    type t_lane_data is array (0 to PARALLELISM-1) of std_logic_vector(TOTAL_WIDTH-1 downto 0);
+    type t_lane_sum is array (0 to PARALLELISM-1) of signed(ACC_WIDTH-1 downto 0);
+
+    signal n_clock : std_logic;
+    signal reset : std_logic;
+    signal state : t_state;
+
+    signal w_in : t_lane_data := (others=>(others=>'0'));
+    signal b_in : t_lane_data := (others=>(others=>'0'));
+
+    -- every lane reads its own rom banks at the same addresses
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
+    signal addr_b : std_logic_vector(B_ADDR_WIDTH-1 downto 0) := (others=>'0');
+
+    type t_y_array is array (0 to OUT_CHANNELS*OUTPUT_LENGTH-1) of std_logic_vector(TOTAL_WIDTH-1 downto 0);
+    signal y_ram : t_y_array;
+
+begin
+
+    n_clock <= not clock;
+    reset <= not enable;
+
+    main : process (clock, enable, reset)
+        variable group_idx : integer range 0 to GROUP_NUM-1 := 0;
+        variable position_idx : integer range 0 to OUTPUT_LENGTH-1 := 0;
+        variable channel_idx : integer range 0 to IN_CHANNELS-1 := 0;
+        variable kernel_idx : integer range 0 to KERNEL_SIZE-1 := 0;
+        variable var_addr_w : integer range 0 to GROUP_NUM*GROUP_WEIGHT_NUM-1 := 0;
+        variable accumulator : t_lane_sum;
+        variable y_write_en : std_logic;
+        variable var_y_write_channel, var_y_write_position : integer;
+    begin
+
+        if (reset = '1') then
+            state <= s_stop;
+            done <= '0';
+
+            group_idx := 0;
+            position_idx := 0;
+            channel_idx := 0;
+            kernel_idx := 0;
+            var_addr_w := 0;
+
+        elsif rising_edge(clock) then
+
+            if state=s_stop then
+                state <= s_forward;
+
+                -- first add b accumulated sum
+                for lane in 0 to PARALLELISM-1 loop
+                    accumulator(lane) := resize(FXP_ONE * signed(b_in(lane)), ACC_WIDTH);
+                end loop;
+            elsif state=s_forward then
+
+                -- x is shared by all lanes
+                for lane in 0 to PARALLELISM-1 loop
+                    accumulator(lane) := accumulator(lane) + resize(signed(x) * signed(w_in(lane)), ACC_WIDTH);
+                end loop;
+
+                if kernel_idx<KERNEL_SIZE-1 then
+                    kernel_idx := kernel_idx + 1;
+                    var_addr_w := var_addr_w + 1;
+                elsif channel_idx<IN_CHANNELS-1 then
+                    kernel_idx := 0;
+                    channel_idx := channel_idx + 1;
+                    var_addr_w := var_addr_w + 1;
+                else
+                    kernel_idx := 0;
+                    channel_idx := 0;
+
+                    y_write_en := '1';
+                    var_y_write_channel := group_idx*PARALLELISM;
+                    var_y_write_position := position_idx;
+
+                    if position_idx<OUTPUT_LENGTH-1 then
+                        position_idx := position_idx + 1;
+                        var_addr_w := group_idx*GROUP_WEIGHT_NUM;
+                        state <= s_stop;
+                    elsif group_idx<GROUP_NUM-1 then
+                        position_idx := 0;
+                        group_idx := group_idx + 1;
+                        var_addr_w := group_idx*GROUP_WEIGHT_NUM;
+                        state <= s_stop;
+                    else
+                        state <= s_idle;
+                        done <= '1';
+                    end if;
+                end if;
+            end if;
+
+            if y_write_en='1' then
+                for lane in 0 to PARALLELISM-1 loop
+                    -- the last group is padded with zero weights if PARALLELISM does not divide OUT_CHANNELS
+                    if var_y_write_channel+lane < OUT_CHANNELS then
+                        y_ram((var_y_write_channel+lane)*OUTPUT_LENGTH+var_y_write_position) <= std_logic_vector(${y_value});
+                    end if;
+                end loop;
+                y_write_en := '0';
+            end if;
+
+        end if;
+
+        x_address <= std_logic_vector(to_unsigned(channel_idx*VECTOR_WIDTH+position_idx+kernel_idx, x_address'length));
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+        addr_b <= std_logic_vector(to_unsigned(group_idx, addr_b'length));
+    end process main;
+
+    y_reading : process (clock, state)
+    begin
+        if (state=s_idle) or (state=s_stop) then
+            if falling_edge(clock) then
+                -- After the layer in at idle mode, y is readable
+                -- but it only update at the falling edge of the clock
+                y <= y_ram(to_integer(unsigned(y_address)));
+            end if;
+        end if;
+    end process y_reading;
+
+    -- Weight and bias banks, one of each per lane
+    ${rom_instances}
+
+end architecture rtl;
@@ -1,14 +1,25 @@
 import math
 
+import numpy as np
+import numpy.typing as npt
+
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
     InProjectTemplate,
     module_to_package,
 )
+from elasticai.creator.nn.fixed_point import fused_activation, range_analysis
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 from elasticai.creator.vhdl.shared_designs.rom import Rom
+from elasticai.creator.vhdl.shared_designs.rom.banks import (
+    interleave_into_banks,
+    save_banks,
+)
 
 from .testbench import Conv1dDesignProtocol
 
@@ -31,9 +42,16 @@ class Conv1dDesign(Design, Conv1dDesignProtocol):
         out_channels: int,
         signal_length: int,
         kernel_size: int,
-        weights: list[list[list[int]]],
-        bias: list[int],
+        weights: npt.ArrayLike,
+        bias: npt.ArrayLike,
+        parallelism: int = 1,
+        x_range: range_analysis.IntRange | None = None,
     ) -> None:
+        if not 1 <= parallelism <= out_channels:
+            raise ValueError(
+                "parallelism needs to be between 1 and out_channels"
+                f" ({out_channels}), but is {parallelism}."
+            )
         super().__init__(name=name)
         self._total_bits = total_bits
         self._frac_bits = frac_bits
@@ -41,8 +59,12 @@ class Conv1dDesign(Design, Conv1dDesignProtocol):
         self._out_channels = out_channels
         self._input_signal_length = signal_length
         self._kernel_size = kernel_size
-        self._weights = weights
-        self._bias = bias
+        self._weights = np.asarray(weights, dtype=np.int64)
+        self._bias = np.asarray(bias, dtype=np.int64)
+        self.parallelism = parallelism
+        self._x_range = x_range
+        self._accumulator_width: int | None = None
+        self.fused_activation: fused_activation.FusableActivation | None = None
         self.output_signal_length = math.floor(
             self.input_signal_length - self.kernel_size + 1
         )
@@ -73,15 +95,158 @@ class Conv1dDesign(Design, Conv1dDesignProtocol):
     def out_channels(self) -> int:
         return self._out_channels
 
+    @property
+    def y_count(self) -> int:
+        return self.out_channels * self.output_signal_length
+
+    @property
+    def accumulator_width(self) -> int:
+        """Bits of the MAC accumulators, see `LinearDesign.accumulator_width`."""
+        if self._accumulator_width is None:
+            self._accumulator_width = range_analysis.accumulator_width(
+                self._weights,
+                self._bias,
+                total_bits=self._total_bits,
+                frac_bits=self._frac_bits,
+                x_range=self._x_range,
+            )
+        return self._accumulator_width
+
+    @property
+    def latency_in_cycles(self) -> int:
+        """Clock cycles from enable until done, derived from the state machines.
+
+        The serial design needs two cycles per multiply accumulate and a few
+        more per output to add the bias and read and reset the mac, see the
+        comments below for `conv1d_function.tpl.vhd`. Parallel lanes need one
+        cycle per multiply accumulate and one to load the bias for each of the
+        `ceil(out_channels / parallelism)` channels they compute.
+        """
+        fan_in = self.in_channels * self.kernel_size
+        if self.parallelism == 1:
+            # per input channel: s_data_transfer_MAC and s_MAC_mul_x_w for every
+            # kernel position, one s_data_transfer_MAC to move to the next channel
+            cycles_per_input_channel = 2 * self.kernel_size + 1
+            # per output: s_data_transfer_MAC and s_MAC_add_b for the bias, one
+            # s_data_transfer_MAC to request the result, two s_MAC_get_result
+            # as the mac raises done one edge after the last next_sample, and
+            # s_reset_mac
+            cycles_per_output = self.in_channels * cycles_per_input_channel + 6
+            # per position: one s_data_transfer_MAC to move to the next position
+            cycles_per_position = self.out_channels * cycles_per_output + 1
+            # s_reset before, and a s_data_transfer_MAC to leave the last
+            # position and s_done setting done after all positions
+            return self.output_signal_length * cycles_per_position + 3
+        groups = math.ceil(self.out_channels / self.parallelism)
+        return groups * self.output_signal_length * (fan_in + 1)
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.restarted_after(self.latency_in_cycles)
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """Every lane has its own multiplier, accumulator and weight and bias
+        roms. The outputs are kept in `y_ram`. The serial design applies the
+        `fused_activation` once when reading `y`, parallel lanes each apply it
+        when writing."""
+        groups = math.ceil(self.out_channels / self.parallelism)
+        fan_in = self.in_channels * self.kernel_size
+        accumulator_width = self.accumulator_width
+        lane = _resources.total(
+            [
+                _resources.multiplier(self._total_bits, self._total_bits),
+                _resources.adder(accumulator_width),
+                _resources.registers(accumulator_width),
+                Rom.estimate_resources(groups * fan_in, self._total_bits),
+                Rom.estimate_resources(groups, self._total_bits),
+            ]
+        )
+        return _resources.total(
+            [
+                lane * self.parallelism,
+                _resources.memory(
+                    self.out_channels * self.output_signal_length,
+                    self._total_bits,
+                    writable=True,
+                ),
+                _resources.counter(self.port["x_address"].width),
+                _resources.counter(self.port["y_address"].width),
+                fused_activation.function_resources(
+                    self.fused_activation, self.parallelism
+                ),
+            ]
+        )
+
+    def banked_parameters(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Weights and biases for each MAC lane, see `interleave_into_banks`."""
+        return interleave_into_banks(self._weights, self._bias, self.parallelism)
+
     @staticmethod
-    def _flatten_params(params: list[list[list[int]]]) -> list[int]:
-        result = []
-        for list_of_lists in params:
-            for list_of_int in list_of_lists:
-                result.extend(list_of_int)
-        return result
+    def _flatten_params(params: npt.ArrayLike) -> np.ndarray:
+        return np.asarray(params).reshape(-1)
 
     def save_to(self, destination: Path) -> None:
+        if self.parallelism == 1:
+            self._save_serial_to(destination)
+        else:
+            self._save_parallel_lanes_to(destination)
+
+    def _save_parallel_lanes_to(self, destination: Path) -> None:
+        groups = math.ceil(self.out_channels / self.parallelism)
+        fan_in = self.in_channels * self.kernel_size
+        rom_instances = save_banks(
+            destination,
+            name=self.name,
+            data_width=self._total_bits,
+            banks=self.banked_parameters(),
+        )
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="conv1d_parallel.tpl.vhd",
+            parameters=dict(
+                frac_width=str(self._frac_bits),
+                in_channels=str(self._in_channels),
+                out_channels=str(self._out_channels),
+                kernel_size=str(self.kernel_size),
+                vector_width=str(self.input_signal_length),
+                acc_width=str(self.accumulator_width),
+                w_addr_width=str(calculate_address_width(groups * fan_in)),
+                b_addr_width=str(calculate_address_width(groups)),
+                parallelism=str(self.parallelism),
+                work_library_name="work",
+                name=self.name,
+                rom_instances=rom_instances,
+                activation_function=fused_activation.function_declaration(
+                    self.fused_activation
+                ),
+                y_value=fused_activation.applied_to(
+                    self.fused_activation, "cut_down(accumulator(lane))"
+                ),
+            )
+            | generate_parameters_from_port(self._port),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+    def _read_path_activation(self) -> dict[str, str | list[str]]:
+        """The core of the serial design is shared by all layers, so the
+        `fused_activation` is applied to the values read from it."""
+        if self.fused_activation is None:
+            return dict(core_y="y", activation_declarations=[], activation_output=[])
+        return dict(
+            core_y="y_core",
+            activation_declarations=[
+                *fused_activation.function_declaration(self.fused_activation),
+                f"signal y_core : std_logic_vector({self._total_bits}-1 downto 0);",
+            ],
+            activation_output=[
+                "y <= std_logic_vector("
+                + fused_activation.applied_to(self.fused_activation, "signed(y_core)")
+                + ");"
+            ],
+        )
+
+    def _save_serial_to(self, destination: Path) -> None:
         print(self.name)
         rom_name = dict(weights=f"{self.name}_w_rom", bias=f"{self.name}_b_rom")
         template = InProjectTemplate(
@@ -93,8 +258,10 @@ class Conv1dDesign(Design, Conv1dDesignProtocol):
                 out_channels=str(self._out_channels),
                 kernel_size=str(self.kernel_size),
                 vector_width=str(self.input_signal_length),
+                acc_width=str(self.accumulator_width),
                 name=self.name,
             )
+            | self._read_path_activation()
             | generate_parameters_from_port(self._port),
         )
         destination.create_subpath(self.name).as_file(".vhd").write(template)
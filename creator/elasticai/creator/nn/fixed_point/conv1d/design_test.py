@@ -4,6 +4,7 @@ import pytest
 
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
 
+from ..hard_tanh.design import HardTanh
 from .design import Conv1dDesign
 
 
@@ -106,3 +107,161 @@ end architecture rtl;"""
     saved_files = save_design(conv1d_design)
     actual_code = saved_files["conv1d_b_rom.vhd"]
     assert expected_code == actual_code
+
+
+def create_parallel_design(parallelism: int) -> Conv1dDesign:
+    return Conv1dDesign(
+        name="conv1d",
+        total_bits=8,
+        frac_bits=2,
+        in_channels=2,
+        out_channels=3,
+        kernel_size=2,
+        signal_length=4,
+        weights=[[[c, c], [-c, -c]] for c in range(1, 4)],
+        bias=[1, 2, 3],
+        parallelism=parallelism,
+    )
+
+
+@pytest.mark.parametrize("parallelism", [0, 4])
+def test_rejects_parallelism_out_of_range(parallelism: int) -> None:
+    with pytest.raises(ValueError):
+        create_parallel_design(parallelism)
+
+
+def test_lanes_hold_interleaved_output_channels() -> None:
+    banks = create_parallel_design(2).banked_parameters()
+    assert [w.tolist() for w, _ in banks] == [
+        [1, 1, -1, -1, 3, 3, -3, -3],
+        [2, 2, -2, -2, 0, 0, 0, 0],
+    ]
+    assert [b.tolist() for _, b in banks] == [[1, 3], [2, 0]]
+
+
+@pytest.mark.parametrize(
+    "parallelism, expected",
+    [(1, 3 * (3 * (2 * 5 + 6) + 1) + 3), (2, 2 * 3 * 5), (3, 3 * 5)],
+)
+def test_latency_in_cycles(parallelism: int, expected: int) -> None:
+    assert create_parallel_design(parallelism).latency_in_cycles == expected
+
+
+def serial_cycles_until_done(
+    in_channels: int, out_channels: int, kernel_size: int, output_length: int
+) -> int:
+    """Steps through the state machine of `conv1d_function.tpl.vhd` and of
+    the mac in `fxp_mac.tpl.vhd` one rising clock edge at a time."""
+    vector_width = in_channels * kernel_size + 1
+    state = "s_reset"
+    kernel = channel = out_channel = position = 0
+    bias_added = False
+    next_sample = mac_reset = False
+    mac_samples, mac_finished, mac_done = 0, False, False
+    cycles = 0
+    while True:
+        cycles += 1
+        sample, reset, new_state = next_sample, mac_reset, state
+        if state == "s_reset":
+            reset, sample, new_state = False, True, "s_data_transfer_MAC"
+        elif state == "s_data_transfer_MAC":
+            reset, sample = True, False
+            if position == output_length:
+                new_state = "s_done"
+            elif out_channel == out_channels:
+                kernel = channel = out_channel = 0
+                position += 1
+            elif channel < in_channels:
+                if kernel < kernel_size:
+                    new_state = "s_MAC_mul_x_w"
+                    kernel += 1
+                else:
+                    kernel = 0
+                    channel += 1
+            elif not bias_added:
+                bias_added, new_state = True, "s_MAC_add_b"
+            else:
+                bias_added, new_state = False, "s_MAC_get_result"
+                kernel = channel = 0
+                out_channel += 1
+        elif state in ("s_MAC_mul_x_w", "s_MAC_add_b"):
+            sample, new_state = True, "s_data_transfer_MAC"
+        elif state == "s_MAC_get_result":
+            sample = True
+            if mac_done:
+                sample, new_state = False, "s_reset_MAC"
+        elif state == "s_reset_MAC":
+            reset, new_state = False, "s_data_transfer_MAC"
+        else:
+            return cycles
+        rising_sample = sample and not next_sample
+        next_sample, mac_reset, state = sample, reset, new_state
+        if not mac_reset:
+            mac_samples, mac_finished, mac_done = 0, False, False
+        elif rising_sample:
+            if mac_finished:
+                mac_done = True
+            else:
+                mac_samples += 1
+                mac_finished = mac_samples == vector_width
+
+
+@pytest.mark.parametrize(
+    "in_channels, out_channels, kernel_size, signal_length",
+    [(1, 1, 1, 1), (2, 3, 2, 5), (3, 1, 4, 4), (1, 4, 3, 8)],
+)
+def test_serial_latency_follows_the_state_machine(
+    in_channels: int, out_channels: int, kernel_size: int, signal_length: int
+) -> None:
+    design = Conv1dDesign(
+        name="conv1d",
+        total_bits=8,
+        frac_bits=2,
+        in_channels=in_channels,
+        out_channels=out_channels,
+        kernel_size=kernel_size,
+        signal_length=signal_length,
+        weights=[[[1] * kernel_size] * in_channels] * out_channels,
+        bias=[1] * out_channels,
+    )
+    assert design.latency_in_cycles == serial_cycles_until_done(
+        in_channels, out_channels, kernel_size, design.output_signal_length
+    )
+
+
+def test_parallel_design_saves_one_rom_bank_per_lane() -> None:
+    saved_files = save_design(create_parallel_design(3))
+    expected_files = {"conv1d.vhd"} | {
+        f"conv1d_{kind}_rom_{lane}.vhd" for kind in "wb" for lane in range(3)
+    }
+    assert set(saved_files) == expected_files
+
+
+def test_parallel_design_connects_lanes_to_their_banks() -> None:
+    code = save_design(create_parallel_design(2))["conv1d.vhd"]
+    assert "PARALLELISM : integer := 2" in code
+    for lane in range(2):
+        assert f"rom_w_{lane} : entity work.conv1d_w_rom_{lane}(rtl)" in code
+        assert f"  data => w_in({lane})," in code
+        assert f"rom_b_{lane} : entity work.conv1d_b_rom_{lane}(rtl)" in code
+        assert f"  data => b_in({lane})," in code
+
+
+def test_serial_design_applies_fused_activation_to_read_values(
+    conv1d_design: Conv1dDesign,
+) -> None:
+    conv1d_design.fused_activation = HardTanh(
+        "hard_tanh", total_bits=16, frac_bits=8, min_val=-256, max_val=256
+    )
+    code = save_design(conv1d_design)["conv1d.vhd"]
+    assert "            y => y_core," in code
+    assert "    y <= std_logic_vector(activation(signed(y_core)));" in code
+
+
+def test_parallel_lanes_apply_fused_activation_before_writing() -> None:
+    design = create_parallel_design(2)
+    design.fused_activation = HardTanh(
+        "hard_tanh", total_bits=8, frac_bits=2, min_val=-4, max_val=4
+    )
+    code = save_design(design)["conv1d.vhd"]
+    assert "std_logic_vector(activation(cut_down(accumulator(lane))))" in code
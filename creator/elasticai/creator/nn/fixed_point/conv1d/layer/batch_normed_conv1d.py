@@ -1,9 +1,10 @@
-from typing import Any, cast
+from typing import Any
 
 import torch
 
 from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
+from elasticai.creator.nn.fixed_point._folded_batch_norm import folded_parameters
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
@@ -83,32 +84,13 @@ class BatchNormedConv1d(DesignCreatorModule):
         return x
 
     def create_design(self, name: str) -> Conv1dDesign:
-        def float_to_signed_int(value: float | list) -> int | list:
-            if isinstance(value, list):
-                return list(map(float_to_signed_int, value))
-            return self._operations.config.as_integer(value)
-
         def flatten_tuple(x: int | tuple[int, ...]) -> int:
             return x[0] if isinstance(x, tuple) else x
 
-        bn_mean = cast(torch.Tensor, self._batch_norm.running_mean)
-        bn_variance = cast(torch.Tensor, self._batch_norm.running_var)
-        bn_epsilon = self._batch_norm.eps
-        conv_weight = self._conv1d.weight
-        conv_bias = (
-            torch.tensor([0] * self._conv1d.out_channels)
-            if self._conv1d.bias is None
-            else self._conv1d.bias
+        weights, bias = folded_parameters(
+            self._conv1d.weight, self._conv1d.bias, self._batch_norm
         )
 
-        std = torch.sqrt(bn_variance + bn_epsilon)
-        weights = conv_weight / std
-        bias = (conv_bias - bn_mean) / std
-
-        if self._batch_norm.affine:
-            weights = (self._batch_norm.weight * weights.t()).t()
-            bias = self._batch_norm.weight * bias + self._batch_norm.bias
-
         return Conv1dDesign(
             name=name,
             total_bits=self._config.total_bits,
@@ -117,6 +99,6 @@ class BatchNormedConv1d(DesignCreatorModule):
             out_channels=self._conv1d.out_channels,
             signal_length=self._signal_length,
             kernel_size=flatten_tuple(self._conv1d.kernel_size),
-            weights=cast(list[list[list[int]]], float_to_signed_int(weights.tolist())),
-            bias=cast(list[int], float_to_signed_int(bias.tolist())),
+            weights=self._config.as_rounded_integer(weights.detach()),
+            bias=self._config.as_rounded_integer(bias.detach()),
         )
@@ -1,5 +1,6 @@
-from typing import Any, cast
+from typing import Any
 
+import torch
 
 from elasticai.creator.base_modules.conv1d import Conv1d as Conv1dBase
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
@@ -22,6 +23,7 @@ class Conv1d(DesignCreatorModule, Conv1dBase):
         kernel_size: int | tuple[int],
         bias: bool = True,
         device: Any = None,
+        parallelism: int = 1,
     ) -> None:
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
         self._signal_length = signal_length
@@ -33,21 +35,15 @@ class Conv1d(DesignCreatorModule, Conv1dBase):
             bias=bias,
             device=device,
         )
+        self.parallelism = parallelism
 
     def create_design(self, name: str) -> Conv1dDesign:
-        def float_to_signed_int(value: float | list) -> int | list:
-            if isinstance(value, list):
-                return list(map(float_to_signed_int, value))
-            return self._config.as_integer(value)
-
         def flatten_tuple(x: int | tuple[int, ...]) -> int:
             return x[0] if isinstance(x, tuple) else x
 
-        bias = [0] * self.out_channels if self.bias is None else self.bias.tolist()
-        signed_int_weights = cast(
-            list[list[list[int]]], float_to_signed_int(self.weight.tolist())
-        )
-        signed_int_bias = cast(list[int], float_to_signed_int(bias))
+        bias = torch.zeros(self.out_channels) if self.bias is None else self.bias
+        signed_int_weights = self._config.as_rounded_integer(self.weight.detach())
+        signed_int_bias = self._config.as_rounded_integer(bias.detach())
 
         return Conv1dDesign(
             name=name,
@@ -59,6 +55,7 @@ class Conv1d(DesignCreatorModule, Conv1dBase):
             kernel_size=flatten_tuple(self.kernel_size),
             weights=signed_int_weights,
             bias=signed_int_bias,
+            parallelism=self.parallelism,
         )
 
     def create_testbench(self, name: str, uut: Conv1dDesign) -> Conv1dTestbench:
@@ -0,0 +1,56 @@
+"""Elementwise activations applied by a MAC layer to its outputs.
+
+Instead of instantiating a separate design, the layer declares the
+activation as a VHDL function named `activation` and calls it on every
+value it writes to its output buffer.
+"""
+
+from typing import Protocol
+
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design.ports import Port
+
+FUNCTION_NAME = "activation"
+
+
+class FusableActivation(Protocol):
+    @property
+    def name(self) -> str: ...
+
+    @property
+    def port(self) -> Port: ...
+
+    @property
+    def function_resources(self) -> _resources.Resources:
+        """Resources of the function alone, without output registers."""
+        ...
+
+    def vhdl_function(self, name: str) -> list[str]: ...
+
+
+def is_fusable(design: object) -> bool:
+    return hasattr(design, "vhdl_function") and hasattr(design, "function_resources")
+
+
+def function_declaration(
+    activation: FusableActivation | None, name: str = FUNCTION_NAME
+) -> list[str]:
+    if activation is None:
+        return []
+    return activation.vhdl_function(name)
+
+
+def applied_to(
+    activation: FusableActivation | None, value: str, name: str = FUNCTION_NAME
+) -> str:
+    if activation is None:
+        return value
+    return f"{name}({value})"
+
+
+def function_resources(
+    activation: FusableActivation | None, instances: int = 1
+) -> _resources.Resources:
+    if activation is None:
+        return _resources.Resources()
+    return activation.function_resources * instances
@@ -0,0 +1,53 @@
+from typing import cast
+
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.file_generation.on_disk_path import OnDiskPath
+from elasticai.creator.nn.fixed_point import HardSigmoid, Tanh
+from elasticai.creator.vhdl.ghdl_simulation import GHDLSimulator
+
+from .fused_activation_testbench import FusedActivationTestbench
+
+
+def hard_sigmoid():
+    return HardSigmoid(total_bits=8, frac_bits=3).create_design("hard_sigmoid")
+
+
+def precomputed_tanh():
+    return Tanh(
+        total_bits=8, frac_bits=3, num_steps=32, sampling_intervall=(-4, 4)
+    ).create_design("tanh")
+
+
+def test_declares_the_function_of_the_activation() -> None:
+    build = InMemoryPath("build", parent=None)
+    FusedActivationTestbench("tb", hard_sigmoid()).save_to(build)
+    code = cast(InMemoryFile, build["tb"]).text
+    assert (
+        "    function activation(x : in signed(8-1 downto 0)) return signed is" in code
+    )
+    assert "    uut : entity work.hard_sigmoid(rtl)" in code
+
+
+def test_parses_results_by_input() -> None:
+    testbench = FusedActivationTestbench("tb", hard_sigmoid())
+    content = ["result: -128,0,0", "result: 3,9,9"]
+    assert testbench.parse_reported_content(content) == {-128: (0, 0), 3: (9, 9)}
+
+
+@pytest.mark.simulation
+@pytest.mark.parametrize("create_activation", (hard_sigmoid, precomputed_tanh))
+def test_fused_function_matches_design_bit_exactly(create_activation, tmp_path):
+    activation = create_activation()
+    testbench = FusedActivationTestbench("fused_activation_testbench", activation)
+    build_dir = OnDiskPath(str(tmp_path), parent="")
+    activation.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    simulator = GHDLSimulator(workdir=str(tmp_path), top_design_name=testbench.name)
+    simulator.initialize()
+    simulator.run()
+    results = testbench.parse_reported_content(simulator.getReportedContent())
+    assert len(results) == 2**8
+    mismatches = {x: r for x, r in results.items() if r[0] != r[1]}
+    assert mismatches == {}
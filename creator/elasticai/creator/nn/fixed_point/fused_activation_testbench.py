@@ -0,0 +1,45 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.simulated_layer import Testbench
+
+from .fused_activation import FUNCTION_NAME, FusableActivation, function_declaration
+
+
+class FusedActivationTestbench(Testbench):
+    """Compares the `vhdl_function` of an activation with its design for every
+    value of the input width, to check that fusing keeps the results bit
+    exact. The design has to be saved next to the testbench."""
+
+    def __init__(self, name: str, activation: FusableActivation) -> None:
+        self._name = name
+        self._activation = activation
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="fused_activation_testbench.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                uut_name=self._activation.name,
+                width=str(self._activation.port["x"].width),
+                function_name=FUNCTION_NAME,
+                activation_function=function_declaration(self._activation),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+    def parse_reported_content(self, content: list[str]) -> dict[int, tuple[int, int]]:
+        """Outputs of the design and of the function by input value."""
+        results = {}
+        for line in content:
+            if line.startswith("result: "):
+                x, design, function = line.removeprefix("result: ").split(",")
+                results[int(x)] = (int(design), int(function))
+        return results
@@ -0,0 +1,52 @@
+-- Applies the activation design and its fused function to every value of
+-- the input width and reports both results as "result: <x>,<design>,<function>".
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+end entity ${name};
+
+architecture rtl of ${name} is
+    constant CLOCK_PERIOD : time := 10 ns;
+    constant WIDTH : integer := ${width};
+    signal clock : std_logic := '0';
+    signal enable : std_logic := '0';
+    signal x : std_logic_vector(WIDTH-1 downto 0) := (others => '0');
+    signal y : std_logic_vector(WIDTH-1 downto 0);
+    signal finished : boolean := false;
+
+    ${activation_function}
+begin
+
+    clock <= not clock after CLOCK_PERIOD/2 when not finished else clock;
+
+    uut : entity work.${uut_name}(rtl)
+    port map (
+        enable => enable,
+        clock => clock,
+        x => x,
+        y => y
+    );
+
+    sweep : process
+        variable fused : signed(WIDTH-1 downto 0);
+    begin
+        wait until falling_edge(clock);
+        enable <= '1';
+        for value in -2**(WIDTH-1) to 2**(WIDTH-1)-1 loop
+            x <= std_logic_vector(to_signed(value, WIDTH));
+            -- registered designs take the value on the next rising edge
+            wait until rising_edge(clock);
+            wait until falling_edge(clock);
+            fused := ${function_name}(signed(x));
+            report "result: " & integer'image(value) & ","
+                & integer'image(to_integer(signed(y))) & ","
+                & integer'image(to_integer(fused));
+        end loop;
+        finished <= true;
+        wait;
+    end process sweep;
+
+end architecture rtl;
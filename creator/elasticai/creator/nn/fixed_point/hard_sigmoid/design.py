@@ -4,6 +4,8 @@ from elasticai.creator.file_generation.template import (
     module_to_package,
 )
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design, Port
 
 
@@ -32,6 +34,57 @@ class HardSigmoid(Design):
     def port(self) -> Port:
         return create_port(x_width=self._total_bits, y_width=self._total_bits)
 
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.registered()
+
+    @property
+    def function_resources(self) -> _resources.Resources:
+        return _resources.total(
+            [
+                _resources.multiplier(self._total_bits, self._total_bits),
+                _resources.adder(2 * self._total_bits),
+                _resources.comparator(self._total_bits) * 2,
+                _resources.Resources(luts=self._total_bits),
+            ]
+        )
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return self.function_resources + _resources.registers(self._total_bits)
+
+    def vhdl_function(self, name: str) -> list[str]:
+        """The activation as a VHDL function on signed values, for layers
+        that apply it to their outputs, see `fuse_activations`. Rounds and
+        saturates like `linear_op` in `hard_sigmoid.tpl.vhd`."""
+        width = self._total_bits
+        frac = self._frac_bits
+        return [
+            f"function {name}(x : in signed({width}-1 downto 0)) return signed is",
+            f"    variable product : signed(2*{width}-1 downto 0);",
+            f"    variable scaled : signed({width}-1 downto 0);",
+            f"    variable dropped : signed({frac}-1 downto 0);",
+            "begin",
+            f"    if x <= to_signed({self._zero_threshold}, {width}) then",
+            f"        return to_signed(0, {width});",
+            f"    elsif x >= to_signed({self._one_threshold}, {width}) then",
+            f"        return to_signed({self._one}, {width});",
+            "    end if;",
+            f"    product := x * to_signed({self._slope}, {width});",
+            f"    scaled := product({width}+{frac}-1 downto {frac});",
+            f"    dropped := product({frac}-1 downto 0);",
+            "    if scaled(scaled'left) = '1' and dropped /= 0 then",
+            "        scaled := scaled + 1;",
+            "    end if;",
+            "    if product > 0 and scaled < 0 then",
+            "        scaled := ('0', others => '1');",
+            "    elsif product < 0 and scaled > 0 then",
+            "        scaled := ('1', others => '0');",
+            "    end if;",
+            f"    return scaled + to_signed({self._y_intercept}, {width});",
+            "end function;",
+        ]
+
     def save_to(self, destination: Path) -> None:
         template = InProjectTemplate(
             package=module_to_package(self.__module__),
@@ -3,16 +3,29 @@ from elasticai.creator.nn.design_creator_module import DesignCreatorModule
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
 )
+from elasticai.creator.vhdl.shared_designs.stream import StreamingElementwise
 
 from .design import HardSigmoid as HardSigmoidDesign
 
 
 class HardSigmoid(DesignCreatorModule, HardSigmoidBase):
-    def __init__(self, total_bits: int, frac_bits: int) -> None:
+    def __init__(
+        self, total_bits: int, frac_bits: int, streaming: bool = False
+    ) -> None:
         super().__init__()
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        self._streaming = streaming
 
-    def create_design(self, name: str) -> HardSigmoidDesign:
+    def create_design(self, name: str) -> HardSigmoidDesign | StreamingElementwise:
+        if self._streaming:
+            return StreamingElementwise(
+                name=name,
+                inner=self._create_hard_sigmoid_design(f"{name}_elementwise"),
+                inner_latency=1,
+            )
+        return self._create_hard_sigmoid_design(name)
+
+    def _create_hard_sigmoid_design(self, name: str) -> HardSigmoidDesign:
         return HardSigmoidDesign(
             name=name,
             total_bits=self._config.total_bits,
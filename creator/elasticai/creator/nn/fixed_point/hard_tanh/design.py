@@ -4,6 +4,8 @@ from elasticai.creator.file_generation.template import (
     module_to_package,
 )
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design, Port
 
 
@@ -21,6 +23,39 @@ class HardTanh(Design):
     def port(self) -> Port:
         return create_port(x_width=self._total_bits, y_width=self._total_bits)
 
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.registered()
+
+    @property
+    def function_resources(self) -> _resources.Resources:
+        return _resources.total(
+            [
+                _resources.comparator(self._total_bits) * 2,
+                _resources.Resources(luts=self._total_bits),
+            ]
+        )
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return self.function_resources + _resources.registers(self._total_bits)
+
+    def vhdl_function(self, name: str) -> list[str]:
+        """The activation as a VHDL function on signed values, for layers
+        that apply it to their outputs, see `fuse_activations`."""
+        width = self._total_bits
+        return [
+            f"function {name}(x : in signed({width}-1 downto 0)) return signed is",
+            "begin",
+            f"    if x <= to_signed({self._min_val}, {width}) then",
+            f"        return to_signed({self._min_val}, {width});",
+            f"    elsif x >= to_signed({self._max_val}, {width}) then",
+            f"        return to_signed({self._max_val}, {width});",
+            "    end if;",
+            "    return x;",
+            "end function;",
+        ]
+
     def save_to(self, destination: Path) -> None:
         template = InProjectTemplate(
             package=module_to_package(self.__module__),
@@ -3,18 +3,38 @@ from elasticai.creator.nn.design_creator_module import DesignCreatorModule
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
 )
+from elasticai.creator.vhdl.shared_designs.stream import StreamingElementwise
 
 from .design import HardTanh as HardTanhDesign
 
 
 class HardTanh(DesignCreatorModule, HardTanhBase):
     def __init__(
-        self, total_bits: int, frac_bits: int, min_val: float = -1, max_val: float = 1
+        self,
+        total_bits: int,
+        frac_bits: int,
+        min_val: float = -1,
+        max_val: float = 1,
+        streaming: bool = False,
     ) -> None:
+        """`streaming` wraps the design into a `StreamingElementwise`. A
+        `Sequential` surrounds every run of streaming designs by a pair of
+        protocol adapters, so use it when the neighbours stream as well,
+        not for a single activation between addressable layers."""
         super().__init__(min_val, max_val)
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
+        self._streaming = streaming
 
-    def create_design(self, name: str) -> HardTanhDesign:
+    def create_design(self, name: str) -> HardTanhDesign | StreamingElementwise:
+        if self._streaming:
+            return StreamingElementwise(
+                name=name,
+                inner=self._create_hard_tanh_design(f"{name}_elementwise"),
+                inner_latency=1,
+            )
+        return self._create_hard_tanh_design(name)
+
+    def _create_hard_tanh_design(self, name: str) -> HardTanhDesign:
         return HardTanhDesign(
             name=name,
             total_bits=self._config.total_bits,
@@ -62,3 +62,12 @@ end architecture rtl;
     design.save_to(build_path)
     actual = cast(InMemoryFile, build_path["tanh"]).text
     assert actual == expected
+
+
+def test_streaming_hard_tanh_waits_for_clocked_result() -> None:
+    design = HardTanh(total_bits=16, frac_bits=8, streaming=True).create_design("tanh")
+    build_path = InMemoryPath("build", parent=None)
+    design.save_to(build_path)
+    wrapper = cast(InMemoryFile, build_path["tanh"]).text
+    assert "        INNER_LATENCY : integer := 1" in wrapper
+    assert "y_last" in design.port.signal_names
@@ -1,14 +1,25 @@
-from itertools import chain
+import math
+
+import numpy as np
+import numpy.typing as npt
 
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
     InProjectTemplate,
     module_to_package,
 )
+from elasticai.creator.nn.fixed_point import fused_activation, range_analysis
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 from elasticai.creator.vhdl.shared_designs.rom import Rom
+from elasticai.creator.vhdl.shared_designs.rom.banks import (
+    interleave_into_banks,
+    save_banks,
+)
 
 from .testbench import LinearDesignProtocol
 
@@ -21,22 +32,34 @@ class LinearDesign(Design, LinearDesignProtocol):
         out_feature_num: int,
         total_bits: int,
         frac_bits: int,
-        weights: list[list[int]],
-        bias: list[int],
+        weights: npt.ArrayLike,
+        bias: npt.ArrayLike,
         name: str,
         work_library_name: str = "work",
         resource_option: str = "auto",
+        parallelism: int = 1,
+        x_range: range_analysis.IntRange | None = None,
     ) -> None:
+        if not 1 <= parallelism <= out_feature_num:
+            raise ValueError(
+                "parallelism needs to be between 1 and out_feature_num"
+                f" ({out_feature_num}), but is {parallelism}."
+            )
         super().__init__(name=name)
         self._name = name
-        self.weights = weights
-        self.bias = bias
+        self.weights = np.asarray(weights, dtype=np.int64)
+        self.bias = np.asarray(bias, dtype=np.int64)
         self._in_feature_num = in_feature_num
         self._out_feature_num = out_feature_num
         self.work_library_name = work_library_name
         self.resource_option = resource_option
+        self.parallelism = parallelism
         self._frac_width = frac_bits
         self._data_width = total_bits
+        self._x_range = x_range
+        self._accumulator_width: int | None = None
+        self.shares_output_buffer = False
+        self.fused_activation: fused_activation.FusableActivation | None = None
         self.x_addr_width = self.port["x_address"].width
         self.y_addr_width = self.port["y_address"].width
 
@@ -52,6 +75,10 @@ class LinearDesign(Design, LinearDesignProtocol):
     def out_feature_num(self) -> int:
         return self._out_feature_num
 
+    @property
+    def y_count(self) -> int:
+        return self.out_feature_num
+
     @property
     def frac_width(self) -> int:
         return self._frac_width
@@ -60,6 +87,79 @@ class LinearDesign(Design, LinearDesignProtocol):
     def data_width(self) -> int:
         return self._data_width
 
+    @property
+    def accumulator_width(self) -> int:
+        """Bits of the MAC accumulators, derived from the weights and biases
+        and the range of the inputs, the full data range unless `x_range`
+        narrows it down. Computed on first access and kept."""
+        if self._accumulator_width is None:
+            self._accumulator_width = range_analysis.accumulator_width(
+                self.weights,
+                self.bias,
+                total_bits=self.data_width,
+                frac_bits=self.frac_width,
+                x_range=self._x_range,
+            )
+        return self._accumulator_width
+
+    @property
+    def latency_in_cycles(self) -> int:
+        """Clock cycles from enable until done.
+
+        Every lane spends one cycle loading its bias and one cycle per input
+        for each of the `ceil(out_feature_num / parallelism)` neurons it computes.
+        """
+        groups = math.ceil(self.out_feature_num / self.parallelism)
+        return groups * (self.in_feature_num + 1)
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.restarted_after(self.latency_in_cycles)
+
+    @property
+    def output_buffer_resources(self) -> _resources.Resources:
+        return _resources.memory(
+            self.out_feature_num + 1,
+            self.data_width,
+            self.resource_option,
+            writable=True,
+        )
+
+    @property
+    def can_share_output_buffer(self) -> bool:
+        """Only the single lane design can keep its outputs in a memory
+        outside the layer, see `linear_shared_buffer.tpl.vhd`."""
+        return self.parallelism == 1
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """Every lane has its own multiplier, accumulator and weight and bias
+        roms, and applies the `fused_activation`, if any. The outputs are
+        kept in `y_ram`, built as `resource_option`, unless the layer
+        `shares_output_buffer`."""
+        groups = math.ceil(self.out_feature_num / self.parallelism)
+        accumulator_width = self.accumulator_width
+        lane = _resources.total(
+            [
+                _resources.multiplier(self.data_width, self.data_width),
+                _resources.adder(accumulator_width),
+                _resources.registers(accumulator_width),
+                Rom.estimate_resources(groups * self.in_feature_num, self.data_width),
+                Rom.estimate_resources(groups, self.data_width),
+                fused_activation.function_resources(self.fused_activation),
+            ]
+        )
+        return _resources.total(
+            [
+                lane * self.parallelism,
+                _resources.Resources()
+                if self.shares_output_buffer
+                else self.output_buffer_resources,
+                _resources.counter(self.x_addr_width),
+                _resources.counter(self.y_addr_width),
+            ]
+        )
+
     @property
     def port(self) -> Port:
         return create_port(
@@ -80,25 +180,50 @@ class LinearDesign(Design, LinearDesignProtocol):
                 "in_feature_num",
                 "out_feature_num",
             )
+        ) | dict(
+            acc_width=str(self.accumulator_width),
+            activation_function=fused_activation.function_declaration(
+                self.fused_activation
+            ),
+        )
+
+    def _y_value(self, accumulator: str) -> str:
+        return fused_activation.applied_to(
+            self.fused_activation, f"cut_down({accumulator})"
         )
 
     @staticmethod
-    def _flatten_params(params: list[list[int]]) -> list[int]:
-        return list(chain(*params))
+    def _flatten_params(params: npt.ArrayLike) -> np.ndarray:
+        return np.asarray(params).reshape(-1)
+
+    def banked_parameters(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Weights and biases for each MAC lane, see `interleave_into_banks`."""
+        return interleave_into_banks(self.weights, self.bias, self.parallelism)
 
     def save_to(self, destination: Path):
+        if self.parallelism == 1:
+            self._save_single_lane_to(destination)
+        else:
+            self._save_parallel_lanes_to(destination)
+
+    def _save_single_lane_to(self, destination: Path):
         rom_name = dict(weights=f"{self.name}_w_rom", bias=f"{self.name}_b_rom")
 
         template = InProjectTemplate(
             package=module_to_package(self.__module__),
-            file_name="linear.tpl.vhd",
+            file_name="linear_shared_buffer.tpl.vhd"
+            if self.shares_output_buffer
+            else "linear.tpl.vhd",
             parameters=dict(
                 layer_name=self.name,
                 weights_rom_name=rom_name["weights"],
                 bias_rom_name=rom_name["bias"],
                 work_library_name=self.work_library_name,
                 resource_option=f'"{self.resource_option}"',
-                log2_max_value="31",
+                w_addr_width=str(
+                    calculate_address_width(self.in_feature_num * self.out_feature_num)
+                ),
+                y_value=self._y_value("var_sum"),
                 **self._template_parameters(),
             ),
         )
@@ -117,3 +242,30 @@ class LinearDesign(Design, LinearDesignProtocol):
             values_as_integers=self.bias,
         )
         bias_rom.save_to(destination.create_subpath(rom_name["bias"]))
+
+    def _save_parallel_lanes_to(self, destination: Path):
+        groups = math.ceil(self.out_feature_num / self.parallelism)
+        rom_instances = save_banks(
+            destination,
+            name=self.name,
+            data_width=self.data_width,
+            banks=self.banked_parameters(),
+            library=self.work_library_name,
+        )
+
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="linear_parallel.tpl.vhd",
+            parameters=dict(
+                layer_name=self.name,
+                work_library_name=self.work_library_name,
+                resource_option=f'"{self.resource_option}"',
+                w_addr_width=str(calculate_address_width(groups * self.in_feature_num)),
+                b_addr_width=str(calculate_address_width(groups)),
+                parallelism=str(self.parallelism),
+                rom_instances=rom_instances,
+                y_value=self._y_value("var_sum(lane)"),
+                **self._template_parameters(),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
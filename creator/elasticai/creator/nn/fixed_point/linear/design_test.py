@@ -1,9 +1,12 @@
 from typing import cast
 
+import numpy as np
 import pytest
+import torch
 
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
 
+from ..relu.design import ReLU
 from .design import LinearDesign
 
 
@@ -36,6 +39,22 @@ def test_saved_design_contains_needed_files(linear_design: LinearDesign) -> None
     assert expected_files == actual_files
 
 
+@pytest.mark.parametrize("to_array", [np.array, torch.tensor])
+def test_accepts_integer_arrays_as_parameters(
+    linear_design: LinearDesign, to_array
+) -> None:
+    design = LinearDesign(
+        name="linear",
+        in_feature_num=3,
+        out_feature_num=2,
+        total_bits=16,
+        frac_bits=8,
+        weights=to_array([[1, 1, 1], [1, 1, 1]]),
+        bias=to_array([1, 1]),
+    )
+    assert save_design(design) == save_design(linear_design)
+
+
 def test_weight_rom_code_generated_correctly(linear_design: LinearDesign) -> None:
     expected_code = """library ieee;
     use ieee.std_logic_1164.all;
@@ -116,6 +135,8 @@ entity linear is -- layer_name is for distinguish same type of layers (with vari
         Y_ADDR_WIDTH : integer := 1;
         IN_FEATURE_NUM : integer := 3;
         OUT_FEATURE_NUM : integer := 2;
+        ACC_WIDTH : integer := 24; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := 3;
         RESOURCE_OPTION : string := "auto" -- can be "distributed", "block", or  "auto"
     );
     port (
@@ -138,7 +159,7 @@ architecture rtl of linear is
     -- macc
     function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
                     x : in signed(DATA_WIDTH-1 downto 0);
-                    y_0 : in signed(2*DATA_WIDTH-1 downto 0)
+                    y_0 : in signed(ACC_WIDTH-1 downto 0)
             ) return signed is
 
         variable TEMP : signed(DATA_WIDTH*2-1 downto 0) := (others=>'0');
@@ -147,10 +168,10 @@ architecture rtl of linear is
     begin
         TEMP := w * x;
 
-        return TEMP+y_0;
+        return resize(TEMP, ACC_WIDTH)+y_0;
     end function;
 
-    function cut_down(x: in signed(2*DATA_WIDTH-1 downto 0))return signed is
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0))return signed is
         variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
         variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
     begin
@@ -169,20 +190,6 @@ architecture rtl of linear is
         return TEMP2;
     end function;
 
-    -- Log2 function is for calculating the bitwidth of the address lines
-    -- for bias and weights rom
-    function log2(val : INTEGER) return natural is
-        variable res : natural;
-    begin
-        for i in 1 to 31 loop
-            if (val <= (2 ** i)) then
-                res := i;
-                exit;
-            end if;
-        end loop;
-        return res;
-    end function log2;
-
     -----------------------------------------------------------
     -- Signals
     -----------------------------------------------------------
@@ -195,12 +202,12 @@ architecture rtl of linear is
     signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
     signal b_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
 
-    signal addr_w : std_logic_vector(log2(IN_FEATURE_NUM*OUT_FEATURE_NUM)-1 downto 0) := (others=>'0');
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
     --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
     signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
 
     signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
-    signal macc_sum : signed(2*DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal macc_sum : signed(ACC_WIDTH-1 downto 0) := (others=>'0');
 
     signal reset : std_logic := '0';
     signal state : t_state;
@@ -227,7 +234,7 @@ begin
         variable current_neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
         variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
         variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
-        variable var_sum, var_y : signed(2*DATA_WIDTH-1 downto 0);
+        variable var_sum, var_y : signed(ACC_WIDTH-1 downto 0);
         variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
         variable y_write_en : std_logic;
         variable var_y_write_idx : integer;
@@ -326,3 +333,137 @@ end architecture rtl;"""
     saved_files = save_design(linear_design)
     actual_code = saved_files["linear.vhd"]
     assert expected_code == actual_code
+
+
+def create_parallel_design(parallelism: int) -> LinearDesign:
+    return LinearDesign(
+        name="linear",
+        in_feature_num=2,
+        out_feature_num=5,
+        total_bits=8,
+        frac_bits=2,
+        weights=np.arange(10).reshape(5, 2),
+        bias=[10, 11, 12, 13, 14],
+        parallelism=parallelism,
+    )
+
+
+@pytest.mark.parametrize("parallelism", [0, 6])
+def test_rejects_parallelism_out_of_range(parallelism: int) -> None:
+    with pytest.raises(ValueError):
+        create_parallel_design(parallelism)
+
+
+def test_lanes_compute_interleaved_neurons() -> None:
+    banks = create_parallel_design(2).banked_parameters()
+    weights = [w.tolist() for w, _ in banks]
+    bias = [b.tolist() for _, b in banks]
+    assert weights == [[0, 1, 4, 5, 8, 9], [2, 3, 6, 7, 0, 0]]
+    assert bias == [[10, 12, 14], [11, 13, 0]]
+
+
+@pytest.mark.parametrize(
+    "parallelism, expected", [(1, 15), (2, 9), (3, 6), (4, 6), (5, 3)]
+)
+def test_latency_shrinks_with_parallelism(parallelism: int, expected: int) -> None:
+    assert create_parallel_design(parallelism).latency_in_cycles == expected
+
+
+def test_timing_restarts_after_latency() -> None:
+    timing = create_parallel_design(2).timing
+    assert (timing.latency_in_cycles, timing.initiation_interval_in_cycles) == (9, 10)
+
+
+@pytest.mark.parametrize("parallelism", [1, 2, 5])
+def test_every_lane_needs_a_dsp(parallelism: int) -> None:
+    assert create_parallel_design(parallelism).resources.dsps == parallelism
+
+
+def test_parallel_design_saves_one_rom_bank_per_lane() -> None:
+    saved_files = save_design(create_parallel_design(2))
+    assert set(saved_files) == {
+        "linear.vhd",
+        "linear_w_rom_0.vhd",
+        "linear_w_rom_1.vhd",
+        "linear_b_rom_0.vhd",
+        "linear_b_rom_1.vhd",
+    }
+
+
+def test_parallel_design_connects_lanes_to_their_banks() -> None:
+    code = save_design(create_parallel_design(2))["linear.vhd"]
+    assert "PARALLELISM : integer := 2;" in code
+    for lane in range(2):
+        assert f"rom_w_{lane} : entity work.linear_w_rom_{lane}(rtl)" in code
+        assert f"  data => w_in({lane})," in code
+        assert f"rom_b_{lane} : entity work.linear_b_rom_{lane}(rtl)" in code
+        assert f"  data => b_in({lane})," in code
+
+
+def test_parallel_weight_bank_holds_lane_rows() -> None:
+    code = save_design(create_parallel_design(2))["linear_w_rom_1.vhd"]
+    expected_values = '("00000010","00000011","00000110","00000111","00000000","00000000","00000000","00000000")'
+    assert expected_values in code
+
+
+def test_parallel_design_sizes_addresses_for_lane_banks() -> None:
+    code = save_design(create_parallel_design(2))["linear.vhd"]
+    assert "W_ADDR_WIDTH : integer := 3;" in code
+    assert "B_ADDR_WIDTH : integer := 2;" in code
+
+
+def test_accumulator_is_sized_for_the_weights() -> None:
+    design = LinearDesign(
+        name="linear",
+        in_feature_num=4,
+        out_feature_num=1,
+        total_bits=8,
+        frac_bits=4,
+        weights=[[127] * 4],
+        bias=[127],
+    )
+    assert design.accumulator_width == 18
+    assert "ACC_WIDTH : integer := 18;" in save_design(design)["linear.vhd"]
+
+
+def test_input_range_narrows_accumulator() -> None:
+    design = LinearDesign(
+        name="linear",
+        in_feature_num=4,
+        out_feature_num=1,
+        total_bits=8,
+        frac_bits=4,
+        weights=[[127] * 4],
+        bias=[127],
+        x_range=(0, 16),
+    )
+    assert design.accumulator_width == 15
+
+
+def test_shared_output_buffer_moves_y_ram_out_of_the_layer(
+    linear_design: LinearDesign,
+) -> None:
+    linear_design.shares_output_buffer = True
+    code = save_design(linear_design)["linear.vhd"]
+    assert "y_buffer_we : out std_logic;" in code
+    assert "signal y_ram" not in code
+    assert linear_design.resources.lutram == 0
+
+
+@pytest.mark.parametrize("parallelism", [1, 2])
+def test_fused_activation_is_applied_before_writing_outputs(
+    parallelism: int,
+) -> None:
+    design = create_parallel_design(parallelism)
+    design.fused_activation = ReLU("relu", total_bits=8, use_clock=False)
+    code = save_design(design)["linear.vhd"]
+    assert "function activation(x : in signed(8-1 downto 0)) return signed is" in code
+    assert "std_logic_vector(activation(cut_down(var_sum" in code
+
+
+def test_fused_activation_adds_its_function_to_every_lane() -> None:
+    design = create_parallel_design(2)
+    unfused = design.resources
+    design.fused_activation = ReLU("relu", total_bits=8, use_clock=True)
+    assert (design.resources - unfused).luts == 2 * 8
+    assert (design.resources - unfused).ffs == 0
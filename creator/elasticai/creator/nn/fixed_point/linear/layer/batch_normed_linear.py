@@ -1,9 +1,10 @@
-from typing import Any, cast
+from typing import Any
 
 import torch
 
 from elasticai.creator.base_modules.linear import Linear as LinearBase
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
+from elasticai.creator.nn.fixed_point._folded_batch_norm import folded_parameters
 from elasticai.creator.nn.fixed_point._math_operations import MathOperations
 from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
     FixedPointConfig,
@@ -73,35 +74,16 @@ class BatchNormedLinear(DesignCreatorModule, torch.nn.Module):
         return x.view(*output_shape)
 
     def create_design(self, name: str) -> LinearDesign:
-        def float_to_signed_int(value: float | list) -> int | list:
-            if isinstance(value, list):
-                return list(map(float_to_signed_int, value))
-            return self._operations.config.as_integer(value)
-
-        bn_mean = cast(torch.Tensor, self._batch_norm.running_mean)
-        bn_variance = cast(torch.Tensor, self._batch_norm.running_var)
-        bn_epsilon = self._batch_norm.eps
-        lin_weight = self._linear.weight
-        lin_bias = (
-            torch.tensor([0] * self._linear.out_features)
-            if self._linear.bias is None
-            else self._linear.bias
+        weights, bias = folded_parameters(
+            self._linear.weight, self._linear.bias, self._batch_norm
         )
 
-        std = torch.sqrt(bn_variance + bn_epsilon)
-        weights = lin_weight / std
-        bias = (lin_bias - bn_mean) / std
-
-        if self._batch_norm.affine:
-            weights = (self._batch_norm.weight * weights.t()).t()
-            bias = self._batch_norm.weight * bias + self._batch_norm.bias
-
         return LinearDesign(
             in_feature_num=self._linear.in_features,
             out_feature_num=self._linear.out_features,
             total_bits=self._operations.config.total_bits,
             frac_bits=self._operations.config.frac_bits,
-            weights=cast(list[list[int]], float_to_signed_int(weights.tolist())),
-            bias=cast(list[int], float_to_signed_int(bias.tolist())),
+            weights=self._operations.config.as_rounded_integer(weights.detach()),
+            bias=self._operations.config.as_rounded_integer(bias.detach()),
             name=name,
         )
@@ -1,4 +1,6 @@
-from typing import Any, cast
+from typing import Any
+
+import torch
 
 from elasticai.creator.base_modules.linear import Linear as LinearBase
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
@@ -19,6 +21,7 @@ class Linear(DesignCreatorModule, LinearBase):
         frac_bits: int,
         bias: bool = True,
         device: Any = None,
+        parallelism: int = 1,
     ) -> None:
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
         super().__init__(
@@ -28,18 +31,12 @@ class Linear(DesignCreatorModule, LinearBase):
             bias=bias,
             device=device,
         )
+        self.parallelism = parallelism
 
     def create_design(self, name: str) -> LinearDesign:
-        def float_to_signed_int(value: float | list) -> int | list:
-            if isinstance(value, list):
-                return list(map(float_to_signed_int, value))
-            return self._config.as_integer(value)
-
-        bias = [0] * self.out_features if self.bias is None else self.bias.tolist()
-        signed_int_weights = cast(
-            list[list[int]], float_to_signed_int(self.weight.tolist())
-        )
-        signed_int_bias = cast(list[int], float_to_signed_int(bias))
+        bias = torch.zeros(self.out_features) if self.bias is None else self.bias
+        signed_int_weights = self._config.as_rounded_integer(self.weight.detach())
+        signed_int_bias = self._config.as_rounded_integer(bias.detach())
 
         return LinearDesign(
             frac_bits=self._config.frac_bits,
@@ -49,6 +46,7 @@ class Linear(DesignCreatorModule, LinearBase):
             weights=signed_int_weights,
             bias=signed_int_bias,
             name=name,
+            parallelism=self.parallelism,
         )
 
     def create_testbench(self, name: str, uut: LinearDesign) -> LinearTestbench:
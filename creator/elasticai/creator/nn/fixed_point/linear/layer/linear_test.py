@@ -60,6 +60,26 @@ def test_bias_addition() -> None:
     assert expected == actual
 
 
+def test_design_parameters_are_rounded_half_to_even() -> None:
+    linear = Linear(total_bits=8, frac_bits=2, in_features=4, out_features=1)
+    linear.weight.data = torch.tensor([[0.3, -0.7, 0.375, 0.625]])
+    linear.bias.data = torch.tensor([-0.125])
+
+    design = linear.create_design("linear")
+
+    assert design.weights.tolist() == [[1, -3, 2, 2]]
+    assert design.bias.tolist() == [0]
+
+
+def test_parallelism_is_passed_to_design() -> None:
+    linear = Linear(
+        total_bits=8, frac_bits=2, in_features=4, out_features=6, parallelism=3
+    )
+    design = linear.create_design("linear")
+    assert design.parallelism == 3
+    assert design.latency_in_cycles == 2 * 5
+
+
 def test_linear_layer_creates_correct_design() -> None:
     expected_linear_code = """library ieee;
 use ieee.std_logic_1164.all;
@@ -76,6 +96,8 @@ entity linear is -- layer_name is for distinguish same type of layers (with vari
         Y_ADDR_WIDTH : integer := 1;
         IN_FEATURE_NUM : integer := 3;
         OUT_FEATURE_NUM : integer := 2;
+        ACC_WIDTH : integer := 25; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := 3;
         RESOURCE_OPTION : string := "auto" -- can be "distributed", "block", or  "auto"
     );
     port (
@@ -98,7 +120,7 @@ architecture rtl of linear is
     -- macc
     function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
                     x : in signed(DATA_WIDTH-1 downto 0);
-                    y_0 : in signed(2*DATA_WIDTH-1 downto 0)
+                    y_0 : in signed(ACC_WIDTH-1 downto 0)
             ) return signed is
 
         variable TEMP : signed(DATA_WIDTH*2-1 downto 0) := (others=>'0');
@@ -107,10 +129,10 @@ architecture rtl of linear is
     begin
         TEMP := w * x;
 
-        return TEMP+y_0;
+        return resize(TEMP, ACC_WIDTH)+y_0;
     end function;
 
-    function cut_down(x: in signed(2*DATA_WIDTH-1 downto 0))return signed is
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0))return signed is
         variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
         variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
     begin
@@ -129,20 +151,6 @@ architecture rtl of linear is
         return TEMP2;
     end function;
 
-    -- Log2 function is for calculating the bitwidth of the address lines
-    -- for bias and weights rom
-    function log2(val : INTEGER) return natural is
-        variable res : natural;
-    begin
-        for i in 1 to 31 loop
-            if (val <= (2 ** i)) then
-                res := i;
-                exit;
-            end if;
-        end loop;
-        return res;
-    end function log2;
-
     -----------------------------------------------------------
     -- Signals
     -----------------------------------------------------------
@@ -155,12 +163,12 @@ architecture rtl of linear is
     signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
     signal b_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
 
-    signal addr_w : std_logic_vector(log2(IN_FEATURE_NUM*OUT_FEATURE_NUM)-1 downto 0) := (others=>'0');
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
     --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
     signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
 
     signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
-    signal macc_sum : signed(2*DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal macc_sum : signed(ACC_WIDTH-1 downto 0) := (others=>'0');
 
     signal reset : std_logic := '0';
     signal state : t_state;
@@ -187,7 +195,7 @@ begin
         variable current_neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
         variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
         variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
-        variable var_sum, var_y : signed(2*DATA_WIDTH-1 downto 0);
+        variable var_sum, var_y : signed(ACC_WIDTH-1 downto 0);
         variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
         variable y_write_en : std_logic;
         variable var_y_write_idx : integer;
@@ -287,6 +295,8 @@ end architecture rtl;"""
     linear = Linear(
         total_bits=16, frac_bits=8, in_features=3, out_features=2, bias=False
     )
+    with torch.no_grad():
+        linear.weight.fill_(0.5)
 
     design = linear.create_design("linear")
     destination = InMemoryPath("linear", parent=None)
@@ -13,6 +13,8 @@ entity ${layer_name} is -- layer_name is for distinguish same type of layers (wi
         Y_ADDR_WIDTH : integer := ${y_addr_width};
         IN_FEATURE_NUM : integer := ${in_feature_num};
         OUT_FEATURE_NUM : integer := ${out_feature_num};
+        ACC_WIDTH : integer := ${acc_width}; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := ${w_addr_width};
         RESOURCE_OPTION : string := ${resource_option} -- can be "distributed", "block", or  "auto"
     );
     port (
@@ -35,7 +37,7 @@ architecture rtl of ${layer_name} is
     -- macc
     function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
                     x : in signed(DATA_WIDTH-1 downto 0);
-                    y_0 : in signed(2*DATA_WIDTH-1 downto 0)
+                    y_0 : in signed(ACC_WIDTH-1 downto 0)
             ) return signed is
 
         variable TEMP : signed(DATA_WIDTH*2-1 downto 0) := (others=>'0');
@@ -44,10 +46,10 @@ architecture rtl of ${layer_name} is
     begin
         TEMP := w * x;
 
-        return TEMP+y_0;
+        return resize(TEMP, ACC_WIDTH)+y_0;
     end function;
 
-    function cut_down(x: in signed(2*DATA_WIDTH-1 downto 0))return signed is
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0))return signed is
         variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
         variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
     begin
@@ -65,20 +67,7 @@ architecture rtl of ${layer_name} is
         end if;
         return TEMP2;
     end function;
-
-    -- Log2 function is for calculating the bitwidth of the address lines
-    -- for bias and weights rom
-    function log2(val : INTEGER) return natural is
-        variable res : natural;
-    begin
-        for i in 1 to ${log2_max_value} loop
-            if (val <= (2 ** i)) then
-                res := i;
-                exit;
-            end if;
-        end loop;
-        return res;
-    end function log2;
+    ${activation_function}
 
     -----------------------------------------------------------
     -- Signals
@@ -92,12 +81,12 @@ architecture rtl of ${layer_name} is
     signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
     signal b_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
 
-    signal addr_w : std_logic_vector(log2(IN_FEATURE_NUM*OUT_FEATURE_NUM)-1 downto 0) := (others=>'0');
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
     --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
     signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
 
     signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
-    signal macc_sum : signed(2*DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal macc_sum : signed(ACC_WIDTH-1 downto 0) := (others=>'0');
 
     signal reset : std_logic := '0';
     signal state : t_state;
@@ -124,7 +113,7 @@ begin
         variable current_neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
         variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
         variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
-        variable var_sum, var_y : signed(2*DATA_WIDTH-1 downto 0);
+        variable var_sum, var_y : signed(ACC_WIDTH-1 downto 0);
         variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
         variable y_write_en : std_logic;
         variable var_y_write_idx : integer;
@@ -179,7 +168,7 @@ begin
             macc_sum <= var_sum;
 
             if y_write_en='1'then
-                y_ram(var_y_write_idx) <= std_logic_vector(cut_down(var_sum));
+                y_ram(var_y_write_idx) <= std_logic_vector(${y_value});
                 y_write_en := '0';
             end if;
 
@@ -0,0 +1,210 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;               -- for type conversions
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+entity ${layer_name} is -- layer_name is for distinguish same type of layers (with various weights) in one module
+    generic (
+        DATA_WIDTH   : integer := ${data_width};
+        FRAC_WIDTH   : integer := ${frac_width};
+        X_ADDR_WIDTH : integer := ${x_addr_width};
+        Y_ADDR_WIDTH : integer := ${y_addr_width};
+        IN_FEATURE_NUM : integer := ${in_feature_num};
+        OUT_FEATURE_NUM : integer := ${out_feature_num};
+        ACC_WIDTH : integer := ${acc_width}; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := ${w_addr_width};
+        B_ADDR_WIDTH : integer := ${b_addr_width};
+        PARALLELISM : integer := ${parallelism}; -- number of MAC lanes, lane l computes neurons l, l+P, l+2P, ...
+        RESOURCE_OPTION : string := ${resource_option} -- can be "distributed", "block", or  "auto"
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x_address : out std_logic_vector(X_ADDR_WIDTH-1 downto 0);
+        y_address : in std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+
+        x   : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        y  : out std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        done   : out std_logic
+    );
+end ${layer_name};
+
+architecture rtl of ${layer_name} is
+    -----------------------------------------------------------
+    -- Functions
+    -----------------------------------------------------------
+    -- macc
+    function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
+                    x : in signed(DATA_WIDTH-1 downto 0);
+                    y_0 : in signed(ACC_WIDTH-1 downto 0)
+            ) return signed is
+
+        variable TEMP : signed(DATA_WIDTH*2-1 downto 0) := (others=>'0');
+        variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+        variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
+    begin
+        TEMP := w * x;
+
+        return resize(TEMP, ACC_WIDTH)+y_0;
+    end function;
+
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0))return signed is
+        variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+        variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
+    begin
+
+        TEMP2 := x(DATA_WIDTH+FRAC_WIDTH-1 downto FRAC_WIDTH);
+        TEMP3 := x(FRAC_WIDTH-1 downto 0);
+        if TEMP2(DATA_WIDTH-1) = '1' and TEMP3 /= 0 then
+            TEMP2 := TEMP2 + 1;
+        end if;
+
+        if x>0 and TEMP2<0 then
+            TEMP2 := ('0', others => '1');
+        elsif x<0 and TEMP2>0 then
+            TEMP2 := ('1', others => '0');
+        end if;
+        return TEMP2;
+    end function;
+    ${activation_function}
+
+    -----------------------------------------------------------
+    -- Signals
+    -----------------------------------------------------------
+    constant FXP_ONE : signed(DATA_WIDTH-1 downto 0) := to_signed(2**FRAC_WIDTH,DATA_WIDTH);
+    constant GROUP_NUM : integer := (OUT_FEATURE_NUM + PARALLELISM - 1) / PARALLELISM;
+
+    type t_state is (s_stop, s_forward, s_idle);
+    type t_lane_data is array (0 to PARALLELISM-1) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    type t_lane_fxp is array (0 to PARALLELISM-1) of signed(DATA_WIDTH-1 downto 0);
+    type t_lane_sum is array (0 to PARALLELISM-1) of signed(ACC_WIDTH-1 downto 0);
+
+    signal n_clock : std_logic;
+    signal w_in : t_lane_data := (others=>(others=>'0'));
+    signal b_in : t_lane_data := (others=>(others=>'0'));
+
+    -- every lane reads its own rom banks at the same addresses
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
+    signal addr_b : std_logic_vector(B_ADDR_WIDTH-1 downto 0) := (others=>'0');
+
+    signal fxp_x : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal macc_sum : t_lane_sum := (others=>(others=>'0'));
+
+    signal reset : std_logic := '0';
+    signal state : t_state;
+
+    -- simple solution for the output buffer
+    type t_y_array is array (0 to OUT_FEATURE_NUM) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal y_ram : t_y_array;
+    attribute rom_style : string;
+    attribute rom_style of y_ram : signal is RESOURCE_OPTION;
+
+begin
+
+    -- connecting signals to ports
+    n_clock <= not clock;
+
+    fxp_x <= signed(x);
+
+    -- connects ports
+    reset <= not enable;
+
+    linear_main : process (clock, enable, reset)
+        variable current_group_idx : integer range 0 to GROUP_NUM-1 := 0;
+        variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
+        variable var_addr_w : integer range 0 to GROUP_NUM*IN_FEATURE_NUM-1 := 0;
+        variable var_sum, var_y : t_lane_sum;
+        variable var_w, var_x : t_lane_fxp;
+        variable y_write_en : std_logic;
+        variable var_y_write_idx : integer;
+    begin
+
+        if (reset = '1') then
+            state <= s_stop;
+            done <= '0';
+
+            current_group_idx := 0;
+            current_input_idx := 0;
+            var_addr_w := 0;
+
+        elsif rising_edge(clock) then
+
+            if state=s_stop then
+                state <= s_forward;
+
+                -- first add b accumulated sum
+                for lane in 0 to PARALLELISM-1 loop
+                    var_y(lane) := (others=>'0');
+                    var_x(lane) := signed(b_in(lane));
+                    var_w(lane) := FXP_ONE;
+                end loop;
+            elsif state=s_forward then
+
+                -- remapping to x and w, x is shared by all lanes
+                for lane in 0 to PARALLELISM-1 loop
+                    var_y(lane) := macc_sum(lane);
+                    var_x(lane) := fxp_x;
+                    var_w(lane) := signed(w_in(lane));
+                end loop;
+
+                if current_input_idx<IN_FEATURE_NUM-1 then
+                    current_input_idx := current_input_idx + 1;
+                    var_addr_w := var_addr_w + 1;
+                else
+                    current_input_idx := 0;
+
+                    y_write_en := '1';
+                    var_y_write_idx := current_group_idx*PARALLELISM;
+
+                    if current_group_idx<GROUP_NUM-1 then
+                        current_group_idx := current_group_idx + 1;
+                        var_addr_w := var_addr_w + 1;
+                        state <= s_stop;
+                    else
+                        state <= s_idle;
+                        done <= '1';
+                    end if;
+
+                end if;
+            end if;
+
+            for lane in 0 to PARALLELISM-1 loop
+                var_sum(lane) := multiply_accumulate(var_w(lane), var_x(lane), var_y(lane));
+            end loop;
+            macc_sum <= var_sum;
+
+            if y_write_en='1'then
+                for lane in 0 to PARALLELISM-1 loop
+                    -- the last group is padded with zero weights if PARALLELISM does not divide OUT_FEATURE_NUM
+                    if var_y_write_idx+lane < OUT_FEATURE_NUM then
+                        y_ram(var_y_write_idx+lane) <= std_logic_vector(${y_value});
+                    end if;
+                end loop;
+                y_write_en := '0';
+            end if;
+
+        end if;
+
+        x_address <= std_logic_vector(to_unsigned(current_input_idx, x_address'length));
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+        addr_b <= std_logic_vector(to_unsigned(current_group_idx, addr_b'length));
+    end process linear_main;
+
+    y_reading : process (clock, state)
+    begin
+        if (state=s_idle) or (state=s_stop) then
+            if falling_edge(clock) then
+                -- After the layer in at idle mode, y is readable
+                -- but it only update at the rising edge of the clock
+                y <= y_ram(to_integer(unsigned(y_address)));
+            end if;
+        end if;
+    end process y_reading;
+
+    -- Weight and bias banks, one of each per lane
+    ${rom_instances}
+
+end architecture rtl;
@@ -0,0 +1,211 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;               -- for type conversions
+
+library ${work_library_name};
+use ${work_library_name}.all;
+
+-- like linear.tpl.vhd, but y is kept in a memory outside the layer, so that
+-- layers whose outputs are never needed at the same time can share it
+entity ${layer_name} is
+    generic (
+        DATA_WIDTH   : integer := ${data_width};
+        FRAC_WIDTH   : integer := ${frac_width};
+        X_ADDR_WIDTH : integer := ${x_addr_width};
+        Y_ADDR_WIDTH : integer := ${y_addr_width};
+        IN_FEATURE_NUM : integer := ${in_feature_num};
+        OUT_FEATURE_NUM : integer := ${out_feature_num};
+        ACC_WIDTH : integer := ${acc_width}; -- wide enough for every partial sum of the weights and biases
+        W_ADDR_WIDTH : integer := ${w_addr_width};
+        RESOURCE_OPTION : string := ${resource_option} -- unused, the shared memory decides
+    );
+    port (
+        enable : in std_logic;
+        clock  : in std_logic;
+        x_address : out std_logic_vector(X_ADDR_WIDTH-1 downto 0);
+        y_address : in std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+
+        x   : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        y  : out std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        done   : out std_logic;
+
+        y_buffer_we : out std_logic;
+        y_buffer_write_address : out std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+        y_buffer_write_data : out std_logic_vector(DATA_WIDTH-1 downto 0);
+        y_buffer_read_address : out std_logic_vector(Y_ADDR_WIDTH-1 downto 0);
+        y_buffer_read_data : in std_logic_vector(DATA_WIDTH-1 downto 0)
+    );
+end ${layer_name};
+
+architecture rtl of ${layer_name} is
+    -----------------------------------------------------------
+    -- Functions
+    -----------------------------------------------------------
+    -- macc
+    function multiply_accumulate(w : in signed(DATA_WIDTH-1 downto 0);
+                    x : in signed(DATA_WIDTH-1 downto 0);
+                    y_0 : in signed(ACC_WIDTH-1 downto 0)
+            ) return signed is
+
+        variable TEMP : signed(DATA_WIDTH*2-1 downto 0) := (others=>'0');
+        variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+        variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
+    begin
+        TEMP := w * x;
+
+        return resize(TEMP, ACC_WIDTH)+y_0;
+    end function;
+
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0))return signed is
+        variable TEMP2 : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+        variable TEMP3 : signed(FRAC_WIDTH-1 downto 0) := (others=>'0');
+    begin
+
+        TEMP2 := x(DATA_WIDTH+FRAC_WIDTH-1 downto FRAC_WIDTH);
+        TEMP3 := x(FRAC_WIDTH-1 downto 0);
+        if TEMP2(DATA_WIDTH-1) = '1' and TEMP3 /= 0 then
+            TEMP2 := TEMP2 + 1;
+        end if;
+
+        if x>0 and TEMP2<0 then
+            TEMP2 := ('0', others => '1');
+        elsif x<0 and TEMP2>0 then
+            TEMP2 := ('1', others => '0');
+        end if;
+        return TEMP2;
+    end function;
+    ${activation_function}
+
+    -----------------------------------------------------------
+    -- Signals
+    -----------------------------------------------------------
+    constant FXP_ZERO : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    constant FXP_ONE : signed(DATA_WIDTH-1 downto 0) := to_signed(2**FRAC_WIDTH,DATA_WIDTH);
+
+    type t_state is (s_stop, s_forward, s_idle);
+
+    signal n_clock : std_logic;
+    signal w_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal b_in : std_logic_vector(DATA_WIDTH-1 downto 0) := (others=>'0');
+
+    signal addr_w : std_logic_vector(W_ADDR_WIDTH-1 downto 0) := (others=>'0');
+    --signal addr_b : std_logic_vector((log2(OUT_FEATURE_NUM)-1) downto 0) := (others=>'0');
+    signal addr_b : std_logic_vector(Y_ADDR_WIDTH-1 downto 0) := (others=>'0');
+
+    signal fxp_x, fxp_w, fxp_b, fxp_y : signed(DATA_WIDTH-1 downto 0) := (others=>'0');
+    signal macc_sum : signed(ACC_WIDTH-1 downto 0) := (others=>'0');
+
+    signal reset : std_logic := '0';
+    signal state : t_state;
+
+begin
+
+    -- connecting signals to ports
+    n_clock <= not clock;
+
+    fxp_w <= signed(w_in);
+    fxp_x <= signed(x);
+    fxp_b <= signed(b_in);
+
+    -- connects ports
+    reset <= not enable;
+
+    linear_main : process (clock, enable, reset)
+        variable current_neuron_idx : integer range 0 to OUT_FEATURE_NUM-1 := 0;
+        variable current_input_idx : integer  range 0 to IN_FEATURE_NUM-1 := 0;
+        variable var_addr_w : integer range 0 to OUT_FEATURE_NUM*IN_FEATURE_NUM-1 := 0;
+        variable var_sum, var_y : signed(ACC_WIDTH-1 downto 0);
+        variable var_w, var_x : signed(DATA_WIDTH-1 downto 0);
+        variable y_write_en : std_logic;
+        variable var_y_write_idx : integer;
+    begin
+
+        if (reset = '1') then
+            state <= s_stop;
+            done <= '0';
+
+            current_neuron_idx := 0;
+            current_input_idx := 0;
+            var_addr_w := 0;
+            y_buffer_we <= '0';
+
+        elsif rising_edge(clock) then
+
+            if state=s_stop then
+                state <= s_forward;
+
+                -- first add b accumulated sum
+                var_y := (others=>'0');
+                var_x := fxp_b;
+                var_w := FXP_ONE;
+            elsif state=s_forward then
+
+                -- remapping to x and w
+                var_y := macc_sum;
+                var_x := fxp_x;
+                var_w := fxp_w;
+
+                if current_input_idx<IN_FEATURE_NUM-1 then
+                    current_input_idx := current_input_idx + 1;
+                    var_addr_w := var_addr_w + 1;
+                else
+                    current_input_idx := 0;
+
+                    y_write_en := '1';
+                    var_y_write_idx := current_neuron_idx;
+
+                    if current_neuron_idx<OUT_FEATURE_NUM-1 then
+                        current_neuron_idx := current_neuron_idx + 1;
+                        var_addr_w := var_addr_w + 1;
+                        state <= s_stop;
+                    else
+                        state <= s_idle;
+                        done <= '1';
+                    end if;
+
+                end if;
+            end if;
+
+            var_sum := multiply_accumulate(var_w, var_x, var_y);
+            macc_sum <= var_sum;
+
+            if y_write_en='1'then
+                y_buffer_we <= '1';
+                y_buffer_write_address <= std_logic_vector(to_unsigned(var_y_write_idx, Y_ADDR_WIDTH));
+                y_buffer_write_data <= std_logic_vector(${y_value});
+                y_write_en := '0';
+            else
+                y_buffer_we <= '0';
+            end if;
+
+        end if;
+
+        x_address <= std_logic_vector(to_unsigned(current_input_idx, x_address'length));
+        addr_w <= std_logic_vector(to_unsigned(var_addr_w, addr_w'length));
+        addr_b <= std_logic_vector(to_unsigned(current_neuron_idx, addr_b'length));
+    end process linear_main;
+
+    -- the shared memory reads at the falling edge of the clock, like y_ram in linear.tpl.vhd
+    y_buffer_read_address <= y_address;
+    y <= y_buffer_read_data;
+
+    -- Weights
+    rom_w : entity ${work_library_name}.${weights_rom_name}(rtl)
+    port map  (
+        clk  => n_clock,
+        en   => '1',
+        addr => addr_w,
+        data => w_in
+    );
+
+    -- Bias
+    rom_b : entity ${work_library_name}.${bias_rom_name}(rtl)
+    port map  (
+        clk  => n_clock,
+        en   => '1',
+        addr => addr_b,
+        data => b_in
+    );
+
+end architecture rtl;
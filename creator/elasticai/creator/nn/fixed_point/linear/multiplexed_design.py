@@ -0,0 +1,217 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.nn.fixed_point import fused_activation
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.shared_designs.rom import Rom
+
+from .design import LinearDesign
+from .testbench import LinearDesignProtocol
+
+
+def can_share_mac(a: LinearDesign, b: LinearDesign) -> bool:
+    """Whether `b` can directly follow `a` on the same MAC."""
+    return (
+        a.in_feature_num == a.out_feature_num == b.in_feature_num == b.out_feature_num
+        and a.data_width == b.data_width
+        and a.frac_width == b.frac_width
+        and a.parallelism == b.parallelism == 1
+        and a.resource_option == b.resource_option
+        and a.work_library_name == b.work_library_name
+    )
+
+
+class MultiplexedLinearDesign(Design, LinearDesignProtocol):
+    """Computes a chain of linear layers of identical shape one after another
+    on a single MAC.
+
+    Compared to one `LinearDesign` per layer this saves all but one
+    multiplier and accumulator, at the cost of one extra clock cycle per
+    layer to move the outputs of a layer to its successor. Layers keep their
+    `fused_activation`, it is applied to the outputs of that layer only.
+    """
+
+    def __init__(self, name: str, layers: Sequence[LinearDesign]) -> None:
+        if len(layers) < 2:
+            raise ValueError(
+                f"multiplexing needs at least two layers, but got {len(layers)}."
+            )
+        for previous, layer in zip(layers, layers[1:]):
+            if not can_share_mac(previous, layer):
+                raise ValueError(
+                    f"{layer.name} can not share the MAC of {previous.name}."
+                )
+        super().__init__(name=name)
+        self._layers = list(layers)
+        self._first = layers[0]
+        self._features = self._first.in_feature_num
+
+    @property
+    def layers(self) -> list[LinearDesign]:
+        return self._layers
+
+    @property
+    def layer_num(self) -> int:
+        return len(self._layers)
+
+    @property
+    def in_feature_num(self) -> int:
+        return self._features
+
+    @property
+    def out_feature_num(self) -> int:
+        return self._features
+
+    @property
+    def data_width(self) -> int:
+        return self._first.data_width
+
+    @property
+    def frac_width(self) -> int:
+        return self._first.frac_width
+
+    @property
+    def accumulator_width(self) -> int:
+        return max(layer.accumulator_width for layer in self._layers)
+
+    @property
+    def port(self) -> Port:
+        return create_port(
+            x_width=self.data_width,
+            y_width=self.data_width,
+            x_count=self._features,
+            y_count=self._features,
+        )
+
+    @property
+    def latency_in_cycles(self) -> int:
+        """Clock cycles from enable until done, every layer takes as long as
+        its own `LinearDesign` plus one cycle to hand its outputs over."""
+        per_layer = self._first.latency_in_cycles
+        return self.layer_num * per_layer + self.layer_num - 1
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.restarted_after(self.latency_in_cycles)
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """A single MAC reading the concatenated weights and biases of all
+        layers, plus a buffer for the outputs handed to the next layer and
+        the fused activations of the layers."""
+        accumulator_width = self.accumulator_width
+        x_addr_width = self.port["x_address"].width
+        return _resources.total(
+            [
+                _resources.multiplier(self.data_width, self.data_width),
+                _resources.adder(accumulator_width),
+                _resources.registers(accumulator_width),
+                Rom.estimate_resources(
+                    self.layer_num * self._features**2, self.data_width
+                ),
+                Rom.estimate_resources(
+                    self.layer_num * self._features, self.data_width
+                ),
+                _resources.memory(
+                    self._features + 1,
+                    self.data_width,
+                    self._first.resource_option,
+                    writable=True,
+                ),
+                _resources.registers(self._features * self.data_width),
+                _resources.counter(x_addr_width) * 2,
+                _resources.counter(calculate_address_width(self.layer_num)),
+                *(
+                    fused_activation.function_resources(layer.fused_activation)
+                    for layer in self._layers
+                ),
+            ]
+        )
+
+    @staticmethod
+    def _function_name(layer_idx: int) -> str:
+        return f"{fused_activation.FUNCTION_NAME}_{layer_idx}"
+
+    def _activation_functions(self) -> list[str]:
+        return [
+            line
+            for idx, layer in enumerate(self._layers)
+            for line in fused_activation.function_declaration(
+                layer.fused_activation, self._function_name(idx)
+            )
+        ]
+
+    def _y_writes(self) -> list[str]:
+        """Writes the output of the layer `var_y_write_layer` to `y_ram`."""
+        lines = ["case var_y_write_layer is"]
+        for idx, layer in enumerate(self._layers):
+            choice = "others" if idx == self.layer_num - 1 else str(idx)
+            value = fused_activation.applied_to(
+                layer.fused_activation, "cut_down(var_sum)", self._function_name(idx)
+            )
+            lines.append(
+                f"    when {choice} => y_ram(var_y_write_idx) <="
+                f" std_logic_vector({value});"
+            )
+        lines.append("end case;")
+        return lines
+
+    def save_to(self, destination: Path) -> None:
+        rom_name = dict(weights=f"{self.name}_w_rom", bias=f"{self.name}_b_rom")
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="linear_multiplexed.tpl.vhd",
+            parameters=dict(
+                layer_name=self.name,
+                weights_rom_name=rom_name["weights"],
+                bias_rom_name=rom_name["bias"],
+                work_library_name=self._first.work_library_name,
+                resource_option=f'"{self._first.resource_option}"',
+                data_width=str(self.data_width),
+                frac_width=str(self.frac_width),
+                x_addr_width=str(self.port["x_address"].width),
+                y_addr_width=str(self.port["y_address"].width),
+                in_feature_num=str(self._features),
+                out_feature_num=str(self._features),
+                layer_num=str(self.layer_num),
+                acc_width=str(self.accumulator_width),
+                w_addr_width=str(
+                    calculate_address_width(self.layer_num * self._features**2)
+                ),
+                b_addr_width=str(
+                    calculate_address_width(self.layer_num * self._features)
+                ),
+                activation_functions=self._activation_functions(),
+                y_writes=self._y_writes(),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+        weights_rom = Rom(
+            name=rom_name["weights"],
+            data_width=self.data_width,
+            values_as_integers=np.concatenate(
+                [layer.weights.reshape(-1) for layer in self._layers]
+            ),
+        )
+        weights_rom.save_to(destination.create_subpath(rom_name["weights"]))
+
+        bias_rom = Rom(
+            name=rom_name["bias"],
+            data_width=self.data_width,
+            values_as_integers=np.concatenate(
+                [layer.bias.reshape(-1) for layer in self._layers]
+            ),
+        )
+        bias_rom.save_to(destination.create_subpath(rom_name["bias"]))
@@ -0,0 +1,96 @@
+from typing import cast
+
+import numpy as np
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn.fixed_point.relu.design import ReLU as ReLUDesign
+
+from .design import LinearDesign
+from .multiplexed_design import MultiplexedLinearDesign
+
+
+def create_layer(name: str, offset: int = 0, features: int = 2) -> LinearDesign:
+    return LinearDesign(
+        name=name,
+        in_feature_num=features,
+        out_feature_num=features,
+        total_bits=8,
+        frac_bits=2,
+        weights=np.arange(features**2).reshape(features, features) + offset,
+        bias=np.arange(features) + offset,
+    )
+
+
+@pytest.fixture
+def design() -> MultiplexedLinearDesign:
+    return MultiplexedLinearDesign(
+        "shared", [create_layer("a"), create_layer("b", 10), create_layer("c", 20)]
+    )
+
+
+def saved_files(design: MultiplexedLinearDesign) -> dict[str, list[str]]:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    return {
+        name: cast(InMemoryFile, destination[name]).text
+        for name in destination.children
+    }
+
+
+def test_rejects_layers_of_different_shape() -> None:
+    with pytest.raises(ValueError):
+        MultiplexedLinearDesign("shared", [create_layer("a"), create_layer("b", 0, 3)])
+
+
+def test_rejects_single_layer() -> None:
+    with pytest.raises(ValueError):
+        MultiplexedLinearDesign("shared", [create_layer("a")])
+
+
+def test_weights_of_all_layers_are_stored_in_one_rom(
+    design: MultiplexedLinearDesign,
+) -> None:
+    rom = "\n".join(saved_files(design)["shared_w_rom"])
+    expected_values = ",".join(
+        f'"{value:08b}"'
+        for value in [0, 1, 2, 3, 10, 11, 12, 13, 20, 21, 22, 23, 0, 0, 0, 0]
+    )
+    assert f"({expected_values})" in rom
+
+
+def test_engine_iterates_over_all_layers(design: MultiplexedLinearDesign) -> None:
+    code = saved_files(design)["shared"]
+    assert "        LAYER_NUM : integer := 3;" in code
+    assert "        B_ADDR_WIDTH : integer := 3;" in code
+
+
+def test_latency_adds_one_cycle_per_layer_handover(
+    design: MultiplexedLinearDesign,
+) -> None:
+    single_layer = create_layer("a").latency_in_cycles
+    assert design.latency_in_cycles == 3 * single_layer + 2
+
+
+def test_needs_a_single_dsp(design: MultiplexedLinearDesign) -> None:
+    assert design.resources.dsps == 1
+
+
+def test_applies_fused_activation_to_outputs_of_its_layer_only() -> None:
+    first = create_layer("a")
+    first.fused_activation = ReLUDesign("relu", total_bits=8, use_clock=False)
+    code = "\n".join(
+        saved_files(MultiplexedLinearDesign("shared", [first, create_layer("b")]))[
+            "shared"
+        ]
+    )
+    assert "    function activation_0(" in code
+    assert "activation_1" not in code
+    assert (
+        "                    when 0 => y_ram(var_y_write_idx) <="
+        " std_logic_vector(activation_0(cut_down(var_sum)));"
+    ) in code
+    assert (
+        "                    when others => y_ram(var_y_write_idx) <="
+        " std_logic_vector(cut_down(var_sum));"
+    ) in code
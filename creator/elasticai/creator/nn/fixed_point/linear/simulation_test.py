@@ -3,9 +3,14 @@ import torch
 
 from elasticai.creator.file_generation.on_disk_path import OnDiskPath
 from elasticai.creator.vhdl.ghdl_simulation import GHDLSimulator
+from elasticai.creator.vhdl.latency_testbench import LatencyTestbench
 from elasticai.creator.vhdl.simulated_layer import SimulatedLayer
 
+from ..hard_tanh.layer import HardTanh
+from ..relu.layer import ReLU
 from .layer import Linear
+from .multiplexed_design import MultiplexedLinearDesign
+from .testbench import LinearTestbench
 
 
 def create_ones_input_list(batch_size: int, in_feature_num: int):
@@ -124,3 +129,110 @@ def test_verify_hw_sw_equivalence_4_inputs_3_outputs(x):
     sim_layer = SimulatedLayer(testbench, GHDLSimulator, working_dir="build")
     sim_output = sim_layer(input_data)
     assert sw_output.tolist() == sim_output
+
+
+@pytest.mark.simulation
+@pytest.mark.parametrize("parallelism", (2, 3, 5))
+def test_parallel_lanes_match_sw(parallelism):
+    input_data = torch.Tensor(
+        [[[1.0, 0.5, -1.0, 0.0]], [[-0.5, 2.0, 1.0, -2.0]], [[0.0, 0.0, 0.0, 1.0]]]
+    )
+    sw_linear = Linear(
+        in_features=4,
+        out_features=5,
+        total_bits=8,
+        frac_bits=2,
+        bias=True,
+        parallelism=parallelism,
+    )
+    sw_linear.weight.data = torch.arange(-10, 10).reshape(5, 4) * 0.25
+    sw_linear.bias.data = torch.Tensor([1.0, 2.0, -1.0, 0.5, -0.25])
+    sw_output = sw_linear(input_data)
+    design = sw_linear.create_design("linear")
+    testbench = sw_linear.create_testbench("linear_testbench", design)
+    build_dir = OnDiskPath("build")
+    design.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    sim_layer = SimulatedLayer(testbench, GHDLSimulator, working_dir="build")
+    sim_output = sim_layer(input_data)
+    assert sw_output.tolist() == sim_output
+
+
+@pytest.mark.simulation
+@pytest.mark.parametrize("parallelism", (1, 2))
+def test_timing_model_matches_simulated_latency(parallelism):
+    design = Linear(
+        in_features=6,
+        out_features=4,
+        total_bits=8,
+        frac_bits=2,
+        bias=True,
+        parallelism=parallelism,
+    ).create_design("linear_timed")
+    testbench = LatencyTestbench("linear_latency_testbench", design)
+    build_dir = OnDiskPath("build")
+    design.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    simulator = GHDLSimulator(workdir="build", top_design_name=testbench.name)
+    simulator.initialize()
+    simulator.run()
+    measured = testbench.parse_reported_content(simulator.getReportedContent())
+    # done is set on the rising edge that ends the last cycle of the state
+    # machine and the testbench counts rising edges until it samples done, so
+    # the counts match exactly
+    assert measured == design.timing.latency_in_cycles
+
+
+@pytest.mark.simulation
+def test_multiplexed_layers_match_sw():
+    input_data = torch.Tensor([[[0.5, 0.25, -1.0, 1.0]], [[-1.0, 1.0, -1.0, 1.0]]])
+    layers = [
+        Linear(in_features=4, out_features=4, total_bits=8, frac_bits=2, bias=True)
+        for _ in range(3)
+    ]
+    sw_output = input_data
+    for layer in layers:
+        sw_output = layer(sw_output)
+    design = MultiplexedLinearDesign(
+        "linear_multiplexed",
+        [layer.create_design(f"linear_{i}") for i, layer in enumerate(layers)],
+    )
+    testbench = LinearTestbench("linear_testbench", design)
+    build_dir = OnDiskPath("build")
+    design.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    sim_layer = SimulatedLayer(testbench, GHDLSimulator, working_dir="build")
+    sim_output = sim_layer(input_data)
+    assert sw_output.tolist() == sim_output
+
+
+@pytest.mark.simulation
+@pytest.mark.parametrize("parallelism", (1, 2))
+@pytest.mark.parametrize(
+    "activation",
+    (ReLU(total_bits=8), HardTanh(total_bits=8, frac_bits=2)),
+)
+def test_fused_activation_matches_sw(parallelism, activation):
+    input_data = torch.Tensor(
+        [[[1.0, 0.5, -1.0, 0.0]], [[-0.5, 2.0, 1.0, -2.0]], [[0.0, 0.0, 0.0, 1.0]]]
+    )
+    sw_linear = Linear(
+        in_features=4,
+        out_features=5,
+        total_bits=8,
+        frac_bits=2,
+        bias=True,
+        parallelism=parallelism,
+    )
+    sw_linear.weight.data = torch.arange(-10, 10).reshape(5, 4) * 0.25
+    sw_linear.bias.data = torch.Tensor([1.0, 2.0, -1.0, 0.5, -0.25])
+    sw_output = activation(sw_linear(input_data))
+    design = sw_linear.create_design("linear")
+    design.fused_activation = activation.create_design("activation")
+    testbench = sw_linear.create_testbench("linear_testbench", design)
+    build_dir = OnDiskPath("build")
+    design.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    sim_layer = SimulatedLayer(testbench, GHDLSimulator, working_dir="build")
+    sim_output = sim_layer(input_data)
+    assert sw_output.tolist() == sim_output
@@ -1,5 +1,6 @@
 from functools import partial
 
+from elasticai.creator.file_generation.deduplicating_path import deduplicated
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
     InProjectTemplate,
@@ -12,7 +13,9 @@ from elasticai.creator.nn.fixed_point.hard_sigmoid import HardSigmoid
 from elasticai.creator.nn.fixed_point.hard_tanh.design import HardTanh
 from elasticai.creator.nn.fixed_point.linear.design import LinearDesign as FPLinear1d
 from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
 from elasticai.creator.vhdl.design import std_signals
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 from elasticai.creator.vhdl.design.signal import Signal
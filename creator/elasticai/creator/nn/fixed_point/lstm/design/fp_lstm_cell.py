@@ -3,6 +3,7 @@ from functools import partial
 from typing import Any, cast
 
 import numpy as np
+import numpy.typing as npt
 
 from ._common_imports import (
     Design,
@@ -12,6 +13,8 @@ from ._common_imports import (
     Port,
     Rom,
     Signal,
+    _resources,
+    _timing,
     calculate_address_width,
     module_to_package,
     std_signals,
@@ -27,25 +30,25 @@ class FPLSTMCell(Design):
         hardsigmoid: Design,
         total_bits: int,
         frac_bits: int,
-        w_ih: list[list[list[int]]],
-        w_hh: list[list[list[int]]],
-        b_ih: list[list[int]],
-        b_hh: list[list[int]],
+        w_ih: npt.ArrayLike,
+        w_hh: npt.ArrayLike,
+        b_ih: npt.ArrayLike,
+        b_hh: npt.ArrayLike,
     ) -> None:
         super().__init__(name=name)
         work_library_name: str = "work"
 
-        self.input_size = len(w_ih[0])
-        self.hidden_size = len(w_ih) // 4
-        self.weights_ih = w_ih
-        self.weights_hh = w_hh
-        self.biases_ih = b_ih
-        self.biases_hh = b_hh
+        self.weights_ih = np.asarray(w_ih, dtype=np.int64)
+        self.weights_hh = np.asarray(w_hh, dtype=np.int64)
+        self.biases_ih = np.asarray(b_ih, dtype=np.int64)
+        self.biases_hh = np.asarray(b_hh, dtype=np.int64)
+        self.input_size = self.weights_ih.shape[1]
+        self.hidden_size = self.weights_ih.shape[0] // 4
         self._config = FixedPointConfig(total_bits=total_bits, frac_bits=frac_bits)
         self._htanh = hardtanh
         self._hsigmoid = hardsigmoid
         self._rom_base_names = ("wi", "wf", "wg", "wo", "bi", "bf", "bg", "bo")
-        self._ram_base_name = f"dual_port_2_clock_ram_{self.name}"
+        self._ram_base_name = "dual_port_2_clock_ram"
         self._template = InProjectTemplate(
             package=module_to_package(self.__module__),
             file_name=f"{self.name}.tpl.vhd",
@@ -86,6 +89,57 @@ class FPLSTMCell(Design):
     def _weight_address_width(self) -> int:
         return int(cast(str, self._template.parameters["w_addr_width"]))
 
+    @property
+    def timing(self) -> _timing.Timing:
+        """Cycles of the state machines in `lstm_cell.tpl.vhd`:
+
+        - one to start the gate process,
+        - two per weight of the four gates for every hidden unit, the hadamard
+          products of one unit overlap the gates of the next,
+        - six for the hadamard products of the last unit,
+        - two per hidden unit to write back the cell and hidden state,
+        - three to signal done.
+
+        The hadamard products only keep up with the gates for
+        `input_size + hidden_size >= 4`.
+        """
+        vector_length = self.input_size + self.hidden_size
+        return _timing.restarted_after(
+            1 + 2 * self.hidden_size * vector_length + 6 + 2 * self.hidden_size + 3
+        )
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """Four gate multipliers and three for the hadamard products, a weight
+        and a bias rom per gate and rams for the concatenated input and hidden
+        state, the cell state and the hidden state."""
+        data_width = self.total_bits
+        accumulator_width = 2 * data_width
+        gate = _resources.total(
+            [
+                _resources.multiplier(data_width, data_width),
+                _resources.adder(accumulator_width),
+                _resources.registers(accumulator_width),
+                Rom.estimate_resources(
+                    (self.input_size + self.hidden_size) * self.hidden_size,
+                    data_width,
+                ),
+                Rom.estimate_resources(self.hidden_size, data_width),
+            ]
+        )
+        ram = _resources.memory(2**self._hidden_addr_width, data_width, writable=True)
+        return _resources.total(
+            [
+                gate * 4,
+                _resources.multiplier(data_width, data_width) * 3,
+                ram * 3,
+                self._htanh.resources,
+                self._hsigmoid.resources,
+                _resources.counter(self._weight_address_width),
+                _resources.counter(self._hidden_addr_width),
+            ]
+        )
+
     @property
     def port(self) -> Port:
         ctrl_signal = partial(Signal, width=0)
@@ -127,14 +181,12 @@ class FPLSTMCell(Design):
 
         destination.create_subpath("lstm_cell").as_file(".vhd").write(self._template)
 
-    def _build_weights(self) -> tuple[list[list], list[list]]:
-        weights = np.concatenate(
-            (np.array(self.weights_ih), np.array(self.weights_hh)), axis=1
-        )
-        w_i, w_f, w_g, w_o = weights.reshape(4, -1).tolist()
+    def _build_weights(self) -> tuple[list[np.ndarray], list[np.ndarray]]:
+        weights = np.concatenate((self.weights_ih, self.weights_hh), axis=1)
+        w_i, w_f, w_g, w_o = weights.reshape(4, -1)
 
         bias = np.add(self.biases_ih, self.biases_hh)
-        b_i, b_f, b_g, b_o = bias.reshape(4, -1).tolist()
+        b_i, b_f, b_g, b_o = bias.reshape(4, -1)
 
         return [w_i, w_f, w_g, w_o], [b_i, b_f, b_g, b_o]
 
@@ -161,6 +213,6 @@ class FPLSTMCell(Design):
         template = InProjectTemplate(
             file_name="dual_port_2_clock_ram.tpl.vhd",
             package=module_to_package(self.__module__),
-            parameters=dict(name=self.name),
+            parameters=dict(name=self._ram_base_name),
         )
         destination.create_subpath(self._ram_base_name).as_file(".vhd").write(template)
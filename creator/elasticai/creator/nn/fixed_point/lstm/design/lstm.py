@@ -8,11 +8,57 @@ from ._common_imports import (
     Path,
     Port,
     Signal,
+    _resources,
+    _timing,
     calculate_address_width,
+    deduplicated,
     module_to_package,
     std_signals,
 )
 
+_WRITE_INPUT_PORTS = [
+    "addr_in   : in std_logic_vector(IN_ADDR_WIDTH-1 downto 0);",
+    "x_we     : in std_logic;",
+]
+
+_WRITE_INPUT_CONFIG = [
+    "INPUT_CONFIG: process(clock, x_we)",
+    "begin",
+    "    if rising_edge(clock) then",
+    "        if x_we = '1' then",
+    "            input_buffer(to_integer(unsigned(addr_in))) := signed(x);",
+    "        end if;",
+    "    end if;",
+    "end process; -- INPUT_CONFIG",
+]
+
+_STREAMING_INPUT_PORTS = [
+    "x_valid : in std_logic;",
+    "x_last : in std_logic;",
+    "x_ready : out std_logic;",
+]
+
+# The input is accepted while the network is idle, x_last restarts at the
+# first input address for the next sequence element.
+_STREAMING_INPUT_CONFIG = [
+    "x_ready <= not enable;",
+    "",
+    "INPUT_CONFIG: process(clock)",
+    "    variable write_addr : integer range 0 to 2**IN_ADDR_WIDTH-1 := 0;",
+    "begin",
+    "    if rising_edge(clock) then",
+    "        if x_valid = '1' and enable = '0' then",
+    "            input_buffer(write_addr) := signed(x);",
+    "            if x_last = '1' then",
+    "                write_addr := 0;",
+    "            else",
+    "                write_addr := write_addr + 1;",
+    "            end if;",
+    "        end if;",
+    "    end if;",
+    "end process; -- INPUT_CONFIG",
+]
+
 
 class LSTMNetworkDesign(Design):
     def __init__(
@@ -23,10 +69,16 @@ class LSTMNetworkDesign(Design):
         frac_bits: int,
         hidden_size: int,
         input_size: int,
+        streaming_input: bool = False,
     ) -> None:
+        """With `streaming_input` the network receives its input as a stream of
+        `x_valid`/`x_last` handshakes instead of writes to `addr_in`."""
         super().__init__(name="lstm_network")
         self._linear_layer = linear_layer
         self._lstm = lstm
+        self._input_size = input_size
+        self._data_width = total_bits
+        self._in_addr_width = 4
         self.template = InProjectTemplate(
             module_to_package(self.__module__),
             file_name="lstm_network.tpl.vhd",
@@ -47,31 +99,62 @@ class LSTMNetworkDesign(Design):
                 w_addr_width=(
                     f"{calculate_address_width((hidden_size + input_size) * hidden_size)}"
                 ),
-                in_addr_width="4",
+                in_addr_width=str(self._in_addr_width),
+                input_ports=(
+                    _STREAMING_INPUT_PORTS if streaming_input else _WRITE_INPUT_PORTS
+                ),
+                input_config=(
+                    _STREAMING_INPUT_CONFIG if streaming_input else _WRITE_INPUT_CONFIG
+                ),
             ),
         )
 
         ctrl_signal = partial(Signal, width=0)
-        self._port = Port(
-            incoming=[
-                std_signals.clock(),
-                std_signals.enable(),
-                ctrl_signal("x_we"),
-                Signal("x", width=lstm.port["x_data"].width),
-                Signal("addr_in", width=lstm.port["h_out_addr"].width),
-            ],
-            outgoing=[
-                std_signals.done(),
-                Signal("d_out", width=lstm.port["h_out_data"].width),
-            ],
-        )
+        incoming = [
+            std_signals.clock(),
+            std_signals.enable(),
+            Signal("x", width=lstm.port["x_data"].width),
+        ]
+        outgoing = [
+            std_signals.done(),
+            Signal("d_out", width=lstm.port["h_out_data"].width),
+        ]
+        if streaming_input:
+            incoming.extend([std_signals.x_valid(), std_signals.x_last()])
+            outgoing.append(std_signals.x_ready())
+        else:
+            incoming.extend(
+                [
+                    ctrl_signal("x_we"),
+                    Signal("addr_in", width=self._in_addr_width),
+                ]
+            )
+        self._port = Port(incoming=incoming, outgoing=outgoing)
         self._subpath_name = "lstm_network"
 
     @property
     def port(self) -> Port:
         return self._port
 
+    @property
+    def timing(self) -> _timing.Timing:
+        """The network takes one cycle to leave reset, then runs the cell
+        once per input value, each run framed by a cycle to release the reset
+        of the cell and one to notice it is done. One cycle enables the linear
+        layer reading the final hidden state and one notices it is done."""
+        cell = self._lstm.timing.latency_in_cycles
+        linear = self._linear_layer.timing.latency_in_cycles
+        return _timing.restarted_after(self._input_size * (cell + 2) + linear + 3)
+
+    @property
+    def resources(self) -> _resources.Resources:
+        input_buffer = _resources.memory(
+            2**self._in_addr_width, self._data_width, writable=True
+        )
+        return self._lstm.resources + self._linear_layer.resources + input_buffer
+
     def save_to(self, destination: Path) -> None:
+        destination = deduplicated(destination)
         self._lstm.save_to(destination)
         self._linear_layer.save_to(destination.create_subpath(self._linear_layer.name))
         destination.create_subpath(self._subpath_name).as_file(".vhd").write(
@@ -194,7 +194,7 @@ clk_hadamard_internal <= clock;
 --------------------------------------------------------
 
 -- Instantiation x input buffer
-buffer_h : entity ${library}.dual_port_2_clock_ram_${name}(rtl)
+buffer_h : entity ${library}.dual_port_2_clock_ram(rtl)
 generic map (
     RAM_WIDTH => DATA_WIDTH,
     RAM_DEPTH_WIDTH => X_H_ADDR_WIDTH,
@@ -219,7 +219,7 @@ x_h_config_addr <= state_update_x_h_addr;
 x_h_config_data <= state_update_x_h_data;
 x_h_config_we <= state_update_we;
 
-buffer_c : entity ${library}.dual_port_2_clock_ram_${name}(rtl)
+buffer_c : entity ${library}.dual_port_2_clock_ram(rtl)
 generic map (
     RAM_WIDTH => DATA_WIDTH,
     RAM_DEPTH_WIDTH => HIDDEN_ADDR_WIDTH,
@@ -247,7 +247,7 @@ c_config_data <= state_update_cell_data;
 c_config_we <= state_update_we;
 
 
-temp_h : entity ${library}.dual_port_2_clock_ram_${name}(rtl)
+temp_h : entity ${library}.dual_port_2_clock_ram(rtl)
 generic map (
     RAM_WIDTH => DATA_WIDTH,
     RAM_DEPTH_WIDTH => X_H_ADDR_WIDTH,
@@ -268,7 +268,7 @@ port map  (
 );
 
 
-temp_c : entity ${library}.dual_port_2_clock_ram_${name}(rtl)
+temp_c : entity ${library}.dual_port_2_clock_ram(rtl)
 generic map (
     RAM_WIDTH => DATA_WIDTH,
     RAM_DEPTH_WIDTH => X_H_ADDR_WIDTH,
@@ -21,8 +21,7 @@ entity ${name} is
         clock     : in std_logic;
         enable    : in std_logic;    -- start computing when it is '1'
         x     : in std_logic_vector(DATA_WIDTH-1 downto 0);
-        addr_in   : in std_logic_vector(IN_ADDR_WIDTH-1 downto 0);
-        x_we     : in std_logic;
+        ${input_ports}
         done : out std_logic;
         d_out : out std_logic_vector(DATA_WIDTH-1 downto 0)
     );
@@ -57,14 +56,7 @@ architecture rtl of ${name} is
     shared variable test_x_ram : t_y_array:=(-7,-4,-8,4,5,5,-10,0,8,8,12,-8,1,-6,-13,-5,0,4,9,5,0,0,0,0,0,0,0,0,0,0,0,0); --27
 begin
 
-    INPUT_CONFIG: process(clock, x_we)
-    begin
-        if rising_edge(clock) then
-            if x_we = '1' then
-                input_buffer(to_integer(unsigned(addr_in))) := signed(x);
-            end if;
-        end if;
-    end process; -- INPUT_CONFIG
+    ${input_config}
 
     INPUT_READ: process(clock, enable)
     begin
@@ -6,6 +6,8 @@ from elasticai.creator.nn.fixed_point.lstm.layer import (
     FixedPointLSTMWithHardActivations,
     LSTMNetwork,
 )
+from elasticai.creator.vhdl.ghdl_simulation import GHDLSimulator
+from elasticai.creator.vhdl.latency_testbench import LatencyTestbench
 
 
 @pytest.mark.simulation
@@ -34,3 +36,38 @@ def test_lstm_network_simulation(tmp_path):
     design = model.create_design("lstm_network")
     testbench = model.create_testbench("lstm_network_tb", design)
     testbench.save_to(OnDiskPath(str(tmp_path), parent=""))
+
+
+@pytest.mark.simulation
+def test_timing_model_matches_simulated_latency(tmp_path):
+    # two input values run the cell twice, the sizes keep the address widths
+    # of the hidden state and the linear layer input equal
+    hidden_size = 6
+    model = LSTMNetwork(
+        [
+            FixedPointLSTMWithHardActivations(
+                total_bits=8,
+                frac_bits=4,
+                input_size=2,
+                hidden_size=hidden_size,
+                bias=True,
+            ),
+            Linear(
+                total_bits=8,
+                frac_bits=4,
+                in_features=hidden_size,
+                out_features=1,
+                bias=True,
+            ),
+        ]
+    )
+    design = model.create_design("lstm_network")
+    testbench = LatencyTestbench("lstm_network_latency_testbench", design)
+    build_dir = OnDiskPath(str(tmp_path), parent="")
+    design.save_to(build_dir.create_subpath("srcs"))
+    testbench.save_to(build_dir.create_subpath("testbenches"))
+    simulator = GHDLSimulator(workdir=str(tmp_path), top_design_name=testbench.name)
+    simulator.initialize()
+    simulator.run()
+    measured = testbench.parse_reported_content(simulator.getReportedContent())
+    assert measured == design.timing.latency_in_cycles
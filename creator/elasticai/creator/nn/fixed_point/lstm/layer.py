@@ -20,8 +20,9 @@ from .design.testbench import LSTMTestBench
 
 
 class LSTMNetwork(DesignCreatorModule):
-    def __init__(self, layers: list[torch.nn.Module]):
+    def __init__(self, layers: list[torch.nn.Module], streaming_input: bool = False):
         super().__init__()
+        self._streaming_input = streaming_input
         self.lstm = layers[0]
         self.layer_names = [f"fp_linear_{i}" for i in range(len(layers[1:]))]
         if len(self.layer_names) > 1:
@@ -46,6 +47,7 @@ class LSTMNetwork(DesignCreatorModule):
             frac_bits=frac_bits,
             hidden_size=hidden_size,
             input_size=input_size,
+            streaming_input=self._streaming_input,
         )
 
     def create_testbench(self, test_bench_name, uut: Design) -> LSTMTestBench:
@@ -107,25 +109,35 @@ class FixedPointLSTMWithHardActivations(DesignCreatorModule, LSTM):
         return self._config
 
     def create_design(self, name: str = "lstm_cell") -> Design:
-        def float_to_signed_int(value: float | list) -> int | list:
-            if isinstance(value, list):
-                return list(map(float_to_signed_int, value))
-            return self._config.as_integer(value)
-
-        def cast_weights(x):
-            return cast(list[list[list[int]]], x)
-
-        def cast_bias(x):
-            return cast(list[list[int]], x)
+        def float_to_signed_int(value: torch.Tensor) -> torch.Tensor:
+            return self._config.as_rounded_integer(value.detach())
 
         return FPLSTMCell(
             name=name,
-            hardtanh=self.cell.tanh.create_design(f"{name}_hardtanh"),
-            hardsigmoid=self.cell.sigmoid.create_design(f"{name}_hardsigmoid"),
+            hardtanh=self.cell.tanh.create_design(self._hard_tanh_name()),
+            hardsigmoid=self.cell.sigmoid.create_design(self._hard_sigmoid_name()),
             total_bits=self._config.total_bits,
             frac_bits=self._config.frac_bits,
-            w_ih=cast_weights(float_to_signed_int(self.cell.linear_ih.weight.tolist())),
-            w_hh=cast_weights(float_to_signed_int(self.cell.linear_hh.weight.tolist())),
-            b_ih=cast_bias(float_to_signed_int(self.cell.linear_ih.bias.tolist())),
-            b_hh=cast_bias(float_to_signed_int(self.cell.linear_hh.bias.tolist())),
+            w_ih=float_to_signed_int(self.cell.linear_ih.weight),
+            w_hh=float_to_signed_int(self.cell.linear_hh.weight),
+            b_ih=float_to_signed_int(self.cell.linear_ih.bias),
+            b_hh=float_to_signed_int(self.cell.linear_hh.bias),
         )
+
+    def _hard_tanh_name(self) -> str:
+        """Activations are named after their parameters instead of the cell,
+        so cells with the same fixed point config share their files when
+        saved to a `DeduplicatingPath`."""
+        tanh = cast(HardTanh, self.cell.tanh)
+        bounds = (self._config.as_integer(v) for v in (tanh.min_val, tanh.max_val))
+        return "_".join(
+            [
+                "hardtanh",
+                str(self._config.total_bits),
+                str(self._config.frac_bits),
+                *(str(b) if b >= 0 else f"m{-b}" for b in bounds),
+            ]
+        )
+
+    def _hard_sigmoid_name(self) -> str:
+        return f"hardsigmoid_{self._config.total_bits}_{self._config.frac_bits}"
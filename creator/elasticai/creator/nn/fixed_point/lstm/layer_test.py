@@ -0,0 +1,36 @@
+from typing import cast
+
+from elasticai.creator.file_generation.deduplicating_path import deduplicated
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
+
+from .layer import FixedPointLSTMWithHardActivations
+
+
+def create_lstm(total_bits: int = 8) -> FixedPointLSTMWithHardActivations:
+    return FixedPointLSTMWithHardActivations(
+        total_bits=total_bits, frac_bits=4, input_size=1, hidden_size=4, bias=True
+    )
+
+
+def test_activations_are_named_after_their_parameters() -> None:
+    build = InMemoryPath("build", parent=None)
+    create_lstm().create_design().save_to(build)
+    files = cast(InMemoryPath, build["lstm_cell"]).children
+    assert "hardtanh_8_4_m16_16" in files and "hardsigmoid_8_4" in files
+
+
+def test_cells_with_same_config_share_activation_files() -> None:
+    build = InMemoryPath("build", parent=None)
+    destination = deduplicated(build)
+    for network, total_bits in (("first", 8), ("second", 8), ("third", 6)):
+        cell = create_lstm(total_bits).create_design()
+        cell.save_to(destination.create_subpath(network))
+    written = {
+        name: set(
+            cast(InMemoryPath, cast(InMemoryPath, build[name])["lstm_cell"]).children
+        )
+        for name in ("first", "second", "third")
+    }
+    assert "hardtanh_8_4_m16_16" not in written["second"]
+    assert "hardsigmoid_8_4" not in written["second"]
+    assert "hardsigmoid_6_4" in written["third"]
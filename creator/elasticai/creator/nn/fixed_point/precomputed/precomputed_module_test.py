@@ -27,7 +27,7 @@ architecture rtl of tanh is
 begin
     signed_x <= signed(x);
     y <= std_logic_vector(signed_y);
-    tanh_process : process(x)
+    tanh_process : process(signed_x)
     begin
         if signed_x <= -20 then signed_y <= to_signed(-3, 8);
         elsif signed_x <= -10 then signed_y <= to_signed(-3, 8);
@@ -72,7 +72,7 @@ architecture rtl of sigmoid is
 begin
     signed_x <= signed(x);
     y <= std_logic_vector(signed_y);
-    sigmoid_process : process(x)
+    sigmoid_process : process(signed_x)
     begin
         if signed_x <= -20 then signed_y <= to_signed(0, 8);
         elsif signed_x <= -10 then signed_y <= to_signed(0, 8);
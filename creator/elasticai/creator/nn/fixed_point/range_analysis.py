@@ -0,0 +1,79 @@
+"""Value ranges of the integer arithmetic in generated MAC units.
+
+Ranges are inclusive `(lower, upper)` pairs of two's complement integers, as
+they appear in hardware, i.e. fixed point values scaled by `2**frac_bits`.
+"""
+
+import numpy as np
+import numpy.typing as npt
+
+IntRange = tuple[int, int]
+
+
+def data_range(total_bits: int) -> IntRange:
+    return -(2 ** (total_bits - 1)), 2 ** (total_bits - 1) - 1
+
+
+def signed_width(value_range: IntRange) -> int:
+    """Number of bits of the narrowest two's complement number holding
+    every value of `value_range`."""
+    lower, upper = value_range
+    magnitude_bits = upper.bit_length() if upper > 0 else 0
+    if lower < 0:
+        magnitude_bits = max(magnitude_bits, (-lower - 1).bit_length())
+    return magnitude_bits + 1
+
+
+def accumulator_range(
+    weights: npt.ArrayLike,
+    bias: npt.ArrayLike,
+    frac_bits: int,
+    x_range: IntRange,
+) -> IntRange:
+    """Range of every partial sum of `bias * 2**frac_bits + sum(w * x)` over
+    all neurons, independent of the order terms are accumulated in.
+
+    `weights` holds one row of fan in weights per neuron. The sums are
+    computed in int64 if they provably fit, as python integers otherwise.
+    """
+    x_lower, x_upper = x_range
+    bias = np.asarray(bias)
+    w = np.asarray(weights).reshape(len(bias), -1)
+    dtype = _summing_dtype(w, bias, frac_bits, max(abs(x_lower), abs(x_upper)))
+    w = w.astype(dtype)
+    b = bias.astype(dtype) * 2**frac_bits
+    products = np.stack((w * x_lower, w * x_upper))
+    upper = np.maximum(products.max(axis=0), 0).sum(axis=1) + np.maximum(b, 0)
+    lower = np.minimum(products.min(axis=0), 0).sum(axis=1) + np.minimum(b, 0)
+    return int(lower.min(initial=0)), int(upper.max(initial=0))
+
+
+def _summing_dtype(
+    w: np.ndarray, b: np.ndarray, frac_bits: int, x_magnitude: int
+) -> type:
+    def magnitude(values: np.ndarray) -> int:
+        return max((abs(int(v)) for v in (values.min(), values.max())), default=0)
+
+    if w.size == 0 or b.size == 0:
+        return np.int64
+    bound = magnitude(w) * x_magnitude * w.shape[1] + magnitude(b) * 2**frac_bits
+    return np.int64 if bound <= np.iinfo(np.int64).max else object
+
+
+def accumulator_width(
+    weights: npt.ArrayLike,
+    bias: npt.ArrayLike,
+    total_bits: int,
+    frac_bits: int,
+    x_range: IntRange | None = None,
+) -> int:
+    """Narrowest accumulator that cannot overflow for inputs in `x_range`,
+    the full data range by default.
+
+    Rounding the result back to `total_bits` slices it above `frac_bits`,
+    so the accumulator never gets narrower than `total_bits + frac_bits`.
+    """
+    if x_range is None:
+        x_range = data_range(total_bits)
+    required = signed_width(accumulator_range(weights, bias, frac_bits, x_range))
+    return max(required, total_bits + frac_bits)
@@ -0,0 +1,67 @@
+import pytest
+
+from .range_analysis import (
+    accumulator_range,
+    accumulator_width,
+    data_range,
+    signed_width,
+)
+
+
+def test_data_range_of_eight_bits() -> None:
+    assert data_range(8) == (-128, 127)
+
+
+@pytest.mark.parametrize(
+    "value_range, expected",
+    [
+        ((0, 0), 1),
+        ((-1, 0), 1),
+        ((-2, 1), 2),
+        ((-128, 127), 8),
+        ((-129, 0), 9),
+        ((0, 128), 9),
+    ],
+)
+def test_signed_width(value_range: tuple[int, int], expected: int) -> None:
+    assert signed_width(value_range) == expected
+
+
+def test_accumulator_range_adds_worst_case_products_and_scaled_bias() -> None:
+    weights = [[2, -3]]
+    bias = [1]
+    assert accumulator_range(weights, bias, frac_bits=2, x_range=(-4, 3)) == (
+        -8 - 9,
+        6 + 12 + 4,
+    )
+
+
+def test_accumulator_range_covers_all_neurons() -> None:
+    weights = [[1], [-1]]
+    bias = [0, 0]
+    assert accumulator_range(weights, bias, frac_bits=0, x_range=(0, 5)) == (-5, 5)
+
+
+def test_large_fan_in_needs_wider_accumulator_than_twice_data_width() -> None:
+    weights = [[127] * 4]
+    bias = [127]
+    assert accumulator_width(weights, bias, total_bits=8, frac_bits=4) == 18
+
+
+def test_small_weights_need_at_least_total_plus_frac_bits() -> None:
+    assert accumulator_width([[1]], [0], total_bits=8, frac_bits=4) == 12
+
+
+def test_narrow_input_range_shrinks_accumulator() -> None:
+    weights = [[127] * 4]
+    bias = [127]
+    assert accumulator_width(
+        weights, bias, total_bits=8, frac_bits=4, x_range=(0, 16)
+    ) < accumulator_width(weights, bias, total_bits=8, frac_bits=4)
+
+
+def test_sums_beyond_int64_are_exact() -> None:
+    weight = 2**31 - 1
+    assert accumulator_range(
+        [[weight] * 16], [0], frac_bits=0, x_range=(-(2**31), 2**31 - 1)
+    ) == (-16 * weight * 2**31, 16 * weight**2)
@@ -1,16 +1,35 @@
 from elasticai.creator.base_modules.relu import ReLU as ReLUBase
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
+from elasticai.creator.vhdl.shared_designs.stream import StreamingElementwise
 
 from .design import ReLU as ReLUDesign
 
 
 class ReLU(DesignCreatorModule, ReLUBase):
-    def __init__(self, total_bits: int, use_clock: bool = False) -> None:
+    def __init__(
+        self, total_bits: int, use_clock: bool = False, streaming: bool = False
+    ) -> None:
+        """With `streaming` the design takes and passes one value per
+        valid/ready handshake. Within a `Sequential` this only pays off
+        next to other streaming designs: between two addressable layers
+        the network has to convert to a stream before the ReLU and buffer
+        the stream again behind it, which costs more than the plain
+        unbuffered ReLU reading through the addresses of its neighbours."""
         super().__init__()
         self._total_bits = total_bits
         self._use_clock = use_clock
+        self._streaming = streaming
 
-    def create_design(self, name: str) -> ReLUDesign:
+    def create_design(self, name: str) -> ReLUDesign | StreamingElementwise:
+        if self._streaming:
+            return StreamingElementwise(
+                name=name,
+                inner=self._create_relu_design(f"{name}_elementwise"),
+                inner_latency=1 if self._use_clock else 0,
+            )
+        return self._create_relu_design(name)
+
+    def _create_relu_design(self, name: str) -> ReLUDesign:
         return ReLUDesign(
             name=name,
             total_bits=self._total_bits,
@@ -75,3 +75,13 @@ end architecture rtl;
     design.save_to(build_path)
     actual = cast(InMemoryFile, build_path["relu"]).text
     assert actual == expected
+
+
+def test_streaming_relu_wraps_combinational_relu() -> None:
+    relu = ReLU(total_bits=16, streaming=True)
+    build_path = InMemoryPath("build", parent=None)
+    relu.create_design("relu").save_to(build_path)
+    wrapper = cast(InMemoryFile, build_path["relu"]).text
+    inner = cast(InMemoryFile, build_path["relu_elementwise"]["relu_elementwise"]).text
+    assert "        INNER_LATENCY : integer := 0" in wrapper
+    assert "        CLOCK_OPTION : boolean := false" in inner
@@ -6,6 +6,7 @@ from elasticai.creator.base_modules.conv1d import MathOperations as Conv1dOps
 from elasticai.creator.base_modules.linear import MathOperations as LinearOps
 from elasticai.creator.base_modules.lstm_cell import MathOperations as LSTMOps
 
+from ._minifloat_table import largest_value
 from ._round_to_float import RoundToFloat
 
 
@@ -16,10 +17,7 @@ class MathOperations(LinearOps, Conv1dOps, LSTMOps):
 
     @property
     def largest_positive_value(self) -> float:
-        exponent_bias = 2 ** (self.exponent_bits - 1)
-        return (2 - 1 / 2**self.mantissa_bits) * 2 ** (
-            2**self.exponent_bits - exponent_bias - 1
-        )
+        return largest_value(self.mantissa_bits, self.exponent_bits)
 
     @property
     def smallest_negative_value(self) -> float:
@@ -0,0 +1,96 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import torch
+
+_MAX_TABLE_SIZE = 1 << 17
+_BIT_LAYOUTS = {torch.float32: (torch.int32, 23), torch.float64: (torch.int64, 52)}
+
+
+def exponent_bias(exponent_bits: int) -> int:
+    return 2 ** (exponent_bits - 1)
+
+
+def largest_value(mantissa_bits: int, exponent_bits: int) -> float:
+    bias = exponent_bias(exponent_bits)
+    return (2 - 1 / 2**mantissa_bits) * 2 ** (2**exponent_bits - bias - 1)
+
+
+def smallest_value(mantissa_bits: int, exponent_bits: int) -> float:
+    return 2 ** (1 - exponent_bias(exponent_bits) - mantissa_bits)
+
+
+def _exponent_range(mantissa_bits: int, exponent_bits: int) -> range:
+    bias = exponent_bias(exponent_bits)
+    return range(1 - bias - mantissa_bits, 2**exponent_bits - bias)
+
+
+def fits_into_table(mantissa_bits: int, exponent_bits: int, dtype: torch.dtype) -> bool:
+    if dtype not in _BIT_LAYOUTS:
+        return False
+    info = torch.finfo(dtype)
+    exponents = _exponent_range(mantissa_bits, exponent_bits)
+    return (
+        len(exponents) * 2**mantissa_bits <= _MAX_TABLE_SIZE
+        and mantissa_bits < _BIT_LAYOUTS[dtype][1]
+        and exponents.start >= math.log2(info.tiny)
+        and exponents.stop <= math.log2(info.max)
+    )
+
+
+@dataclass(frozen=True)
+class MinifloatTable:
+    """Sorted positive magnitudes a minifloat config can represent.
+
+    Positive IEEE floats are ordered like their bit patterns, so the table
+    index of a magnitude is its bit pattern with the surplus mantissa bits
+    rounded away (half to even) minus the pattern of the smallest value.
+    That spares us a search as well as `log2`/`pow` per element.
+    """
+
+    values: torch.Tensor
+    mantissa_bits: int
+    shift: int
+    offset: int
+
+    def round(self, x: torch.Tensor) -> torch.Tensor:
+        magnitude = x.abs()
+        bits = magnitude.view(_BIT_LAYOUTS[x.dtype][0])
+        if self.mantissa_bits > 0:
+            index = (bits >> self.shift).bitwise_and_(1)
+        else:
+            index = torch.ones_like(bits)
+        index.add_(bits).add_((1 << (self.shift - 1)) - 1)
+        index.bitwise_right_shift_(self.shift).sub_(self.offset)
+        index.clamp_(0, self.values.numel() - 1)
+        rounded = self.values.index_select(0, index.flatten()).view_as(x)
+        smallest = self.values[0]
+        return rounded.copysign_(x).masked_fill_(magnitude < smallest, smallest)
+
+
+@lru_cache(maxsize=None)
+def minifloat_table(
+    mantissa_bits: int,
+    exponent_bits: int,
+    dtype: torch.dtype = torch.float32,
+    device: torch.device = torch.device("cpu"),
+) -> MinifloatTable:
+    int_dtype, float_mantissa_bits = _BIT_LAYOUTS[dtype]
+    exponent_range = _exponent_range(mantissa_bits, exponent_bits)
+    exponents = torch.arange(
+        exponent_range.start, exponent_range.stop, dtype=torch.float64
+    )
+    mantissas = torch.arange(2**mantissa_bits, 2 ** (mantissa_bits + 1))
+    values = torch.ldexp(
+        mantissas.to(torch.float64).unsqueeze(0),
+        (exponents - mantissa_bits).unsqueeze(1),
+    ).flatten()
+    values = values.to(dtype=dtype, device=device)
+    shift = float_mantissa_bits - mantissa_bits
+    return MinifloatTable(
+        values=values,
+        mantissa_bits=mantissa_bits,
+        shift=shift,
+        offset=int(values[0].view(int_dtype).item()) >> shift,
+    )
@@ -2,6 +2,13 @@ from typing import Any
 
 import torch
 
+from ._minifloat_table import (
+    fits_into_table,
+    largest_value,
+    minifloat_table,
+    smallest_value,
+)
+
 
 class RoundToFloat(torch.autograd.Function):
     @staticmethod
@@ -15,18 +22,17 @@ class RoundToFloat(torch.autograd.Function):
         mantissa_bits: int = args[1]
         exponent_bits: int = args[2]
 
-        exponent_bias = 2 ** (exponent_bits - 1)
-        largest_value = (2 - 1 / 2**mantissa_bits) * 2 ** (
-            2**exponent_bits - exponent_bias - 1
-        )
-
-        out_of_bounds = (x < -largest_value) | (x > largest_value)
+        largest = largest_value(mantissa_bits, exponent_bits)
+        out_of_bounds = (x < -largest) | (x > largest)
         if torch.any(out_of_bounds):
             raise ValueError("Cannot quantize tensor. Values out of bounds.")
 
-        smallest_value = 2 ** (1 - exponent_bias - mantissa_bits)
-        x[(x > -smallest_value) & (x < smallest_value)] = smallest_value
+        if fits_into_table(mantissa_bits, exponent_bits, x.dtype):
+            table = minifloat_table(mantissa_bits, exponent_bits, x.dtype, x.device)
+            return table.round(x)
 
+        smallest = smallest_value(mantissa_bits, exponent_bits)
+        x = torch.where((x > -smallest) & (x < smallest), smallest, x)
         scale = 2 ** (x.abs().log2().floor() - mantissa_bits)
         return scale * torch.round(x / scale)
 
@@ -44,3 +44,45 @@ def test_uses_different_scale_for_each_value_in_tensor() -> None:
 def test_raises_error_if_value_out_of_bounds(decimal: float) -> None:
     with pytest.raises(ValueError):
         _ = roundToFloat(decimal, 6, 3)
+
+
+def _round_arithmetically(
+    x: torch.Tensor, mantissa_bits: int, exponent_bits: int
+) -> torch.Tensor:
+    smallest_value = 2 ** (1 - 2 ** (exponent_bits - 1) - mantissa_bits)
+    x = torch.where((x > -smallest_value) & (x < smallest_value), smallest_value, x)
+    scale = 2 ** (x.abs().log2().floor() - mantissa_bits)
+    return scale * torch.round(x / scale)
+
+
+def test_does_not_modify_input() -> None:
+    values = torch.tensor([0.0, -0.001, 0.001, 1.3])
+    original = values.clone()
+    _ = roundToFloat(values, 6, 3)
+    assertTensorEqual(original, values)
+
+
+@pytest.mark.parametrize(
+    "mantissa_bits,exponent_bits", [(0, 2), (1, 1), (3, 1), (3, 4), (6, 3), (10, 5)]
+)
+def test_matches_arithmetic_rounding(mantissa_bits: int, exponent_bits: int) -> None:
+    exponent_bias = 2 ** (exponent_bits - 1)
+    largest = (2 - 1 / 2**mantissa_bits) * 2 ** (2**exponent_bits - exponent_bias - 1)
+    generator = torch.Generator().manual_seed(0)
+    values = (torch.rand(10_000, generator=generator) * 2 - 1) * largest
+    exponents = torch.randint(-12, 1, (10_000,), generator=generator)
+    values = torch.cat([values, values * 2.0**exponents])
+    expected = _round_arithmetically(values, mantissa_bits, exponent_bits)
+    assertTensorEqual(expected, roundToFloat(values, mantissa_bits, exponent_bits))
+
+
+def test_breaks_ties_like_torch_round() -> None:
+    values = torch.tensor([1.0625, 1.1875, -1.0625, 0.1875, 1.5])
+    expected = _round_arithmetically(values, 3, 2)
+    assertTensorEqual(expected, roundToFloat(values, 3, 2))
+
+
+def test_passes_gradient_through() -> None:
+    values = torch.tensor([0.0, 0.3, -1.2], requires_grad=True)
+    roundToFloat(values, 3, 1).sum().backward()
+    assertTensorEqual([1.0, 1.0, 1.0], cast(torch.Tensor, values.grad))
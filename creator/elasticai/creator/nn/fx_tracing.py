@@ -0,0 +1,158 @@
+"""Import of `elasticai.creator.nn` models into an `ir.Graph` via torch.fx.
+
+Modules creating designs are leaves of the trace, every call of such a
+module becomes a node whose type is the lower case class name, as used by
+`Sequential` for naming its sub designs. The attributes of a node are
+extracted by the functions registered at `module_attributes` for its type,
+quantized parameters are stored as integer arrays of the smallest dtype
+holding `total_bits`. Calls of other torch modules, like a `BatchNorm1d`
+that is not folded yet, are typed `torch_<class name>`. Every other node
+of the trace, like inputs, outputs and calls of functions, becomes a node
+typed after its fx opcode or function name without further attributes.
+"""
+
+from collections.abc import Callable
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+import torch
+import torch.fx
+
+from elasticai.creator import ir
+from elasticai.creator.function_utils import KeyedFunctionDispatcher
+from elasticai.creator.ir.attribute import Attribute
+from elasticai.creator.nn.design_creator_module import DesignCreatorModule
+from elasticai.creator.nn.fixed_point._two_complement_fixed_point_config import (
+    FixedPointConfig,
+)
+
+
+def module_type(module: torch.nn.Module) -> str:
+    return module.__class__.__name__.lower()
+
+
+module_attributes: KeyedFunctionDispatcher[torch.nn.Module, dict[str, Attribute]] = (
+    KeyedFunctionDispatcher(module_type)
+)
+
+
+class DesignCreatorTracer(torch.fx.Tracer):
+    """Does not trace into modules that create designs, their forward
+    functions quantize with data dependent checks that fx can not trace.
+    Containers, like `Sequential`, are traced into."""
+
+    def is_leaf_module(self, m: torch.nn.Module, module_qualified_name: str) -> bool:
+        if isinstance(m, DesignCreatorModule) and not isinstance(
+            m, (torch.nn.Sequential, torch.nn.ModuleList, torch.nn.ModuleDict)
+        ):
+            return True
+        return super().is_leaf_module(m, module_qualified_name)
+
+
+def to_ir(model: torch.nn.Module) -> ir.Graph[ir.Node, ir.Edge]:
+    """Traces `model` and converts its fx graph into an `ir.Graph`.
+
+    Node names are the names fx assigns, edges point from the node producing
+    a value to every node consuming it. Nodes are added in execution order.
+    """
+    traced = DesignCreatorTracer().trace(model)
+    modules = dict(model.named_modules())
+    graph: ir.Graph[ir.Node, ir.Edge] = ir.Graph()
+    for fx_node in traced.nodes:
+        graph.add_node(_to_ir_node(fx_node, modules))
+        for source in fx_node.all_input_nodes:
+            graph.add_edge(ir.edge(source.name, fx_node.name))
+    return graph
+
+
+def _to_ir_node(fx_node: torch.fx.Node, modules: dict[str, torch.nn.Module]) -> ir.Node:
+    if fx_node.op == "call_module":
+        target = cast(str, fx_node.target)
+        module = modules[target]
+        attributes: dict[str, Attribute] = dict(target=target)
+        if not isinstance(module, DesignCreatorModule):
+            return ir.node(fx_node.name, f"torch_{module_type(module)}", attributes)
+        if module_attributes.can_dispatch(module):
+            attributes |= module_attributes(module)
+        return ir.node(fx_node.name, module_type(module), attributes)
+    if fx_node.op in ("call_function", "call_method"):
+        return ir.node(fx_node.name, _callable_name(fx_node.target))
+    return ir.node(fx_node.name, fx_node.op)
+
+
+def _callable_name(target: Callable[..., Any] | str) -> str:
+    if isinstance(target, str):
+        return target
+    return getattr(target, "__name__", str(target))
+
+
+def integer_array(
+    values: torch.Tensor, config: FixedPointConfig
+) -> npt.NDArray[np.integer]:
+    """`values` as rounded fixed point integers in the smallest signed dtype
+    holding `config.total_bits`."""
+    dtype = np.min_scalar_type(config.minimum_as_integer)
+    integers = config.as_rounded_integer(values.detach().cpu()).clamp(
+        config.minimum_as_integer, config.maximum_as_integer
+    )
+    return integers.numpy().astype(dtype)
+
+
+def _bias(module: torch.nn.Module, outputs: int) -> torch.Tensor:
+    bias = cast(torch.Tensor | None, module.bias)
+    return torch.zeros(outputs) if bias is None else bias
+
+
+def _format(config: FixedPointConfig) -> dict[str, Attribute]:
+    return dict(total_bits=config.total_bits, frac_bits=config.frac_bits)
+
+
+@module_attributes.register
+def linear(module: torch.nn.Module) -> dict[str, Attribute]:
+    config = cast(FixedPointConfig, module._config)
+    return _format(config) | dict(
+        in_features=module.in_features,
+        out_features=module.out_features,
+        parallelism=module.parallelism,
+        weight=integer_array(module.weight, config),
+        bias=integer_array(_bias(module, module.out_features), config),
+    )
+
+
+@module_attributes.register
+def conv1d(module: torch.nn.Module) -> dict[str, Attribute]:
+    config = cast(FixedPointConfig, module._config)
+    (kernel_size,) = module.kernel_size
+    return _format(config) | dict(
+        in_channels=module.in_channels,
+        out_channels=module.out_channels,
+        signal_length=module._signal_length,
+        kernel_size=kernel_size,
+        parallelism=module.parallelism,
+        weight=integer_array(module.weight, config),
+        bias=integer_array(_bias(module, module.out_channels), config),
+    )
+
+
+@module_attributes.register
+def relu(module: torch.nn.Module) -> dict[str, Attribute]:
+    return dict(
+        total_bits=module._total_bits,
+        use_clock=module._use_clock,
+        streaming=module._streaming,
+    )
+
+
+@module_attributes.register
+def hardtanh(module: torch.nn.Module) -> dict[str, Attribute]:
+    config = cast(FixedPointConfig, module._config)
+    return _format(config) | dict(
+        min_val=config.as_integer(module.min_val),
+        max_val=config.as_integer(module.max_val),
+    )
+
+
+@module_attributes.register
+def hardsigmoid(module: torch.nn.Module) -> dict[str, Attribute]:
+    return _format(cast(FixedPointConfig, module._config))
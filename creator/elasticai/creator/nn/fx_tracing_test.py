@@ -0,0 +1,72 @@
+import numpy as np
+import torch
+
+from elasticai.creator.nn.fixed_point import HardTanh, Linear, ReLU
+from elasticai.creator.nn.sequential import Sequential
+
+from .fx_tracing import to_ir
+
+
+def linear(total_bits: int = 8) -> Linear:
+    return Linear(in_features=3, out_features=2, total_bits=total_bits, frac_bits=2)
+
+
+def test_sequential_becomes_chain_of_typed_nodes() -> None:
+    graph = to_ir(Sequential(linear(), ReLU(8), HardTanh(8, 2)))
+    assert [n.type for n in graph.nodes.values()] == [
+        "placeholder",
+        "linear",
+        "relu",
+        "hardtanh",
+        "output",
+    ]
+    names = list(graph.nodes)
+    assert list(graph.edges) == list(zip(names, names[1:]))
+
+
+def test_parameters_are_stored_as_compact_integer_arrays() -> None:
+    layer = linear()
+    with torch.no_grad():
+        layer.weight.copy_(torch.tensor([[0.25, -0.5, 1.0], [2.0, 0.0, -1.0]]))
+        layer.bias.copy_(torch.tensor([0.5, -0.25]))
+    (node,) = (n for n in to_ir(Sequential(layer)).nodes.values() if n.type == "linear")
+    weight = node.data["weight"]
+    assert isinstance(weight, np.ndarray) and weight.dtype == np.int8
+    assert weight.tolist() == [[1, -2, 4], [8, 0, -4]]
+    assert node.data["bias"].tolist() == [2, -1]
+
+
+def test_wider_formats_get_wider_arrays() -> None:
+    graph = to_ir(Sequential(linear(total_bits=12)))
+    assert graph.nodes["_0"].data["weight"].dtype == np.int16
+
+
+def test_fixed_point_format_and_shape_are_attributes() -> None:
+    node = to_ir(Sequential(linear())).nodes["_0"]
+    assert {
+        k: node.data[k]
+        for k in ("target", "total_bits", "frac_bits", "in_features", "out_features")
+    } == dict(target="0", total_bits=8, frac_bits=2, in_features=3, out_features=2)
+
+
+class Residual(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.linear = Linear(in_features=3, out_features=3, total_bits=8, frac_bits=2)
+        self.norm = torch.nn.BatchNorm1d(3)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.norm(x + self.linear(x))
+
+
+def test_non_sequential_models_keep_their_data_flow() -> None:
+    graph = to_ir(Residual())
+    types = {name: n.type for name, n in graph.nodes.items()}
+    assert types == dict(
+        x="placeholder",
+        linear="linear",
+        add="add",
+        norm="torch_batchnorm1d",
+        output="output",
+    )
+    assert set(graph.predecessors("add")) == {"x", "linear"}
@@ -5,6 +5,8 @@ from elasticai.creator.file_generation.template import (
 )
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
 from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 
@@ -16,6 +18,18 @@ class BufferedIdentity(Design):
         self._address_width = calculate_address_width(num_input_features)
         super().__init__(name)
 
+    @property
+    def y_count(self) -> int:
+        return self._num_input_features
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.combinational()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.Resources()
+
     @property
     def port(self) -> Port:
         return create_port(
@@ -45,6 +59,14 @@ class BufferlessDesign(Design):
         super().__init__(name)
         self._num_input_bits = num_input_bits
 
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.combinational()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.Resources()
+
     @property
     def port(self) -> Port:
         return create_port(x_width=self._num_input_bits, y_width=self._num_input_bits)
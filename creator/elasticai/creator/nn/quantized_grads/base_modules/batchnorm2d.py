@@ -12,7 +12,8 @@ class MathOperations(Quantize, Protocol): ...
 class BatchNorm2d(_BatchNorm2d):
     """This module implements a 2d batch norm.
     The output of the batchnorm is fake quantized. The weights and bias are fake quantized during initialization.
-    To keep the weights quantized use only optimizers that apply a quantized update
+    To keep the weights quantized use only optimizers that apply a quantized update,
+    e.g. QuantizedSGD or QuantizedAdam from elasticai.creator.nn.quantized_grads.fixed_point.
     """
 
     def __init__(
@@ -13,7 +13,8 @@ class MathOperations(Quantize, Protocol): ...
 class Conv2d(_Conv2d):
     """This module implements a 2d convolution.
     The output of the convolution is fake quantized. The weights and bias are fake quantized during initialization.
-    To keep the weights quantized use only optimizers that apply a quantized update
+    To keep the weights quantized use only optimizers that apply a quantized update,
+    e.g. QuantizedSGD or QuantizedAdam from elasticai.creator.nn.quantized_grads.fixed_point.
     """
 
     def __init__(
@@ -5,4 +5,10 @@ from .math_operations import (
     MathOperationsForwHTE,
     MathOperationsForwStoch,
 )
-from .quantize_to_fixed_point import quantize_to_fxp_hte, quantize_to_fxp_stochastic
+from .optimizers import QuantizedAdam, QuantizedSGD
+from .quantize_to_fixed_point import (
+    StochasticRounding,
+    quantize_to_fxp_hte,
+    quantize_to_fxp_hte_,
+    quantize_to_fxp_stochastic,
+)
@@ -6,18 +6,22 @@ from elasticai.creator.nn.quantized_grads._math_operations import MathOperations
 from elasticai.creator.nn.quantized_grads.fixed_point import FixedPointConfigV2
 from elasticai.creator.nn.quantized_grads.fixed_point._round_to_fixed_point_autograd import (
     QuantizeForwBackwHTE,
-    QuantizeForwBackwStochastic,
     QuantizeForwHTE,
-    QuantizeForwStochastic,
+    _make_autograd_function_forw,
+    _make_autograd_function_forwbackw,
+)
+from elasticai.creator.nn.quantized_grads.fixed_point.quantize_to_fixed_point import (
+    StochasticRounding,
 )
 
 
 class MathOperationsForwStoch(MathOperations):
-    def __init__(self, forward: FixedPointConfigV2) -> None:
+    def __init__(self, forward: FixedPointConfigV2, seed: int | None = None) -> None:
         self.forward = forward
+        self._quantize_forw = _make_autograd_function_forw(StochasticRounding(seed))
 
     def quantize(self, a: torch.Tensor) -> torch.Tensor:
-        return cast(torch.Tensor, QuantizeForwStochastic.apply(a, self.forward))
+        return cast(torch.Tensor, self._quantize_forw.apply(a, self.forward))
 
 
 class MathOperationsForwHTE(MathOperations):
@@ -30,15 +34,21 @@ class MathOperationsForwHTE(MathOperations):
 
 class MathOperationsForwBackwStoch(MathOperations):
     def __init__(
-        self, forward: FixedPointConfigV2, backward: FixedPointConfigV2
+        self,
+        forward: FixedPointConfigV2,
+        backward: FixedPointConfigV2,
+        seed: int | None = None,
     ) -> None:
         self.forward = forward
         self.backward = backward
+        self._quantize_forwbackw = _make_autograd_function_forwbackw(
+            StochasticRounding(seed)
+        )
 
     def quantize(self, a: torch.Tensor) -> torch.Tensor:
         return cast(
             torch.Tensor,
-            QuantizeForwBackwStochastic.apply(a, self.forward, self.backward),
+            self._quantize_forwbackw.apply(a, self.forward, self.backward),
         )
 
 
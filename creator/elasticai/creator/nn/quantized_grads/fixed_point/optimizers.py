@@ -0,0 +1,158 @@
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import Any, Literal
+
+import torch
+from torch.optim import Optimizer
+
+from ._two_complement_fixed_point_config import FixedPointConfigV2
+from .quantize_to_fixed_point import StochasticRounding, quantize_to_fxp_hte_
+
+Rounding = Literal["hte", "stochastic"]
+
+
+class _FixedPointOptimizer(Optimizer, ABC):
+    def __init__(
+        self,
+        params: Iterable[torch.Tensor] | Iterable[dict[str, Any]],
+        defaults: dict[str, Any],
+        param_config: FixedPointConfigV2,
+        state_config: FixedPointConfigV2 | None,
+        rounding: Rounding,
+        seed: int | None,
+    ) -> None:
+        super().__init__(params, defaults)
+        self.param_config = param_config
+        self.state_config = param_config if state_config is None else state_config
+        self._quantize_: Callable[[torch.Tensor, FixedPointConfigV2], torch.Tensor]
+        if rounding == "hte":
+            self._quantize_ = quantize_to_fxp_hte_
+        elif rounding == "stochastic":
+            self._quantize_ = StochasticRounding(seed).quantize_
+        else:
+            raise ValueError(
+                f"rounding needs to be 'hte' or 'stochastic', but is {rounding}."
+            )
+
+    def _params_with_grad(self, group: dict[str, Any]) -> Iterable[torch.Tensor]:
+        return (p for p in group["params"] if p.grad is not None)
+
+    @torch.no_grad()
+    def step(self, closure: Callable[[], float] | None = None) -> float | None:  # type: ignore[override]
+        loss = None
+        if closure is not None:
+            with torch.enable_grad():
+                loss = closure()
+        for group in self.param_groups:
+            for p in self._params_with_grad(group):
+                self._update_(p, group, self.state[p])
+                self._quantize_(p, self.param_config)
+        return loss
+
+    @abstractmethod
+    def _update_(
+        self, p: torch.Tensor, group: dict[str, Any], state: dict[str, Any]
+    ) -> None: ...
+
+
+class QuantizedSGD(_FixedPointOptimizer):
+    """SGD with optional momentum for parameters in fixed point.
+    Parameters are updated and requantized to `param_config` in place after every step.
+    The momentum buffer is kept in `state_config` (defaults to `param_config`).
+    Use `rounding="stochastic"` to keep small updates from being rounded away.
+    """
+
+    def __init__(
+        self,
+        params: Iterable[torch.Tensor] | Iterable[dict[str, Any]],
+        lr: float,
+        param_config: FixedPointConfigV2,
+        state_config: FixedPointConfigV2 | None = None,
+        momentum: float = 0.0,
+        rounding: Rounding = "hte",
+        seed: int | None = None,
+    ) -> None:
+        if lr < 0.0:
+            raise ValueError(f"Invalid learning rate: {lr}")
+        if momentum < 0.0:
+            raise ValueError(f"Invalid momentum value: {momentum}")
+        super().__init__(
+            params,
+            dict(lr=lr, momentum=momentum),
+            param_config,
+            state_config,
+            rounding,
+            seed,
+        )
+
+    def _update_(
+        self, p: torch.Tensor, group: dict[str, Any], state: dict[str, Any]
+    ) -> None:
+        assert p.grad is not None
+        update = p.grad
+        if group["momentum"] != 0.0:
+            if "momentum_buffer" not in state:
+                state["momentum_buffer"] = p.grad.clone()
+            else:
+                state["momentum_buffer"].mul_(group["momentum"]).add_(p.grad)
+            update = self._quantize_(state["momentum_buffer"], self.state_config)
+        p.add_(update, alpha=-group["lr"])
+
+
+class QuantizedAdam(_FixedPointOptimizer):
+    """Adam for parameters in fixed point.
+    Parameters are updated and requantized to `param_config` in place after every step.
+    First and second moment estimates are kept in `state_config` (defaults to `param_config`).
+    The second moment holds squared gradients, so `state_config` usually needs more frac bits than `param_config`.
+    Second moments below the resolution of `state_config` round to zero, the denominator
+    is floored at that resolution, so such parameters are not pushed to the limits of their range.
+    """
+
+    def __init__(
+        self,
+        params: Iterable[torch.Tensor] | Iterable[dict[str, Any]],
+        lr: float,
+        param_config: FixedPointConfigV2,
+        state_config: FixedPointConfigV2 | None = None,
+        betas: tuple[float, float] = (0.9, 0.999),
+        eps: float = 1e-8,
+        rounding: Rounding = "hte",
+        seed: int | None = None,
+    ) -> None:
+        if lr < 0.0:
+            raise ValueError(f"Invalid learning rate: {lr}")
+        if not all(0.0 <= beta < 1.0 for beta in betas):
+            raise ValueError(f"Invalid beta parameters: {betas}")
+        super().__init__(
+            params,
+            dict(lr=lr, betas=betas, eps=eps),
+            param_config,
+            state_config,
+            rounding,
+            seed,
+        )
+
+    def _update_(
+        self, p: torch.Tensor, group: dict[str, Any], state: dict[str, Any]
+    ) -> None:
+        assert p.grad is not None
+        beta1, beta2 = group["betas"]
+        if len(state) == 0:
+            state["step"] = 0
+            state["exp_avg"] = torch.zeros_like(p)
+            state["exp_avg_sq"] = torch.zeros_like(p)
+        state["step"] += 1
+        exp_avg = state["exp_avg"].mul_(beta1).add_(p.grad, alpha=1 - beta1)
+        exp_avg_sq = state["exp_avg_sq"].mul_(beta2)
+        exp_avg_sq.addcmul_(p.grad, p.grad, value=1 - beta2)
+        self._quantize_(exp_avg, self.state_config)
+        self._quantize_(exp_avg_sq, self.state_config)
+
+        bias_correction1 = 1 - beta1 ** state["step"]
+        bias_correction2 = 1 - beta2 ** state["step"]
+        resolution = 2.0**-self.state_config.frac_bits
+        denominator = exp_avg_sq.clamp(min=resolution).sqrt_()
+        denominator.div_(math.sqrt(bias_correction2))
+        denominator.add_(group["eps"])
+        p.addcdiv_(exp_avg, denominator, value=-group["lr"] / bias_correction1)
@@ -1,19 +1,93 @@
+import threading
+from collections import OrderedDict
+
 import torch
 
 from elasticai.creator.nn.quantized_grads.fixed_point import FixedPointConfigV2
 
 
+class StochasticRounding:
+    """
+    Round fixed point stochastic with reusable noise buffers.
+    Noise is drawn into a buffer that is kept per shape, dtype and device and reused by later calls.
+    Only the `max_buffers` most recently used buffers are kept, so create one instance per call site,
+    e.g. per optimizer, whose tensors come in a few shapes.
+    Clamping, adding noise, rounding and rescaling happen in place on the single output tensor.
+    Drawing and adding the noise is locked, an instance can be shared between threads.
+    Passing a seed makes the results reproducible, without a seed the global torch generator is used.
+    """
+
+    def __init__(self, seed: int | None = None, max_buffers: int = 4) -> None:
+        self._seed = seed
+        self._max_buffers = max_buffers
+        self._lock = threading.Lock()
+        self._generators: dict[torch.device, torch.Generator] = {}
+        self._noise_buffers: OrderedDict[
+            tuple[torch.Size, torch.dtype, torch.device], torch.Tensor
+        ] = OrderedDict()
+
+    def __call__(
+        self, number: torch.Tensor, fxp_conf: FixedPointConfigV2
+    ) -> torch.Tensor:
+        out = torch.clamp(
+            number, fxp_conf.minimum_as_rational, fxp_conf.maximum_as_rational
+        )
+        return self._round_clamped_(out, fxp_conf)
+
+    def quantize_(
+        self, number: torch.Tensor, fxp_conf: FixedPointConfigV2
+    ) -> torch.Tensor:
+        """
+        In place version of calling the instance, overwrites and returns `number`.
+        """
+        number.clamp_(fxp_conf.minimum_as_rational, fxp_conf.maximum_as_rational)
+        return self._round_clamped_(number, fxp_conf)
+
+    def _round_clamped_(
+        self, number: torch.Tensor, fxp_conf: FixedPointConfigV2
+    ) -> torch.Tensor:
+        scale = 2**fxp_conf.frac_bits
+        number.mul_(scale)
+        with self._lock:
+            number.add_(self._noise(number))
+        return number.round_().div_(scale)
+
+    def _noise(self, like: torch.Tensor) -> torch.Tensor:
+        key = (like.shape, like.dtype, like.device)
+        if key in self._noise_buffers:
+            self._noise_buffers.move_to_end(key)
+        else:
+            if len(self._noise_buffers) == self._max_buffers:
+                self._noise_buffers.popitem(last=False)
+            self._noise_buffers[key] = torch.empty(
+                like.shape, dtype=like.dtype, device=like.device
+            )
+        return self._noise_buffers[key].uniform_(
+            -0.5, 0.5, generator=self._generator(like.device)
+        )
+
+    def _generator(self, device: torch.device) -> torch.Generator | None:
+        if self._seed is None:
+            return None
+        if device not in self._generators:
+            self._generators[device] = torch.Generator(device).manual_seed(self._seed)
+        return self._generators[device]
+
+
 def quantize_to_fxp_stochastic(
     number: torch.Tensor, fxp_conf: FixedPointConfigV2
 ) -> torch.Tensor:
     """
     Round fixed point stochastic adds a noise of [-0.5/2**fracbits to 0.5/2**fracbits] on the input tensor.
     The tensor is clamped and rounded to a fixed point number.
+    The noise is drawn for every call, use a `StochasticRounding` to reuse its buffer.
     """
-    noise = (torch.rand_like(number) - 0.5) / (2**fxp_conf.frac_bits)
-    return _round_to_fixed_point_hte(
-        _clamp(number, fxp_conf) + noise, fxp_conf.frac_bits
+    scale = 2**fxp_conf.frac_bits
+    out = torch.clamp(
+        number, fxp_conf.minimum_as_rational, fxp_conf.maximum_as_rational
     )
+    out.mul_(scale).add_(torch.rand_like(out).sub_(0.5))
+    return out.round_().div_(scale)
 
 
 def quantize_to_fxp_hte(
@@ -26,6 +100,17 @@ def quantize_to_fxp_hte(
     return _clamp(_round_to_fixed_point_hte(number, fxp_conf.frac_bits), fxp_conf)
 
 
+def quantize_to_fxp_hte_(
+    number: torch.Tensor, fxp_conf: FixedPointConfigV2
+) -> torch.Tensor:
+    """
+    In place version of quantize_to_fxp_hte, overwrites and returns `number`.
+    """
+    scale = 2**fxp_conf.frac_bits
+    number.mul_(scale).round_().div_(scale)
+    return number.clamp_(fxp_conf.minimum_as_rational, fxp_conf.maximum_as_rational)
+
+
 def _clamp(number: torch.Tensor, fxp_conf: FixedPointConfigV2) -> torch.Tensor:
     return torch.clamp(
         number,
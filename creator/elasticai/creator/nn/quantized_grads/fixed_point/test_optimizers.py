@@ -0,0 +1,131 @@
+import pytest
+import torch
+
+from elasticai.creator.nn.quantized_grads.fixed_point import (
+    FixedPointConfigV2,
+    QuantizedAdam,
+    QuantizedSGD,
+    quantize_to_fxp_hte,
+)
+
+PARAM_CONF = FixedPointConfigV2(total_bits=8, frac_bits=4)
+STATE_CONF = FixedPointConfigV2(total_bits=16, frac_bits=12)
+
+
+def is_on_grid(x: torch.Tensor, conf: FixedPointConfigV2) -> bool:
+    return (
+        torch.equal(x * 2**conf.frac_bits, torch.round(x * 2**conf.frac_bits))
+        and bool((x >= conf.minimum_as_rational).all())
+        and bool((x <= conf.maximum_as_rational).all())
+    )
+
+
+def make_param(values: list[float]) -> torch.nn.Parameter:
+    return torch.nn.Parameter(torch.tensor(values))
+
+
+def test_sgd_matches_float_sgd_with_requantization():
+    p = make_param([0.5, -1.0, 2.0])
+    p.grad = torch.tensor([1.0, -3.0, 0.3])
+    QuantizedSGD([p], lr=0.1, param_config=PARAM_CONF).step()
+    expected = quantize_to_fxp_hte(
+        torch.tensor([0.5, -1.0, 2.0]) - 0.1 * torch.tensor([1.0, -3.0, 0.3]),
+        PARAM_CONF,
+    )
+    assert torch.equal(p.data, expected)
+
+
+def test_sgd_updates_parameter_in_place():
+    p = make_param([0.5, -1.0])
+    storage = p.data.data_ptr()
+    p.grad = torch.tensor([1.0, 1.0])
+    QuantizedSGD([p], lr=0.1, param_config=PARAM_CONF).step()
+    assert p.data.data_ptr() == storage
+
+
+def test_sgd_clamps_to_param_config():
+    p = make_param([7.5, -8.0])
+    p.grad = torch.tensor([-10.0, 10.0])
+    QuantizedSGD([p], lr=1.0, param_config=PARAM_CONF).step()
+    assert p.data.tolist() == [
+        PARAM_CONF.maximum_as_rational,
+        PARAM_CONF.minimum_as_rational,
+    ]
+
+
+def test_sgd_keeps_momentum_buffer_in_state_config():
+    p = make_param([0.5, -1.0, 2.0])
+    optimizer = QuantizedSGD(
+        [p], lr=0.1, param_config=PARAM_CONF, state_config=STATE_CONF, momentum=0.9
+    )
+    for _ in range(3):
+        p.grad = torch.tensor([0.123, -0.456, 0.789])
+        optimizer.step()
+    assert is_on_grid(optimizer.state[p]["momentum_buffer"], STATE_CONF)
+    assert is_on_grid(p.data, PARAM_CONF)
+
+
+def test_stochastic_sgd_is_reproducible_from_seed():
+    def train(seed: int) -> torch.Tensor:
+        p = make_param([0.5, -1.0, 2.0, 0.25])
+        optimizer = QuantizedSGD(
+            [p], lr=0.01, param_config=PARAM_CONF, rounding="stochastic", seed=seed
+        )
+        for _ in range(10):
+            p.grad = torch.tensor([1.0, -2.0, 0.5, 3.0])
+            optimizer.step()
+        return p.data
+
+    assert torch.equal(train(5), train(5))
+    assert is_on_grid(train(5), PARAM_CONF)
+
+
+def test_stochastic_rounding_does_not_swallow_small_updates():
+    p = make_param([0.0] * 1000)
+    optimizer = QuantizedSGD(
+        [p], lr=0.01, param_config=PARAM_CONF, rounding="stochastic", seed=0
+    )
+    p.grad = torch.ones(1000)
+    optimizer.step()
+    assert p.data.min() < 0
+
+
+def test_adam_keeps_parameters_and_moments_in_fixed_point():
+    p = make_param([0.5, -1.0, 2.0])
+    optimizer = QuantizedAdam(
+        [p], lr=0.1, param_config=PARAM_CONF, state_config=STATE_CONF
+    )
+    for _ in range(5):
+        p.grad = torch.tensor([0.3, -0.2, 0.1])
+        optimizer.step()
+    assert is_on_grid(p.data, PARAM_CONF)
+    assert is_on_grid(optimizer.state[p]["exp_avg"], STATE_CONF)
+    assert is_on_grid(optimizer.state[p]["exp_avg_sq"], STATE_CONF)
+
+
+def test_adam_moves_parameters_against_gradient():
+    p = make_param([0.5, -1.0])
+    optimizer = QuantizedAdam(
+        [p], lr=0.25, param_config=PARAM_CONF, state_config=STATE_CONF
+    )
+    p.grad = torch.tensor([1.0, -1.0])
+    optimizer.step()
+    assert p.data.tolist() == [0.25, -0.75]
+
+
+def test_adam_keeps_parameters_with_second_moment_below_resolution():
+    p = make_param([0.5, -1.0])
+    optimizer = QuantizedAdam(
+        [p], lr=1e-3, param_config=PARAM_CONF, state_config=STATE_CONF
+    )
+    p.grad = torch.tensor([0.03, -0.03])
+    optimizer.step()
+    assert optimizer.state[p]["exp_avg_sq"].tolist() == [0.0, 0.0]
+    assert p.data.tolist() == [0.5, -1.0]
+
+
+def test_raises_error_for_unknown_rounding():
+    with pytest.raises(ValueError):
+        QuantizedSGD(
+            [make_param([0.0])], lr=0.1, param_config=PARAM_CONF, rounding="up"
+        )  # type: ignore[arg-type]
@@ -1,10 +1,16 @@
 import torch
 
 from elasticai.creator.nn.quantized_grads.fixed_point import FixedPointConfigV2
+from elasticai.creator.nn.quantized_grads.fixed_point.math_operations import (
+    MathOperationsForwBackwStoch,
+    MathOperationsForwStoch,
+)
 from elasticai.creator.nn.quantized_grads.fixed_point.quantize_to_fixed_point import (
+    StochasticRounding,
     _clamp,
     _round_to_fixed_point_hte,
     quantize_to_fxp_hte,
+    quantize_to_fxp_stochastic,
 )
 
 
@@ -98,3 +104,85 @@ def test_quantize_determinstic_to_fixed_point():
         ]
     )
     assert torch.equal(actual, expected)
+
+
+def test_quantize_stochastic_matches_unfused_computation():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    x = torch.linspace(-20, 20, 1000)
+    torch.manual_seed(3)
+    noise = (torch.rand_like(x) - 0.5) / (2**conf.frac_bits)
+    expected = _round_to_fixed_point_hte(_clamp(x, conf) + noise, conf.frac_bits)
+    torch.manual_seed(3)
+    actual = quantize_to_fxp_stochastic(x, conf)
+    assert torch.equal(actual, expected)
+
+
+def test_quantize_stochastic_does_not_modify_input():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    x = torch.linspace(-20, 20, 100)
+    original = x.clone()
+    quantize_to_fxp_stochastic(x, conf)
+    assert torch.equal(x, original)
+
+
+def test_stochastic_rounding_is_reproducible_from_seed():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    x = torch.rand(4, 16)
+    first, second = StochasticRounding(seed=42), StochasticRounding(seed=42)
+    for _ in range(3):
+        assert torch.equal(first(x, conf), second(x, conf))
+
+
+def test_stochastic_rounding_rounds_to_neighbouring_fixed_point_values():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=2)
+    x = torch.full((1000,), 0.1)
+    actual = StochasticRounding(seed=0)(x, conf)
+    assert set(actual.tolist()) == {0.0, 0.25}
+
+
+def test_stochastic_rounding_reuses_noise_buffer_without_aliasing_outputs():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    rounding = StochasticRounding(seed=1)
+    x = torch.rand(64)
+    first = rounding(x, conf)
+    first_copy = first.clone()
+    second = rounding(x, conf)
+    assert torch.equal(first, first_copy)
+    assert first.data_ptr() != second.data_ptr()
+
+
+def test_stochastic_rounding_keeps_only_recently_used_noise_buffers():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    rounding = StochasticRounding(seed=1, max_buffers=2)
+    for size in (1, 2, 3, 2):
+        rounding(torch.rand(size), conf)
+    assert [key[0] for key in rounding._noise_buffers] == [
+        torch.Size([3]),
+        torch.Size([2]),
+    ]
+
+
+def test_seeded_math_operations_reproduce_gradients():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+
+    def gradient(seed: int) -> torch.Tensor:
+        x = torch.rand(32, requires_grad=True)
+        ops = MathOperationsForwBackwStoch(conf, conf, seed=seed)
+        (ops.quantize(x) * torch.linspace(0, 1, 32)).sum().backward()
+        return x.grad
+
+    torch.manual_seed(0)
+    first = gradient(7)
+    torch.manual_seed(0)
+    assert torch.equal(first, gradient(7))
+
+
+def test_unseeded_math_operations_draw_from_global_generator():
+    conf = FixedPointConfigV2(total_bits=8, frac_bits=3)
+    x = torch.rand(32)
+    ops = MathOperationsForwStoch(conf)
+
+    torch.manual_seed(0)
+    first = ops.quantize(x)
+    torch.manual_seed(0)
+    assert torch.equal(first, ops.quantize(x))
@@ -1,6 +1,8 @@
-from functools import partial, reduce
+import copy
+import dataclasses
 from itertools import chain
 
+from elasticai.creator.file_generation.deduplicating_path import deduplicated
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
     InProjectTemplate,
@@ -9,83 +11,172 @@ from elasticai.creator.file_generation.template import (
 from elasticai.creator.vhdl.auto_wire_protocols.autowiring import (
     AutoWirer,
     DataFlowNode,
+    DataProtocol,
+    protocol_changes,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import (
+    create_port,
+    create_port_for_pipelined_design,
 )
-from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
 from elasticai.creator.vhdl.code_generation.code_abstractions import (
     create_connections_using_to_from_pairs,
     create_instance,
+    create_join,
     create_signal_definitions,
 )
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.signal import Signal
+from elasticai.creator.vhdl.shared_designs.pipeline import (
+    PingPongBuffer,
+    PipelineControl,
+)
+from elasticai.creator.vhdl.shared_designs.stream import (
+    AddressableToStream,
+    StreamToAddressable,
+)
+
+from .memory_planning import MemoryPlan, buffer_lifetimes, plan_memory
+
+_BUFFER_SIGNALS = ("we", "write_address", "write_data", "read_address", "read_data")
+
+
+def _buffer_signals(prefix: str, width: int, address_width: int) -> list[Signal]:
+    widths = dict(
+        we=0,
+        write_address=address_width,
+        write_data=width,
+        read_address=address_width,
+        read_data=width,
+    )
+    return [Signal(f"{prefix}{name}", widths[name]) for name in _BUFFER_SIGNALS]
+
+
+def _data_flow_node(name: str, port: Port) -> DataFlowNode:
+    return DataFlowNode(
+        name=name,
+        sinks=tuple(s.name for s in port.incoming),
+        sources=tuple(s.name for s in port.outgoing),
+    )
 
 
 class Sequential(Design):
+    """Chains its sub designs in the given order.
+
+    Where a streaming sub design follows an addressable one or vice versa, an
+    `AddressableToStream` or `StreamToAddressable` adapter is inserted.
+    With `share_buffers` the output buffers of sub designs that are never
+    read at the same time are moved into shared memories, see `memory_plan`.
+    """
+
+    _template_file_name = "network.tpl.vhd"
+
     def __init__(
         self,
         sub_designs: list[Design],
         *,
         name: str,
+        share_buffers: bool = False,
     ) -> None:
         super().__init__(name)
-        self._subdesigns = sub_designs
+        self._subdesigns = self._insert_protocol_adapters(sub_designs)
+        self._shared_buffers = (
+            plan_memory(self._subdesigns).shared_buffers if share_buffers else ()
+        )
+        sharing = {m.design for b in self._shared_buffers for m in b.members}
+        self._subdesigns = [
+            self._sharing_output_buffer(d) if d.name in sharing else d
+            for d in self._subdesigns
+        ]
+        self._ports: dict[str, Port] = {d.name: d.port for d in self._subdesigns}
+        autowirer = self._wire()
         self._connections: dict[tuple[str, str], tuple[str, str]] = (
-            self._build_connections_map()
+            autowirer.connections()
         )
+        self._joins = autowirer.joins()
         self._port = self._build_port()
         self._library_name_for_instances = "work"
         self._architecture_name_for_instances = "rtl"
 
-    def _qualified_signal_name(self, instance: str, signal: str) -> str:
-        return f"{instance}_{signal}"
+    @staticmethod
+    def _sharing_output_buffer(design: Design) -> Design:
+        """A copy of `design` writing into a shared buffer, the given design
+        may still be used in other networks with its own buffer."""
+        sharing = copy.copy(design)
+        setattr(sharing, "shares_output_buffer", True)
+        return sharing
 
-    def _build_port(self) -> Port:
-        def get_designs_by_name(name: str) -> list[Design]:
-            return [d for d in self._subdesigns if d.name == name]
-
-        def connected_to_self_source(
-            sink_source: tuple[tuple[str, str], tuple[str, str]], self_source_name: str
-        ) -> bool:
-            return sink_source[1] == (self.name, self_source_name)
-
-        def connected_to_self_sink(sink_source, self_sink_name):
-            return sink_source[0] == (self.name, self_sink_name)
-
-        def sink_design_name(sink_source):
-            return sink_source[0][0]
-
-        def source_design_name(
-            sink_source: tuple[tuple[str, str], tuple[str, str]],
-        ) -> str:
-            return sink_source[1][0]
-
-        def get_connected_designs(get_name, is_connected) -> list[Design]:
-            return reduce(
-                lambda a, b: a + b,
-                map(
-                    get_designs_by_name,
-                    map(
-                        get_name,
-                        filter(is_connected, self._connections.items()),
-                    ),
-                ),
-                [],
+    @staticmethod
+    def _insert_protocol_adapters(sub_designs: list[Design]) -> list[Design]:
+        """Surrounds every run of streaming designs by an
+        `AddressableToStream` and a `StreamToAddressable`.
+
+        The protocol is chosen per design, not per edge, so a single
+        streaming design between addressable ones is converted to and from
+        a stream as well, which adds a buffer and the cycles to fill it.
+        Streaming only pays off for runs of several streaming designs,
+        whose values then pass without being buffered in between.
+        """
+
+        def count_of_addressable_producer(position: int) -> int:
+            for design in reversed(sub_designs[:position]):
+                if hasattr(design, "y_count"):
+                    return design.y_count
+                if "x_address" in design.port:
+                    break
+            raise ValueError(
+                f"cannot stream into {sub_designs[position].name}, no preceding"
+                " design provides its number of outputs as y_count."
             )
 
-        width = {k: 1 for k in ("x", "y_address", "x_address", "y")}
-        sink_keys = ("y", "x_address")
-        source_keys = ("x", "y_address")
+        changes = {
+            position: to
+            for position, _, to in protocol_changes(
+                _data_flow_node(d.name, d.port) for d in sub_designs
+            )
+        }
+        designs: list[Design] = []
+        stream_in: AddressableToStream | None = None
+        for position in range(len(sub_designs) + 1):
+            if changes.get(position) == DataProtocol.STREAMING:
+                stream_in = AddressableToStream(
+                    name=f"{sub_designs[position].name}_stream_in",
+                    data_width=sub_designs[position].port["x"].width,
+                    count=count_of_addressable_producer(position),
+                )
+                designs.append(stream_in)
+            elif changes.get(position) == DataProtocol.ADDRESSABLE:
+                assert stream_in is not None
+                designs.append(
+                    StreamToAddressable(
+                        name=f"{designs[-1].name}_stream_out",
+                        data_width=designs[-1].port["y"].width,
+                        count=stream_in.count,
+                    )
+                )
+            if position < len(sub_designs):
+                designs.append(sub_designs[position])
+        return designs
 
-        for key in sink_keys:
-            connected = partial(connected_to_self_sink, self_sink_name=key)
-            for d in get_connected_designs(source_design_name, connected):
-                width[key] = d.port[key].width
+    def _qualified_signal_name(self, instance: str, signal: str) -> str:
+        return f"{instance}_{signal}"
 
-        for key in source_keys:
-            connected = partial(connected_to_self_source, self_source_name=key)
-            for d in get_connected_designs(sink_design_name, connected):
-                width[key] = d.port[key].width
+    def _build_port(self) -> Port:
+        """Widths of the top level signals are taken from the sub design
+        signals they are connected to, the last connection wins."""
+        width = {k: 1 for k in ("x", "y_address", "x_address", "y")}
+        for (sink_design, sink), (source_design, source) in self._connections.items():
+            if sink_design == self.name and source_design in self._ports:
+                if sink in ("y", "x_address"):
+                    width[sink] = self._ports[source_design][sink].width
+            elif source_design == self.name and sink_design in self._ports:
+                if source in ("x", "y_address"):
+                    width[source] = self._ports[sink_design][source].width
+        return self._create_port(width)
 
+    def _create_port(self, width: dict[str, int]) -> Port:
         return create_port(
             x_width=width["x"],
             y_width=width["y"],
@@ -97,6 +188,51 @@ class Sequential(Design):
     def port(self) -> Port:
         return self._port
 
+    @property
+    def memory_plan(self) -> MemoryPlan:
+        """Lifetimes of the output buffers and the memories they can share."""
+        return plan_memory(self._subdesigns)
+
+    @property
+    def timing(self) -> _timing.Timing:
+        """Addressable sub designs run one after the other. A streamed section
+        is filled once, then passes one value per initiation interval of its
+        slowest design."""
+        total = 0
+        section_latency = 0
+        section_interval = 1
+        count = 0
+        for design in self._subdesigns:
+            timing = design.timing
+            if isinstance(design, AddressableToStream):
+                count = design.count
+                section_latency = timing.latency_in_cycles
+                section_interval = timing.initiation_interval_in_cycles
+            elif isinstance(design, StreamToAddressable):
+                total += (
+                    section_latency
+                    + (count - 1) * section_interval
+                    + timing.latency_in_cycles
+                )
+                count = 0
+            elif count > 0:
+                section_latency += timing.latency_in_cycles
+                section_interval = max(
+                    section_interval, timing.initiation_interval_in_cycles
+                )
+            else:
+                total += timing.latency_in_cycles
+        return _timing.restarted_after(total)
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.total(
+            chain(
+                (design.resources for design in self._subdesigns),
+                (buffer.resources for buffer in self._shared_buffers),
+            )
+        )
+
     def _save_subdesigns(self, destination: Path) -> None:
         for design in self._subdesigns:
             design.save_to(destination.create_subpath(design.name))
@@ -104,20 +240,15 @@ class Sequential(Design):
     def _instance_names(self) -> list[str]:
         return [f"i_{design.name}" for design in self._subdesigns]
 
-    def _build_connections_map(self) -> dict[tuple[str, str], tuple[str, str]]:
-        named_ports = [(d.name, d.port) for d in self._subdesigns]
-        nodes = [
-            DataFlowNode(
-                name=n[0],
-                sinks=tuple(s.name for s in n[1].incoming),
-                sources=tuple(s.name for s in n[1].outgoing),
-            )
-            for n in named_ports
-        ]
-        top = DataFlowNode.top(self.name)
+    def _wire(self) -> AutoWirer:
+        nodes = [_data_flow_node(name, port) for name, port in self._ports.items()]
+        top = self._top_node()
         autowirer = AutoWirer()
         autowirer.wire(top, graph=nodes)
-        return autowirer.connections()
+        return autowirer
+
+    def _top_node(self) -> DataFlowNode:
+        return DataFlowNode.top(self.name)
 
     def _generate_connections_code(self) -> list[str]:
         def generate_name(node_name: str, signal_name: str) -> str:
@@ -131,7 +262,42 @@ class Sequential(Design):
         }
 
         lines = create_connections_using_to_from_pairs(map)
-        lines = list(sorted(lines))
+        lines += [
+            create_join(generate_name(*sink), [generate_name(*s) for s in sources])
+            for sink, sources in self._joins.items()
+        ]
+        lines = list(sorted(lines)) + self._generate_shared_buffer_connections()
+        return lines
+
+    def _generate_shared_buffer_connections(self) -> list[str]:
+        """A shared buffer belongs to the last of its members that is enabled,
+        as the buffers of all earlier members are dead by then."""
+        lines = []
+        for buffer in self._shared_buffers:
+            members = [f"i_{m.design}" for m in reversed(buffer.members)]
+            for signal in _BUFFER_SIGNALS[:-1]:
+                width = buffer.address_width if "address" in signal else 0
+
+                def source(member: str) -> str:
+                    name = f"{member}_y_buffer_{signal}"
+                    if width == 0:
+                        return name
+                    return f"std_logic_vector(resize(unsigned({name}), {width}))"
+
+                choices = [
+                    f"{source(m)} when {m}_enable = '1' else" for m in members[:-1]
+                ]
+                lines.append(
+                    " ".join(
+                        [
+                            f"{buffer.name}_{signal} <=",
+                            *choices,
+                            f"{source(members[-1])};",
+                        ]
+                    )
+                )
+            for member in members:
+                lines.append(f"{member}_y_buffer_read_data <= {buffer.name}_read_data;")
         return lines
 
     def _instance_name_and_design_pairs(self):
@@ -142,7 +308,7 @@ class Sequential(Design):
         for instance, design in self._instance_name_and_design_pairs():
             signal_map = {
                 signal.name: self._qualified_signal_name(instance, signal.name)
-                for signal in design.port
+                for signal in self._signals_of(design)
             }
             instantiations.extend(
                 create_instance(
@@ -153,13 +319,48 @@ class Sequential(Design):
                     signal_mapping=signal_map,
                 )
             )
+        for buffer in self._shared_buffers:
+            instantiations.extend(
+                create_instance(
+                    name=buffer.name,
+                    entity="shared_buffer",
+                    library=self._library_name_for_instances,
+                    architecture=self._architecture_name_for_instances,
+                    generic_mapping=dict(
+                        DATA_WIDTH=str(buffer.width),
+                        ADDR_WIDTH=str(buffer.address_width),
+                    ),
+                    signal_mapping=dict(clock="clock")
+                    | {signal: f"{buffer.name}_{signal}" for signal in _BUFFER_SIGNALS},
+                )
+            )
         return instantiations
 
+    def _signals_of(self, design: Design) -> list[Signal]:
+        signals = self._ports[design.name].signals
+        if getattr(design, "shares_output_buffer", False):
+            port = self._ports[design.name]
+            signals = signals + _buffer_signals(
+                "y_buffer_", port["y"].width, port["y_address"].width
+            )
+        return signals
+
     def _generate_signal_definitions(self) -> list[str]:
         return sorted(
-            chain.from_iterable(
-                create_signal_definitions(f"{instance_id}_", instance.port.signals)
-                for instance_id, instance in self._instance_name_and_design_pairs()
+            chain(
+                chain.from_iterable(
+                    create_signal_definitions(
+                        f"{instance_id}_", self._signals_of(design)
+                    )
+                    for instance_id, design in self._instance_name_and_design_pairs()
+                ),
+                chain.from_iterable(
+                    create_signal_definitions(
+                        f"{buffer.name}_",
+                        _buffer_signals("", buffer.width, buffer.address_width),
+                    )
+                    for buffer in self._shared_buffers
+                ),
             )
         )
 
@@ -180,10 +381,20 @@ class Sequential(Design):
         return self.port["y"].width
 
     def save_to(self, destination: Path):
+        destination = deduplicated(destination)
         self._save_subdesigns(destination)
+        if self._shared_buffers:
+            shared_buffer = InProjectTemplate(
+                package=module_to_package(self.__module__),
+                file_name="shared_buffer.tpl.vhd",
+                parameters={},
+            )
+            destination.create_subpath("shared_buffer").as_file(".vhd").write(
+                shared_buffer
+            )
         network_template = InProjectTemplate(
             package=module_to_package(self.__module__),
-            file_name="network.tpl.vhd",
+            file_name=self._template_file_name,
             parameters=dict(
                 layer_connections=self._generate_connections_code(),
                 layer_instantiations=self._generate_instantiations(),
@@ -196,3 +407,109 @@ class Sequential(Design):
             ),
         )
         destination.create_subpath(self.name).as_file(".vhd").write(network_template)
+
+
+class PipelinedSequential(Sequential):
+    """Layer pipelined network.
+
+    Every buffered sub design, together with the unbuffered designs following
+    it, forms a pipeline stage that writes into a `PingPongBuffer`. A
+    `PipelineControl` steps all stages at once as soon as each of them is done,
+    so stage n works on sample k+1 while stage n+1 works on sample k.
+    The network requests the next input with `x_sample_ready` and waits with the
+    next step until `y_sample_ready` signals that the environment consumed the
+    output.
+    """
+
+    _template_file_name = "pipelined_network.tpl.vhd"
+
+    def __init__(self, sub_designs: list[Design], *, name: str) -> None:
+        self._stages = self._split_into_stages(sub_designs)
+        designs: list[Design] = [PipelineControl(f"{name}_control")]
+        for stage, buffer in self._stages:
+            designs.extend(stage)
+            if buffer is not None:
+                designs.append(buffer)
+        super().__init__(designs, name=name)
+
+    @staticmethod
+    def _split_into_stages(
+        sub_designs: list[Design],
+    ) -> list[tuple[list[Design], PingPongBuffer | None]]:
+        def is_buffered(design: Design) -> bool:
+            return "x_address" in design.port
+
+        def output_count(design: Design) -> int:
+            if not hasattr(design, "y_count"):
+                raise ValueError(
+                    f"cannot buffer the outputs of {design.name}, it does not"
+                    " provide its number of outputs as y_count."
+                )
+            return design.y_count
+
+        stages: list[list[Design]] = [[]]
+        for design in sub_designs:
+            if is_buffered(design):
+                stages.append([])
+            stages[-1].append(design)
+
+        result: list[tuple[list[Design], PingPongBuffer | None]] = [(stages[0], None)]
+        for stage in stages[1:]:
+            head = stage[0]
+            buffer = PingPongBuffer(
+                name=f"{head.name}_buffer",
+                data_width=stage[-1].port["y"].width,
+                depth=output_count(head),
+            )
+            result.append((stage, buffer))
+        return result
+
+    @property
+    def initiation_interval_in_cycles(self) -> int:
+        """Clock cycles between two consecutive steps in steady state.
+
+        A step takes one cycle to swap the buffers and one to release the
+        reset of the layers. Then the slowest stage computes its sample and its
+        buffer copies the outputs.
+        """
+        stage_cycles = [0]
+        for stage, buffer in self._stages:
+            if buffer is None:
+                continue
+            head = stage[0]
+            stage_cycles.append(head.timing.latency_in_cycles + buffer.copy_cycles)
+        return max(stage_cycles) + 2
+
+    @property
+    def timing(self) -> _timing.Timing:
+        """A sample passes one buffered stage per step."""
+        interval = self.initiation_interval_in_cycles
+        buffered_stages = sum(1 for _, buffer in self._stages if buffer is not None)
+        return _timing.Timing(
+            latency_in_cycles=buffered_stages * interval,
+            initiation_interval_in_cycles=interval,
+        )
+
+    @property
+    def memory_plan(self) -> MemoryPlan:
+        """All stages work at once, so every buffer lives for the whole
+        schedule and no memories are shared."""
+        end = len(self._subdesigns)
+        return MemoryPlan(
+            lifetimes=tuple(
+                dataclasses.replace(lifetime, start=0, end=end)
+                for lifetime in buffer_lifetimes(self._subdesigns)
+            ),
+            shared_buffers=(),
+        )
+
+    def _top_node(self) -> DataFlowNode:
+        return DataFlowNode.pipelined_top(self.name)
+
+    def _create_port(self, width: dict[str, int]) -> Port:
+        return create_port_for_pipelined_design(
+            x_width=width["x"],
+            y_width=width["y"],
+            x_address_width=width["x_address"],
+            y_address_width=width["y_address"],
+        )
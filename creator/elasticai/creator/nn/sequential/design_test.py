@@ -1,11 +1,20 @@
+from typing import cast
+
 import pytest
 
+from elasticai.creator.file_generation.in_memory_path import InMemoryPath
 from elasticai.creator.file_generation.savable import Path
-from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.nn.fixed_point.conv1d.design import Conv1dDesign
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import (
+    create_port,
+    create_port_for_streaming_design,
+)
+from elasticai.creator.vhdl.design import timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.resources import Resources
 
-from .design import Sequential
+from .design import PipelinedSequential, Sequential
 
 
 class DummyDesign(Design):
@@ -24,6 +33,14 @@ class DummyDesign(Design):
     def save_to(self, destination: Path) -> None:
         pass
 
+    @property
+    def timing(self) -> timing.Timing:
+        return timing.combinational()
+
+    @property
+    def resources(self) -> Resources:
+        return Resources()
+
 
 class TestSequentialSignalWidthsAreDerivedFromSubdesigns:
     @pytest.fixture
@@ -42,3 +59,219 @@ class TestSequentialSignalWidthsAreDerivedFromSubdesigns:
 
     def test_y_width_matches(self, port_of_mixed_sequential: Port) -> None:
         assert port_of_mixed_sequential["y"].width == 2
+
+
+class LatencyDummyDesign(DummyDesign):
+    def __init__(self, name: str, y_count: int, latency_in_cycles: int) -> None:
+        super().__init__(name, x_width=8, y_width=8, x_count=4, y_count=y_count)
+        self.y_count = y_count
+        self.latency_in_cycles = latency_in_cycles
+
+    @property
+    def timing(self) -> timing.Timing:
+        return timing.restarted_after(self.latency_in_cycles)
+
+
+class TestPipelinedSequential:
+    @pytest.fixture
+    def pipeline(self) -> PipelinedSequential:
+        return PipelinedSequential(
+            [
+                LatencyDummyDesign("a", y_count=4, latency_in_cycles=20),
+                DummyDesign("act", x_width=8, y_width=8),
+                LatencyDummyDesign("b", y_count=2, latency_in_cycles=30),
+            ],
+            name="pipeline",
+        )
+
+    def test_buffers_every_stage(self, pipeline: PipelinedSequential) -> None:
+        names = [design.name for design in pipeline._subdesigns]
+        assert names == [
+            "pipeline_control",
+            "a",
+            "act",
+            "a_buffer",
+            "b",
+            "b_buffer",
+        ]
+
+    def test_port_has_pipeline_handshake(self, pipeline: PipelinedSequential) -> None:
+        assert {"x_sample_ready", "y_sample_ready"} <= set(pipeline.port.signal_names)
+        assert pipeline.port["y_address"].width == 1
+
+    def test_initiation_interval_is_bound_by_slowest_stage(
+        self, pipeline: PipelinedSequential
+    ) -> None:
+        assert pipeline.initiation_interval_in_cycles == 30 + 3 + 2
+
+    def test_sample_passes_one_stage_per_step(
+        self, pipeline: PipelinedSequential
+    ) -> None:
+        assert pipeline.timing == timing.Timing(2 * 35, 35)
+
+    def test_memory_plan_shares_no_buffers(self, pipeline: PipelinedSequential) -> None:
+        plan = pipeline.memory_plan
+        assert plan.shared_buffers == ()
+        assert plan.bits_saved == 0
+        assert all(
+            (lifetime.start, lifetime.end) == (0, len(pipeline._subdesigns))
+            for lifetime in plan.lifetimes
+        )
+
+    def test_requires_number_of_outputs_for_buffers(self) -> None:
+        with pytest.raises(ValueError):
+            PipelinedSequential(
+                [DummyDesign("a", x_width=8, y_width=8, x_count=2, y_count=2)],
+                name="pipeline",
+            )
+
+
+class StreamingDummyDesign(DummyDesign):
+    def __init__(self, name: str, width: int, cycles_per_value: int = 1) -> None:
+        super().__init__(name, x_width=width, y_width=width)
+        self._port = create_port_for_streaming_design(x_width=width, y_width=width)
+        self._cycles_per_value = cycles_per_value
+
+    @property
+    def timing(self) -> timing.Timing:
+        return timing.Timing(self._cycles_per_value, self._cycles_per_value)
+
+
+class TestSequentialInsertsStreamAdapters:
+    @pytest.fixture
+    def network(self) -> Sequential:
+        return Sequential(
+            [
+                LatencyDummyDesign("a", y_count=3, latency_in_cycles=10),
+                StreamingDummyDesign("relu", width=8),
+                StreamingDummyDesign("tanh", width=8),
+                LatencyDummyDesign("b", y_count=2, latency_in_cycles=10),
+            ],
+            name="network",
+        )
+
+    def test_adapters_are_placed_where_protocol_changes(
+        self, network: Sequential
+    ) -> None:
+        names = [design.name for design in network._subdesigns]
+        assert names == ["a", "relu_stream_in", "relu", "tanh", "tanh_stream_out", "b"]
+
+    def test_stream_carries_outputs_of_producer(self, network: Sequential) -> None:
+        assert network._subdesigns[4].port["y_address"].width == 2
+
+    def test_stream_is_handshaked_between_streaming_designs(
+        self, network: Sequential
+    ) -> None:
+        connections = network._connections
+        assert connections[("tanh", "x_valid")] == ("relu", "y_valid")
+        assert connections[("relu", "y_ready")] == ("tanh", "x_ready")
+
+    def test_streaming_network_input_needs_known_count(self) -> None:
+        with pytest.raises(ValueError):
+            Sequential([StreamingDummyDesign("relu", width=8)], name="network")
+
+
+class TestSequentialTiming:
+    def test_addressable_designs_run_one_after_the_other(self) -> None:
+        network = Sequential(
+            [
+                LatencyDummyDesign("a", y_count=3, latency_in_cycles=10),
+                LatencyDummyDesign("b", y_count=2, latency_in_cycles=20),
+            ],
+            name="network",
+        )
+        assert network.timing == timing.restarted_after(30)
+
+    @pytest.mark.parametrize(
+        "cycles_per_value, section_cycles", [(1, 3 + 2 * 1 + 1), (3, 5 + 2 * 3 + 1)]
+    )
+    def test_stream_is_filled_once_and_paced_by_slowest_design(
+        self, cycles_per_value: int, section_cycles: int
+    ) -> None:
+        network = Sequential(
+            [
+                LatencyDummyDesign("a", y_count=3, latency_in_cycles=10),
+                StreamingDummyDesign("relu", width=8),
+                StreamingDummyDesign(
+                    "tanh", width=8, cycles_per_value=cycles_per_value
+                ),
+                LatencyDummyDesign("b", y_count=2, latency_in_cycles=10),
+            ],
+            name="network",
+        )
+        assert network.timing == timing.restarted_after(20 + section_cycles)
+
+    def test_throughput_at_clock_frequency(self) -> None:
+        network = Sequential(
+            [LatencyDummyDesign("a", y_count=3, latency_in_cycles=9)], name="network"
+        )
+        assert network.timing.throughput(100e6) == pytest.approx(10e6)
+
+
+class ResourceDummyDesign(DummyDesign):
+    def __init__(self, name: str, resources: Resources) -> None:
+        super().__init__(name, x_width=8, y_width=8, x_count=2, y_count=2)
+        self._resources = resources
+
+    @property
+    def resources(self) -> Resources:
+        return self._resources
+
+
+def test_resources_of_sub_designs_add_up() -> None:
+    network = Sequential(
+        [
+            ResourceDummyDesign("a", Resources(luts=10, dsps=1)),
+            ResourceDummyDesign("b", Resources(luts=5, bram=2)),
+        ],
+        name="network",
+    )
+    assert network.resources == Resources(luts=15, dsps=1, bram=2)
+
+
+class CountingDummyDesign(DummyDesign):
+    port_accesses = 0
+
+    @property
+    def port(self) -> Port:
+        CountingDummyDesign.port_accesses += 1
+        return self._port
+
+
+def test_ports_of_sub_designs_are_built_once_per_generation() -> None:
+    CountingDummyDesign.port_accesses = 0
+    sub_designs = [
+        CountingDummyDesign(f"d_{i}", x_width=4, y_width=4, x_count=2, y_count=2)
+        for i in range(50)
+    ]
+    network = Sequential(sub_designs, name="network")
+    network._generate_signal_definitions()
+    network._generate_instantiations()
+    assert CountingDummyDesign.port_accesses <= 2 * len(sub_designs)
+
+
+def test_shared_mac_of_conv1d_layers_is_saved_once() -> None:
+    def conv1d(name: str, signal_length: int) -> Conv1dDesign:
+        return Conv1dDesign(
+            name=name,
+            total_bits=8,
+            frac_bits=2,
+            in_channels=1,
+            out_channels=1,
+            signal_length=signal_length,
+            kernel_size=2,
+            weights=[[[1, 1]]],
+            bias=[0],
+        )
+
+    destination = InMemoryPath("build", parent=None)
+    Sequential([conv1d("conv0", 4), conv1d("conv1", 3)], name="network").save_to(
+        destination
+    )
+    mac_files = [
+        name
+        for layer in ("conv0", "conv1")
+        for name in cast(InMemoryPath, destination[layer]).children
+        if name == "fxp_mac"
+    ]
+    assert mac_files == ["fxp_mac"]
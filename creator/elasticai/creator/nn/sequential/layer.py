@@ -6,22 +6,72 @@ import torch
 from elasticai.creator.nn.design_creator_module import DesignCreatorModule
 from elasticai.creator.vhdl.design.design import Design
 
+from .design import PipelinedSequential as _PipelinedSequentialDesign
 from .design import Sequential as _SequentialDesign
+from .operator_fusion import fuse_activations
+from .time_multiplexing import (
+    MultiplexingReport,
+    multiplex_identical_layers,
+    multiplexing_report,
+)
 
 
 class Sequential(DesignCreatorModule, torch.nn.Sequential):
-    def __init__(self, *submodules: DesignCreatorModule):
+    def __init__(
+        self,
+        *submodules: DesignCreatorModule,
+        pipelined: bool = False,
+        time_multiplexed: bool = False,
+        share_buffers: bool = False,
+        fuse_activations: bool = False,
+    ):
+        """With `time_multiplexed`, consecutive linear layers of identical
+        shape share one MAC, trading latency for area, see
+        `multiplexing_report`. With `share_buffers`, output buffers that are
+        never live at the same time share memories, see
+        `Sequential.memory_plan` of the design. With `fuse_activations`,
+        linear and conv1d layers apply a directly following elementwise
+        activation to their outputs instead of instantiating it."""
+        if pipelined and share_buffers:
+            raise ValueError(
+                "share_buffers needs the non pipelined schedule, where only"
+                " adjacent buffers are live at once."
+            )
         super().__init__(*submodules)
+        self.pipelined = pipelined
+        self.time_multiplexed = time_multiplexed
+        self.share_buffers = share_buffers
+        self.fuse_activations = fuse_activations
 
-    def create_design(self, name: str) -> Design:
+    def _create_subdesigns(self) -> list[Design]:
         registry = _Registry()
         submodules = [cast(DesignCreatorModule, m) for m in self.children()]
         for module in submodules:
             registry.register(module.__class__.__name__.lower(), module)
-        subdesigns = list(registry.build_designs())
+        return list(registry.build_designs())
+
+    def _create_fused_subdesigns(self) -> list[Design]:
+        subdesigns = self._create_subdesigns()
+        if self.fuse_activations:
+            subdesigns = fuse_activations(subdesigns)
+        return subdesigns
+
+    def multiplexing_report(self) -> MultiplexingReport:
+        """Area saved and latency added by `time_multiplexed`."""
+        return multiplexing_report(self._create_fused_subdesigns())
+
+    def create_design(self, name: str) -> Design:
+        # fusing first removes the activations between linear layers, so
+        # that `Linear, ReLU, Linear` can share a MAC
+        subdesigns = self._create_fused_subdesigns()
+        if self.time_multiplexed:
+            subdesigns = multiplex_identical_layers(subdesigns)
+        if self.pipelined:
+            return _PipelinedSequentialDesign(sub_designs=subdesigns, name=name)
         return _SequentialDesign(
             sub_designs=subdesigns,
             name=name,
+            share_buffers=self.share_buffers,
         )
 
 
@@ -106,6 +106,21 @@ end rtl;"""
         actual_code = "\n".join(sequential_layer_code_for_model(model))
         assert actual_code == expected
 
+    def test_pipelined_model_buffers_layer_outputs(self) -> None:
+        model = Sequential(
+            BufferedIdentity(num_input_features=3, total_bits=4), pipelined=True
+        )
+        destination = translate_model(model)
+        assert set(destination.children) == {
+            "sequential_control",
+            "bufferedidentity_0",
+            "bufferedidentity_0_buffer",
+            "sequential",
+        }
+        code = "\n".join(get_code(destination["sequential"]))
+        assert "x_sample_ready <= i_sequential_control_x_sample_ready;" in code
+        assert "y <= i_bufferedidentity_0_buffer_y;" in code
+
 
 def get_code(code_file: InMemoryPath | InMemoryFile) -> list[str]:
     return cast(InMemoryFile, code_file).text
@@ -0,0 +1,150 @@
+"""Liveness of the output buffers in a non pipelined `Sequential`.
+
+Sub designs run one after another, so the outputs of a design are only
+needed until the next design that reads them by address is done. Buffers
+whose lifetimes do not overlap can live in the same memory.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from elasticai.creator.nn.fixed_point.linear.design import LinearDesign
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design.design import Design
+
+
+@dataclass(frozen=True)
+class BufferLifetime:
+    """The buffer of `design` is written at position `start` of the
+    schedule and read until the design at position `end` is done."""
+
+    design: str
+    start: int
+    end: int
+    depth: int
+    width: int
+
+    @property
+    def bits(self) -> int:
+        return self.depth * self.width
+
+
+@dataclass(frozen=True)
+class SharedBuffer:
+    name: str
+    members: tuple[BufferLifetime, ...]
+
+    @property
+    def width(self) -> int:
+        return self.members[0].width
+
+    @property
+    def address_width(self) -> int:
+        return calculate_address_width(max(m.depth for m in self.members))
+
+    @property
+    def bits(self) -> int:
+        return max(m.depth for m in self.members) * self.width
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.memory(2**self.address_width, self.width, writable=True)
+
+
+@dataclass(frozen=True)
+class MemoryPlan:
+    lifetimes: tuple[BufferLifetime, ...]
+    shared_buffers: tuple[SharedBuffer, ...]
+
+    @property
+    def bits_before(self) -> int:
+        return sum(lifetime.bits for lifetime in self.lifetimes)
+
+    @property
+    def bits_after(self) -> int:
+        shared = {m.design for b in self.shared_buffers for m in b.members}
+        return sum(
+            lifetime.bits
+            for lifetime in self.lifetimes
+            if lifetime.design not in shared
+        ) + sum(buffer.bits for buffer in self.shared_buffers)
+
+    @property
+    def bits_saved(self) -> int:
+        return self.bits_before - self.bits_after
+
+    def __str__(self) -> str:
+        lines = [
+            f"{buffer.name}: {', '.join(m.design for m in buffer.members)}"
+            for buffer in self.shared_buffers
+        ]
+        lines.append(
+            f"saved {self.bits_saved} of {self.bits_before} bits of output buffers"
+        )
+        return "\n".join(lines)
+
+
+def buffer_lifetimes(designs: Sequence[Design]) -> list[BufferLifetime]:
+    """Lifetimes of the outputs of all designs that report their `y_count`.
+
+    Designs without an `x_address` pass addresses through to the buffer they
+    read, so a buffer lives until the next design reading by address is done,
+    or until the end of the schedule for the last buffer.
+    """
+    lifetimes = []
+    for position, design in enumerate(designs):
+        if not hasattr(design, "y_count") or "y_address" not in design.port:
+            continue
+        end = next(
+            (
+                reader
+                for reader in range(position + 1, len(designs))
+                if "x_address" in designs[reader].port
+            ),
+            len(designs),
+        )
+        lifetimes.append(
+            BufferLifetime(
+                design=design.name,
+                start=position,
+                end=end,
+                depth=design.y_count,
+                width=design.port["y"].width,
+            )
+        )
+    return lifetimes
+
+
+def _can_share_output_buffer(design: Design) -> bool:
+    return isinstance(design, LinearDesign) and design.can_share_output_buffer
+
+
+def plan_memory(
+    designs: Sequence[Design],
+    can_share: Callable[[Design], bool] = _can_share_output_buffer,
+) -> MemoryPlan:
+    """Assigns the buffers of the designs that `can_share` to as few memories
+    as possible, first fit in order of the schedule. Only memories holding
+    more than one buffer are shared, the others stay in their designs."""
+    lifetimes = buffer_lifetimes(designs)
+    shareable = {d.name for d in designs if can_share(d)}
+    regions: list[list[BufferLifetime]] = []
+    for lifetime in lifetimes:
+        if lifetime.design not in shareable:
+            continue
+        for region in regions:
+            last = region[-1]
+            if last.end < lifetime.start and last.width == lifetime.width:
+                region.append(lifetime)
+                break
+        else:
+            regions.append([lifetime])
+    shared = [region for region in regions if len(region) > 1]
+    return MemoryPlan(
+        lifetimes=tuple(lifetimes),
+        shared_buffers=tuple(
+            SharedBuffer(name=f"shared_buffer_{i}", members=tuple(region))
+            for i, region in enumerate(shared)
+        ),
+    )
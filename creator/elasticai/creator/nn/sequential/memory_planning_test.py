@@ -0,0 +1,83 @@
+from elasticai.creator.nn.fixed_point import Linear, ReLU
+
+from .design import Sequential as SequentialDesign
+from .layer import Sequential
+from .memory_planning import buffer_lifetimes, plan_memory
+
+
+def linear(in_features: int, out_features: int) -> Linear:
+    return Linear(
+        in_features=in_features, out_features=out_features, total_bits=8, frac_bits=2
+    )
+
+
+def designs_of(*layers) -> list:
+    return Sequential(*layers)._create_subdesigns()
+
+
+def test_buffer_lives_until_next_addressing_reader_is_done() -> None:
+    lifetimes = buffer_lifetimes(designs_of(linear(4, 6), ReLU(8), linear(6, 3)))
+    assert [(b.design, b.start, b.end) for b in lifetimes] == [
+        ("linear_0", 0, 2),
+        ("linear_1", 2, 3),
+    ]
+
+
+def test_buffers_alternate_between_two_shared_memories() -> None:
+    plan = plan_memory(
+        designs_of(linear(4, 6), linear(6, 6), linear(6, 5), linear(5, 3))
+    )
+    assert [[m.design for m in b.members] for b in plan.shared_buffers] == [
+        ["linear_0", "linear_2"],
+        ["linear_1", "linear_3"],
+    ]
+
+
+def test_plan_reports_saved_bits() -> None:
+    plan = plan_memory(designs_of(linear(4, 6), linear(6, 6), linear(6, 2)))
+    assert plan.bits_before == (6 + 6 + 2) * 8
+    assert plan.bits_after == (6 + 6) * 8
+    assert plan.bits_saved == 2 * 8
+
+
+def test_adjacent_buffers_are_not_shared() -> None:
+    plan = plan_memory(designs_of(linear(4, 6), linear(6, 3)))
+    assert plan.shared_buffers == ()
+    assert plan.bits_saved == 0
+
+
+def test_sharing_designs_connect_to_shared_memory() -> None:
+    design = SequentialDesign(
+        designs_of(linear(4, 6), linear(6, 6), linear(6, 2)),
+        name="network",
+        share_buffers=True,
+    )
+    code = "\n".join(
+        design._generate_connections_code() + design._generate_instantiations()
+    )
+    assert (
+        "shared_buffer_0_we <= i_linear_2_y_buffer_we when i_linear_2_enable = '1'"
+        " else i_linear_0_y_buffer_we;"
+    ) in code
+    assert "shared_buffer_0 : entity work.shared_buffer(rtl)" in code
+    assert "  y_buffer_read_data => i_linear_0_y_buffer_read_data," in code
+    assert "i_linear_1_y_buffer" not in code
+
+
+def test_shared_memory_replaces_buffers_in_resources() -> None:
+    designs = designs_of(linear(4, 6), linear(6, 6), linear(6, 2))
+    private = SequentialDesign(designs, name="network").resources
+    shared = SequentialDesign(
+        designs_of(linear(4, 6), linear(6, 6), linear(6, 2)),
+        name="network",
+        share_buffers=True,
+    ).resources
+    assert shared.luts < private.luts
+
+
+def test_sharing_buffers_does_not_change_the_given_designs() -> None:
+    designs = designs_of(linear(4, 6), linear(6, 6), linear(6, 2))
+    private = SequentialDesign(designs, name="network").resources
+    SequentialDesign(designs, name="network", share_buffers=True)
+    assert [d.shares_output_buffer for d in designs] == [False, False, False]
+    assert SequentialDesign(designs, name="network").resources == private
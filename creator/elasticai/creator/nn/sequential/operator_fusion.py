@@ -0,0 +1,45 @@
+import copy
+from collections.abc import Sequence
+
+from elasticai.creator.nn.fixed_point.fused_activation import is_fusable
+from elasticai.creator.vhdl.design.design import Design
+
+
+def can_fuse(producer: Design, activation: Design) -> bool:
+    """Whether `producer` can apply `activation` to its outputs itself.
+
+    Producers offer this by a `fused_activation` attribute. Only activations
+    that keep the data width of the producer can be fused.
+    """
+    return (
+        getattr(producer, "fused_activation", False) is None
+        and is_fusable(activation)
+        and producer.port["y"].width
+        == activation.port["x"].width
+        == activation.port["y"].width
+    )
+
+
+def fuse_activations(designs: Sequence[Design]) -> list[Design]:
+    """Removes every elementwise activation that directly follows a layer
+    able to apply it, e.g. the ReLU of `Linear, ReLU`, and hands it to that
+    layer as its `fused_activation`.
+
+    The layer then writes the activated values into its output buffer, which
+    saves the instance, its wiring and, for registered activations, the
+    clock cycle of the activation, while producing the same values.
+    The given designs are left unchanged, fused layers are copies.
+    """
+    fused: list[Design] = []
+    for design in designs:
+        if fused and can_fuse(fused[-1], design):
+            fused[-1] = _with_fused_activation(fused[-1], design)
+        else:
+            fused.append(design)
+    return fused
+
+
+def _with_fused_activation(producer: Design, activation: Design) -> Design:
+    fusing = copy.copy(producer)
+    setattr(fusing, "fused_activation", activation)
+    return fusing
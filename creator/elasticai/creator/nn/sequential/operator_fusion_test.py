@@ -0,0 +1,52 @@
+from elasticai.creator.nn.fixed_point import HardSigmoid, Linear, ReLU
+
+from .layer import Sequential
+from .operator_fusion import fuse_activations
+
+
+def linear(in_features: int = 4, out_features: int = 4) -> Linear:
+    return Linear(
+        in_features=in_features, out_features=out_features, total_bits=8, frac_bits=2
+    )
+
+
+def designs_of(*layers) -> list:
+    return Sequential(*layers)._create_subdesigns()
+
+
+def test_activation_following_a_linear_layer_is_fused() -> None:
+    fused = fuse_activations(designs_of(linear(), ReLU(8), linear()))
+    assert [d.name for d in fused] == ["linear_0", "linear_1"]
+    assert fused[0].fused_activation.name == "relu_0"
+    assert fused[1].fused_activation is None
+
+
+def test_given_designs_are_not_changed() -> None:
+    designs = designs_of(linear(), ReLU(8))
+    fuse_activations(designs)
+    assert designs[0].fused_activation is None
+
+
+def test_only_one_activation_is_fused_per_layer() -> None:
+    fused = fuse_activations(
+        designs_of(linear(), ReLU(8), HardSigmoid(total_bits=8, frac_bits=2))
+    )
+    assert [d.name for d in fused] == ["linear_0", "hardsigmoid_0"]
+
+
+def test_activation_of_different_width_is_kept() -> None:
+    fused = fuse_activations(designs_of(linear(), ReLU(6)))
+    assert [d.name for d in fused] == ["linear_0", "relu_0"]
+
+
+def test_streaming_activation_is_kept() -> None:
+    fused = fuse_activations(designs_of(linear(), ReLU(8, streaming=True)))
+    assert len(fused) > 1
+
+
+def test_fusing_removes_the_cycle_of_a_registered_activation() -> None:
+    layers = (linear(), HardSigmoid(total_bits=8, frac_bits=2), linear(4, 2))
+    unfused = Sequential(*layers).create_design("network")
+    fused = Sequential(*layers, fuse_activations=True).create_design("network")
+    assert unfused.timing.latency_in_cycles - fused.timing.latency_in_cycles == 1
+    assert (unfused.resources - fused.resources).ffs == 8
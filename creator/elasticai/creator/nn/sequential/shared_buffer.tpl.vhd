@@ -0,0 +1,40 @@
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+-- output buffer shared by layers whose outputs are never live at the same time
+entity shared_buffer is
+    generic (
+        DATA_WIDTH : integer;
+        ADDR_WIDTH : integer
+    );
+    port (
+        clock : in std_logic;
+        we : in std_logic;
+        write_address : in std_logic_vector(ADDR_WIDTH-1 downto 0);
+        write_data : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        read_address : in std_logic_vector(ADDR_WIDTH-1 downto 0);
+        read_data : out std_logic_vector(DATA_WIDTH-1 downto 0)
+    );
+end shared_buffer;
+
+architecture rtl of shared_buffer is
+    type t_ram is array (0 to 2**ADDR_WIDTH-1) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal ram : t_ram;
+begin
+    -- writes and reads at the falling edge, a value written in a cycle can
+    -- be read in the same cycle, just like the buffers inside the layers
+    access_ram : process (clock)
+    begin
+        if falling_edge(clock) then
+            if we = '1' then
+                ram(to_integer(unsigned(write_address))) <= write_data;
+            end if;
+            if we = '1' and write_address = read_address then
+                read_data <= write_data;
+            else
+                read_data <= ram(to_integer(unsigned(read_address)));
+            end if;
+        end if;
+    end process access_ram;
+end rtl;
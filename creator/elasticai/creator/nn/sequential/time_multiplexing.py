@@ -0,0 +1,80 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from elasticai.creator.nn.fixed_point.linear.design import LinearDesign
+from elasticai.creator.nn.fixed_point.linear.multiplexed_design import (
+    MultiplexedLinearDesign,
+    can_share_mac,
+)
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.resources import Resources
+from elasticai.creator.vhdl.design.timing import Timing
+
+from .design import Sequential
+
+
+def multiplex_identical_layers(designs: Sequence[Design]) -> list[Design]:
+    """Replaces every run of consecutive linear layers that can share a MAC,
+    i.e. square layers of identical shape and bit width, by a single
+    `MultiplexedLinearDesign`."""
+    lowered: list[Design] = []
+    run: list[LinearDesign] = []
+
+    def close_run() -> None:
+        if len(run) > 1:
+            lowered.append(
+                MultiplexedLinearDesign(f"{run[0].name}_to_{run[-1].name}", run)
+            )
+        else:
+            lowered.extend(run)
+        run.clear()
+
+    for design in designs:
+        if isinstance(design, LinearDesign):
+            if run and not can_share_mac(run[-1], design):
+                close_run()
+            run.append(design)
+        else:
+            close_run()
+            lowered.append(design)
+    close_run()
+    return lowered
+
+
+@dataclass(frozen=True)
+class MultiplexingReport:
+    resources_before: Resources
+    resources_after: Resources
+    timing_before: Timing
+    timing_after: Timing
+
+    @property
+    def resources_saved(self) -> Resources:
+        return self.resources_before - self.resources_after
+
+    @property
+    def latency_added_in_cycles(self) -> int:
+        return (
+            self.timing_after.latency_in_cycles - self.timing_before.latency_in_cycles
+        )
+
+    def __str__(self) -> str:
+        saved = self.resources_saved
+        return (
+            f"saved {saved.luts} LUTs, {saved.ffs} FFs, {saved.dsps} DSPs and"
+            f" {saved.bram} BRAM18 for {self.latency_added_in_cycles} cycles of"
+            " additional latency"
+        )
+
+
+def multiplexing_report(designs: Sequence[Design]) -> MultiplexingReport:
+    """Analytic area and latency of a network before and after
+    `multiplex_identical_layers`."""
+    before = Sequential(list(designs), name="before")
+    after = Sequential(multiplex_identical_layers(designs), name="after")
+    return MultiplexingReport(
+        resources_before=before.resources,
+        resources_after=after.resources,
+        timing_before=before.timing,
+        timing_after=after.timing,
+    )
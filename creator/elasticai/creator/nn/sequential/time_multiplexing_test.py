@@ -0,0 +1,75 @@
+from elasticai.creator.nn.fixed_point import Linear, ReLU
+from elasticai.creator.nn.fixed_point.linear.multiplexed_design import (
+    MultiplexedLinearDesign,
+)
+
+from .layer import Sequential
+from .time_multiplexing import multiplex_identical_layers
+
+
+def square_linear(features: int = 4) -> Linear:
+    return Linear(
+        in_features=features, out_features=features, total_bits=8, frac_bits=2
+    )
+
+
+def designs_of(*layers) -> list:
+    return Sequential(*layers)._create_subdesigns()
+
+
+def test_runs_of_identical_linear_layers_are_merged() -> None:
+    lowered = multiplex_identical_layers(
+        designs_of(square_linear(), square_linear(), square_linear(), ReLU(8))
+    )
+    assert [d.name for d in lowered] == ["linear_0_to_linear_2", "relu_0"]
+    assert isinstance(lowered[0], MultiplexedLinearDesign)
+    assert lowered[0].layer_num == 3
+
+
+def test_layers_separated_by_other_designs_are_kept() -> None:
+    lowered = multiplex_identical_layers(
+        designs_of(square_linear(), ReLU(8), square_linear())
+    )
+    assert [d.name for d in lowered] == ["linear_0", "relu_0", "linear_1"]
+
+
+def test_layers_of_different_shape_are_kept() -> None:
+    lowered = multiplex_identical_layers(
+        designs_of(square_linear(4), square_linear(8), square_linear(8))
+    )
+    assert [d.name for d in lowered] == ["linear_0", "linear_1_to_linear_2"]
+
+
+def test_time_multiplexed_sequential_builds_shared_engine() -> None:
+    model = Sequential(square_linear(), square_linear(), time_multiplexed=True)
+    design = model.create_design("network")
+    assert [d.name for d in design._subdesigns] == ["linear_0_to_linear_1"]
+
+
+def test_report_trades_dsps_for_latency() -> None:
+    report = Sequential(
+        square_linear(), square_linear(), square_linear()
+    ).multiplexing_report()
+    assert report.resources_saved.dsps == 2
+    assert report.latency_added_in_cycles == 2
+
+
+def test_layers_with_fused_activations_share_a_mac() -> None:
+    model = Sequential(
+        square_linear(),
+        ReLU(8),
+        square_linear(),
+        ReLU(8),
+        square_linear(),
+        time_multiplexed=True,
+        fuse_activations=True,
+    )
+    design = model.create_design("network")
+    [engine] = design._subdesigns
+    assert isinstance(engine, MultiplexedLinearDesign)
+    assert [layer.fused_activation is not None for layer in engine.layers] == [
+        True,
+        True,
+        False,
+    ]
+    assert model.multiplexing_report().resources_saved.dsps == 2
@@ -0,0 +1,41 @@
+import re
+
+_MESSAGE = re.compile(r"^\*\* (\w+): ([^:\s]+): ?(.*)$")
+_LOCATION = re.compile(r" at ([^\s:]+):(\d+)(?::(\d+))?")
+
+
+def parse_report(text: str) -> list[dict]:
+    """Parses messages of nvc like
+
+    ```
+    ** Note: 4ps+0: my report message
+       Process :my_test_bench:_p0 at my_test_bench.vhd:64
+    ```
+
+    into the fields of `_ghdl_report_parsing.parse_report`. The `type` is
+    the lower case severity, the `time` omits the delta cycle and `line`
+    and `column` are 0 if nvc does not tell them.
+    """
+    parsed: list[dict] = []
+    for line in text.split("\n"):
+        message = _MESSAGE.match(line)
+        if message is not None:
+            severity, time, content = message.groups()
+            parsed.append(
+                dict(
+                    source="",
+                    line=0,
+                    column=0,
+                    time=time.split("+")[0],
+                    type=severity.lower(),
+                    content=content,
+                )
+            )
+            continue
+        location = _LOCATION.search(line)
+        if location is not None and parsed and parsed[-1]["source"] == "":
+            source, line_number, column = location.groups()
+            parsed[-1]["source"] = source
+            parsed[-1]["line"] = int(line_number)
+            parsed[-1]["column"] = int(column or 0)
+    return parsed
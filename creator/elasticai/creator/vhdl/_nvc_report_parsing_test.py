@@ -0,0 +1,30 @@
+from ._nvc_report_parsing import parse_report
+
+
+def test_parse_nvc_report_with_location():
+    simulation_output = (
+        "** Note: 4ps+1: my report message\n"
+        "   Process :my_test_bench:_p0 at my_test_bench.vhd:64\n"
+    )
+    expected = [
+        {
+            "source": "my_test_bench.vhd",
+            "line": 64,
+            "column": 0,
+            "time": "4ps",
+            "type": "note",
+            "content": "my report message",
+        }
+    ]
+    assert expected == parse_report(simulation_output)
+
+
+def test_put_colon_content_in_content_field():
+    simulation_output = "** Note: 0ms+0: D:e:f\n** Error: 2ns+0: x\n"
+    parsed = parse_report(simulation_output)
+    assert ["D:e:f", "x"] == [line["content"] for line in parsed]
+    assert ["note", "error"] == [line["type"] for line in parsed]
+
+
+def test_ignores_lines_of_nvc_itself():
+    assert [] == parse_report("** Note: 0ms+0\nsome progress output\n")
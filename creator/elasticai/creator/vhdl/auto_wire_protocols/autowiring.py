@@ -1,7 +1,11 @@
-from collections.abc import Iterable, Iterator, Sequence
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
+from enum import Enum
 from itertools import chain
-from typing import Any, TypeVar
+from typing import cast
+
+from elasticai.creator import ir
 
 
 @dataclass(eq=True, frozen=True)
@@ -30,6 +34,56 @@ class DataFlowNode:
     def unbuffered(cls, name: str) -> "DataFlowNode":
         return cls(name=name, sinks=("clock", "x", "enable"), sources=("y",))
 
+    @classmethod
+    def streaming(cls, name: str) -> "DataFlowNode":
+        return cls(
+            name=name,
+            sinks=("clock", "enable", "x", "x_valid", "x_last", "y_ready"),
+            sources=("y", "y_valid", "y_last", "x_ready"),
+        )
+
+    @classmethod
+    def addressable_to_stream(cls, name: str) -> "DataFlowNode":
+        return cls(
+            name=name,
+            sinks=("clock", "enable", "x", "y_ready"),
+            sources=("x_address", "y", "y_valid", "y_last"),
+        )
+
+    @classmethod
+    def stream_to_addressable(cls, name: str) -> "DataFlowNode":
+        return cls(
+            name=name,
+            sinks=("clock", "enable", "x", "x_valid", "x_last", "y_address"),
+            sources=("done", "x_ready", "y"),
+        )
+
+    @classmethod
+    def pipelined_top(cls, name: str) -> "DataFlowNode":
+        top = cls.top(name)
+        return cls(
+            name=name,
+            sinks=top.sinks + ("x_sample_ready",),
+            sources=top.sources + ("y_sample_ready",),
+        )
+
+    @classmethod
+    def pipeline_control(cls, name: str) -> "DataFlowNode":
+        return cls(
+            name=name,
+            sinks=("clock", "enable", "y_sample_ready"),
+            sources=("done", "step", "x_sample_ready", "y_sample_valid"),
+        )
+
+    @classmethod
+    def ping_pong_buffer(cls, name: str) -> "DataFlowNode":
+        buffered = cls.buffered(name)
+        return cls(
+            name=name,
+            sinks=buffered.sinks + ("step", "x_sample_valid", "y_sample_ready"),
+            sources=buffered.sources + ("x_sample_ready", "y_sample_valid"),
+        )
+
 
 @dataclass(eq=True, frozen=True)
 class WiringProtocol:
@@ -46,6 +100,12 @@ class WiringProtocol:
     down_sinks: dict[str, tuple[str, ...]]
 
 
+# Besides the addressable handshake, layer pipelined networks use `step` to swap
+# all ping-pong buffers at once, `x_sample_valid` to tell each buffer whether its
+# producer works on a sample and `y_sample_ready`/`x_sample_ready` to chain the
+# readiness of all stages back to the pipeline control.
+# Streaming designs pass one element per `valid`/`ready` handshake instead of
+# letting the consumer address into a buffer, `last` marks the end of a sample.
 BASIC_WIRING = WiringProtocol(
     up_sinks={
         "clock": ("clock",),
@@ -53,19 +113,123 @@ BASIC_WIRING = WiringProtocol(
         "x": ("x", "y"),
         "y": ("x", "y"),
         "done": ("enable", "done"),
+        "step": ("step",),
+        "x_sample_valid": ("y_sample_valid",),
+        "x_valid": ("y_valid",),
+        "x_last": ("y_last",),
     },
     down_sinks={
         "y_address": ("y_address", "x_address"),
         "x_address": ("y_address", "x_address"),
+        "y_sample_ready": ("y_sample_ready", "x_sample_ready"),
+        "x_sample_ready": ("x_sample_ready",),
+        "y_ready": ("y_ready", "x_ready"),
     },
 )
 
 
+# Handshake sinks that may only be asserted once all of their sources are,
+# e.g. a join is enabled when every branch is done.
+JOINED_HANDSHAKES = frozenset(
+    (
+        "enable",
+        "done",
+        "x_valid",
+        "y_ready",
+        "x_sample_valid",
+        "x_sample_ready",
+        "y_sample_ready",
+    )
+)
+
+
 class AutoWiringProtocolViolation(Exception):
     pass
 
 
-T = TypeVar("T")
+class DataProtocol(Enum):
+    ADDRESSABLE = "addressable"
+    STREAMING = "streaming"
+
+
+def input_protocol(node: DataFlowNode) -> DataProtocol | None:
+    """The protocol a node expects its `x` in. Nodes without a handshake of
+    their own, like unbuffered designs, pass on whatever protocol they are
+    fed with and yield `None`."""
+    if "x_last" in node.sinks:
+        return DataProtocol.STREAMING
+    if "x_address" in node.sources:
+        return DataProtocol.ADDRESSABLE
+    return None
+
+
+def output_protocol(node: DataFlowNode) -> DataProtocol | None:
+    if "y_last" in node.sources:
+        return DataProtocol.STREAMING
+    if "y_address" in node.sinks:
+        return DataProtocol.ADDRESSABLE
+    return None
+
+
+def protocol_changes(
+    graph: Iterable[DataFlowNode],
+) -> list[tuple[int, DataProtocol, DataProtocol]]:
+    """Find the edges of a sequence of nodes connecting different protocols.
+
+    Each change is reported as `(position, from, to)` where an adapter from
+    `from` to `to` has to be placed in front of the node at `position`.
+    The top node feeds and consumes the graph through the addressable
+    protocol, so a change at `len(graph)` means the output of the graph needs
+    to be converted before it leaves the top node.
+    """
+    nodes = list(graph)
+    changes = []
+    current = DataProtocol.ADDRESSABLE
+    for position, node in enumerate(nodes):
+        protocol = input_protocol(node)
+        if protocol is not None and protocol != current:
+            changes.append((position, current, protocol))
+        current = output_protocol(node) or current
+    if current != DataProtocol.ADDRESSABLE:
+        changes.append((len(nodes), current, DataProtocol.ADDRESSABLE))
+    return changes
+
+
+Connection = tuple[str, str]
+
+
+def data_flow_graph(
+    nodes: Iterable[DataFlowNode], edges: Iterable[tuple[str, str]]
+) -> ir.Graph[ir.Node, ir.Edge]:
+    """Build an `ir.Graph` whose nodes carry the `sinks` and `sources` of the
+    given data flow nodes. Nodes are wired in the order they are given here,
+    as far as the edges allow."""
+    return ir.Graph(
+        nodes=(
+            ir.node(
+                name=n.name,
+                type="data_flow_node",
+                attributes=dict(sinks=n.sinks, sources=n.sources),
+            )
+            for n in nodes
+        ),
+        edges=(ir.edge(src, sink) for src, sink in edges),
+    )
+
+
+def _chain(nodes: Iterable[DataFlowNode]) -> ir.Graph[ir.Node, ir.Edge]:
+    nodes = tuple(nodes)
+    return data_flow_graph(
+        nodes, ((a.name, b.name) for a, b in zip(nodes[:-1], nodes[1:]))
+    )
+
+
+def _as_data_flow_node(node: ir.Node) -> DataFlowNode:
+    return DataFlowNode(
+        name=node.name,
+        sinks=tuple(cast(tuple[str, ...], node.data["sinks"])),
+        sources=tuple(cast(tuple[str, ...], node.data["sources"])),
+    )
 
 
 class AutoWirer:
@@ -73,109 +237,208 @@ class AutoWirer:
     Please note that this implementation performs the wiring solely based on names.
     Hence, it will not check whether signals are compatible based on their width
     or data type.
-    It only supports a sequence of nodes as the input graph.
-    Handling nodes with more than one child requires deciding how data paths are split
-    and merged.
+
+    The graph is either a sequence of nodes or an `ir.Graph` built with
+    `data_flow_graph`. Nodes without predecessors receive their up sinks from
+    the top node and nodes without successors feed the top node.
+    An up sink is connected to the closest compatible source among its
+    ancestors, a down sink to the closest compatible source among its
+    descendants along every path, falling back to the top node.
+
+    Where paths fork or join, a sink can end up with more than one source.
+    Such sinks are not part of `connections()` but of `merged_connections()`,
+    listing all sources in the order their nodes are wired. Merged handshake
+    signals like `enable`, `*_valid` and `*_ready` are listed by `joins()` and
+    driven by the logical and of their sources, see `create_join`. Merged
+    data and address signals have to be resolved by the design owning the
+    sink.
+
+    Apart from `ir.Graph` sorting the neighbours of each node, wiring takes
+    time linear in the number of nodes and edges.
     """
 
     def __init__(self) -> None:
         self._reset()
 
     def _check_protocol_support_violations(self, graph, top):
+        sinks = set(self._protocol.up_sinks) | set(self._protocol.down_sinks)
+        sources = set(
+            chain.from_iterable(
+                chain(
+                    self._protocol.up_sinks.values(),
+                    self._protocol.down_sinks.values(),
+                )
+            )
+        )
         for node in chain(graph, (top,)):
             for sink in node.sinks:
-                if sink not in self._all_protocol_sinks():
+                if sink not in sinks:
                     raise AutoWiringProtocolViolation(f"{sink}")
             for source in node.sources:
-                if source not in self._all_protocol_sources():
+                if source not in sources:
                     raise AutoWiringProtocolViolation(f"{source}")
 
-    def _all_protocol_sources(self) -> Iterator[str]:
-        def flatten(items: Iterable[Iterable[str]]) -> Iterable[str]:
-            return chain.from_iterable(items)
-
-        down_sources = flatten(self._protocol.down_sinks.values())
-        up_sources = flatten(self._protocol.up_sinks.values())
-        return chain(down_sources, up_sources)
-
-    def _all_protocol_sinks(self) -> Iterator[str]:
-        return chain(self._protocol.up_sinks, self._protocol.down_sinks)
-
     def connections(self) -> dict[tuple[str, str], tuple[str, str]]:
         return self._connections
 
-    def wire(self, top: DataFlowNode, graph: Iterable[DataFlowNode]):
-        self._check_protocol_support_violations(graph=graph, top=top)
+    def merged_connections(self) -> dict[Connection, tuple[Connection, ...]]:
+        return self._merged_connections
+
+    def joins(self) -> dict[Connection, tuple[Connection, ...]]:
+        """The merged connections of the `JOINED_HANDSHAKES`."""
+        return {
+            sink: sources
+            for sink, sources in self._merged_connections.items()
+            if sink[1] in JOINED_HANDSHAKES
+        }
+
+    def wire(
+        self,
+        top: DataFlowNode,
+        graph: Iterable[DataFlowNode] | ir.Graph[ir.Node, ir.Edge],
+    ):
+        if not isinstance(graph, ir.Graph):
+            graph = _chain(graph)
+        nodes = {name: _as_data_flow_node(node) for name, node in graph.nodes.items()}
+        self._check_protocol_support_violations(graph=nodes.values(), top=top)
         self._reset()
-        self._remember_sources_provided_by(top)
-        self._remember_unsatisfied_down_sinks_from(top)
-        g = chain(graph, (top,))
-        for node in g:
-            self._connect_all_down_sinks_for(node)
-            self._connect_all_up_sinks_for(node)
-            self._remember_sources_provided_by(node)
-            self._remember_unsatisfied_down_sinks_from(node)
-
-    def _remember_unsatisfied_down_sinks_from(self, node: "DataFlowNode"):
-        for s in self._protocol_down_sinks(node):
-            if (node.name, s) not in self._unsatisfied_down_sinks:
-                self._unsatisfied_down_sinks.append((node.name, s))
-
-    def _connect_all_down_sinks_for(self, node: "DataFlowNode"):
-        unsatisfied_down_sinks = self._unsatisfied_down_sinks.copy()
-        for node_name, sink_name in unsatisfied_down_sinks:
-            for source in self._protocol_down_sources(sink_name, node):
-                self._connect_down_sink(
-                    sink=(node_name, sink_name), source=(node.name, source)
-                )
-                break
-
-    def _connect_all_up_sinks_for(self, node: "DataFlowNode"):
-        for sink in self._protocol_up_sinks(node):
-            self._connect_up_sink(node.name, sink)
+        order, successors, predecessors = self._topological_order(graph)
+        roots = [name for name in order if len(predecessors[name]) == 0]
+        leaves = [name for name in order if len(successors[name]) == 0]
+
+        provided_by_top = self._up_sources_provided_by(top, {})
+        available: dict[str, dict[str, tuple[Connection, ...]]] = {}
+        for name in order:
+            incoming = self._merge(
+                [available[p] for p in predecessors[name]] or [provided_by_top]
+            )
+            self._connect_up_sinks(nodes[name], incoming)
+            available[name] = self._up_sources_provided_by(nodes[name], incoming)
+
+        below_leaves = self._down_sources_provided_by(top, {})
+        reachable: dict[str, dict[str, tuple[Connection, ...]]] = {}
+        for name in reversed(order):
+            reachable[name] = self._merge(
+                [
+                    self._down_sources_provided_by(nodes[s], reachable[s])
+                    for s in successors[name]
+                ]
+                or [below_leaves]
+            )
+        for name in order:
+            self._connect_down_sinks(nodes[name], reachable[name])
+
+        self._connect_down_sinks(
+            top,
+            self._merge(
+                [self._down_sources_provided_by(nodes[r], reachable[r]) for r in roots]
+                or [below_leaves]
+            ),
+        )
+        self._connect_up_sinks(
+            top,
+            self._merge([available[leaf] for leaf in leaves] or [provided_by_top]),
+        )
 
-    def _update_available_sources(self, matched_sink: str, node_name: str, source: str):
-        self._available_sources[matched_sink] = (node_name, source)
+    @staticmethod
+    def _topological_order(
+        graph: ir.Graph[ir.Node, ir.Edge],
+    ) -> tuple[list[str], dict[str, list[str]], dict[str, list[str]]]:
+        """Kahn's algorithm starting from the nodes without predecessors in
+        the order they were added to the graph. Successors and predecessors
+        are returned in topological order."""
+        in_degree = {name: 0 for name in graph.nodes}
+        for _, sink in graph.edges:
+            in_degree[sink] += 1
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        order: list[str] = []
+        predecessors: dict[str, list[str]] = {name: [] for name in in_degree}
+        while len(ready) > 0:
+            name = ready.popleft()
+            order.append(name)
+            for successor in graph.successors(name):
+                predecessors[successor].append(name)
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    ready.append(successor)
+        if len(order) != len(in_degree):
+            raise AutoWiringProtocolViolation("graph contains a cycle")
+        successors: dict[str, list[str]] = {name: [] for name in order}
+        for name in order:
+            for predecessor in predecessors[name]:
+                successors[predecessor].append(name)
+        return order, successors, predecessors
 
-    def _remember_sources_provided_by(self, node: "DataFlowNode"):
-        for sink in self._protocol.up_sinks:
-            sources = self._protocol_up_sources(sink, node)
-            for source in sources:
-                self._update_available_sources(sink, node.name, source)
+    @staticmethod
+    def _merge(
+        sources: list[dict[str, tuple[Connection, ...]]],
+    ) -> dict[str, tuple[Connection, ...]]:
+        if len(sources) == 1:
+            return sources[0]
+        merged: dict[str, dict[Connection, None]] = {}
+        for s in sources:
+            for sink, connections in s.items():
+                merged.setdefault(sink, {}).update(dict.fromkeys(connections))
+        return {sink: tuple(connections) for sink, connections in merged.items()}
+
+    def _up_sources_provided_by(
+        self, node: DataFlowNode, available: dict[str, tuple[Connection, ...]]
+    ) -> dict[str, tuple[Connection, ...]]:
+        provided = dict(available)
+        for source in node.sources:
+            for sink in self._up_sinks_by_source.get(source, ()):
+                provided[sink] = ((node.name, source),)
+        return provided
+
+    def _down_sources_provided_by(
+        self, node: DataFlowNode, reachable: dict[str, tuple[Connection, ...]]
+    ) -> dict[str, tuple[Connection, ...]]:
+        provided = dict(reachable)
+        satisfied = set()
+        for source in node.sources:
+            for sink in self._down_sinks_by_source.get(source, ()):
+                if sink not in satisfied:
+                    provided[sink] = ((node.name, source),)
+                    satisfied.add(sink)
+        return provided
+
+    def _connect_up_sinks(
+        self, node: DataFlowNode, available: dict[str, tuple[Connection, ...]]
+    ) -> None:
+        for sink in node.sinks:
+            if sink in self._protocol.up_sinks:
+                if sink not in available:
+                    raise AutoWiringProtocolViolation(
+                        f"no source for {sink} of {node.name}"
+                    )
+                self._connect((node.name, sink), available[sink])
+
+    def _connect_down_sinks(
+        self, node: DataFlowNode, reachable: dict[str, tuple[Connection, ...]]
+    ) -> None:
+        for sink in node.sinks:
+            if sink in self._protocol.down_sinks and sink in reachable:
+                self._connect((node.name, sink), reachable[sink])
+
+    def _connect(self, sink: Connection, sources: tuple[Connection, ...]) -> None:
+        if len(sources) == 1:
+            self._connections[sink] = sources[0]
+        else:
+            self._merged_connections[sink] = sources
 
     def _reset(self) -> None:
-        self._available_sources: dict[str, tuple[str, str]] = {}
-        self._unsatisfied_down_sinks: list[tuple[str, str]] = list()
-        self._connections: dict[tuple[str, str], tuple[str, str]] = {}
+        self._connections: dict[Connection, Connection] = {}
+        self._merged_connections: dict[Connection, tuple[Connection, ...]] = {}
         self._protocol = BASIC_WIRING
+        self._up_sinks_by_source = self._index_by_source(self._protocol.up_sinks)
+        self._down_sinks_by_source = self._index_by_source(self._protocol.down_sinks)
 
     @staticmethod
-    def _intersection_iterator(
-        a: Iterable[T], b: Sequence[T] | dict[T, Any]
-    ) -> Iterator[T]:
-        for s in a:
-            if s in b:
-                yield s
-
-    def _protocol_down_sinks(self, node) -> Iterator[str]:
-        yield from self._intersection_iterator(node.sinks, self._protocol.down_sinks)
-
-    def _protocol_up_sinks(self, node) -> Iterator[str]:
-        yield from self._intersection_iterator(node.sinks, self._protocol.up_sinks)
-
-    def _protocol_up_sources(self, sink: str, node: "DataFlowNode") -> Iterator[str]:
-        yield from self._intersection_iterator(
-            node.sources, self._protocol.up_sinks[sink]
-        )
-
-    def _protocol_down_sources(self, sink: str, node: "DataFlowNode") -> Iterator[str]:
-        yield from self._intersection_iterator(
-            node.sources, self._protocol.down_sinks[sink]
-        )
-
-    def _connect_up_sink(self, node_name: str, sink_name: str):
-        self._connections[(node_name, sink_name)] = self._available_sources[sink_name]
-
-    def _connect_down_sink(self, source: tuple[str, str], sink: tuple[str, str]):
-        self._connections[sink] = source
-        self._unsatisfied_down_sinks.remove(sink)
+    def _index_by_source(
+        sinks: dict[str, tuple[str, ...]],
+    ) -> dict[str, tuple[str, ...]]:
+        index: dict[str, list[str]] = {}
+        for sink, compatible in sinks.items():
+            for source in compatible:
+                index.setdefault(source, []).append(sink)
+        return {source: tuple(sinks) for source, sinks in index.items()}
@@ -2,11 +2,20 @@ import re
 
 import pytest
 
-from .autowiring import AutoWirer, AutoWiringProtocolViolation, DataFlowNode
+from elasticai.creator.ir import Graph
+
+from .autowiring import (
+    AutoWirer,
+    AutoWiringProtocolViolation,
+    DataFlowNode,
+    DataProtocol,
+    data_flow_graph,
+    protocol_changes,
+)
 
 
 def _wire(
-    top: DataFlowNode, graph: tuple[DataFlowNode, ...]
+    top: DataFlowNode, graph: tuple[DataFlowNode, ...] | Graph
 ) -> dict[tuple[str, str], tuple[str, str]]:
     _autowirer = AutoWirer()
     _autowirer.wire(top, graph)
@@ -97,3 +106,174 @@ def test_wiring_unknown_signals_yields_error() -> None:
     a = DataFlowNode(name="a", sinks=("signal_a",), sources=tuple())
     with pytest.raises(AutoWiringProtocolViolation):
         _wire(top=DataFlowNode.top("top"), graph=(a,))
+
+
+def test_wire_pipeline_of_two_stages() -> None:
+    control = DataFlowNode.pipeline_control("control")
+    a = DataFlowNode.buffered("a")
+    a_buffer = DataFlowNode.ping_pong_buffer("a_buffer")
+    b = DataFlowNode.buffered("b")
+    b_buffer = DataFlowNode.ping_pong_buffer("b_buffer")
+    top = DataFlowNode.pipelined_top("top")
+    spec = """
+        control, clock : top, clock
+        control, enable : top, enable
+        control, y_sample_ready : a_buffer, x_sample_ready
+        a, clock : top, clock
+        a, enable : control, done
+        a, x : top, x
+        a, y_address : a_buffer, x_address
+        a_buffer, clock : top, clock
+        a_buffer, enable : a, done
+        a_buffer, step : control, step
+        a_buffer, x : a, y
+        a_buffer, x_sample_valid : control, y_sample_valid
+        a_buffer, y_address : b, x_address
+        a_buffer, y_sample_ready : b_buffer, x_sample_ready
+        b, clock : top, clock
+        b, enable : a_buffer, done
+        b, x : a_buffer, y
+        b, y_address : b_buffer, x_address
+        b_buffer, clock : top, clock
+        b_buffer, enable : b, done
+        b_buffer, step : control, step
+        b_buffer, x : b, y
+        b_buffer, x_sample_valid : a_buffer, y_sample_valid
+        b_buffer, y_address : top, y_address
+        b_buffer, y_sample_ready : top, y_sample_ready
+        top, done : b_buffer, done
+        top, x_address : a, x_address
+        top, x_sample_ready : control, x_sample_ready
+        top, y : b_buffer, y
+        """
+    connections = _wire(top=top, graph=(control, a, a_buffer, b, b_buffer))
+    assert connections == _build_expected_connections(spec)
+
+
+def test_wire_stream_between_buffered_entity_and_top() -> None:
+    graph = (
+        DataFlowNode.buffered("a"),
+        DataFlowNode.addressable_to_stream("a2s"),
+        DataFlowNode.streaming("s"),
+        DataFlowNode.stream_to_addressable("s2a"),
+    )
+    spec = """
+        a2s, x : a, y
+        a, y_address : a2s, x_address
+        a2s, y_ready : s, x_ready
+        s, x : a2s, y
+        s, x_valid : a2s, y_valid
+        s, x_last : a2s, y_last
+        s, y_ready : s2a, x_ready
+        s2a, x : s, y
+        s2a, x_valid : s, y_valid
+        s2a, x_last : s, y_last
+        s2a, y_address : top, y_address
+        top, y : s2a, y
+        top, done : s2a, done
+    """
+    connections = _wire(top=DataFlowNode.top("top"), graph=graph)
+    expected = _build_expected_connections(spec)
+    assert {k: connections[k] for k in expected} == expected
+
+
+def test_streaming_node_after_buffered_node_changes_protocol() -> None:
+    graph = (
+        DataFlowNode.buffered("a"),
+        DataFlowNode.unbuffered("u"),
+        DataFlowNode.streaming("s"),
+        DataFlowNode.buffered("b"),
+    )
+    assert protocol_changes(graph) == [
+        (2, DataProtocol.ADDRESSABLE, DataProtocol.STREAMING),
+        (3, DataProtocol.STREAMING, DataProtocol.ADDRESSABLE),
+    ]
+
+
+def test_stream_leaving_the_graph_is_converted_before_top() -> None:
+    graph = (DataFlowNode.buffered("a"), DataFlowNode.streaming("s"))
+    assert protocol_changes(graph)[-1] == (
+        2,
+        DataProtocol.STREAMING,
+        DataProtocol.ADDRESSABLE,
+    )
+
+
+def test_graph_with_adapters_needs_no_further_changes() -> None:
+    graph = (
+        DataFlowNode.buffered("a"),
+        DataFlowNode.addressable_to_stream("a2s"),
+        DataFlowNode.streaming("s"),
+        DataFlowNode.stream_to_addressable("s2a"),
+    )
+    assert protocol_changes(graph) == []
+
+
+@pytest.fixture
+def residual_graph():
+    nodes = (
+        DataFlowNode.buffered("a"),
+        DataFlowNode.buffered("b"),
+        DataFlowNode.unbuffered("c"),
+        DataFlowNode.buffered("d"),
+    )
+    edges = (("a", "b"), ("a", "c"), ("b", "d"), ("c", "d"))
+    return data_flow_graph(nodes, edges)
+
+
+def test_graph_of_chain_is_wired_like_sequence() -> None:
+    nodes = (
+        DataFlowNode.buffered("a"),
+        DataFlowNode.unbuffered("b"),
+        DataFlowNode.buffered("c"),
+    )
+    graph = data_flow_graph(nodes, (("a", "b"), ("b", "c")))
+    top = DataFlowNode.top("top")
+    assert _wire(top=top, graph=graph) == _wire(top=top, graph=nodes)
+
+
+def test_fork_broadcasts_output(residual_graph) -> None:
+    connections = _wire(top=DataFlowNode.top("top"), graph=residual_graph)
+    assert connections[("b", "x")] == ("a", "y")
+    assert connections[("c", "x")] == ("a", "y")
+    assert connections[("c", "enable")] == ("a", "done")
+
+
+def test_join_merges_sources_of_all_branches(residual_graph) -> None:
+    autowirer = AutoWirer()
+    autowirer.wire(DataFlowNode.top("top"), residual_graph)
+    merged = autowirer.merged_connections()
+    assert merged[("d", "x")] == (("b", "y"), ("c", "y"))
+    assert merged[("d", "enable")] == (("b", "done"), ("a", "done"))
+    assert merged[("a", "y_address")] == (("b", "x_address"), ("d", "x_address"))
+    assert ("d", "x") not in autowirer.connections()
+
+
+def test_sources_shared_by_all_branches_are_not_merged(residual_graph) -> None:
+    connections = _wire(top=DataFlowNode.top("top"), graph=residual_graph)
+    assert connections[("d", "clock")] == ("top", "clock")
+    assert connections[("top", "y")] == ("d", "y")
+
+
+def test_wiring_is_deterministic(residual_graph) -> None:
+    def wire() -> list:
+        autowirer = AutoWirer()
+        autowirer.wire(DataFlowNode.top("top"), residual_graph)
+        return list(autowirer.connections().items()) + list(
+            autowirer.merged_connections().items()
+        )
+
+    assert wire() == wire()
+
+
+def test_wiring_cyclic_graph_yields_error() -> None:
+    nodes = (DataFlowNode.buffered("a"), DataFlowNode.buffered("b"))
+    graph = data_flow_graph(nodes, (("a", "b"), ("b", "a")))
+    with pytest.raises(AutoWiringProtocolViolation):
+        _wire(top=DataFlowNode.top("top"), graph=graph)
+
+
+def test_joins_are_the_merged_handshakes(residual_graph) -> None:
+    autowirer = AutoWirer()
+    autowirer.wire(DataFlowNode.top("top"), residual_graph)
+    assert autowirer.joins() == {("d", "enable"): (("b", "done"), ("a", "done"))}
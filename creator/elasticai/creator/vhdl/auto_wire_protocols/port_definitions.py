@@ -81,6 +81,111 @@ def create_port_for_buffered_design(
     return Port(incoming=in_signals, outgoing=out_signals)
 
 
+def create_port_for_pipelined_design(
+    *, x_width: int, y_width: int, x_address_width: int, y_address_width: int
+) -> Port:
+    """Buffered design that additionally requests its next input with
+    `x_sample_ready` and is told by `y_sample_ready` when its output has been
+    consumed."""
+    port = create_port_for_buffered_design(
+        x_width=x_width,
+        y_width=y_width,
+        x_count=0,
+        y_count=0,
+        x_address_width=x_address_width,
+        y_address_width=y_address_width,
+    )
+    return Port(
+        incoming=port.incoming + [_signals.y_sample_ready()],
+        outgoing=port.outgoing + [_signals.x_sample_ready()],
+    )
+
+
+def create_port_for_ping_pong_buffer(data_width: int, address_width: int) -> Port:
+    in_signals = [
+        _signals.enable(),
+        _signals.clock(),
+        _signals.step(),
+        _signals.x_sample_valid(),
+        _signals.y_sample_ready(),
+        _signals.x(data_width),
+        _signals.y_address(address_width),
+    ]
+    out_signals = [
+        _signals.done(),
+        _signals.x_sample_ready(),
+        _signals.y_sample_valid(),
+        _signals.y(data_width),
+        _signals.x_address(address_width),
+    ]
+    return Port(incoming=in_signals, outgoing=out_signals)
+
+
+def create_port_for_pipeline_control() -> Port:
+    in_signals = [_signals.enable(), _signals.clock(), _signals.y_sample_ready()]
+    out_signals = [
+        _signals.done(),
+        _signals.step(),
+        _signals.x_sample_ready(),
+        _signals.y_sample_valid(),
+    ]
+    return Port(incoming=in_signals, outgoing=out_signals)
+
+
+def create_port_for_streaming_design(x_width: int, y_width: int) -> Port:
+    """Design that takes one element per `x_valid`/`x_ready` handshake and emits
+    one element per `y_valid`/`y_ready` handshake. `x_last`/`y_last` mark the
+    final element of a sample."""
+    in_signals = [
+        _signals.enable(),
+        _signals.clock(),
+        _signals.x(x_width),
+        _signals.x_valid(),
+        _signals.x_last(),
+        _signals.y_ready(),
+    ]
+    out_signals = [
+        _signals.y(y_width),
+        _signals.y_valid(),
+        _signals.y_last(),
+        _signals.x_ready(),
+    ]
+    return Port(incoming=in_signals, outgoing=out_signals)
+
+
+def create_port_for_addressable_to_stream(data_width: int, address_width: int) -> Port:
+    in_signals = [
+        _signals.enable(),
+        _signals.clock(),
+        _signals.x(data_width),
+        _signals.y_ready(),
+    ]
+    out_signals = [
+        _signals.x_address(address_width),
+        _signals.y(data_width),
+        _signals.y_valid(),
+        _signals.y_last(),
+    ]
+    return Port(incoming=in_signals, outgoing=out_signals)
+
+
+def create_port_for_stream_to_addressable(data_width: int, address_width: int) -> Port:
+    in_signals = [
+        _signals.enable(),
+        _signals.clock(),
+        _signals.x(data_width),
+        _signals.x_valid(),
+        _signals.x_last(),
+        _signals.y_address(address_width),
+    ]
+    out_signals = [
+        _signals.done(),
+        _signals.x_ready(),
+        _signals.y(data_width),
+    ]
+    return Port(incoming=in_signals, outgoing=out_signals)
+
+
 def port_definition_template_for_buffered_design() -> list[str]:
     return template_string_for_port_definition(
         create_port_for_buffered_design(x_width=1, y_width=1, x_count=1, y_count=1)
@@ -1,5 +1,8 @@
 from collections.abc import Sequence
 
+import numpy as np
+import numpy.typing as npt
+
 from elasticai.creator.vhdl.design.signal import Signal
 
 
@@ -14,9 +17,15 @@ def create_instance(
     signal_mapping: dict[str, str],
     library: str,
     architecture: str = "rtl",
+    generic_mapping: dict[str, str] | None = None,
 ) -> list[str]:
     signal_mapping = _sorted_dict(signal_mapping)
-    result = [f"{name} : entity {library}.{entity}({architecture})", "port map("]
+    result = [f"{name} : entity {library}.{entity}({architecture})"]
+    if generic_mapping:
+        generics = [f"  {k} => {v}" for k, v in generic_mapping.items()]
+        generics = [f"{line}," for line in generics[:-1]] + generics[-1:]
+        result.extend(["generic map(", *generics, ")"])
+    result.append("port map(")
     for _from in tuple(signal_mapping.keys())[:-1]:
         _to = signal_mapping[_from]
         result.append(f"  {_from} => {_to},")
@@ -38,6 +47,11 @@ def create_connection(sink, source) -> str:
     return f"{sink} <= {source};"
 
 
+def create_join(sink: str, sources: Sequence[str]) -> str:
+    """Drives a handshake `sink` by the logical and of all its `sources`."""
+    return f"{sink} <= {' and '.join(sources)};"
+
+
 def create_signal_definitions(prefix: str, signals: Sequence[Signal]):
     return sorted(
         [
@@ -96,3 +110,32 @@ def to_vhdl_binary_string(number: int, number_of_bits: int) -> str:
     two_complement = _to_unsigned(number, number_of_bits)
 
     return f'"{two_complement:0{number_of_bits}b}"'
+
+
+def join_as_vhdl_binary_strings(
+    numbers: npt.ArrayLike, number_of_bits: int, separator: str = ","
+) -> str:
+    """Vectorized equivalent of joining `to_vhdl_binary_string` for all numbers."""
+    values = np.asarray(numbers, dtype=np.int64).reshape(-1)
+    if values.size == 0:
+        return ""
+    if number_of_bits > 62:
+        return separator.join(
+            to_vhdl_binary_string(int(value), number_of_bits) for value in values
+        )
+    out_of_range = np.abs(values) >= 2**number_of_bits
+    if out_of_range.any():
+        raise ValueError(
+            f"Value '{values[out_of_range][0]}' cannot be represented with"
+            f" {number_of_bits} bits."
+        )
+    two_complement = values & ((1 << number_of_bits) - 1)
+    shifts = np.arange(number_of_bits - 1, -1, -1, dtype=np.int64)
+    chars = np.empty((values.size, number_of_bits + 2 + len(separator)), np.uint8)
+    chars[:, 0] = chars[:, number_of_bits + 1] = ord('"')
+    chars[:, 1 : number_of_bits + 1] = ((two_complement[:, None] >> shifts) & 1) + ord(
+        "0"
+    )
+    chars[:, number_of_bits + 2 :] = np.frombuffer(separator.encode(), np.uint8)
+    joined = chars.tobytes().decode("ascii")
+    return joined[: len(joined) - len(separator)]
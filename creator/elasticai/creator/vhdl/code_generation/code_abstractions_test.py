@@ -1,6 +1,10 @@
 import pytest
 
-from .code_abstractions import to_vhdl_binary_string
+from .code_abstractions import (
+    create_join,
+    join_as_vhdl_binary_strings,
+    to_vhdl_binary_string,
+)
 
 
 def test_to_vhdl_binary_string_raises_error_if_value_not_representable() -> None:
@@ -21,3 +25,24 @@ def test_to_vhdl_binary_string_raises_error_if_value_not_representable() -> None
 )
 def test_to_vhdl_binary_string(number: int, number_of_bits: int, expected: str) -> None:
     assert to_vhdl_binary_string(number, number_of_bits) == expected
+
+
+def test_join_as_vhdl_binary_strings_matches_scalar_conversion() -> None:
+    numbers = list(range(-16, 16))
+    expected = ",".join(to_vhdl_binary_string(n, 5) for n in numbers)
+    assert join_as_vhdl_binary_strings(numbers, 5) == expected
+
+
+def test_join_as_vhdl_binary_strings_uses_separator() -> None:
+    assert join_as_vhdl_binary_strings([[1, -1]], 2, separator=", ") == '"01", "11"'
+
+
+def test_join_as_vhdl_binary_strings_raises_error_if_value_not_representable() -> None:
+    with pytest.raises(ValueError):
+        _ = join_as_vhdl_binary_strings([0, -8], 3)
+
+
+def test_join_drives_sink_by_and_of_all_sources() -> None:
+    assert create_join("i_d_enable", ["i_b_done", "i_a_done"]) == (
+        "i_d_enable <= i_b_done and i_a_done;"
+    )
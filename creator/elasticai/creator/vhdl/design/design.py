@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 from elasticai.creator.file_generation.savable import Path, Savable
 from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.resources import Resources
+from elasticai.creator.vhdl.design.timing import Timing
 
 
 class Design(Savable, ABC):
@@ -18,3 +20,15 @@ class Design(Savable, ABC):
 
     @abstractmethod
     def save_to(self, destination: Path) -> None: ...
+
+    @property
+    @abstractmethod
+    def timing(self) -> Timing:
+        """Analytical cycle counts, see `Timing`."""
+        ...
+
+    @property
+    @abstractmethod
+    def resources(self) -> Resources:
+        """Estimated FPGA primitives, see `Resources`."""
+        ...
@@ -0,0 +1,132 @@
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+
+_DSP_OPERAND_WIDTHS = (25, 18)
+_LUT_MULTIPLIER_MAX_WIDTH = 4
+_LUT_MEMORY_DEPTH = 64
+_BRAM_ASPECT_RATIOS = (
+    (16384, 1),
+    (8192, 2),
+    (4096, 4),
+    (2048, 9),
+    (1024, 18),
+    (512, 36),
+)
+_AUTO_BLOCK_MIN_BITS = 4096
+
+
+@dataclass(frozen=True)
+class Resources:
+    """Estimated primitives a design occupies on a 7 series FPGA.
+
+    `lutram` counts the LUTs used as distributed RAM, these are included in
+    `luts` as well. `bram` counts 18Kb block RAM halves.
+    """
+
+    luts: int = 0
+    ffs: int = 0
+    dsps: int = 0
+    bram: int = 0
+    lutram: int = 0
+
+    def __add__(self, other: "Resources") -> "Resources":
+        return Resources(
+            **{
+                f.name: getattr(self, f.name) + getattr(other, f.name)
+                for f in fields(self)
+            }
+        )
+
+    def __sub__(self, other: "Resources") -> "Resources":
+        return Resources(
+            **{
+                f.name: getattr(self, f.name) - getattr(other, f.name)
+                for f in fields(self)
+            }
+        )
+
+    def __mul__(self, times: int) -> "Resources":
+        return Resources(
+            **{f.name: getattr(self, f.name) * times for f in fields(self)}
+        )
+
+    def exceeded_on(self, device: "Device") -> list[str]:
+        """Names of the primitives the design needs more of than `device` has."""
+        return [
+            f.name
+            for f in fields(self)
+            if getattr(self, f.name) > getattr(device.capacity, f.name)
+        ]
+
+    def fits(self, device: "Device") -> bool:
+        return not self.exceeded_on(device)
+
+    def utilization(self, device: "Device") -> float:
+        """Fraction of the scarcest primitive of `device` the design uses."""
+        return max(
+            getattr(self, f.name) / getattr(device.capacity, f.name)
+            for f in fields(self)
+            if getattr(device.capacity, f.name) > 0
+        )
+
+
+@dataclass(frozen=True)
+class Device:
+    name: str
+    capacity: Resources
+
+
+def total(resources: Iterable[Resources]) -> Resources:
+    return sum(resources, Resources())
+
+
+def registers(bits: int) -> Resources:
+    return Resources(ffs=bits)
+
+
+def adder(width: int) -> Resources:
+    return Resources(luts=width)
+
+
+def comparator(width: int) -> Resources:
+    return Resources(luts=math.ceil(width / 2))
+
+
+def counter(width: int) -> Resources:
+    return adder(width) + registers(width)
+
+
+def multiplier(a_width: int, b_width: int) -> Resources:
+    """A DSP48E1 slice multiplies 25x18 bit operands, wider products are
+    split across several slices. Very narrow products end up in LUTs."""
+    if min(a_width, b_width) <= _LUT_MULTIPLIER_MAX_WIDTH:
+        return Resources(luts=a_width * b_width)
+    wide, narrow = sorted((a_width, b_width), reverse=True)
+    dsp_wide, dsp_narrow = _DSP_OPERAND_WIDTHS
+    return Resources(dsps=math.ceil(wide / dsp_wide) * math.ceil(narrow / dsp_narrow))
+
+
+def memory(
+    depth: int, width: int, resource_option: str = "auto", writable: bool = False
+) -> Resources:
+    """`resource_option` is the `rom_style`/`ram_style` passed to synthesis,
+    i.e. `"block"`, `"distributed"` or `"auto"`. We assume `"auto"` picks
+    block RAM for memories of at least 4Kb."""
+    if resource_option == "auto":
+        block = depth * width >= _AUTO_BLOCK_MIN_BITS
+        resource_option = "block" if block else "distributed"
+    if resource_option == "block":
+        return Resources(
+            bram=min(
+                math.ceil(depth / ratio_depth) * math.ceil(width / ratio_width)
+                for ratio_depth, ratio_width in _BRAM_ASPECT_RATIOS
+            )
+        )
+    if resource_option == "distributed":
+        luts = math.ceil(depth / _LUT_MEMORY_DEPTH) * width
+        return Resources(luts=luts, lutram=luts if writable else 0)
+    raise ValueError(
+        "resource_option needs to be 'block', 'distributed' or 'auto', but is"
+        f" {resource_option}."
+    )
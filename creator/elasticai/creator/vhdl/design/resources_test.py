@@ -0,0 +1,69 @@
+import pytest
+
+from .resources import (
+    Device,
+    Resources,
+    memory,
+    multiplier,
+    total,
+)
+
+SMALL_DEVICE = Device(
+    name="small", capacity=Resources(luts=100, ffs=100, dsps=2, bram=2, lutram=10)
+)
+
+
+def test_resources_add_up() -> None:
+    assert total([Resources(luts=1, dsps=1), Resources(luts=2, bram=3)]) == Resources(
+        luts=3, dsps=1, bram=3
+    )
+
+
+def test_resources_scale_with_number_of_instances() -> None:
+    assert Resources(luts=2, ffs=3) * 4 == Resources(luts=8, ffs=12)
+
+
+@pytest.mark.parametrize(
+    "widths, dsps", [((8, 8), 1), ((25, 18), 1), ((18, 25), 1), ((32, 32), 4)]
+)
+def test_multiplier_is_split_across_dsp_slices(
+    widths: tuple[int, int], dsps: int
+) -> None:
+    assert multiplier(*widths) == Resources(dsps=dsps)
+
+
+def test_narrow_multiplier_is_built_from_luts() -> None:
+    assert multiplier(4, 8) == Resources(luts=32)
+
+
+def test_block_memory_picks_best_aspect_ratio() -> None:
+    assert memory(1024, 16, "block") == Resources(bram=1)
+    assert memory(1024, 32, "block") == Resources(bram=2)
+
+
+def test_distributed_ram_counts_as_lutram() -> None:
+    assert memory(128, 8, "distributed", writable=True) == Resources(luts=16, lutram=16)
+
+
+def test_distributed_rom_is_plain_logic() -> None:
+    assert memory(128, 8, "distributed") == Resources(luts=16)
+
+
+def test_auto_uses_block_ram_only_for_large_memories() -> None:
+    assert memory(64, 8) == Resources(luts=8)
+    assert memory(512, 16) == Resources(bram=1)
+
+
+def test_unknown_resource_option_is_an_error() -> None:
+    with pytest.raises(ValueError):
+        memory(64, 8, "registers")
+
+
+def test_reports_exceeded_resources() -> None:
+    resources = Resources(luts=50, dsps=3, lutram=11)
+    assert resources.exceeded_on(SMALL_DEVICE) == ["dsps", "lutram"]
+    assert not resources.fits(SMALL_DEVICE)
+
+
+def test_utilization_is_bound_by_scarcest_primitive() -> None:
+    assert Resources(luts=50, dsps=1).utilization(SMALL_DEVICE) == 0.5
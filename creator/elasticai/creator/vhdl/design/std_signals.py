@@ -27,3 +27,47 @@ def x_address(width: int) -> Signal:
 
 def y_address(width: int) -> Signal:
     return Signal(name="y_address", width=width)
+
+
+def step() -> Signal:
+    return Signal(name="step", width=0)
+
+
+def x_ready() -> Signal:
+    return Signal(name="x_ready", width=0)
+
+
+def y_ready() -> Signal:
+    return Signal(name="y_ready", width=0)
+
+
+def x_valid() -> Signal:
+    return Signal(name="x_valid", width=0)
+
+
+def y_valid() -> Signal:
+    return Signal(name="y_valid", width=0)
+
+
+def x_sample_ready() -> Signal:
+    return Signal(name="x_sample_ready", width=0)
+
+
+def y_sample_ready() -> Signal:
+    return Signal(name="y_sample_ready", width=0)
+
+
+def x_sample_valid() -> Signal:
+    return Signal(name="x_sample_valid", width=0)
+
+
+def y_sample_valid() -> Signal:
+    return Signal(name="y_sample_valid", width=0)
+
+
+def x_last() -> Signal:
+    return Signal(name="x_last", width=0)
+
+
+def y_last() -> Signal:
+    return Signal(name="y_last", width=0)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Analytical cycle counts of a design, derived from its parameters.
+
+    `latency_in_cycles` counts the rising clock edges from `enable` until
+    `done` for buffered designs and until a value arrives at `y` for
+    elementwise and streaming designs.
+    `initiation_interval_in_cycles` counts the cycles between accepting two
+    consecutive inputs, i.e. samples or, for streaming designs, values.
+    """
+
+    latency_in_cycles: int
+    initiation_interval_in_cycles: int
+
+    def latency_in_seconds(self, clock_frequency: float) -> float:
+        return self.latency_in_cycles / clock_frequency
+
+    def throughput(self, clock_frequency: float) -> float:
+        """Inputs per second."""
+        return clock_frequency / self.initiation_interval_in_cycles
+
+
+def combinational() -> Timing:
+    return Timing(latency_in_cycles=0, initiation_interval_in_cycles=1)
+
+
+def registered() -> Timing:
+    return Timing(latency_in_cycles=1, initiation_interval_in_cycles=1)
+
+
+def restarted_after(latency_in_cycles: int) -> Timing:
+    """Timing of a buffered design that has to be reset by pulling `enable`
+    low for one cycle before it accepts the next sample."""
+    return Timing(
+        latency_in_cycles=latency_in_cycles,
+        initiation_interval_in_cycles=latency_in_cycles + 1,
+    )
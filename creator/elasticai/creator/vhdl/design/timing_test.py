@@ -0,0 +1,23 @@
+import pytest
+
+from .timing import Timing, combinational, registered, restarted_after
+
+
+def test_latency_in_seconds_scales_with_clock_period() -> None:
+    assert Timing(10, 11).latency_in_seconds(100e6) == pytest.approx(100e-9)
+
+
+def test_throughput_is_inputs_per_second() -> None:
+    assert Timing(10, 4).throughput(100e6) == pytest.approx(25e6)
+
+
+def test_combinational_design_takes_no_cycle() -> None:
+    assert combinational() == Timing(0, 1)
+
+
+def test_registered_design_takes_one_cycle() -> None:
+    assert registered() == Timing(1, 1)
+
+
+def test_restarted_design_spends_one_cycle_in_reset() -> None:
+    assert restarted_after(7) == Timing(7, 8)
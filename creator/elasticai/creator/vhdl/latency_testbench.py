@@ -0,0 +1,72 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.signal import Signal
+from elasticai.creator.vhdl.simulated_layer import Testbench
+
+
+class LatencyTestbench(Testbench):
+    """Measures the clock cycles a design takes from `enable` until `done`,
+    to validate its `timing` against a simulation.
+
+    The testbench drives `clock` and `enable` of the design under test and
+    holds all its other inputs at zero, so it fits any design with these
+    three signals, e.g. a buffered layer or the `LSTMNetworkDesign`.
+    """
+
+    def __init__(self, name: str, uut: Design, max_cycles: int = 100_000) -> None:
+        self._name = name
+        self._uut = uut
+        self._max_cycles = max_cycles
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def save_to(self, destination: Path) -> None:
+        port = self._uut.port
+        driven = {"clock", "enable", "done"}
+        inputs = sorted((s for s in port.incoming if s.name not in driven), key=_name)
+        outputs = sorted((s for s in port.outgoing if s.name not in driven), key=_name)
+        port_map = [f"{name} => {name}," for name in sorted(port.signal_names)]
+        port_map[-1] = port_map[-1].removesuffix(",")
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="latency_testbench.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                uut_name=self._uut.name,
+                signals=[_declaration(s, initialized=True) for s in inputs]
+                + [_declaration(s, initialized=False) for s in outputs],
+                port_map=port_map,
+                max_cycles=str(self._max_cycles),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+    def parse_reported_content(self, content: list[str]) -> int:
+        for line in content:
+            if line.startswith("result: "):
+                return int(line.removeprefix("result: "))
+        raise ValueError(f"{self.name} reported no latency.")
+
+
+def _name(signal: Signal) -> str:
+    return signal.name
+
+
+def _declaration(signal: Signal, initialized: bool) -> str:
+    if signal.width == 0:
+        declaration = f"signal {signal.name} : std_logic"
+        zero = "'0'"
+    else:
+        declaration = (
+            f"signal {signal.name} : std_logic_vector({signal.width}-1 downto 0)"
+        )
+        zero = "(others => '0')"
+    if initialized:
+        declaration = f"{declaration} := {zero}"
+    return f"{declaration};"
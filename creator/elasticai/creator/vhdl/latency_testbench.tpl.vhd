@@ -0,0 +1,46 @@
+-- Counts the rising clock edges from pulling enable high until the design
+-- under test signals done and reports them as "result: <cycles>".
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity ${name} is
+    generic (
+        MAX_CYCLES : integer := ${max_cycles}
+    );
+end entity ${name};
+
+architecture rtl of ${name} is
+    constant CLOCK_PERIOD : time := 10 ns;
+    signal clock : std_logic := '0';
+    signal enable : std_logic := '0';
+    signal done : std_logic;
+    -- remaining inputs of the design under test are held at zero
+    ${signals}
+    signal finished : boolean := false;
+begin
+
+    clock <= not clock after CLOCK_PERIOD/2 when not finished else clock;
+
+    uut : entity work.${uut_name}(rtl)
+    port map (
+        ${port_map}
+    );
+
+    measure : process
+        variable cycles : integer := 0;
+    begin
+        wait until falling_edge(clock);
+        enable <= '1';
+        loop
+            wait until rising_edge(clock);
+            cycles := cycles + 1;
+            wait until falling_edge(clock);
+            exit when done = '1' or cycles = MAX_CYCLES;
+        end loop;
+        report "result: " & integer'image(cycles);
+        finished <= true;
+        wait;
+    end process measure;
+
+end architecture rtl;
@@ -0,0 +1,76 @@
+from typing import cast
+
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design import timing
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.resources import Resources
+from elasticai.creator.vhdl.design.signal import Signal
+
+from .latency_testbench import LatencyTestbench
+
+
+class DummyDesign(Design):
+    @property
+    def port(self) -> Port:
+        return create_port(x_width=8, y_width=6, x_count=4, y_count=2)
+
+    def save_to(self, destination: Path) -> None:
+        pass
+
+    @property
+    def timing(self) -> timing.Timing:
+        return timing.combinational()
+
+    @property
+    def resources(self) -> Resources:
+        return Resources()
+
+
+class ControlledDesign(DummyDesign):
+    @property
+    def port(self) -> Port:
+        port = super().port
+        return Port(
+            incoming=port.incoming + [Signal("x_we", width=0)],
+            outgoing=port.outgoing,
+        )
+
+
+@pytest.fixture
+def testbench() -> LatencyTestbench:
+    return LatencyTestbench("tb", DummyDesign("uut"))
+
+
+def test_instantiates_design_under_test(testbench: LatencyTestbench) -> None:
+    build = InMemoryPath("build", parent=None)
+    testbench.save_to(build)
+    code = cast(InMemoryFile, build["tb"]).text
+    assert "    uut : entity work.uut(rtl)" in code
+    assert (
+        "    signal x_address : std_logic_vector(2-1 downto 0);" in code
+        and "    signal y : std_logic_vector(6-1 downto 0);" in code
+    )
+
+
+def test_holds_further_inputs_at_zero() -> None:
+    build = InMemoryPath("build", parent=None)
+    LatencyTestbench("tb", ControlledDesign("uut")).save_to(build)
+    code = cast(InMemoryFile, build["tb"]).text
+    assert "    signal x_we : std_logic := '0';" in code
+    assert "        x_we => x_we," in code
+    assert "        y_address => y_address" in code
+
+
+def test_parses_reported_cycles(testbench: LatencyTestbench) -> None:
+    content = ["status: started", "result: 42"]
+    assert testbench.parse_reported_content(content) == 42
+
+
+def test_missing_result_is_an_error(testbench: LatencyTestbench) -> None:
+    with pytest.raises(ValueError):
+        testbench.parse_reported_content(["status: started"])
@@ -0,0 +1,99 @@
+import os
+import re
+from collections.abc import Iterable
+
+from ._nvc_report_parsing import parse_report
+from .simulator import CommandLineSimulator
+
+_DECLARATION = re.compile(r"^\s*(?:entity|package)\s+(\w+)\s+is\b", re.I | re.M)
+_REFERENCE = re.compile(r"\bwork\.(\w+)", re.I)
+
+
+class NVCSimulator(CommandLineSimulator):
+    """Runs testbenches with the nvc tool, a drop in replacement for
+    `GHDLSimulator` that compiles testbenches to native code and is
+    considerably faster for long simulations.
+
+    nvc does not find the order of analysis itself, so files are analysed
+    after the files declaring the entities and packages they reference via
+    `work.`. Generics are applied during elaboration, which is part of
+    `run`. nvc writes reports to stderr, both streams are parsed.
+    """
+
+    def __init__(self, workdir, top_design_name) -> None:
+        super().__init__(workdir, top_design_name)
+        self._nvc_dir = "nvc_build"
+        self._standard = "2008"
+
+    def initialize(self):
+        """Call this function once before calling `run()` and on every file change."""
+        os.makedirs(f"{self._root}/{self._nvc_dir}", exist_ok=True)
+        self._execute_command(
+            self._assemble_command() + ["-a", "--relaxed"] + self._ordered_files()
+        )
+
+    def run(self):
+        """Elaborates the testbench with the generics, runs it and saves
+        whatever the tool reported. Call `initialize` once before."""
+        generic_options = [f"-g{key}={value}" for key, value in self._generics.items()]
+        self._execute_command(
+            self._assemble_command()
+            + ["-e", self._test_bench_name]
+            + generic_options
+            + ["-r"]
+        )
+
+    @property
+    def _result(self) -> str:
+        return self._stdout() + self._stderr()
+
+    def _parse_report(self, text: str) -> list[dict]:
+        return parse_report(text)
+
+    def _ordered_files(self) -> list[str]:
+        sources = {}
+        for file in self._files:
+            with open(f"{self._root}/{file}") as f:
+                sources[file] = f.read()
+        return analysis_order(sources)
+
+    def _assemble_command(self) -> list[str]:
+        return [
+            "nvc",
+            f"--std={self._standard}",
+            f"--work=work:{self._nvc_dir}/work",
+            "-L",
+            self._nvc_dir,
+        ]
+
+
+def analysis_order(sources: dict[str, str]) -> list[str]:
+    """Names of the files in `sources` ordered such that every file comes
+    after the files declaring units it references from the `work` library.
+    Files keep their order otherwise, references to unknown units or cycles
+    are left to the tool to report."""
+    declared_in: dict[str, str] = {}
+    for file, code in sources.items():
+        for unit in _DECLARATION.findall(code):
+            declared_in.setdefault(unit.lower(), file)
+
+    def dependencies(file: str) -> Iterable[str]:
+        for unit in _REFERENCE.findall(sources[file]):
+            dependency = declared_in.get(unit.lower())
+            if dependency is not None and dependency != file:
+                yield dependency
+
+    ordered: list[str] = []
+    visited: set[str] = set()
+
+    def visit(file: str) -> None:
+        if file in visited:
+            return
+        visited.add(file)
+        for dependency in dependencies(file):
+            visit(dependency)
+        ordered.append(file)
+
+    for file in sources:
+        visit(file)
+    return ordered
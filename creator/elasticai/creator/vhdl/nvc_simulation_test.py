@@ -0,0 +1,20 @@
+from .nvc_simulation import analysis_order
+
+
+def test_files_come_after_the_units_they_use():
+    sources = {
+        "tb.vhd": "entity tb is\n...\nuut: entity work.linear(rtl)",
+        "linear.vhd": "use work.pkg.all;\nentity linear is",
+        "pkg.vhd": "package pkg is\nend package;\npackage body pkg is",
+    }
+    assert ["pkg.vhd", "linear.vhd", "tb.vhd"] == analysis_order(sources)
+
+
+def test_files_without_dependencies_keep_their_order():
+    sources = {"b.vhd": "entity b is", "a.vhd": "entity a is", "c.vhd": ""}
+    assert ["b.vhd", "a.vhd", "c.vhd"] == analysis_order(sources)
+
+
+def test_references_to_unknown_units_are_ignored():
+    sources = {"tb.vhd": "uut: entity work.missing", "a.vhd": "entity a is"}
+    assert ["tb.vhd", "a.vhd"] == analysis_order(sources)
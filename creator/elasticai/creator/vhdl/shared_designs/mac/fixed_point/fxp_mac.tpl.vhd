@@ -6,7 +6,8 @@ entity fxp_MAC_RoundToZero is
     generic (
         VECTOR_WIDTH : integer;
         TOTAL_WIDTH   : integer;
-        FRAC_WIDTH   : integer
+        FRAC_WIDTH   : integer;
+        ACC_WIDTH    : integer := 2*TOTAL_WIDTH
     );
     port (
         reset : in std_logic;
@@ -20,7 +21,7 @@ end;
 
 architecture rtl of fxp_Mac_RoundToZero is
 
-    function cut_down(x: in signed(2*TOTAL_WIDTH-1 downto 0)) return signed is
+    function cut_down(x: in signed(ACC_WIDTH-1 downto 0)) return signed is
         variable result : signed(TOTAL_WIDTH-1 downto 0) := (others=>'0');
         constant left_bit : natural := TOTAL_WIDTH-1+FRAC_WIDTH;
         constant right_bit : natural := FRAC_WIDTH;
@@ -48,7 +49,7 @@ architecture rtl of fxp_Mac_RoundToZero is
 
 begin
     mac : process (next_sample, reset)
-        variable accumulator : signed(2*TOTAL_WIDTH-1 downto 0) := (others=>'0');
+        variable accumulator : signed(ACC_WIDTH-1 downto 0) := (others=>'0');
         variable vector_idx : integer := 0;
         type t_state is (s_compute, s_finished);
         variable state : t_state := s_compute;
@@ -66,7 +67,7 @@ begin
                     --report("debug: fxpMAC: state = s_compute");
                     --report("debug: fxpMAC: x1 = " & to_bstring(x1));
                     --report("debug: fxpMAC: x2 = " & to_bstring(x2));
-                    accumulator := x1*x2 + accumulator;
+                    accumulator := resize(x1*x2, ACC_WIDTH) + accumulator;
                     vector_idx := vector_idx + 1;
                     if vector_idx = VECTOR_WIDTH then
                        --report("debug: fxpMAC: Vectorwidth reached");
@@ -0,0 +1 @@
+from .design import PingPongBuffer, PipelineControl
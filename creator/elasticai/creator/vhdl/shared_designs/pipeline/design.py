@@ -0,0 +1,82 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import (
+    create_port_for_ping_pong_buffer,
+    create_port_for_pipeline_control,
+)
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+
+
+class PingPongBuffer(Design):
+    """Holds `depth` values of the preceding layer in one bank while the next
+    layer reads the previous sample from the other bank."""
+
+    def __init__(self, name: str, data_width: int, depth: int) -> None:
+        super().__init__(name)
+        self._data_width = data_width
+        self.depth = depth
+        self._address_width = calculate_address_width(depth)
+
+    @property
+    def port(self) -> Port:
+        return create_port_for_ping_pong_buffer(
+            data_width=self._data_width, address_width=self._address_width
+        )
+
+    @property
+    def copy_cycles(self) -> int:
+        return self.depth + 1
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.Timing(
+            latency_in_cycles=self.copy_cycles,
+            initiation_interval_in_cycles=self.copy_cycles,
+        )
+
+    @property
+    def resources(self) -> _resources.Resources:
+        banks = _resources.memory(2 * self.depth, self._data_width, writable=True)
+        return banks + _resources.counter(self._address_width)
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="ping_pong_buffer.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                data_width=str(self._data_width),
+                address_width=str(self._address_width),
+                depth=str(self.depth),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+
+class PipelineControl(Design):
+    @property
+    def port(self) -> Port:
+        return create_port_for_pipeline_control()
+
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.registered()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.Resources(luts=8, ffs=4)
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="pipeline_control.tpl.vhd",
+            parameters=dict(name=self.name),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
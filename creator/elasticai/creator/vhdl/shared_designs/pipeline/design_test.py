@@ -0,0 +1,30 @@
+from typing import cast
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+
+from .design import PingPongBuffer, PipelineControl
+
+
+def saved_code(design: PingPongBuffer | PipelineControl) -> str:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    file = cast(InMemoryFile, destination.children[design.name])
+    return "\n".join(file.text)
+
+
+def test_buffer_generics_match_depth() -> None:
+    code = saved_code(PingPongBuffer("buffer", data_width=8, depth=5))
+    assert "DATA_WIDTH : integer := 8;" in code
+    assert "ADDRESS_WIDTH : integer := 3;" in code
+    assert "DEPTH : integer := 5" in code
+
+
+def test_buffer_addresses_its_depth() -> None:
+    port = PingPongBuffer("buffer", data_width=8, depth=5).port
+    assert port["x_address"].width == 3
+    assert port["y_address"].width == 3
+    assert port["y"].width == 8
+
+
+def test_control_is_named_after_design() -> None:
+    assert "entity control is" in saved_code(PipelineControl("control"))
@@ -0,0 +1,85 @@
+-- Double buffered stage register for layer pipelined networks.
+-- While the next layer reads one bank through y_address, the outputs of the
+-- previous layer are copied into the other bank through x_address as soon as
+-- that layer signals done. Banks are swapped on every pipeline step.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        ADDRESS_WIDTH : integer := ${address_width};
+        DEPTH : integer := ${depth}
+    );
+    port (
+        enable : in std_logic; -- done of the producing layer
+        clock : in std_logic;
+        step : in std_logic;
+        x_sample_valid : in std_logic; -- the producing layer computes a valid sample in this step
+        y_sample_ready : in std_logic; -- all stages behind this one are ready for the next step
+
+        x_address : out std_logic_vector(ADDRESS_WIDTH-1 downto 0);
+        y_address : in std_logic_vector(ADDRESS_WIDTH-1 downto 0);
+
+        x : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        y : out std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        x_sample_ready : out std_logic;
+        y_sample_valid : out std_logic;
+        done : out std_logic -- enable of the consuming layer
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    type t_banks is array (0 to 2*DEPTH-1) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal banks : t_banks;
+
+    signal write_bank : integer range 0 to 1 := 0;
+    signal filled : std_logic := '0';
+    signal copying : std_logic := '0';
+    signal read_valid : std_logic := '0';
+begin
+
+    done <= read_valid and not step;
+    y_sample_valid <= read_valid;
+    x_sample_ready <= y_sample_ready and (filled or not x_sample_valid);
+
+    copy : process (clock)
+        variable write_idx : integer range 0 to DEPTH-1 := 0;
+    begin
+        if rising_edge(clock) then
+            if step = '1' then
+                read_valid <= filled;
+                filled <= '0';
+                copying <= '0';
+                write_bank <= 1 - write_bank;
+                write_idx := 0;
+            elsif enable = '1' and filled = '0' then
+                if copying = '1' then
+                    -- x holds the value at the address we set in the previous cycle
+                    banks(write_bank*DEPTH + write_idx) <= x;
+                    if write_idx = DEPTH-1 then
+                        filled <= '1';
+                        copying <= '0';
+                    else
+                        write_idx := write_idx + 1;
+                    end if;
+                else
+                    copying <= '1';
+                    write_idx := 0;
+                end if;
+            end if;
+            x_address <= std_logic_vector(to_unsigned(write_idx, x_address'length));
+        end if;
+    end process copy;
+
+    read : process (clock)
+    begin
+        if falling_edge(clock) then
+            y <= banks((1 - write_bank)*DEPTH + to_integer(unsigned(y_address)));
+        end if;
+    end process read;
+
+end architecture rtl;
@@ -0,0 +1,41 @@
+-- Steps a layer pipelined network forward once every stage is ready.
+-- A step lasts one clock cycle. It swaps the banks of all ping-pong buffers,
+-- resets all layers and tells the environment to provide the next input.
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+entity ${name} is
+    port (
+        enable : in std_logic; -- the network input holds a valid sample
+        clock : in std_logic;
+        y_sample_ready : in std_logic;
+
+        step : out std_logic;
+        x_sample_ready : out std_logic;
+        y_sample_valid : out std_logic;
+        done : out std_logic -- enable of the first layer
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    signal step_i : std_logic := '0';
+begin
+
+    step <= step_i;
+    x_sample_ready <= step_i;
+    y_sample_valid <= enable;
+    done <= enable and not step_i;
+
+    stepping : process (clock)
+    begin
+        if rising_edge(clock) then
+            if step_i = '1' then
+                step_i <= '0';
+            elsif y_sample_ready = '1' then
+                step_i <= '1';
+            end if;
+        end if;
+    end process stepping;
+
+end architecture rtl;
@@ -6,6 +6,8 @@ from elasticai.creator.file_generation.template import (
     module_to_package,
 )
 from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.design.ports import Port
 
@@ -46,6 +48,49 @@ class PrecomputedScalarFunction(Design):
             io_pairs.append((input_value, output_value))
         return io_pairs
 
+    @property
+    def timing(self) -> _timing.Timing:
+        return _timing.combinational()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """The case statement is synthesized like a distributed rom."""
+        return _resources.memory(
+            2**self._input_width, self._output_width, "distributed"
+        )
+
+    @property
+    def function_resources(self) -> _resources.Resources:
+        return self.resources
+
+    def vhdl_function(self, name: str) -> list[str]:
+        """The lookup as a VHDL function on signed values, for layers that
+        apply it to their outputs, see `fuse_activations`."""
+        if self._input_width != self._output_width:
+            raise ValueError(
+                f"{self.name} maps {self._input_width} to {self._output_width}"
+                " bits, only functions keeping the width can be fused."
+            )
+        width = self._output_width
+        pairs = self._compute_io_pairs()
+        lines = [
+            f"function {name}(x : in signed({width}-1 downto 0)) return signed is",
+            "begin",
+        ]
+        keyword = "if"
+        for input_value, output_value in pairs[:-1]:
+            lines.append(
+                f"    {keyword} x <= {input_value} then"
+                f" return to_signed({output_value}, {width});"
+            )
+            keyword = "elsif"
+        _, output_value = pairs[-1]
+        if len(pairs) > 1:
+            lines.append("    end if;")
+        lines.append(f"    return to_signed({output_value}, {width});")
+        lines.append("end function;")
+        return lines
+
     @property
     def port(self) -> Port:
         return create_port(x_width=self._input_width, y_width=self._output_width)
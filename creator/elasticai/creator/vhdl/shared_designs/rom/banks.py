@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.vhdl.code_generation.code_abstractions import create_instance
+
+from .design import Rom
+
+
+def interleave_into_banks(
+    rows: npt.ArrayLike, bias: npt.ArrayLike, banks: int
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Split per output weights and biases into one weight and one bias bank per lane.
+
+    Lane `l` computes the outputs `l, l + banks, l + 2 * banks, ...`, so its
+    weight bank holds their flattened rows one after another and its bias bank
+    their biases. Banks are zero padded to equal length if `banks` does not
+    divide the number of outputs.
+    """
+    bias = np.asarray(bias).reshape(-1)
+    rows = np.asarray(rows).reshape(bias.size, -1)
+    groups = math.ceil(bias.size / banks)
+    padding = groups * banks - bias.size
+    rows = np.pad(rows, ((0, padding), (0, 0))).reshape(groups, banks, -1)
+    bias = np.pad(bias, (0, padding)).reshape(groups, banks)
+    return [(rows[:, lane].reshape(-1), bias[:, lane].copy()) for lane in range(banks)]
+
+
+def save_banks(
+    destination: Path,
+    name: str,
+    data_width: int,
+    banks: list[tuple[np.ndarray, np.ndarray]],
+    library: str = "work",
+) -> list[str]:
+    """Save a weight rom `<name>_w_rom_<lane>` and a bias rom `<name>_b_rom_<lane>` per lane.
+
+    Returns the instantiations of the roms. They are clocked by `n_clock`, read
+    from `addr_w`/`addr_b` and write to the lane's element of `w_in`/`b_in`.
+    """
+    instances: list[str] = []
+    for lane, (weights, bias) in enumerate(banks):
+        for kind, values in (("w", weights), ("b", bias)):
+            rom_name = f"{name}_{kind}_rom_{lane}"
+            Rom(
+                name=rom_name, data_width=data_width, values_as_integers=values
+            ).save_to(destination.create_subpath(rom_name))
+            instances.extend(
+                create_instance(
+                    name=f"rom_{kind}_{lane}",
+                    entity=rom_name,
+                    library=library,
+                    signal_mapping=dict(
+                        clk="n_clock",
+                        en="'1'",
+                        addr=f"addr_{kind}",
+                        data=f"{kind}_in({lane})",
+                    ),
+                )
+            )
+    return instances
@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.typing as npt
+
 from elasticai.creator.file_generation.savable import Path
 from elasticai.creator.file_generation.template import (
     InProjectTemplate,
@@ -5,22 +8,27 @@ from elasticai.creator.file_generation.template import (
 )
 from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
 from elasticai.creator.vhdl.code_generation.code_abstractions import (
-    to_vhdl_binary_string,
+    join_as_vhdl_binary_strings,
 )
+from elasticai.creator.vhdl.design import resources as _resources
 
 
 class Rom:
     def __init__(
-        self, name: str, data_width: int, values_as_integers: list[int]
+        self,
+        name: str,
+        data_width: int,
+        values_as_integers: npt.ArrayLike,
+        resource_option: str = "auto",
     ) -> None:
         self._name = name
         self._data_width = data_width
-        number_of_values = len(values_as_integers)
-        self._address_width = self._bits_required_to_address_n_values(number_of_values)
-        self._values = [
-            to_vhdl_binary_string(x, self._data_width)
-            for x in self._append_zeros_to_fill_addressable_memory(values_as_integers)
-        ]
+        self._resource_option = resource_option
+        values = np.asarray(values_as_integers, dtype=np.int64).reshape(-1)
+        self._address_width = self._bits_required_to_address_n_values(values.size)
+        self._values = join_as_vhdl_binary_strings(
+            self._append_zeros_to_fill_addressable_memory(values), self._data_width
+        )
 
     def save_to(self, destination: Path):
         template = InProjectTemplate(
@@ -31,21 +39,38 @@ class Rom:
                 rom_addr_bitwidth=str(self._address_width),
                 rom_data_bitwidth=str(self._data_width),
                 name=self._name,
-                resource_option="auto",
+                resource_option=self._resource_option,
             ),
         )
         destination.as_file(".vhd").write(template)
 
+    @property
+    def resources(self) -> _resources.Resources:
+        return self.estimate_resources(
+            2**self._address_width, self._data_width, self._resource_option
+        )
+
+    @staticmethod
+    def estimate_resources(
+        num_values: int, data_width: int, resource_option: str = "auto"
+    ) -> _resources.Resources:
+        """Resources of a rom holding `num_values` values, without building it.
+        The rom is filled up with zeros to the next power of two."""
+        depth = 2 ** calculate_address_width(num_values)
+        return _resources.memory(depth, data_width, resource_option)
+
     def _rom_values(self) -> str:
-        return ",".join(self._values)
+        return self._values
 
-    def _append_zeros_to_fill_addressable_memory(self, values: list[int]) -> list[int]:
-        missing_number_of_zeros = 2**self._address_width - len(values)
-        return values + _zeros(missing_number_of_zeros)
+    def _append_zeros_to_fill_addressable_memory(
+        self, values: np.ndarray
+    ) -> np.ndarray:
+        missing_number_of_zeros = 2**self._address_width - values.size
+        return np.concatenate((values, _zeros(missing_number_of_zeros)))
 
     def _bits_required_to_address_n_values(self, n: int) -> int:
         return calculate_address_width(n)
 
 
-def _zeros(n: int) -> list[int]:
-    return [0] * n
+def _zeros(n: int) -> np.ndarray:
+    return np.zeros(n, dtype=np.int64)
@@ -0,0 +1 @@
+from .design import AddressableToStream, StreamingElementwise, StreamToAddressable
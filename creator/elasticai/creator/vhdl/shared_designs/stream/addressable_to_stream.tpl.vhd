@@ -0,0 +1,71 @@
+-- Reads COUNT values from an addressable producer and emits them one per
+-- valid/ready handshake, marking the final value with y_last.
+-- The producer answers an address on the falling edge, so every value is
+-- captured one rising edge after its address was set.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        ADDRESS_WIDTH : integer := ${address_width};
+        COUNT : integer := ${count}
+    );
+    port (
+        enable : in std_logic; -- done of the producing layer
+        clock : in std_logic;
+
+        x_address : out std_logic_vector(ADDRESS_WIDTH-1 downto 0);
+        x : in std_logic_vector(DATA_WIDTH-1 downto 0);
+
+        y : out std_logic_vector(DATA_WIDTH-1 downto 0);
+        y_valid : out std_logic;
+        y_last : out std_logic;
+        y_ready : in std_logic
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    signal address : integer range 0 to COUNT := 0;
+    signal y_valid_i : std_logic := '0';
+begin
+
+    y_valid <= y_valid_i;
+
+    read_address : process (address)
+    begin
+        if address < COUNT then
+            x_address <= std_logic_vector(to_unsigned(address, ADDRESS_WIDTH));
+        else
+            x_address <= std_logic_vector(to_unsigned(COUNT-1, ADDRESS_WIDTH));
+        end if;
+    end process read_address;
+
+    emit : process (clock, enable)
+    begin
+        if enable = '0' then
+            address <= 0;
+            y_valid_i <= '0';
+            y_last <= '0';
+        elsif rising_edge(clock) then
+            if y_valid_i = '0' or y_ready = '1' then
+                if address < COUNT then
+                    y <= x;
+                    y_valid_i <= '1';
+                    if address = COUNT-1 then
+                        y_last <= '1';
+                    else
+                        y_last <= '0';
+                    end if;
+                    address <= address + 1;
+                else
+                    y_valid_i <= '0';
+                    y_last <= '0';
+                end if;
+            end if;
+        end if;
+    end process emit;
+
+end architecture rtl;
@@ -0,0 +1,155 @@
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.file_generation.template import (
+    InProjectTemplate,
+    module_to_package,
+)
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import (
+    create_port_for_addressable_to_stream,
+    create_port_for_stream_to_addressable,
+    create_port_for_streaming_design,
+)
+from elasticai.creator.vhdl.code_generation.addressable import calculate_address_width
+from elasticai.creator.vhdl.design import resources as _resources
+from elasticai.creator.vhdl.design import timing as _timing
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+
+
+class AddressableToStream(Design):
+    """Reads the `count` outputs of a buffered design and streams them."""
+
+    def __init__(self, name: str, data_width: int, count: int) -> None:
+        super().__init__(name)
+        self._data_width = data_width
+        self.count = count
+        self._address_width = calculate_address_width(count)
+
+    @property
+    def port(self) -> Port:
+        return create_port_for_addressable_to_stream(
+            data_width=self._data_width, address_width=self._address_width
+        )
+
+    @property
+    def timing(self) -> _timing.Timing:
+        """Per streamed value."""
+        return _timing.registered()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        return _resources.registers(self._data_width + 2) + _resources.counter(
+            self._address_width
+        )
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="addressable_to_stream.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                data_width=str(self._data_width),
+                address_width=str(self._address_width),
+                count=str(self.count),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+
+class StreamToAddressable(Design):
+    """Collects `count` streamed values and lets the next design address them."""
+
+    def __init__(self, name: str, data_width: int, count: int) -> None:
+        super().__init__(name)
+        self._data_width = data_width
+        self.count = count
+        self._address_width = calculate_address_width(count)
+
+    @property
+    def port(self) -> Port:
+        return create_port_for_stream_to_addressable(
+            data_width=self._data_width, address_width=self._address_width
+        )
+
+    @property
+    def y_count(self) -> int:
+        return self.count
+
+    @property
+    def timing(self) -> _timing.Timing:
+        """Per collected value, `done` rises with the edge taking the last one."""
+        return _timing.registered()
+
+    @property
+    def resources(self) -> _resources.Resources:
+        values = _resources.memory(
+            self.count, self._data_width, "distributed", writable=True
+        )
+        return values + _resources.counter(self._address_width)
+
+    def save_to(self, destination: Path) -> None:
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="stream_to_addressable.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                data_width=str(self._data_width),
+                address_width=str(self._address_width),
+                count=str(self.count),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
+
+
+class StreamingElementwise(Design):
+    """Streams values through an unbuffered design, one value at a time.
+
+    `inner_latency` is the number of clock cycles `inner` takes to update its
+    `y` after `x` changed. Only with a combinational `inner` the stream keeps
+    a throughput of one value per cycle.
+    """
+
+    def __init__(self, name: str, inner: Design, inner_latency: int) -> None:
+        super().__init__(name)
+        if "x_address" in inner.port:
+            raise ValueError(
+                f"cannot stream through {inner.name}, it is a buffered design."
+            )
+        if inner_latency < 0:
+            raise ValueError(f"Invalid inner latency: {inner_latency}")
+        self.inner = inner
+        self.inner_latency = inner_latency
+
+    @property
+    def port(self) -> Port:
+        return create_port_for_streaming_design(
+            x_width=self.inner.port["x"].width, y_width=self.inner.port["y"].width
+        )
+
+    @property
+    def timing(self) -> _timing.Timing:
+        """Per value, the handshake holds every value until `inner` settled."""
+        return _timing.Timing(
+            latency_in_cycles=self.inner_latency + 1,
+            initiation_interval_in_cycles=self.inner_latency + 1,
+        )
+
+    @property
+    def resources(self) -> _resources.Resources:
+        held = _resources.registers(self.inner.port["x"].width + 2)
+        wait = _resources.counter(max(1, self.inner_latency.bit_length()))
+        return self.inner.resources + held + wait
+
+    def save_to(self, destination: Path) -> None:
+        self.inner.save_to(destination.create_subpath(self.inner.name))
+        template = InProjectTemplate(
+            package=module_to_package(self.__module__),
+            file_name="streaming_elementwise.tpl.vhd",
+            parameters=dict(
+                name=self.name,
+                inner_name=self.inner.name,
+                x_width=str(self.inner.port["x"].width),
+                y_width=str(self.inner.port["y"].width),
+                inner_latency=str(self.inner_latency),
+            ),
+        )
+        destination.create_subpath(self.name).as_file(".vhd").write(template)
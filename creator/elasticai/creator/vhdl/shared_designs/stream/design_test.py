@@ -0,0 +1,96 @@
+from typing import cast
+
+import pytest
+
+from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.vhdl.auto_wire_protocols.port_definitions import create_port
+from elasticai.creator.vhdl.design import timing
+from elasticai.creator.vhdl.design.design import Design
+from elasticai.creator.vhdl.design.ports import Port
+from elasticai.creator.vhdl.design.resources import Resources
+
+from .design import AddressableToStream, StreamingElementwise, StreamToAddressable
+
+
+class DummyDesign(Design):
+    def __init__(self, name: str, width: int, count: int = 0) -> None:
+        super().__init__(name)
+        self._port = create_port(
+            x_width=width, y_width=width, x_count=count, y_count=count
+        )
+
+    @property
+    def port(self) -> Port:
+        return self._port
+
+    def save_to(self, destination: Path) -> None:
+        pass
+
+    @property
+    def timing(self) -> timing.Timing:
+        return timing.combinational()
+
+    @property
+    def resources(self) -> Resources:
+        return Resources()
+
+
+def saved_code(design: AddressableToStream | StreamToAddressable) -> str:
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    file = cast(InMemoryFile, destination.children[design.name])
+    return "\n".join(file.text)
+
+
+def test_addressable_to_stream_addresses_count_values() -> None:
+    adapter = AddressableToStream("a2s", data_width=8, count=5)
+    code = saved_code(adapter)
+    assert adapter.port["x_address"].width == 3
+    assert "COUNT : integer := 5" in code
+    assert "entity a2s is" in code
+
+
+def test_stream_to_addressable_provides_count_values() -> None:
+    adapter = StreamToAddressable("s2a", data_width=8, count=5)
+    assert adapter.port["y_address"].width == 3
+    assert adapter.y_count == 5
+    assert "COUNT : integer := 5" in saved_code(adapter)
+
+
+def test_elementwise_stream_instantiates_inner_design() -> None:
+    design = StreamingElementwise(
+        "relu", inner=DummyDesign("relu_inner", width=6), inner_latency=0
+    )
+    destination = InMemoryPath("build", parent=None)
+    design.save_to(destination)
+    code = "\n".join(cast(InMemoryFile, destination.children["relu"]).text)
+    assert "i_inner : entity work.relu_inner(rtl)" in code
+    assert "INNER_LATENCY : integer := 0" in code
+    assert "relu_inner" in destination.children
+
+
+def test_elementwise_stream_has_handshake_signals() -> None:
+    design = StreamingElementwise(
+        "relu", inner=DummyDesign("relu_inner", width=6), inner_latency=1
+    )
+    assert {s.name for s in design.port} == {
+        "enable",
+        "clock",
+        "x",
+        "x_valid",
+        "x_last",
+        "x_ready",
+        "y",
+        "y_valid",
+        "y_last",
+        "y_ready",
+    }
+    assert design.port["y"].width == 6
+
+
+def test_cannot_stream_through_buffered_design() -> None:
+    with pytest.raises(ValueError):
+        StreamingElementwise(
+            "stream", inner=DummyDesign("linear", width=8, count=2), inner_latency=0
+        )
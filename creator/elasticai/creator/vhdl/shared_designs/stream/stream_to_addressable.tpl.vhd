@@ -0,0 +1,63 @@
+-- Collects the values of one sample from a valid/ready stream and provides
+-- them to an addressable consumer. done rises with the value marked by x_last.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        DATA_WIDTH : integer := ${data_width};
+        ADDRESS_WIDTH : integer := ${address_width};
+        COUNT : integer := ${count}
+    );
+    port (
+        enable : in std_logic;
+        clock : in std_logic;
+
+        x : in std_logic_vector(DATA_WIDTH-1 downto 0);
+        x_valid : in std_logic;
+        x_last : in std_logic;
+        x_ready : out std_logic;
+
+        y_address : in std_logic_vector(ADDRESS_WIDTH-1 downto 0);
+        y : out std_logic_vector(DATA_WIDTH-1 downto 0);
+        done : out std_logic -- enable of the consuming layer
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    type t_buffer is array (0 to COUNT-1) of std_logic_vector(DATA_WIDTH-1 downto 0);
+    signal values : t_buffer;
+    signal filled : std_logic := '0';
+begin
+
+    done <= filled;
+    x_ready <= enable and not filled;
+
+    collect : process (clock, enable)
+        variable write_idx : integer range 0 to COUNT-1 := 0;
+    begin
+        if enable = '0' then
+            filled <= '0';
+            write_idx := 0;
+        elsif rising_edge(clock) then
+            if x_valid = '1' and filled = '0' then
+                values(write_idx) <= x;
+                if x_last = '1' or write_idx = COUNT-1 then
+                    filled <= '1';
+                else
+                    write_idx := write_idx + 1;
+                end if;
+            end if;
+        end if;
+    end process collect;
+
+    read : process (clock)
+    begin
+        if falling_edge(clock) then
+            y <= values(to_integer(unsigned(y_address)));
+        end if;
+    end process read;
+
+end architecture rtl;
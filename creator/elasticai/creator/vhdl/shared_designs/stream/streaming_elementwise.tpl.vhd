@@ -0,0 +1,73 @@
+-- Applies the elementwise design ${inner_name} to a valid/ready stream.
+-- Every accepted value is held at the input of ${inner_name} for
+-- INNER_LATENCY cycles before the result is offered downstream. With a
+-- combinational ${inner_name} one value passes per clock cycle.
+
+library ieee;
+use ieee.std_logic_1164.all;
+use ieee.numeric_std.all;
+
+entity ${name} is
+    generic (
+        X_WIDTH : integer := ${x_width};
+        Y_WIDTH : integer := ${y_width};
+        INNER_LATENCY : integer := ${inner_latency}
+    );
+    port (
+        enable : in std_logic;
+        clock : in std_logic;
+
+        x : in std_logic_vector(X_WIDTH-1 downto 0);
+        x_valid : in std_logic;
+        x_last : in std_logic;
+        x_ready : out std_logic;
+
+        y : out std_logic_vector(Y_WIDTH-1 downto 0);
+        y_valid : out std_logic;
+        y_last : out std_logic;
+        y_ready : in std_logic
+    );
+end ${name};
+
+architecture rtl of ${name} is
+    signal x_held : std_logic_vector(X_WIDTH-1 downto 0) := (others => '0');
+    signal holding : std_logic := '0';
+    signal settled : std_logic;
+    signal x_ready_i : std_logic;
+    signal wait_cycles : integer range 0 to INNER_LATENCY := 0;
+begin
+
+    settled <= holding when wait_cycles = 0 else '0';
+    y_valid <= settled;
+    x_ready_i <= (not holding) or (settled and y_ready);
+    x_ready <= enable and x_ready_i;
+
+    i_inner : entity work.${inner_name}(rtl)
+    port map (
+        enable => enable,
+        clock => clock,
+        x => x_held,
+        y => y
+    );
+
+    handshake : process (clock, enable)
+    begin
+        if enable = '0' then
+            holding <= '0';
+            y_last <= '0';
+            wait_cycles <= 0;
+        elsif rising_edge(clock) then
+            if x_valid = '1' and x_ready_i = '1' then
+                x_held <= x;
+                y_last <= x_last;
+                holding <= '1';
+                wait_cycles <= INNER_LATENCY;
+            elsif settled = '1' and y_ready = '1' then
+                holding <= '0';
+            elsif wait_cycles > 0 then
+                wait_cycles <= wait_cycles - 1;
+            end if;
+        end if;
+    end process handshake;
+
+end architecture rtl;
@@ -1,9 +1,18 @@
 import csv
 import pathlib
+from collections.abc import Callable
 from typing import Any
 
 from elasticai.creator.file_generation.savable import Path
 
+from .ghdl_simulation import GHDLSimulator
+from .nvc_simulation import NVCSimulator
+from .simulator import Simulator
+
+SIMULATORS: dict[str, Callable[..., Simulator]] = dict(
+    ghdl=GHDLSimulator, nvc=NVCSimulator
+)
+
 
 class Testbench:
     @property
@@ -21,8 +30,18 @@ class Testbench:
 
 
 class SimulatedLayer:
-    def __init__(self, testbench: Testbench, simulator_constructor, working_dir):
+    """Runs `testbench` in the simulator built by `simulator_constructor`,
+    or in the one named so in `SIMULATORS`, e.g. `"nvc"`."""
+
+    def __init__(
+        self,
+        testbench: Testbench,
+        simulator_constructor: Callable[..., Simulator] | str,
+        working_dir,
+    ):
         self._testbench = testbench
+        if isinstance(simulator_constructor, str):
+            simulator_constructor = SIMULATORS[simulator_constructor]
         self._simulator_constructor = simulator_constructor
         self._working_dir = working_dir
         self._inputs_file_path = (
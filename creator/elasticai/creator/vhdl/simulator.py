@@ -0,0 +1,128 @@
+import glob
+import subprocess
+from abc import ABC, abstractmethod
+from typing import Protocol
+
+
+class SimulationError(Exception):
+    pass
+
+
+class Simulator(Protocol):
+    """A simulation tool running the testbench `top_design_name` from all vhd
+    files below `workdir`, both given to its constructor by `SimulatedLayer`.
+
+    Reports are parsed into dicts with the keys
+    `("source", "line", "column", "time", "type", "content")` for every tool,
+    where `type` is the lower case severity, e.g. `"note"`.
+    """
+
+    def add_generic(self, **kwargs: str) -> None: ...
+
+    def initialize(self) -> None:
+        """Analyses all files, once before `run` and after every file change."""
+        ...
+
+    def run(self) -> None:
+        """Elaborates the testbench with the generics and simulates it."""
+        ...
+
+    def getReportedContent(self) -> list[str]: ...
+
+    def getFullReport(self) -> list[dict]: ...
+
+    def getRawResult(self) -> str: ...
+
+
+class CommandLineSimulator(ABC):
+    """Runs a simulation tool through its command line interface and keeps
+    the output of the last call.
+
+    Will raise a `SimulationError` in case any of the calls fails.
+    """
+
+    def __init__(self, workdir, top_design_name) -> None:
+        self._root = workdir
+        self._files = list(glob.glob("**/*.vhd", root_dir=self._root, recursive=True))
+        self._test_bench_name = top_design_name
+        self._generics: dict[str, str] = {}
+        self._completed_process: None | subprocess.CompletedProcess = None
+
+    def add_generic(self, **kwargs):
+        self._generics.update(kwargs)
+
+    @abstractmethod
+    def initialize(self) -> None: ...
+
+    @abstractmethod
+    def run(self) -> None: ...
+
+    @abstractmethod
+    def _parse_report(self, text: str) -> list[dict]: ...
+
+    @property
+    def _result(self) -> str:
+        return self._stdout()
+
+    def getReportedContent(self) -> list[str]:
+        """Strips any information that the simulation tool added automatically to the output
+        to return only the information that was printed to stdout via VHDL/Verilog statements.
+        """
+        parsed = self._parse_report(self._result)
+        return list(line["content"] for line in parsed)
+
+    def getFullReport(self) -> list[dict]:
+        """Parses the output from the simulation tool, to provide a more structured representation.
+        The fields are the same for every tool, `line` and `column` are 0 if the tool omits them.
+        """
+        return [_normalized(line) for line in self._parse_report(self._result)]
+
+    def getRawResult(self) -> str:
+        """Returns the raw stdout output as written by the simulation tool."""
+        return self._result
+
+    def _execute_command(self, command):
+        try:
+            self._completed_process = subprocess.run(
+                command, cwd=self._root, capture_output=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise SimulationError(
+                f"ERROR:: executing {command}\n\tSTDERR::"
+                f" {e.stderr.decode()}\n\tSTDOUT:: {e.stdout.decode()}"
+            )
+
+        self._check_for_error()
+
+    def _check_for_error(self):
+        try:
+            self._completed_process.check_returncode()
+        except subprocess.CalledProcessError as exception:
+            error_message = self._get_error_message()
+            sim_error = SimulationError(error_message)
+            raise sim_error from exception
+
+    def _get_error_message(self) -> str:
+        # ghdl seems to pipe errors to stdout instead of stdin
+        error_message = self._stderr()
+        if error_message == "":
+            error_message = self._stdout()
+        return error_message
+
+    def _stdout(self) -> str:
+        if self._completed_process is not None:
+            return self._completed_process.stdout.decode()
+        else:
+            return ""
+
+    def _stderr(self) -> str:
+        if self._completed_process is not None:
+            return self._completed_process.stderr.decode()
+        else:
+            return ""
+
+
+def _normalized(line: dict) -> dict:
+    """Reduces tool specific types, like `"report note"` or
+    `"assertion error"` of GHDL, to the severity."""
+    return line | dict(type=line["type"].split(" ")[-1].lower())
@@ -0,0 +1,30 @@
+import subprocess
+
+from .ghdl_simulation import GHDLSimulator
+from .nvc_simulation import NVCSimulator
+
+
+def _finished(simulator, stdout: str, stderr: str = ""):
+    simulator._completed_process = subprocess.CompletedProcess(
+        args=[], returncode=0, stdout=stdout.encode(), stderr=stderr.encode()
+    )
+    return simulator
+
+
+def test_ghdl_and_nvc_reports_are_parsed_alike(tmp_path):
+    ghdl = _finished(
+        GHDLSimulator(str(tmp_path), "tb"),
+        "tb.vhd:64:17:@4ps:(report note):y = 1:2\n"
+        "tb.vhd:70:9:@8ps:(assertion error):wrong\n"
+        "simulation finished\n",
+    )
+    nvc = _finished(
+        NVCSimulator(str(tmp_path), "tb"),
+        "",
+        "** Note: 4ps+0: y = 1:2\n"
+        "   Process :tb:_p0 at tb.vhd:64:17\n"
+        "** Error: 8ps+1: wrong\n"
+        "   Process :tb:_p0 at tb.vhd:70:9\n",
+    )
+    assert ghdl.getFullReport() == nvc.getFullReport()
+    assert ["note", "error"] == [line["type"] for line in nvc.getFullReport()]
@@ -1,6 +1,8 @@
+import warnings
 from typing import Protocol
 
 from elasticai.creator.file_generation.savable import Path
+from elasticai.creator.vhdl.design import resources as _resources
 from elasticai.creator.vhdl.design.design import Design
 from elasticai.creator.vhdl.system_integrations.env5_constraints.env5_constraints import (
     ENV5Constraints,
@@ -15,15 +17,48 @@ from elasticai.creator.vhdl.system_integrations.top.env5_reconfig_top import (
 )
 
 
+ENV5_FPGA = _resources.Device(
+    name="xc7s15",
+    capacity=_resources.Resources(luts=8000, ffs=16000, dsps=20, bram=20, lutram=2400),
+)
+# spi slave, icap interface and user logic interface of the middleware
+_MIDDLEWARE_RESOURCES = _resources.Resources(luts=500, ffs=600)
+
+
 class SkeletonType(Protocol):
     def save_to(self, destination: Path) -> None: ...
 
 
 class _FirmwareENv5Base:
-    def __init__(self, skeleton: SkeletonType) -> None:
+    def __init__(self, skeleton: SkeletonType, network: Design) -> None:
         self._skeleton = skeleton
+        self._network = network
+
+    @property
+    def resources(self) -> _resources.Resources:
+        """Estimated resources of the network together with skeleton and
+        middleware."""
+        return (
+            self._network.resources + self._skeleton_resources + _MIDDLEWARE_RESOURCES
+        )
+
+    @property
+    def _skeleton_resources(self) -> _resources.Resources:
+        return _resources.Resources()
+
+    def _warn_if_exceeding(self, device: _resources.Device) -> None:
+        resources = self.resources
+        exceeded = resources.exceeded_on(device)
+        if exceeded:
+            warnings.warn(
+                f"{self._network.name} is estimated to exceed the {device.name}"
+                f" in {', '.join(exceeded)}: {resources}",
+                stacklevel=3,
+            )
 
     def save_to(self, destination: Path) -> None:
+        self._warn_if_exceeding(ENV5_FPGA)
+
         def save_srcs(destination: Path):
             self._skeleton.save_to(destination.create_subpath("skeleton"))
 
@@ -60,10 +95,17 @@ class FirmwareENv5(_FirmwareENv5Base):
                 y_num_values=y_num_values,
                 id=id,
                 skeleton_version=skeleton_version,
-            )
+            ),
+            network=network,
         )
+        self._x_num_values = x_num_values
+
+    @property
+    def _skeleton_resources(self) -> _resources.Resources:
+        x_width = self._network.port["x"].width
+        return _resources.memory(self._x_num_values + 1, x_width, writable=True)
 
 
 class LSTMFirmwareENv5(_FirmwareENv5Base):
     def __init__(self, network: Design):
-        super().__init__(skeleton=LSTMSkeleton(network.name))
+        super().__init__(skeleton=LSTMSkeleton(network.name), network=network)
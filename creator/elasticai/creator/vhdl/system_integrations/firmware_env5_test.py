@@ -3,10 +3,11 @@ from typing import cast
 import pytest
 
 from elasticai.creator.file_generation.in_memory_path import InMemoryFile, InMemoryPath
+from elasticai.creator.nn.fixed_point import Linear
 from elasticai.creator.nn.identity.layer import BufferedIdentity
 from elasticai.creator.nn.sequential.layer import Sequential
 
-from .firmware_env5 import FirmwareENv5
+from .firmware_env5 import ENV5_FPGA, FirmwareENv5
 
 
 def extract_skeleton_code(firmware) -> str:
@@ -278,3 +279,29 @@ begin
 
 end rtl;"""
     assert expected_code == actual_code
+
+
+def test_firmware_warns_if_network_exceeds_env5_fpga() -> None:
+    model = Sequential(
+        Linear(in_features=16, out_features=16, total_bits=8, frac_bits=4),
+        *(
+            Linear(
+                in_features=16,
+                out_features=16,
+                total_bits=8,
+                frac_bits=4,
+                parallelism=8,
+            )
+            for _ in range(3)
+        ),
+    )
+    firmware = FirmwareENv5(
+        model.create_design("network"),
+        x_num_values=16,
+        y_num_values=16,
+        id=list(range(0, 16)),
+        skeleton_version="v2",
+    )
+    assert firmware.resources.exceeded_on(ENV5_FPGA) == ["dsps"]
+    with pytest.warns(UserWarning, match="dsps"):
+        firmware.save_to(InMemoryPath(name="build", parent=None))